@@ -447,8 +447,8 @@ class SAR_ADC:
         )
 
         # do the conversions, assuming input codes have uniform density
-        for i in range(len(input_voltage_data)):
-            adc_data[i] = self.sample_and_convert(input_voltage_data[i] / 2.0, -input_voltage_data[i] / 2.0)
+        _bout, codes, _energy = self.sample_and_convert_batch(input_voltage_data / 2.0, -input_voltage_data / 2.0)
+        adc_data[: len(codes)] = codes
 
         # ADC data array - results now in structured output
 
@@ -524,14 +524,10 @@ class SAR_ADC:
 
         # For 100 ns sampling times, this gives 1 ms of capture.
         time_array = np.arange(0, num_samples / self.sampling_frequency, 1 / self.sampling_frequency)
-        input_voltage_array = np.empty(len(time_array))
-        adc_data_array = np.empty(len(time_array))
 
         # sample sine wave
-        for i in range(len(time_array)):  # Q: So one cycle of the sine wave?
-            input_voltage = offset + amplitude * np.sin(2 * np.pi * frequency * time_array[i])
-            input_voltage_array[i] = input_voltage
-            adc_data_array[i] = self.sample_and_convert(input_voltage, -input_voltage)
+        input_voltage_array = offset + amplitude * np.sin(2 * np.pi * frequency * time_array)
+        _bout, adc_data_array, _energy = self.sample_and_convert_batch(input_voltage_array, -input_voltage_array)
 
         # calculate residuals which represent the noise (in LSB)
         # Q: Assumes an ideal binary ADCs, so just ideal quantization noise.
@@ -577,19 +573,16 @@ class SAR_ADC:
             self.diff_input_voltage_range / 2,
             self.lsb_size / samples_per_bin,
         )
-        conversion_energy_array = np.empty(len(input_voltage_data))
         adc_data = np.empty(2 ** self.params["resolution"] * samples_per_bin)
         conversion_energy_average = 0
 
-        for i in range(len(input_voltage_data)):
-            adc_data[i] = self.sample_and_convert(
-                input_voltage_data[i] / 2 + common_mode_input_voltage,
-                -input_voltage_data[i] / 2 + common_mode_input_voltage,
-                do_calculate_energy=True,
-            )
-            # This is the core of the algorithm. At every input voltage, it records the energy used
-            # Inside sample_and_convert: reset() is run one, and update()
-            conversion_energy_array[i] = self.conversion_energy
+        # This is the core of the algorithm. At every input voltage, it records the energy used
+        _bout, codes, conversion_energy_array = self.sample_and_convert_batch(
+            input_voltage_data / 2 + common_mode_input_voltage,
+            -input_voltage_data / 2 + common_mode_input_voltage,
+            do_calculate_energy=True,
+        )
+        adc_data[: len(codes)] = codes
         conversion_energy_average = np.average(conversion_energy_array)
 
         self.fom = conversion_energy_average / self.params["resolution"]
@@ -671,13 +664,13 @@ class SAR_ADC:
         )
         input_voltage_data_lsb = np.empty(len(input_voltage_data))
         adc_data = np.empty(2 ** self.params["resolution"] * samples_per_bin)
-        for i in range(len(input_voltage_data)):
-            adc_data[i] = self.sample_and_convert(
-                input_voltage_data[i] / 2 + common_mode_input_voltage,
-                -input_voltage_data[i] / 2 + common_mode_input_voltage,
-            )
-            # adc_data[i] = self.ideal_conversion(input_voltage_data[i]/2, -input_voltage_data[i]/2)
-            # input_voltage_data_lsb[i] = self.ideal_conversion(input_voltage_data[i]/2, -input_voltage_data[i]/2)
+        _bout, codes, _energy = self.sample_and_convert_batch(
+            input_voltage_data / 2 + common_mode_input_voltage,
+            -input_voltage_data / 2 + common_mode_input_voltage,
+        )
+        adc_data[: len(codes)] = codes
+        # adc_data[i] = self.ideal_conversion(input_voltage_data[i]/2, -input_voltage_data[i]/2)
+        # input_voltage_data_lsb[i] = self.ideal_conversion(input_voltage_data[i]/2, -input_voltage_data[i]/2)
 
         input_voltage_data_lsb = input_voltage_data / self.lsb_size + 0.5
 
@@ -1087,3 +1080,153 @@ class SAR_ADC:
                 plot.annotate(self.comp_result[i], xy=(i + 0.5, 0), ha="center", color=color)
 
         return result
+
+    def sample_and_convert_batch(
+        self,
+        input_voltage_p,
+        input_voltage_n,
+        do_calculate_energy=False,
+        do_normalize_result=True,
+        chunk_size=65_536,
+    ):
+        """
+        Convert arrays of input pairs at once; returns (bout, codes, energy).
+
+        Each conversion follows sample_and_convert() step for step: every SAR cycle updates the (N,) register
+        states of a whole chunk through precomputed capacitor step vectors and bit masks, and the reference and
+        comparator noise of all cycles is drawn in one call per chunk. The draws come from np.random in the scalar
+        model's order (reset reference noise, then comparator and reference noise alternating), and the float
+        operations are kept in the same order, so a batch reproduces the scalar conversions bit for bit.
+        bout is the (N, cycles) uint8 comparator matrix and energy is the conversion energy in J, which is zero
+        unless do_calculate_energy is set.
+        """
+
+        input_voltage_p, input_voltage_n = np.broadcast_arrays(
+            np.asarray(input_voltage_p, dtype="float64"), np.asarray(input_voltage_n, dtype="float64")
+        )
+        if input_voltage_p.ndim != 1:
+            raise ValueError("batched conversion inputs must be one-dimensional")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        array_size = self.dac.params["array_size"]
+        if self.dac.params["switching_strat"] == "monotonic":
+            reset_value = 2**array_size - 1
+        elif self.dac.params["switching_strat"] == "bss":
+            reset_value = 2 ** (array_size - 1) - 1
+        else:
+            raise ValueError("switching_strat wasn't one of the allowed values: monotonic, bss")
+
+        # register bit mask and signed voltage step of each SAR cycle, in capacitor order (MSB first)
+        bit_masks = [1 << (array_size - i - 1) for i in range(array_size)]
+        increments = [reset_value & mask == 0 for mask in bit_masks]
+        delta_backplane_voltage = (
+            self.dac.params["positive_reference_voltage"] - self.dac.params["negative_reference_voltage"]
+        )
+        step_p = self.dac.capacitor_array_p / self.dac.capacitance_sum_p * delta_backplane_voltage
+        step_n = self.dac.capacitor_array_n / self.dac.capacitance_sum_n * delta_backplane_voltage
+        if self.params["use_calibration"]:
+            result_weights = self.dac.capacitor_array_p / self.dac.params["unit_capacitance"]
+        else:
+            result_weights = self.dac.weights_array
+        noise_sigma = np.array(
+            [self.dac.params["reference_voltage_noise"], self.comparator.params["threshold_voltage_noise"]]
+        )
+        offset_voltage = self.comparator.params["offset_voltage"]
+        common_mode_gain = self.comparator.params["common_mode_dependent_offset_gain"]
+        settling_time_error = self.dac.settling_time_error
+
+        def compare(voltage_p, voltage_n, noise_voltage):
+            common_mode_offset_voltage = (voltage_p + voltage_n) / 2 * common_mode_gain
+            return voltage_p > voltage_n + offset_voltage + common_mode_offset_voltage + noise_voltage
+
+        def capacitance_at_vref(register, capacitor_array):
+            # accumulate in capacitor order, as CDAC_BSS.update() does
+            capacitance = np.zeros(len(register))
+            for capacitor, mask in zip(capacitor_array, bit_masks):
+                capacitance += np.where(register & mask != 0, capacitor, 0.0)
+            return capacitance
+
+        def consumed_charge(register, capacitor_array, delta_output_voltage):
+            # positive steps draw charge into the capacitors at ground, negative ones out of those at VREF
+            rising = delta_output_voltage > 0
+            charge = np.zeros(len(register))
+            for capacitor, mask in zip(capacitor_array, bit_masks):
+                connected = register & mask != 0
+                charge += np.where(
+                    rising,
+                    np.where(connected, 0.0, capacitor * delta_output_voltage),
+                    np.where(connected, -(capacitor * delta_output_voltage), 0.0),
+                )
+            return charge
+
+        conversions = len(input_voltage_p)
+        bout = np.empty((conversions, self.cycles), dtype=np.uint8)
+        energy = np.zeros(conversions)
+        register_p = register_n = np.full(0, reset_value, dtype=np.int64)
+        for start in range(0, conversions, chunk_size):
+            stop = min(start + chunk_size, conversions)
+            count = stop - start
+            # per conversion: reset reference noise, first comparison, then one (reference, comparator) pair per cycle
+            noise = np.random.normal(0, noise_sigma, size=(count, array_size + 1, 2))
+            register_p = np.full(count, reset_value, dtype=np.int64)
+            register_n = np.full(count, reset_value, dtype=np.int64)
+            output_voltage_p = input_voltage_p[start:stop].copy()
+            output_voltage_n = input_voltage_n[start:stop].copy()
+            total_consumed_charge = np.zeros(count)
+            decision = compare(output_voltage_p, output_voltage_n, noise[:, 0, 1])
+            bout[start:stop, 0] = decision
+
+            for i in range(array_size):  # SAR loop, one capacitor per cycle
+                mask = bit_masks[i]
+                if increments[i]:
+                    register_n = np.where(decision, register_n + mask, register_n)
+                    register_p = np.where(decision, register_p, register_p + mask)
+                    delta_output_voltage_p = np.where(decision, 0.0, step_p[i])
+                    delta_output_voltage_n = np.where(decision, step_n[i], 0.0)
+                else:
+                    register_p = np.where(decision, register_p - mask, register_p)
+                    register_n = np.where(decision, register_n, register_n - mask)
+                    delta_output_voltage_p = np.where(decision, -step_p[i], 0.0)
+                    delta_output_voltage_n = np.where(decision, 0.0, -step_n[i])
+
+                if do_calculate_energy:
+                    total_consumed_charge += consumed_charge(
+                        register_p, self.dac.capacitor_array_p, delta_output_voltage_p
+                    ) + consumed_charge(register_n, self.dac.capacitor_array_n, delta_output_voltage_n)
+
+                output_voltage_p += delta_output_voltage_p
+                output_voltage_n += delta_output_voltage_n
+                if noise_sigma[0] > 0:
+                    voltage_noise_sample = noise[:, i + 1, 0]
+                    noise_p = voltage_noise_sample * capacitance_at_vref(register_p, self.dac.capacitor_array_p)
+                    noise_n = voltage_noise_sample * capacitance_at_vref(register_n, self.dac.capacitor_array_n)
+                    dac_output_p = output_voltage_p + noise_p / self.dac.capacitance_sum_p
+                    dac_output_n = output_voltage_n + noise_n / self.dac.capacitance_sum_n
+                else:
+                    dac_output_p = output_voltage_p
+                    dac_output_n = output_voltage_n
+                dac_output_p = dac_output_p - delta_output_voltage_p * settling_time_error
+                dac_output_n = dac_output_n - delta_output_voltage_n * settling_time_error
+
+                decision = compare(dac_output_p, dac_output_n, noise[:, i + 1, 1])
+                bout[start:stop, i + 1] = decision
+
+            energy[start:stop] = total_consumed_charge * delta_backplane_voltage
+
+        # accumulate weights in bit order, as calculate_result() does
+        comparisons = 2 * bout.astype(np.int64) - 1
+        codes = np.zeros(conversions, dtype=np.result_type(result_weights, np.int64))
+        for i in range(self.cycles - 1):
+            codes = codes + comparisons[:, i] * result_weights[i]
+        codes = codes + bout[:, self.cycles - 1]
+        if do_normalize_result:
+            codes = codes * ((2 ** (self.params["resolution"] - 1) - 1) / (self.dac.weights_sum))
+            codes = np.round(codes).astype(np.int64)
+
+        # leave the model in the state of the last conversion, like sample_and_convert()
+        if conversions:
+            self.dac.register_p = int(register_p[-1])
+            self.dac.register_n = int(register_n[-1])
+            self.comp_result = bout[-1].tolist()
+            self.conversion_energy = float(energy[-1])
+        return bout, codes, energy
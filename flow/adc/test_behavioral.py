@@ -0,0 +1,62 @@
+"""Equivalence checks for the batched behavioral SAR conversion."""
+
+import numpy as np
+import pytest
+
+from .behavioral import SAR_ADC
+
+
+def behavioral_params(switching_strat: str, use_calibration: bool) -> dict[str, dict[str, object]]:
+    weights = [768, 512, 256, 160, 96, 64, 32, 20, 12, 8, 4, 2, 1]
+    return {
+        "ADC": {"sampling_frequency": 10e6, "use_calibration": use_calibration, "resolution": 12},
+        "COMP": {
+            "offset_voltage": 1e-3,
+            "common_mode_dependent_offset_gain": 0.01,
+            "threshold_voltage_noise": 2e-4,
+        },
+        "CDAC": {
+            "positive_reference_voltage": 1.2,
+            "negative_reference_voltage": 0.0,
+            "reference_voltage_noise": 1e-4,
+            "unit_capacitance": 1e-15,
+            "use_individual_weights": True,
+            "individual_weights": weights,
+            "parasitic_capacitance": 50e-15,
+            "capacitor_mismatch_error": 0.5,
+            "settling_time": 1e-9,
+            "switching_strat": switching_strat,
+            "array_size": len(weights),
+        },
+    }
+
+
+@pytest.mark.parametrize(("switching_strat", "use_calibration"), (("monotonic", False), ("bss", True)))
+def test_batched_conversion_reproduces_scalar_conversions(switching_strat: str, use_calibration: bool) -> None:
+    np.random.seed(7)
+    adc = SAR_ADC(behavioral_params(switching_strat, use_calibration))
+    vin_diff = np.linspace(-1.25, 1.25, 257)
+    rng_state = np.random.get_state()
+
+    codes = []
+    bout = []
+    energy = []
+    for vin in vin_diff:
+        codes.append(adc.sample_and_convert(0.6 + vin / 2, 0.6 - vin / 2, do_calculate_energy=True))
+        bout.append(adc.comp_result)
+        energy.append(adc.conversion_energy)
+    scalar_end_state = np.random.get_state()[1]
+
+    np.random.set_state(rng_state)
+    batch_bout, batch_codes, batch_energy = adc.sample_and_convert_batch(
+        0.6 + vin_diff / 2,
+        0.6 - vin_diff / 2,
+        do_calculate_energy=True,
+        chunk_size=100,
+    )
+
+    np.testing.assert_array_equal(batch_bout, np.asarray(bout, dtype=np.uint8))
+    np.testing.assert_array_equal(batch_codes, codes)
+    np.testing.assert_array_equal(batch_energy, energy)
+    np.testing.assert_array_equal(np.random.get_state()[1], scalar_end_state)
+    assert adc.comp_result == bout[-1]
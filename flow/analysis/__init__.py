@@ -2,6 +2,7 @@
 
 from .adc import (
     analyze_adc_code_distribution,
+    analyze_adc_decision_path_histogram,
     analyze_adc_decision_paths,
     analyze_adc_dynamic,
     analyze_adc_dynamic_sweep,
@@ -9,11 +10,13 @@ from .adc import (
     analyze_adc_nonlinearity,
     analyze_adc_power_sweep,
     analyze_adc_ramp,
+    analyze_adc_spectra,
     analyze_adc_transfer,
 )
 from .cdac import analyze_cdac_cap_mismatch
 from .comp import (
     analyze_comp_offset_noise,
+    analyze_comp_offset_noise_curves,
     analyze_comp_power,
     analyze_comp_timing,
 )
@@ -21,6 +24,7 @@ from .io import read_measurement, write_measurement
 
 __all__ = [
     "analyze_adc_code_distribution",
+    "analyze_adc_decision_path_histogram",
     "analyze_adc_decision_paths",
     "analyze_adc_dynamic",
     "analyze_adc_dynamic_sweep",
@@ -28,9 +32,11 @@ __all__ = [
     "analyze_adc_nonlinearity",
     "analyze_adc_power_sweep",
     "analyze_adc_ramp",
+    "analyze_adc_spectra",
     "analyze_adc_transfer",
     "analyze_cdac_cap_mismatch",
     "analyze_comp_offset_noise",
+    "analyze_comp_offset_noise_curves",
     "analyze_comp_power",
     "analyze_comp_timing",
     "read_measurement",
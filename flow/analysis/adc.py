@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
+import functools
 import math
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 import hdl21 as h
 import numpy as np
 from scipy.optimize import minimize_scalar
 from scipy.signal.windows import blackmanharris
 
-from flow.analysis.measure import find_code_transitions, find_crossings, histogram_inl_dnl
+from flow.analysis.cache import cached_analysis
+from flow.analysis.measure import (
+    decode_packed_bout,
+    find_code_transitions,
+    find_crossings,
+    fit_sine_four_parameter,
+    fit_sine_three_parameter,
+    grouped_statistics,
+    histogram_inl_dnl,
+    merge_grouped_statistics,
+    pack_bout,
+    unpack_bout,
+)
 from flow.analysis.types import (
+    ADC_BOUT_BITS,
+    AdcDaq,
     AdcDecisionSelection,
     AdcDecoding,
     AdcNonlinearityMethod,
+    AdcSineFitMethod,
+    AdcSpectrumMode,
     AnalysisAdcCalibration,
     AnalysisAdcCodeDistribution,
+    AnalysisAdcDecisionPathHistogram,
     AnalysisAdcDecisionPaths,
     AnalysisAdcDynamic,
     AnalysisAdcDynamicSweep,
@@ -29,6 +47,7 @@ from flow.analysis.types import (
     AnalysisAdcRamp,
     AnalysisAdcRampCurve,
     AnalysisAdcScopeBits,
+    AnalysisAdcSpectra,
     AnalysisAdcTransfer,
     MeasAdc,
     MeasAdcExt,
@@ -41,6 +60,7 @@ ADC_DYNAMIC_GAUSSIAN_TAIL_FRACTION = 0.0027
 ADC_RAMP_RESET_EXCLUSION_CONVERSIONS = 8
 
 
+@cached_analysis
 def analyze_scope_wave_to_bits(msmt: MeasAdcExt) -> AnalysisAdcScopeBits:
     """Decode the first 17 scope COMP_OUT decisions and compare FastRX."""
 
@@ -83,7 +103,7 @@ def analyze_scope_wave_to_bits(msmt: MeasAdcExt) -> AnalysisAdcScopeBits:
         scope_bits = ~scope_bits
     return AnalysisAdcScopeBits(
         scope_bits=scope_bits,
-        fastrx_bits=msmt.daq.bout[0].astype(np.bool_),
+        fastrx_bits=msmt.daq.bout_bits[0].astype(np.bool_),
         comp_threshold_v=comp_threshold_v,
         comp_out_threshold_v=comp_out_threshold_v,
         comp_edge_times_s=comp_edge_times_s,
@@ -98,17 +118,26 @@ def decode_bout(
     *,
     rounded: bool = True,
 ) -> np.ndarray:
-    """Apply one method-independent 17-weight digital calibration."""
+    """Apply one method-independent 17-weight digital calibration.
+
+    ``bout`` is either the ``(samples, 17)`` decision matrix or the packed
+    one-word-per-conversion form stored in ``AdcDaq.bout``.
+    """
 
     decisions = np.asarray(bout)
-    if decisions.ndim != 2 or decisions.shape[1] != 17:
-        raise ValueError("calibrated ADC decoding requires BOUT shape (samples, 17)")
-    if np.any((decisions != 0) & (decisions != 1)):
-        raise ValueError("calibrated ADC decoding requires binary BOUT values")
-    fractional = np.asarray(
-        decisions.astype(np.float64) @ calibration.calibrated_weights,
-        dtype=np.float64,
-    )
+    if decisions.ndim == 1:
+        if np.any(decisions.astype(np.uint32) >> np.uint32(ADC_BOUT_BITS)):
+            raise ValueError(f"packed BOUT words must use only the low {ADC_BOUT_BITS} bits")
+        fractional = decode_packed_bout(decisions, np.asarray(calibration.calibrated_weights, dtype=np.float64))
+    else:
+        if decisions.ndim != 2 or decisions.shape[1] != ADC_BOUT_BITS:
+            raise ValueError("calibrated ADC decoding requires BOUT shape (samples, 17) or packed (samples,)")
+        if np.any((decisions != 0) & (decisions != 1)):
+            raise ValueError("calibrated ADC decoding requires binary BOUT values")
+        fractional = np.asarray(
+            decisions.astype(np.float64) @ calibration.calibrated_weights,
+            dtype=np.float64,
+        )
     fractional = np.clip(fractional, 0.0, float(calibration.code_max))
     if not rounded:
         return fractional
@@ -162,24 +191,37 @@ def _input_frequency_hz(measurement: MeasAdc) -> float:
     return float(source.freq)
 
 
-def _calculate_adc_spectrum(
+def _calculate_adc_spectra(
     measured_dout: np.ndarray,
     *,
     sample_rate_hz: float,
-    fitted_frequency_hz: float,
-    offset_dout: float,
+    fitted_frequency_hz: np.ndarray,
+    offset_dout: np.ndarray,
     full_scale_peak_dout: float,
     maximum_harmonic_order: int,
-) -> tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
-    """Calculate windowed SNR, SNDR, THD, SFDR, ENOB, and spectrum."""
+    mode: AdcSpectrumMode = "windowed",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate SNR, SNDR, THD, SFDR, ENOB, and spectra for a stack of records.
+
+    Rows of ``measured_dout`` are equal-length records. ``"windowed"`` applies
+    a Blackman-Harris window and integrates nine bins per tone, ``"coherent"``
+    uses a rectangular window with one bin per tone, and ``"averaged"`` averages
+    the windowed power spectra of all rows (which share one tone) into a single
+    row before the metrics.
+    """
 
-    window = blackmanharris(measured_dout.size, sym=False)
-    spectrum = np.fft.rfft((measured_dout - offset_dout) * window)
-    frequency_hz = np.fft.rfftfreq(measured_dout.size, d=1.0 / sample_rate_hz)
-    amplitude_dout = 2.0 * np.abs(spectrum) / float(np.sum(window))
-    amplitude_dout[0] *= 0.5
-    if measured_dout.size % 2 == 0:
-        amplitude_dout[-1] *= 0.5
+    sample_count = measured_dout.shape[1]
+    window = np.ones(sample_count) if mode == "coherent" else blackmanharris(sample_count, sym=False)
+    spectrum = np.fft.rfft((measured_dout - offset_dout[:, None]) * window, axis=1)
+    power = spectrum.real**2 + spectrum.imag**2
+    if mode == "averaged":
+        power = np.mean(power, axis=0, keepdims=True)
+        fitted_frequency_hz = fitted_frequency_hz[:1]
+    frequency_hz = np.fft.rfftfreq(sample_count, d=1.0 / sample_rate_hz)
+    amplitude_dout = 2.0 * np.sqrt(power) / float(np.sum(window))
+    amplitude_dout[:, 0] *= 0.5
+    if sample_count % 2 == 0:
+        amplitude_dout[:, -1] *= 0.5
     amplitude_dbfs = 20.0 * np.log10(
         np.maximum(
             amplitude_dout / full_scale_peak_dout,
@@ -187,55 +229,56 @@ def _calculate_adc_spectrum(
         )
     )
 
-    spectral_power = np.abs(spectrum) ** 2
-    if measured_dout.size % 2 == 0:
-        spectral_power[1:-1] *= 2.0
+    spectral_power = power.copy()
+    if sample_count % 2 == 0:
+        spectral_power[:, 1:-1] *= 2.0
     else:
-        spectral_power[1:] *= 2.0
-    spectral_power[0] = 0.0
-    bin_width_hz = sample_rate_hz / measured_dout.size
-
-    def tone_bins(tone_frequency_hz: float) -> set[int]:
-        center_bin = round(tone_frequency_hz / bin_width_hz)
-        return set(
-            range(
-                max(1, center_bin - 4),
-                min(len(spectral_power), center_bin + 5),
-            )
-        )
-
-    fundamental_bins = tone_bins(fitted_frequency_hz)
-    harmonic_bins: set[int] = set()
-    for harmonic_order in range(2, maximum_harmonic_order + 1):
-        wrapped_hz = (harmonic_order * fitted_frequency_hz) % sample_rate_hz
-        aliased_hz = min(wrapped_hz, sample_rate_hz - wrapped_hz)
-        harmonic_bins.update(tone_bins(aliased_hz) - fundamental_bins)
-
-    noise_bins = set(range(1, len(spectral_power))) - fundamental_bins - harmonic_bins
-    fundamental_power = float(np.sum(spectral_power[list(fundamental_bins)]))
-    harmonic_power = float(np.sum(spectral_power[list(harmonic_bins)]))
-    noise_power = float(np.sum(spectral_power[list(noise_bins)]))
+        spectral_power[:, 1:] *= 2.0
+    spectral_power[:, 0] = 0.0
+    bin_width_hz = sample_rate_hz / sample_count
+    bins = np.arange(spectral_power.shape[1])
+    half_width_bins = 0 if mode == "coherent" else 4
+
+    def tone_mask(center_bins: np.ndarray) -> np.ndarray:
+        # center_bins is (rows, tones); the mask is (rows, bins) excluding DC.
+        distance = np.abs(bins[None, None, :] - center_bins[:, :, None])
+        return np.any(distance <= half_width_bins, axis=1) & (bins >= 1)
+
+    fundamental = tone_mask(np.rint(fitted_frequency_hz / bin_width_hz)[:, None])
+    wrapped_hz = (np.arange(2, maximum_harmonic_order + 1) * fitted_frequency_hz[:, None]) % sample_rate_hz
+    aliased_hz = np.minimum(wrapped_hz, sample_rate_hz - wrapped_hz)
+    harmonic = tone_mask(np.rint(aliased_hz / bin_width_hz)) & ~fundamental
+    noise = (bins >= 1) & ~fundamental & ~harmonic
+    fundamental_power = np.sum(spectral_power, axis=1, where=fundamental)
+    harmonic_power = np.sum(spectral_power, axis=1, where=harmonic)
+    noise_power = np.sum(spectral_power, axis=1, where=noise)
     noise_and_distortion = harmonic_power + noise_power
-    if fundamental_power <= 0:
-        sndr_db = -math.inf
-        snr_db = -math.inf
-        thd_db = math.inf if harmonic_power > 0 else -math.inf
-    else:
-        sndr_db = 10.0 * math.log10(fundamental_power / noise_and_distortion) if noise_and_distortion > 0 else math.inf
-        snr_db = 10.0 * math.log10(fundamental_power / noise_power) if noise_power > 0 else math.inf
-        thd_db = 10.0 * math.log10(harmonic_power / fundamental_power) if harmonic_power > 0 else -math.inf
 
-    spur_candidates = np.asarray(
-        sorted(set(range(1, len(spectral_power))) - fundamental_bins),
-        dtype=np.int64,
-    )
-    if fundamental_power > 0 and spur_candidates.size:
-        spur_center = int(spur_candidates[np.argmax(spectral_power[spur_candidates])])
-        spur_bins = tone_bins(frequency_hz[spur_center]) - fundamental_bins
-        spur_power = float(np.sum(spectral_power[list(spur_bins)]))
-        sfdr_db = 10.0 * math.log10(fundamental_power / spur_power) if spur_power > 0 else math.inf
-    else:
-        sfdr_db = math.inf
+    spur_candidates = (bins >= 1) & ~fundamental
+    spur_center = np.argmax(np.where(spur_candidates, spectral_power, -np.inf), axis=1)
+    spur_power = np.sum(spectral_power, axis=1, where=tone_mask(spur_center[:, None]) & ~fundamental)
+    has_fundamental = fundamental_power > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sndr_db = np.where(
+            has_fundamental,
+            np.where(noise_and_distortion > 0, 10.0 * np.log10(fundamental_power / noise_and_distortion), np.inf),
+            -np.inf,
+        )
+        snr_db = np.where(
+            has_fundamental,
+            np.where(noise_power > 0, 10.0 * np.log10(fundamental_power / noise_power), np.inf),
+            -np.inf,
+        )
+        thd_db = np.where(
+            has_fundamental,
+            np.where(harmonic_power > 0, 10.0 * np.log10(harmonic_power / fundamental_power), -np.inf),
+            np.where(harmonic_power > 0, np.inf, -np.inf),
+        )
+        sfdr_db = np.where(
+            has_fundamental & np.any(spur_candidates, axis=1) & (spur_power > 0),
+            10.0 * np.log10(fundamental_power / spur_power),
+            np.inf,
+        )
     return (
         sndr_db,
         snr_db,
@@ -247,13 +290,53 @@ def _calculate_adc_spectrum(
     )
 
 
+def _calculate_adc_spectrum(
+    measured_dout: np.ndarray,
+    *,
+    sample_rate_hz: float,
+    fitted_frequency_hz: float,
+    offset_dout: float,
+    full_scale_peak_dout: float,
+    maximum_harmonic_order: int,
+) -> tuple[float, float, float, float, float, np.ndarray, np.ndarray]:
+    """Calculate windowed SNR, SNDR, THD, SFDR, ENOB, and spectrum."""
+
+    sndr_db, snr_db, thd_db, sfdr_db, enob_bits, frequency_hz, amplitude_dbfs = _calculate_adc_spectra(
+        measured_dout[None, :],
+        sample_rate_hz=sample_rate_hz,
+        fitted_frequency_hz=np.asarray([fitted_frequency_hz]),
+        offset_dout=np.asarray([offset_dout]),
+        full_scale_peak_dout=full_scale_peak_dout,
+        maximum_harmonic_order=maximum_harmonic_order,
+    )
+    return (
+        float(sndr_db[0]),
+        float(snr_db[0]),
+        float(thd_db[0]),
+        float(sfdr_db[0]),
+        float(enob_bits[0]),
+        frequency_hz,
+        amplitude_dbfs[0],
+    )
+
+
+@cached_analysis
 def analyze_adc_dynamic(
     measurement: MeasAdc,
     *,
     frequency_search_fraction: float = 0.02,
     maximum_harmonic_order: int = 5,
+    sine_fit: AdcSineFitMethod = "newton",
 ) -> AnalysisAdcDynamic:
-    """Fit one sine acquisition and calculate time- and frequency-domain metrics."""
+    """Fit one sine acquisition and calculate time- and frequency-domain metrics.
+
+    The sine frequency is the least-squares optimum within
+    ``frequency_search_fraction`` of the programmed tone (and within 0.45 FFT
+    bins). ``"newton"`` reaches it with a few four-parameter Gauss-Newton
+    passes from the programmed frequency and falls back to the bounded scalar
+    search only if those steps leave the window or fail to settle;
+    ``"bounded_search"`` always uses the scalar search.
+    """
 
     params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
     measured_dout = np.asarray(measurement.daq.dout, dtype=np.float64)
@@ -272,6 +355,8 @@ def analyze_adc_dynamic(
         raise ValueError("frequency_search_fraction must be finite and in [0, 1)")
     if maximum_harmonic_order < 2:
         raise ValueError("maximum_harmonic_order must be at least two")
+    if sine_fit not in ("newton", "bounded_search"):
+        raise ValueError("ADC sine fit must be 'newton' or 'bounded_search'")
     time_s = np.arange(measured_dout.size, dtype=np.float64) / sample_rate_hz
     ones = np.ones(measured_dout.size, dtype=np.float64)
 
@@ -293,15 +378,28 @@ def analyze_adc_dynamic(
             np.nextafter(sample_rate_hz / 2.0, 0.0),
             input_frequency_hz + maximum_offset_hz,
         )
-        frequency_fit = minimize_scalar(
-            lambda frequency_hz: fit_at_frequency(float(frequency_hz))[3],
-            bounds=(lower_hz, upper_hz),
-            method="bounded",
-            options={"xatol": max(1e-9, input_frequency_hz * 1e-10)},
-        )
-        if not frequency_fit.success:
-            raise RuntimeError(f"ADC sine frequency fit failed: {frequency_fit.message}")
-        fitted_frequency_hz = float(frequency_fit.x)
+        tolerance_hz = max(1e-9, input_frequency_hz * 1e-10)
+        fitted_frequency_hz = math.nan
+        if sine_fit == "newton":
+            try:
+                fitted_frequency_hz = fit_sine_four_parameter(
+                    measured_dout,
+                    time_s,
+                    input_frequency_hz,
+                    tolerance_hz=tolerance_hz,
+                )[0]
+            except (RuntimeError, np.linalg.LinAlgError):
+                pass
+        if not lower_hz <= fitted_frequency_hz <= upper_hz:
+            frequency_fit = minimize_scalar(
+                lambda frequency_hz: fit_at_frequency(float(frequency_hz))[3],
+                bounds=(lower_hz, upper_hz),
+                method="bounded",
+                options={"xatol": tolerance_hz},
+            )
+            if not frequency_fit.success:
+                raise RuntimeError(f"ADC sine frequency fit failed: {frequency_fit.message}")
+            fitted_frequency_hz = float(frequency_fit.x)
     else:
         fitted_frequency_hz = input_frequency_hz
 
@@ -369,6 +467,7 @@ def analyze_adc_dynamic(
     )
 
 
+@cached_analysis
 def analyze_adc_transfer(
     measurements: Sequence[MeasAdc],
     *,
@@ -381,32 +480,32 @@ def analyze_adc_transfer(
     if calibration is not None:
         for measurement in measurements:
             _validate_calibration(measurement, calibration)
-    inputs = np.concatenate([measurement.daq.vin_diff_v for measurement in measurements])
-    dout = np.concatenate(
-        [
-            measurement.daq.dout if calibration is None else decode_bout(measurement.daq.bout, calibration)
+    # Reduce each file separately and merge, so campaign size never requires
+    # one concatenated copy of every conversion.
+    statistics = functools.reduce(
+        merge_grouped_statistics,
+        (
+            grouped_statistics(
+                measurement.daq.vin_diff_v,
+                measurement.daq.dout if calibration is None else decode_bout(measurement.daq.bout, calibration),
+            )
             for measurement in measurements
-        ]
-    ).astype(np.float64)
-    if not len(dout):
-        raise ValueError("ADC transfer analysis requires at least one conversion")
-    unique_inputs, inverse = np.unique(inputs, return_inverse=True)
+        ),
+    )
     return AnalysisAdcTransfer(
-        vin_diff_v=unique_inputs,
-        mean_dout=np.asarray([np.mean(dout[inverse == index]) for index in range(len(unique_inputs))]),
-        std_dout=np.asarray([np.std(dout[inverse == index]) for index in range(len(unique_inputs))]),
-        sample_count=np.bincount(inverse, minlength=len(unique_inputs)).astype(np.int64),
+        vin_diff_v=statistics.key,
+        mean_dout=statistics.mean,
+        std_dout=statistics.std,
+        sample_count=statistics.count,
     )
 
 
 def _endpoint_nonlinearity(measurement: MeasAdc, decoded_dout: np.ndarray) -> AnalysisAdcNonlinearity:
-    inputs = measurement.daq.vin_diff_v
     decoded_dout = np.asarray(decoded_dout, dtype=np.float64)
-    unique_inputs, inverse = np.unique(inputs, return_inverse=True)
-    if len(unique_inputs) < 3:
+    statistics = grouped_statistics(measurement.daq.vin_diff_v, decoded_dout)
+    if len(statistics.key) < 3:
         raise ValueError("endpoint nonlinearity requires at least three input points")
-    mean_dout = np.asarray([np.mean(decoded_dout[inverse == index]) for index in range(len(unique_inputs))])
-    transition_code, transition_input = find_code_transitions(unique_inputs, mean_dout)
+    transition_code, transition_input = find_code_transitions(statistics.key, statistics.mean)
     if len(transition_input) < 2:
         raise ValueError("endpoint nonlinearity spans fewer than two code transitions")
     endpoint_lsb_v = float((transition_input[-1] - transition_input[0]) / (len(transition_input) - 1))
@@ -455,6 +554,7 @@ def _code_density_nonlinearity(
     )
 
 
+@cached_analysis
 def analyze_adc_nonlinearity(
     measurement: MeasAdc,
     *,
@@ -476,11 +576,42 @@ def analyze_adc_nonlinearity(
     raise ValueError("ADC nonlinearity method must be 'endpoint' or 'code_density'")
 
 
+def _conversion_slices(length: int, chunk_size: int | None) -> Iterator[slice]:
+    """Yield consecutive conversion slices covering one DAQ of ``length`` rows."""
+
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("ADC analysis chunk_size must be positive")
+    step = max(length, 1) if chunk_size is None else chunk_size
+    for start in range(0, length, step):
+        yield slice(start, min(start + step, length))
+
+
+def _selected_row_slices(rows: np.ndarray, chunk_size: int) -> Iterator[slice]:
+    """Yield slices of sorted ``rows`` whose conversions span at most ``chunk_size`` rows."""
+
+    if chunk_size <= 0:
+        raise ValueError("ADC analysis chunk_size must be positive")
+    start = 0
+    while start < len(rows):
+        stop = int(np.searchsorted(rows, rows[start] + chunk_size, side="left"))
+        yield slice(start, stop)
+        start = stop
+
+
+def _bout_words(daq: AdcDaq, rows: slice) -> np.ndarray:
+    """Return packed BOUT words for one conversion slice of either stored layout."""
+
+    bout = np.asarray(daq.bout[rows])
+    return bout.astype(np.uint32) if bout.ndim == 1 else pack_bout(bout)
+
+
+@cached_analysis
 def analyze_adc_ramp(
     measurement: MeasAdc,
     *,
     calibrations: Sequence[AnalysisAdcCalibration] = (),
     code_range: tuple[int, int] | None = None,
+    chunk_size: int | None = None,
 ) -> AnalysisAdcRamp:
     """Recover nominal and optionally calibrated curves from one repeated ramp.
 
@@ -492,18 +623,20 @@ def analyze_adc_ramp(
     are excluded from linearity by default. Every supplied calibration is
     applied to the same stored BOUT words and analyzed on the same retained
     conversions, making all three methods directly comparable.
+
+    With ``chunk_size``, two passes over consecutive DAQ slices first find the
+    resets and then accumulate the histograms and transfer sums, so only one
+    slice of each array and its temporaries is resident. Pass a measurement
+    from ``read_measurement(path, lazy=True)`` to read those slices from HDF5.
     """
 
     params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
     if not isinstance(params.vin_diff, h.Vpwl.Params):
         raise TypeError("ADC ramp analysis requires a PWL differential-input source")
-    intended_input = np.asarray(measurement.daq.vin_diff_v, dtype=np.float64)
-    if intended_input.ndim != 1 or len(intended_input) < 2:
+    daq = measurement.daq
+    sample_count = len(daq.dout)
+    if np.ndim(daq.vin_diff_v) != 1 or len(daq.vin_diff_v) < 2:
         raise ValueError("ADC ramp analysis requires at least two intended input samples")
-    vin_diff_min_v = float(np.min(intended_input))
-    vin_diff_max_v = float(np.max(intended_input))
-    if not vin_diff_max_v > vin_diff_min_v:
-        raise ValueError("ADC ramp input must span a nonzero differential range")
 
     nominal_weights_int = np.asarray(
         [2 * value for value in get_cdac_weights(params.dut.cdac)] + [1],
@@ -512,22 +645,8 @@ def analyze_adc_ramp(
     nominal_weights = nominal_weights_int.astype(np.float64)
     number_codes = 1 << params.dut.adc_bits
     code_max = number_codes - 1
-    if measurement.daq.bout.shape[1] != len(nominal_weights):
+    if len(nominal_weights) != ADC_BOUT_BITS:
         raise ValueError("ADC ramp decisions do not match the nominal CDAC weights")
-    decisions_int = np.asarray(measurement.daq.bout, dtype=np.int64)
-    nominal_raw = decisions_int @ nominal_weights_int
-    if not np.array_equal(nominal_raw, measurement.daq.dout_raw):
-        raise ValueError("stored ramp DOUT_RAW does not match BOUT decoded with the configured design weights")
-    expected_nominal_dout = np.rint(nominal_raw * code_max / np.sum(nominal_weights_int)).astype(np.int64)
-    if not np.array_equal(expected_nominal_dout, measurement.daq.dout):
-        raise ValueError("stored ramp DOUT does not match normalized DOUT_RAW")
-    nominal_decoded = np.asarray(measurement.daq.dout, dtype=np.int64)
-    if np.any((nominal_decoded < 0) | (nominal_decoded >= number_codes)):
-        raise ValueError(f"ADC ramp contains output codes outside 0..{number_codes - 1}")
-
-    decodings: list[tuple[AdcDecoding, str, np.ndarray, np.ndarray]] = [
-        ("uncalibrated_dout", "Uncalibrated DOUT", nominal_weights, nominal_decoded)
-    ]
     adc_index = (
         -1
         if not isinstance(measurement, MeasAdcExt) or measurement.param.observed_adc is None
@@ -539,16 +658,35 @@ def analyze_adc_ramp(
             raise ValueError(f"duplicate ADC calibration method {calibration.method!r}")
         observed_methods.add(calibration.method)
         _validate_calibration(measurement, calibration)
-        decodings.append(
-            (
-                calibration.method,
-                calibration.label,
-                calibration.calibrated_weights,
-                decode_bout(measurement.daq.bout, calibration),
-            )
+
+    # First pass: validate the stored codes, find the input span, and locate
+    # reset candidates, carrying the previous slice's last code across slices.
+    vin_diff_min_v = math.inf
+    vin_diff_max_v = -math.inf
+    previous_dout = np.asarray([], dtype=np.int64)
+    candidate_parts = []
+    for rows in _conversion_slices(sample_count, chunk_size):
+        intended_input = np.asarray(daq.vin_diff_v[rows], dtype=np.float64)
+        vin_diff_min_v = min(vin_diff_min_v, float(np.min(intended_input)))
+        vin_diff_max_v = max(vin_diff_max_v, float(np.max(intended_input)))
+        nominal_raw = decode_packed_bout(_bout_words(daq, rows), nominal_weights_int)
+        if not np.array_equal(nominal_raw, np.asarray(daq.dout_raw[rows])):
+            raise ValueError("stored ramp DOUT_RAW does not match BOUT decoded with the configured design weights")
+        expected_nominal_dout = np.rint(nominal_raw * code_max / np.sum(nominal_weights_int)).astype(np.int64)
+        nominal_decoded = np.asarray(daq.dout[rows], dtype=np.int64)
+        if not np.array_equal(expected_nominal_dout, nominal_decoded):
+            raise ValueError("stored ramp DOUT does not match normalized DOUT_RAW")
+        if np.any((nominal_decoded < 0) | (nominal_decoded >= number_codes)):
+            raise ValueError(f"ADC ramp contains output codes outside 0..{number_codes - 1}")
+        joined = np.concatenate((previous_dout, nominal_decoded))
+        candidate_parts.append(
+            np.flatnonzero(np.diff(joined) < -0.25 * code_max).astype(np.int64) + rows.start + 1 - len(previous_dout)
         )
+        previous_dout = nominal_decoded[-1:]
+    if not vin_diff_max_v > vin_diff_min_v:
+        raise ValueError("ADC ramp input must span a nonzero differential range")
 
-    reset_candidates = np.flatnonzero(np.diff(nominal_decoded) < -0.25 * code_max).astype(np.int64) + 1
+    reset_candidates = np.concatenate(candidate_parts)
     if len(reset_candidates):
         cluster_starts = np.concatenate(
             (
@@ -576,38 +714,60 @@ def analyze_adc_ramp(
     sample_rate_hz = _pattern_repeat_rate_hz(measurement)
     ramp_frequency_hz = sample_rate_hz / period_samples
     ramp_phase_cycles = float(np.mod(-first_reset_sample / period_samples, 1.0))
-    conversion_phase = np.mod(
-        (np.arange(len(nominal_decoded), dtype=np.float64) - first_reset_sample) / period_samples,
-        1.0,
-    )
-    retained = np.ones(len(nominal_decoded), dtype=bool)
-    for reset_index in reset_conversion_index:
-        retained[reset_index : reset_index + ADC_RAMP_RESET_EXCLUSION_CONVERSIONS] = False
-    retained_sample_count = int(np.count_nonzero(retained))
+
+    # Second pass: accumulate code histograms and phase-binned transfer sums
+    # of every decoding over the retained conversions.
+    decodings: list[tuple[AdcDecoding, str, np.ndarray, AnalysisAdcCalibration | None]] = [
+        ("uncalibrated_dout", "Uncalibrated DOUT", nominal_weights, None),
+        *((item.method, item.label, item.calibrated_weights, item) for item in calibrations),
+    ]
+    counts = np.zeros((len(decodings), number_codes), dtype=np.int64)
+    transfer_sum = np.zeros((len(decodings), number_codes), dtype=np.float64)
+    transfer_sample_count = np.zeros(number_codes, dtype=np.int64)
+    for rows in _conversion_slices(sample_count, chunk_size):
+        conversion_phase = np.mod(
+            (np.arange(rows.start, rows.stop, dtype=np.float64) - first_reset_sample) / period_samples,
+            1.0,
+        )
+        retained = np.ones(rows.stop - rows.start, dtype=bool)
+        nearby = (reset_conversion_index < rows.stop) & (
+            reset_conversion_index + ADC_RAMP_RESET_EXCLUSION_CONVERSIONS > rows.start
+        )
+        for reset_index in reset_conversion_index[nearby]:
+            start = max(int(reset_index), rows.start)
+            stop = min(int(reset_index) + ADC_RAMP_RESET_EXCLUSION_CONVERSIONS, rows.stop)
+            retained[start - rows.start : stop - rows.start] = False
+        transfer_bin = np.minimum((conversion_phase * number_codes).astype(np.int64), number_codes - 1)[retained]
+        transfer_sample_count += np.bincount(transfer_bin, minlength=number_codes)
+        words = None if not calibrations else _bout_words(daq, rows)[retained]
+        for index, (_decoding, _label, _weights, calibration) in enumerate(decodings):
+            decoded = (
+                np.asarray(daq.dout[rows], dtype=np.int64)[retained]
+                if calibration is None
+                else decode_bout(words, calibration)
+            )
+            counts[index] += np.bincount(decoded, minlength=number_codes)
+            transfer_sum[index] += np.bincount(transfer_bin, weights=decoded, minlength=number_codes)
+    retained_sample_count = int(np.sum(transfer_sample_count))
 
     first_code, last_code = code_range or (1, number_codes - 2)
-    transfer_bin = np.minimum((conversion_phase * number_codes).astype(np.int64), number_codes - 1)
-    transfer_sample_count = np.bincount(transfer_bin[retained], minlength=number_codes).astype(np.int64)
     populated = transfer_sample_count > 0
     transfer_vin_diff_v = vin_diff_min_v + (
         (np.arange(number_codes, dtype=np.float64) + 0.5) / number_codes * (vin_diff_max_v - vin_diff_min_v)
     )
     curves = []
-    for decoding, label, weights, decoded in decodings:
-        counts = np.bincount(decoded[retained], minlength=number_codes).astype(np.int64)
-        density = histogram_inl_dnl(counts, first_code=first_code, last_code=last_code)
-        transfer_sum = np.bincount(transfer_bin[retained], weights=decoded[retained], minlength=number_codes)
-        transfer_mean_dout = transfer_sum[populated] / transfer_sample_count[populated]
+    for index, (decoding, label, weights, _calibration) in enumerate(decodings):
+        density = histogram_inl_dnl(counts[index], first_code=first_code, last_code=last_code)
         curves.append(
             AnalysisAdcRampCurve(
                 decoding=decoding,
                 label=label,
                 weights=weights,
                 transfer_vin_diff_v=transfer_vin_diff_v[populated],
-                transfer_mean_dout=transfer_mean_dout,
+                transfer_mean_dout=transfer_sum[index, populated] / transfer_sample_count[populated],
                 transfer_sample_count=transfer_sample_count[populated],
                 code=np.arange(number_codes, dtype=np.int64),
-                count=counts,
+                count=counts[index],
                 linearity_code=density["codes"],
                 dnl=density["dnl"],
                 inl=density["inl"],
@@ -616,7 +776,7 @@ def analyze_adc_ramp(
         )
     return AnalysisAdcRamp(
         adc_index=adc_index,
-        sample_count=len(nominal_decoded),
+        sample_count=sample_count,
         retained_sample_count=retained_sample_count,
         sample_rate_hz=sample_rate_hz,
         ramp_frequency_hz=ramp_frequency_hz,
@@ -628,12 +788,18 @@ def analyze_adc_ramp(
     )
 
 
+@cached_analysis
 def analyze_adc_code_distribution(
     measurements: Sequence[MeasAdc],
     *,
     calibration: AnalysisAdcCalibration | None = None,
+    chunk_size: int | None = None,
 ) -> AnalysisAdcCodeDistribution:
-    """Calculate code histograms with optional calibrated BOUT decoding."""
+    """Calculate code histograms with optional calibrated BOUT decoding.
+
+    ``chunk_size`` accumulates each measurement over consecutive DAQ slices,
+    as in :func:`analyze_adc_ramp`.
+    """
 
     if not measurements:
         raise ValueError("ADC code-distribution analysis requires at least one measurement")
@@ -647,22 +813,33 @@ def analyze_adc_code_distribution(
     if calibration is not None:
         for measurement in measurements:
             _validate_calibration(measurement, calibration)
-    inputs = np.concatenate([measurement.daq.vin_diff_v for measurement in measurements])
-    dout = np.concatenate(
-        [
-            measurement.daq.dout if calibration is None else decode_bout(measurement.daq.bout, calibration)
-            for measurement in measurements
-        ]
-    )
-    unique_inputs, inverse = np.unique(inputs, return_inverse=True)
     number_codes = 1 << adc_bits
-    count = np.zeros((len(unique_inputs), number_codes), dtype=np.int64)
-    for index in range(len(unique_inputs)):
-        values = dout[inverse == index]
-        valid = values[(values >= 0) & (values < number_codes)]
-        if not len(valid):
-            raise ValueError(f"input point {unique_inputs[index]:g} V has no valid ADC codes")
-        count[index] = np.bincount(valid, minlength=number_codes)
+    unique_inputs = np.asarray([], dtype=np.float64)
+    count = np.zeros((0, number_codes), dtype=np.int64)
+    for measurement in measurements:
+        for rows in _conversion_slices(len(measurement.daq.dout), chunk_size):
+            dout = (
+                np.asarray(measurement.daq.dout[rows], dtype=np.int64)
+                if calibration is None
+                else decode_bout(_bout_words(measurement.daq, rows), calibration)
+            )
+            chunk_inputs, inverse = np.unique(
+                np.asarray(measurement.daq.vin_diff_v[rows], dtype=np.float64),
+                return_inverse=True,
+            )
+            valid = (dout >= 0) & (dout < number_codes)
+            chunk_count = np.bincount(
+                inverse[valid] * number_codes + dout[valid],
+                minlength=len(chunk_inputs) * number_codes,
+            ).reshape(len(chunk_inputs), number_codes)
+            merged_inputs = np.union1d(unique_inputs, chunk_inputs)
+            merged_count = np.zeros((len(merged_inputs), number_codes), dtype=np.int64)
+            merged_count[np.searchsorted(merged_inputs, unique_inputs)] += count
+            merged_count[np.searchsorted(merged_inputs, chunk_inputs)] += chunk_count
+            unique_inputs, count = merged_inputs, merged_count
+    empty = np.flatnonzero(np.sum(count, axis=1) == 0)
+    if len(empty):
+        raise ValueError(f"input point {unique_inputs[empty[0]]:g} V has no valid ADC codes")
     return AnalysisAdcCodeDistribution(
         vin_diff_v=unique_inputs,
         code=np.arange(number_codes, dtype=np.int64),
@@ -670,10 +847,18 @@ def analyze_adc_code_distribution(
     )
 
 
+@cached_analysis
 def analyze_adc_noise_sweep(
     measurements: Sequence[MeasAdc],
+    *,
+    chunk_size: int | None = None,
 ) -> AnalysisAdcNoiseSweep:
-    """Combine fixed-input code variation across conversion timing settings."""
+    """Combine fixed-input code variation across conversion timing settings.
+
+    Each point's code spread is taken from its code histogram, which
+    ``chunk_size`` accumulates over consecutive DAQ slices as in
+    :func:`analyze_adc_ramp`.
+    """
 
     if not measurements:
         raise ValueError("ADC noise sweep requires at least one measurement")
@@ -720,7 +905,6 @@ def analyze_adc_noise_sweep(
         sample_rate_hz.append(_active_conversion_rate_hz(measurement))
         logic_phase.append(phase)
         comparator_percent.append(50.0 + 12.5 * phase)
-        std_dout.append(float(np.std(measurement.daq.dout)))
         pretrigger = measurement.wave.time_s < 0.0
         if np.any(pretrigger):
             quiet_input = measurement.wave.vin_diff_v[:, pretrigger]
@@ -732,10 +916,16 @@ def analyze_adc_noise_sweep(
             pretrigger_vin_diff_mean_v.append(float("nan"))
             pretrigger_vin_diff_noise_rms_v.append(float("nan"))
         bit_mismatches.append(int(measurement.info.readbacks.get("scope_fastrx_bit_mismatches", 0)))
-        valid_dout = measurement.daq.dout[(measurement.daq.dout >= 0) & (measurement.daq.dout < number_codes)]
-        if len(valid_dout) != len(measurement.daq.dout):
-            raise ValueError("ADC noise sweep contains output codes outside its resolution")
-        counts.append(np.bincount(valid_dout, minlength=number_codes))
+        count = np.zeros(number_codes, dtype=np.int64)
+        for rows in _conversion_slices(len(measurement.daq.dout), chunk_size):
+            dout = np.asarray(measurement.daq.dout[rows], dtype=np.int64)
+            if np.any((dout < 0) | (dout >= number_codes)):
+                raise ValueError("ADC noise sweep contains output codes outside its resolution")
+            count += np.bincount(dout, minlength=number_codes)
+        code = np.arange(number_codes, dtype=np.float64)
+        mean_dout = float(np.dot(count, code) / np.sum(count))
+        std_dout.append(math.sqrt(float(np.dot(count, np.square(code - mean_dout)) / np.sum(count))))
+        counts.append(count)
     sample_rate_hz_array = np.asarray(sample_rate_hz)
     comparator_percent_array = np.asarray(comparator_percent)
     std_dout_array = np.asarray(std_dout)
@@ -829,23 +1019,20 @@ def combine_adc_noise_comparison(
     )
 
 
-def analyze_adc_decision_paths(
+def _decision_path_setup(
     measurement: MeasAdc,
     *,
-    selection: AdcDecisionSelection = "single",
-    row_index: int = 0,
-    selected_dout: int | None = None,
-) -> AnalysisAdcDecisionPaths:
-    """Reconstruct running SAR estimates from captured comparator decisions."""
+    selection: AdcDecisionSelection,
+    row_index: int,
+    selected_dout: int | None,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Return selected conversion rows, raw decision weights, and the normalized code maximum."""
 
     params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
     cap_weights = get_cdac_weights(params.dut.cdac)
     weights = np.asarray([2 * weight for weight in cap_weights] + [1], dtype=np.float64)
-    if measurement.daq.bout.shape[1] != len(weights):
-        raise ValueError(
-            f"ADC measurement has {measurement.daq.bout.shape[1]} decisions, "
-            f"but its CDAC defines {len(weights)} weights"
-        )
+    if len(weights) != ADC_BOUT_BITS:
+        raise ValueError(f"ADC measurement has {ADC_BOUT_BITS} decisions, but its CDAC defines {len(weights)} weights")
     indices = np.arange(len(measurement.daq.dout), dtype=np.int64)
     if selection == "single":
         if not 0 <= row_index < len(indices):
@@ -859,36 +1046,128 @@ def analyze_adc_decision_paths(
         selected = indices
     else:
         raise ValueError("decision-path selection must be 'single', 'same_dout', or 'all'")
+    return selected, weights, (1 << params.dut.adc_bits) - 1
+
+
+def _running_estimates(bout: np.ndarray, weights: np.ndarray, normalized_code_max: int) -> np.ndarray:
+    """Return the ``(N, decisions + 1)`` running SAR estimate before and after each decision."""
 
-    normalized_code_max = (1 << params.dut.adc_bits) - 1
     raw_code_max = float(np.sum(weights))
-    paths = np.empty((len(selected), len(weights) + 1), dtype=np.float64)
+    paths = np.empty((len(bout), len(weights) + 1), dtype=np.float64)
     paths[:, 0] = normalized_code_max / 2.0
-    for row, conversion in enumerate(selected):
-        decided = 0.0
-        remaining = float(np.sum(weights))
-        for cycle, (bit, weight) in enumerate(
-            zip(measurement.daq.bout[conversion], weights, strict=True),
-            start=1,
-        ):
-            decided += bit * weight
-            remaining -= weight
-            paths[row, cycle] = (decided + 0.5 * remaining) * normalized_code_max / raw_code_max
+    # Accumulate in decision order so every estimate matches the sequential sum.
+    decided = np.cumsum(bout * weights, axis=1)
+    remaining = np.cumsum(np.concatenate(([raw_code_max], -weights)))[1:]
+    paths[:, 1:] = (decided + 0.5 * remaining) * normalized_code_max / raw_code_max
+    return paths
+
+
+@cached_analysis
+def analyze_adc_decision_paths(
+    measurement: MeasAdc,
+    *,
+    selection: AdcDecisionSelection = "single",
+    row_index: int = 0,
+    selected_dout: int | None = None,
+) -> AnalysisAdcDecisionPaths:
+    """Reconstruct running SAR estimates from captured comparator decisions."""
+
+    selected, weights, normalized_code_max = _decision_path_setup(
+        measurement,
+        selection=selection,
+        row_index=row_index,
+        selected_dout=selected_dout,
+    )
+    # Expand only the selected conversions when BOUT is stored packed.
+    bout = np.asarray(measurement.daq.bout)[selected]
+    if bout.ndim == 1:
+        bout = unpack_bout(bout, ADC_BOUT_BITS)
     return AnalysisAdcDecisionPaths(
         selection=selection,
         conversion_index=measurement.daq.conversion_index[selected],
         final_dout=measurement.daq.dout[selected],
-        bout=measurement.daq.bout[selected],
+        bout=bout,
         weights=weights,
-        estimate_dout=paths,
+        estimate_dout=_running_estimates(bout, weights, normalized_code_max),
+    )
+
+
+@cached_analysis
+def analyze_adc_decision_path_histogram(
+    measurement: MeasAdc,
+    *,
+    selection: AdcDecisionSelection = "all",
+    row_index: int = 0,
+    selected_dout: int | None = None,
+    chunk_size: int = 65_536,
+) -> AnalysisAdcDecisionPathHistogram:
+    """Count running SAR estimates by decision cycle and nearest code.
+
+    Equivalent to binning ``analyze_adc_decision_paths().estimate_dout``, but
+    each chunk reads and expands at most ``chunk_size`` consecutive
+    conversions, so neither the stored BOUT nor the full path array is ever
+    materialized, however sparse the selection.
+    """
+
+    selected, weights, normalized_code_max = _decision_path_setup(
+        measurement,
+        selection=selection,
+        row_index=row_index,
+        selected_dout=selected_dout,
+    )
+    if not len(selected):
+        raise ValueError("ADC decision paths require at least one conversion")
+    code_total = normalized_code_max + 1
+    cycle_total = len(weights) + 1
+    code_count = np.zeros(cycle_total * code_total, dtype=np.int64)
+    cycle_offset = np.arange(cycle_total, dtype=np.int64) * code_total
+    transition_keys = []
+    transition_counts = []
+    final_estimate = np.empty(len(selected), dtype=np.float64)
+    final_dout_sum = 0.0
+    for chunk in _selected_row_slices(selected, chunk_size):
+        rows = selected[chunk]
+        span = slice(int(rows[0]), int(rows[-1]) + 1)
+        offsets = rows - rows[0]
+        bout = unpack_bout(_bout_words(measurement.daq, span)[offsets], ADC_BOUT_BITS)
+        paths = _running_estimates(bout, weights, normalized_code_max)
+        codes = np.floor(paths + 0.5).astype(np.int64)
+        code_count += np.bincount((codes + cycle_offset).ravel(), minlength=len(code_count))
+        # Consecutive estimates always differ by half a decision weight, so
+        # every (cycle, source, destination) triple is a drawn transition.
+        keys, counts = np.unique(
+            ((cycle_offset[1:] + codes[:, :-1]) * code_total + codes[:, 1:]).ravel(),
+            return_counts=True,
+        )
+        transition_keys.append(keys)
+        transition_counts.append(counts)
+        final_estimate[chunk] = paths[:, -1]
+        final_dout_sum += float(np.sum(np.asarray(measurement.daq.dout[span])[offsets]))
+    keys, inverse = np.unique(np.concatenate(transition_keys), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(transition_counts)).astype(np.int64)
+    source_key, destination_code = np.divmod(keys, code_total)
+    transition_cycle, source_code = np.divmod(source_key, code_total)
+    return AnalysisAdcDecisionPathHistogram(
+        selection=selection,
+        conversion_count=len(selected),
+        code_count=code_count.reshape(cycle_total, code_total),
+        transition_cycle=transition_cycle,
+        transition_source_code=source_code,
+        transition_destination_code=destination_code,
+        transition_count=counts,
+        final_estimate_mean_dout=float(np.mean(final_estimate)),
+        final_estimate_std_dout=float(np.std(final_estimate)),
+        final_dout_mean=final_dout_sum / len(selected),
     )
 
 
+@cached_analysis
 def analyze_adc_dynamic_sweep(
     measurements: Sequence[MeasAdc],
     *,
     frequency_search_fraction: float = 0.02,
     maximum_harmonic_order: int = 5,
+    sine_fit: AdcSineFitMethod = "newton",
 ) -> AnalysisAdcDynamicSweep:
     """Analyze and combine sine acquisitions into dynamic trend arrays."""
 
@@ -897,6 +1176,7 @@ def analyze_adc_dynamic_sweep(
             measurement,
             frequency_search_fraction=frequency_search_fraction,
             maximum_harmonic_order=maximum_harmonic_order,
+            sine_fit=sine_fit,
         )
         for measurement in measurements
     ]
@@ -949,6 +1229,79 @@ def analyze_adc_dynamic_sweep(
     )
 
 
+@cached_analysis
+def analyze_adc_spectra(
+    measurements: Sequence[MeasAdc],
+    *,
+    mode: AdcSpectrumMode = "windowed",
+    maximum_harmonic_order: int = 5,
+) -> AnalysisAdcSpectra:
+    """Calculate spectral figures of merit for equal-length sine records in one pass.
+
+    Unlike ``analyze_adc_dynamic()``, no frequency search is made: each tone
+    is located at its programmed frequency, each record's offset comes from
+    one batched three-parameter fit there, and the whole stack shares one
+    FFT. ``"coherent"`` requires an integer number of input cycles per
+    record, and ``"averaged"`` requires one common tone and returns a single
+    averaged row.
+    """
+
+    if not measurements:
+        raise ValueError("ADC spectra require at least one measurement")
+    if mode not in ("windowed", "coherent", "averaged"):
+        raise ValueError("ADC spectrum mode must be 'windowed', 'coherent', or 'averaged'")
+    if maximum_harmonic_order < 2:
+        raise ValueError("maximum_harmonic_order must be at least two")
+    params = [
+        measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
+        for measurement in measurements
+    ]
+    sample_rates_hz = {_pattern_repeat_rate_hz(measurement) for measurement in measurements}
+    adc_bits = {param.dut.adc_bits for param in params}
+    if len(sample_rates_hz) != 1 or len(adc_bits) != 1:
+        raise ValueError("ADC spectra require one common sample rate and resolution")
+    if len({len(measurement.daq.dout) for measurement in measurements}) != 1:
+        raise ValueError("ADC spectra require equal-length records")
+    sample_rate_hz = sample_rates_hz.pop()
+    measured_dout = np.stack([np.asarray(measurement.daq.dout, dtype=np.float64) for measurement in measurements])
+    input_frequency_hz = np.asarray([_input_frequency_hz(measurement) for measurement in measurements])
+    if measured_dout.shape[1] < 8:
+        raise ValueError("ADC spectra require at least eight samples per record")
+    if np.any(input_frequency_hz <= 0.0) or np.any(input_frequency_hz >= sample_rate_hz / 2.0):
+        raise ValueError("input_frequency_hz must be between zero and Nyquist")
+    cycles = input_frequency_hz * measured_dout.shape[1] / sample_rate_hz
+    if mode == "coherent" and np.any(np.abs(cycles - np.rint(cycles)) > 1e-6):
+        raise ValueError("coherent ADC spectra require an integer number of input cycles per record")
+    if mode == "averaged" and np.any(input_frequency_hz != input_frequency_hz[0]):
+        raise ValueError("averaged ADC spectra require one common input frequency")
+    sndr_db, snr_db, thd_db, sfdr_db, enob_bits, frequency_hz, spectrum_dbfs = _calculate_adc_spectra(
+        measured_dout,
+        sample_rate_hz=sample_rate_hz,
+        fitted_frequency_hz=input_frequency_hz,
+        offset_dout=fit_sine_three_parameter(
+            measured_dout,
+            np.arange(measured_dout.shape[1]) / sample_rate_hz,
+            input_frequency_hz,
+        )[:, 2],
+        full_scale_peak_dout=((1 << adc_bits.pop()) - 1) / 2.0,
+        maximum_harmonic_order=maximum_harmonic_order,
+        mode=mode,
+    )
+    return AnalysisAdcSpectra(
+        mode=mode,
+        sample_rate_hz=sample_rate_hz,
+        input_frequency_hz=input_frequency_hz[: len(sndr_db)],
+        spectral_sndr_db=sndr_db,
+        spectral_snr_db=snr_db,
+        spectral_thd_db=thd_db,
+        spectral_sfdr_db=sfdr_db,
+        spectral_enob_bits=enob_bits,
+        spectrum_frequency_hz=frequency_hz,
+        spectrum_dbfs=spectrum_dbfs,
+    )
+
+
+@cached_analysis
 def analyze_adc_power_sweep(measurements: Sequence[MeasAdc]) -> AnalysisAdcPowerSweep:
     """Separate active power into static-baseline and incremental parts.
 
@@ -1068,6 +1421,7 @@ def analyze_adc_power_sweep(measurements: Sequence[MeasAdc]) -> AnalysisAdcPower
     )
 
 
+@cached_analysis
 def analyze_adc_power_waveform(measurement: MeasAdcInt) -> AnalysisAdcPowerWaveform:
     """Select and align one simulated conversion for detailed power plotting."""
 
@@ -0,0 +1,229 @@
+"""Manually invoked throughput benchmarks for the analysis layer.
+
+Run one named benchmark from the repository root with:
+
+    uv run python -m flow.analysis.benchmark storage_profiles
+    uv run python -m flow.analysis.benchmark sine_fit
+    uv run python -m flow.analysis.benchmark behavioral_conversion
+
+Benchmarks write only into a temporary directory and print one plain-text
+table; they are not collected by pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+import hdl21 as h
+import numpy as np
+
+from flow.adc.behavioral import SAR_ADC
+from flow.adc.sim import AdcTbParams
+from flow.analysis.adc import analyze_adc_dynamic
+from flow.analysis.io import STORAGE_PROFILES, read_measurement, write_measurement
+from flow.analysis.types import AdcDaq, AdcExtWave, MeasAdcExt, MeasInfo
+from flow.scans.params import AdcScanParams
+from flow.scans.scan_behavioral import build_frida_params
+
+
+def synthetic_adc_measurement(conversions: int, *, wave_samples: int = 12_500, seed: int = 0) -> MeasAdcExt:
+    """Return one physical-shaped external ADC measurement with random decisions."""
+
+    rng = np.random.default_rng(seed)
+    bout = rng.integers(0, 2, size=(conversions, 17), dtype=np.uint8)
+    weights = 2 ** np.arange(16, -1, -1, dtype=np.int64)
+    dout = bout.astype(np.int64) @ weights >> 5
+    vin_diff_v = np.linspace(-0.75, 0.75, conversions)
+    time_s = np.arange(wave_samples, dtype=np.float64) * 0.4e-9
+    record = np.sin(2.0 * np.pi * time_s / time_s[-1])[None, :]
+    return MeasAdcExt(
+        info=MeasInfo(
+            schema_version=2,
+            measurement_type="MeasAdcExt",
+            backend="physical",
+            timestamp_utc=datetime(2026, 8, 12, tzinfo=UTC),
+        ),
+        param=AdcScanParams(
+            tb=AdcTbParams(view="frida65a", conversions=conversions),
+            board_id="00",
+            observed_adc=0,
+            active_adc_mask=(0,) * 15 + (1,),
+        ),
+        daq=AdcDaq(
+            conversion_index=np.arange(conversions, dtype=np.int64),
+            bout=bout,
+            dout_raw=dout,
+            dout=dout,
+            vin_diff_v=vin_diff_v,
+            fastrx_word=rng.integers(0, 2**32, size=conversions, dtype=np.uint32),
+        ),
+        wave=AdcExtWave(
+            conversion_index=np.asarray([0], dtype=np.int64),
+            time_s=time_s,
+            vin_diff_v=record,
+            seq_comp_v=record,
+            seq_logic_v=record,
+            comp_out_v=record,
+        ),
+    )
+
+
+def synthetic_adc_sine_measurement(
+    samples: int,
+    *,
+    sample_rate_hz: float = 10.0e6,
+    input_frequency_hz: float = 1.234e6,
+    seed: int = 0,
+) -> MeasAdcExt:
+    """Return one coherent-ish noisy sine capture with a small second harmonic."""
+
+    rng = np.random.default_rng(seed)
+    measurement = synthetic_adc_measurement(samples, wave_samples=8, seed=seed)
+    # Offset the actual tone from the programmed one so the frequency search has work to do.
+    time_s = np.arange(samples, dtype=np.float64) / sample_rate_hz
+    phase = 2.0 * np.pi * (input_frequency_hz + 0.2 * sample_rate_hz / samples) * time_s + 0.3
+    dout = np.clip(
+        np.rint(2047.5 + 1_900.0 * np.sin(phase) + 4.0 * np.sin(2.0 * phase) + rng.normal(0.0, 0.6, samples)),
+        0,
+        4095,
+    ).astype(np.int64)
+    tb = measurement.param.tb
+    return replace(
+        measurement,
+        param=replace(
+            measurement.param,
+            tb=replace(
+                tb,
+                symbol_rate=sample_rate_hz * len(tb.seq_init_pattern),
+                vin_diff=h.Vsin.Params(voff=0.0, vamp=0.5, freq=input_frequency_hz),
+            ),
+        ),
+        daq=replace(measurement.daq, dout_raw=dout, dout=dout),
+    )
+
+
+def sine_fit(samples: int = 65_536, records: int = 8, repeats: int = 3) -> None:
+    """Compare the Gauss-Newton and bounded-search sine fits of analyze_adc_dynamic."""
+
+    measurements = [synthetic_adc_sine_measurement(samples, seed=seed) for seed in range(records)]
+    results = {}
+    print(f"{'method':>15} {'samples':>8} {'ms/record':>10} {'mean SNDR dB':>13} {'mean ENOB':>10}")
+    for method in ("bounded_search", "newton"):
+        elapsed_s = []
+        for _ in range(repeats):
+            start = perf_counter()
+            results[method] = [analyze_adc_dynamic(measurement, sine_fit=method) for measurement in measurements]
+            elapsed_s.append(perf_counter() - start)
+        print(
+            f"{method:>15} {samples:>8,} {1e3 * min(elapsed_s) / records:>10.2f} "
+            f"{np.mean([result.spectral_sndr_db for result in results[method]]):>13.6f} "
+            f"{np.mean([result.spectral_enob_bits for result in results[method]]):>10.6f}"
+        )
+    sndr_delta_db = max(
+        abs(newton.spectral_sndr_db - search.spectral_sndr_db)
+        for newton, search in zip(results["newton"], results["bounded_search"], strict=True)
+    )
+    print(f"maximum |SNDR difference| {sndr_delta_db:.3g} dB")
+
+
+def storage_profiles(conversions: tuple[int, ...] = (100_000, 4_000_000), repeats: int = 3) -> None:
+    """Report write/read throughput and file size for every storage profile."""
+
+    print(f"{'profile':>10} {'conversions':>12} {'write MB/s':>11} {'read MB/s':>10} {'file MB':>8} {'ratio':>6}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in conversions:
+            measurement = synthetic_adc_measurement(count)
+            logical_bytes = sum(
+                getattr(section, name).nbytes
+                for section in (measurement.daq, measurement.wave)
+                for name in section.__dataclass_fields__
+                if getattr(section, name) is not None
+            )
+            for profile in STORAGE_PROFILES:
+                path = Path(directory) / f"{profile}_{count}.h5"
+                write_s = []
+                read_s = []
+                for _ in range(repeats):
+                    start = perf_counter()
+                    write_measurement(path, measurement, profile=profile)
+                    write_s.append(perf_counter() - start)
+                    start = perf_counter()
+                    read_measurement(path)
+                    read_s.append(perf_counter() - start)
+                file_bytes = path.stat().st_size
+                print(
+                    f"{profile:>10} {count:>12,} {logical_bytes / min(write_s) / 1e6:>11.1f} "
+                    f"{logical_bytes / min(read_s) / 1e6:>10.1f} {file_bytes / 1e6:>8.1f} "
+                    f"{logical_bytes / file_bytes:>6.2f}"
+                )
+
+
+def behavioral_conversion(conversions: tuple[int, ...] = (1_000, 10_000), repeats: int = 3) -> None:
+    """Compare scalar and batched behavioral SAR conversions of one noisy input ramp."""
+
+    params = build_frida_params()
+    params["COMP"]["threshold_voltage_noise"] = 0.5e-3
+    params["CDAC"]["reference_voltage_noise"] = 0.2e-3
+    params["CDAC"]["settling_time"] = 20e-12
+    print(f"{'conversions':>12} {'scalar ms':>10} {'batch ms':>9} {'speedup':>8} {'identical':>10}")
+    for count in conversions:
+        vin_diff_v = np.linspace(-0.75, 0.75, count)
+        vin_p = 0.6 + vin_diff_v / 2.0
+        vin_n = 0.6 - vin_diff_v / 2.0
+        np.random.seed(0)
+        adc = SAR_ADC(params)
+        rng_state = np.random.get_state()
+        scalar_s = []
+        batch_s = []
+        for _ in range(repeats):
+            np.random.set_state(rng_state)
+            start = perf_counter()
+            scalar_bout = np.empty((count, adc.cycles), dtype=np.uint8)
+            scalar_energy = np.empty(count)
+            for index in range(count):
+                adc.sample_and_convert(vin_p[index], vin_n[index], do_calculate_energy=True)
+                scalar_bout[index] = adc.comp_result
+                scalar_energy[index] = adc.conversion_energy
+            scalar_s.append(perf_counter() - start)
+            np.random.set_state(rng_state)
+            start = perf_counter()
+            bout, _codes, energy = adc.sample_and_convert_batch(vin_p, vin_n, do_calculate_energy=True)
+            batch_s.append(perf_counter() - start)
+        identical = np.array_equal(bout, scalar_bout) and np.array_equal(energy, scalar_energy)
+        print(
+            f"{count:>12,} {1e3 * min(scalar_s):>10.1f} {1e3 * min(batch_s):>9.1f} "
+            f"{min(scalar_s) / min(batch_s):>8.1f} {identical!s:>10}"
+        )
+
+
+BENCHMARKS: dict[str, Callable[[], None]] = {
+    benchmark.__name__: benchmark for benchmark in (behavioral_conversion, sine_fit, storage_profiles)
+}
+
+
+def main() -> None:
+    """Run one named benchmark, or every benchmark when none is named."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "benchmark",
+        nargs="?",
+        choices=sorted(BENCHMARKS),
+        help="benchmark function to run; omit to run all benchmarks",
+    )
+    args = parser.parse_args()
+    for name in (args.benchmark,) if args.benchmark else tuple(BENCHMARKS):
+        print(f"== {name}")
+        start_time = perf_counter()
+        BENCHMARKS[name]()
+        print(f"Completed {name} in {perf_counter() - start_time:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
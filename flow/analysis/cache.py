@@ -0,0 +1,275 @@
+"""Content-addressed cache of analysis results across runner invocations.
+
+Inside ``with analysis_cache(directory)``, each call of a function decorated
+with :func:`cached_analysis` is keyed by the function's qualified name, a
+checksum of every argument value (measurement arrays, parameters, and prior
+analyses included), and a hash of the analysis source code. A hit reads the
+typed result back from HDF5; a miss computes and stores it. Outside such a
+block the decorated functions run unchanged.
+
+Arguments are hashed by content rather than by file path and modification
+time, so a measurement filtered or rebuilt in memory never reuses a result
+computed from different arrays. A :class:`LazyDataset` is instead
+identified by its source file's size and modification time, dataset name,
+shape, and dtype, so looking up a lazy capture never reads it. Calls made while another cached analysis is
+computing run uncached; only the outermost result is stored.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import inspect
+import os
+import threading
+import warnings
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+import h5py
+import numpy as np
+
+from flow.analysis.io import LazyDataset, read_analysis, write_analysis
+
+# Least recently used entries are evicted once the cache directory exceeds
+# this many bytes.
+DEFAULT_CACHE_SIZE_BYTES = 4 << 30
+# Arguments that select how a result is computed, never what it is.
+RESULT_INDEPENDENT_ARGUMENTS = frozenset({"workers"})
+ANALYSIS_SOURCE_EXCLUDED = frozenset({"benchmark.py", "plots.py", "runner.py"})
+# Files outside flow/analysis whose contents analyses read: the CDAC weights
+# and the physical board map with its parameter loader.
+ANALYSIS_DEPENDENCY_SOURCES = ("cdac/__init__.py", "cdac/subckt.py", "scans/params.py", "scans/map_board.yaml")
+
+
+def analysis_code_version() -> str:
+    """Hash the analysis sources and their inputs so editing any invalidates the cache."""
+
+    analysis_directory = Path(__file__).resolve().parent
+    sources = [
+        (path.name, path)
+        for path in sorted(analysis_directory.glob("*.py"))
+        if not path.name.startswith("test_") and path.name not in ANALYSIS_SOURCE_EXCLUDED
+    ]
+    sources.extend((str(name), analysis_directory.parent / name) for name in ANALYSIS_DEPENDENCY_SOURCES)
+    digest = hashlib.sha256()
+    for name, path in sources:
+        digest.update(name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _update_fingerprint(digest, value) -> None:
+    """Feed one argument value, recursively and type-tagged, into ``digest``."""
+
+    if isinstance(value, LazyDataset):
+        stat = value.path.stat()
+        digest.update(
+            f"lazy:{value.path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:"
+            f"{value.name}:{value.dtype.str}:{value.shape}".encode()
+        )
+    elif isinstance(value, np.ndarray) or hasattr(value, "__array__"):
+        array = np.asarray(value)
+        digest.update(f"ndarray:{array.dtype.str}:{array.shape}".encode())
+        if array.dtype.kind == "O":
+            digest.update(repr(array.tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(array).view(np.uint8).data)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        digest.update(f"dataclass:{type(value).__module__}:{type(value).__qualname__}".encode())
+        for data_field in dataclasses.fields(value):
+            digest.update(data_field.name.encode())
+            _update_fingerprint(digest, getattr(value, data_field.name))
+    elif isinstance(value, Mapping):
+        digest.update(f"mapping:{len(value)}".encode())
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode())
+            _update_fingerprint(digest, value[key])
+    elif isinstance(value, (tuple, list)):
+        digest.update(f"{type(value).__name__}:{len(value)}".encode())
+        for item in value:
+            _update_fingerprint(digest, item)
+    elif callable(value):
+        digest.update(f"callable:{value.__module__}:{value.__qualname__}".encode())
+    elif hasattr(value, "__dict__"):
+        digest.update(f"object:{type(value).__module__}:{type(value).__qualname__}".encode())
+        _update_fingerprint(digest, vars(value))
+    else:
+        digest.update(f"{type(value).__qualname__}:{value!r}".encode())
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisCacheStats:
+    """Lookups and stored size of one cache since it was opened."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entry_count: int
+    size_bytes: int
+    saved_s: float
+
+
+class AnalysisCache:
+    """Typed HDF5 results beneath ``directory``, one file per key.
+
+    Every hit refreshes its entry's modification time, and each store evicts
+    the least recently used entries until the directory fits ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_SIZE_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("analysis cache max_bytes must be non-negative")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.code_version = analysis_code_version()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_s = 0.0
+        self._lock = threading.Lock()
+
+    def key(self, function_name: str, arguments: Mapping[str, object]) -> str:
+        """Return the entry name of one call."""
+
+        digest = hashlib.sha256()
+        digest.update(f"{self.code_version}:{function_name}".encode())
+        _update_fingerprint(digest, dict(arguments))
+        return digest.hexdigest()
+
+    def lookup(self, key: str):
+        """Return the stored result of ``key``, or ``None`` on a miss."""
+
+        path = self.directory / f"{key}.h5"
+        try:
+            result = read_analysis(path)
+            compute_s = self._compute_s(path)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (AttributeError, ImportError, KeyError, OSError, TypeError, ValueError):
+            # A truncated or stale-schema entry is recomputed and replaced.
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self.saved_s += compute_s
+        return result
+
+    def store(self, key: str, function_name: str, result, compute_s: float) -> None:
+        """Write one computed result and evict old entries beyond the size limit.
+
+        A failed write only warns: the result is already computed, and the
+        next call simply misses again.
+        """
+
+        try:
+            path = write_analysis(
+                self.directory / f"{key}.h5",
+                result,
+                attrs={"function": function_name, "code_version": self.code_version, "compute_s": compute_s},
+            )
+        except OSError as error:
+            warnings.warn(f"could not cache {function_name} in {self.directory}: {error}", RuntimeWarning, stacklevel=3)
+            return
+        with self._lock:
+            self._evict(keep=path)
+
+    def stats(self) -> AnalysisCacheStats:
+        """Return the lookup counters and the current size on disk."""
+
+        entries = self._entries()
+        return AnalysisCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entry_count=len(entries),
+            size_bytes=sum(stat.st_size for _path, stat in entries),
+            saved_s=self.saved_s,
+        )
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        if not self.directory.is_dir():
+            return []
+        return [(path, path.stat()) for path in self.directory.glob("*.h5")]
+
+    def _compute_s(self, path: Path) -> float:
+        with h5py.File(path, "r") as entry:
+            return float(entry.attrs.get("compute_s", 0.0))
+
+    def _evict(self, *, keep: Path) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size_bytes = sum(stat.st_size for _path, stat in entries)
+        for path, stat in entries:
+            if size_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            size_bytes -= stat.st_size
+            self.evictions += 1
+
+
+_ACTIVE_ANALYSIS_CACHE: AnalysisCache | None = None
+# Set while this thread computes a cached analysis, so nested calls run uncached.
+_COMPUTING = threading.local()
+
+
+@contextmanager
+def analysis_cache(
+    directory: Path | None,
+    *,
+    max_bytes: int = DEFAULT_CACHE_SIZE_BYTES,
+) -> Iterator[AnalysisCache | None]:
+    """Serve every cached analysis inside the block from ``directory``; ``None`` disables caching."""
+
+    global _ACTIVE_ANALYSIS_CACHE
+
+    cache = None if directory is None else AnalysisCache(directory, max_bytes=max_bytes)
+    previous_cache = _ACTIVE_ANALYSIS_CACHE
+    _ACTIVE_ANALYSIS_CACHE = cache
+    try:
+        yield cache
+    finally:
+        _ACTIVE_ANALYSIS_CACHE = previous_cache
+
+
+def cached_analysis[**P, R](analysis: Callable[P, R]) -> Callable[P, R]:
+    """Look calls up in the active analysis cache, or compute directly without one."""
+
+    signature = inspect.signature(analysis)
+    function_name = f"{analysis.__module__}.{analysis.__qualname__}"
+
+    @functools.wraps(analysis)
+    def lookup_or_compute(*args: P.args, **kwargs: P.kwargs) -> R:
+        cache = _ACTIVE_ANALYSIS_CACHE
+        if cache is None or getattr(_COMPUTING, "active", False):
+            return analysis(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = cache.key(
+            function_name,
+            {name: value for name, value in bound.arguments.items() if name not in RESULT_INDEPENDENT_ARGUMENTS},
+        )
+        result = cache.lookup(key)
+        if result is not None:
+            return result
+        _COMPUTING.active = True
+        try:
+            start_time = perf_counter()
+            result = analysis(*args, **kwargs)
+            compute_s = perf_counter() - start_time
+        finally:
+            _COMPUTING.active = False
+        cache.store(key, function_name, result, compute_s)
+        return result
+
+    return lookup_or_compute
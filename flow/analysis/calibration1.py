@@ -8,6 +8,8 @@ while B selects which endpoint is reached.
 
 from __future__ import annotations
 
+import functools
+import math
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Literal
@@ -15,8 +17,16 @@ from typing import Literal
 import numpy as np
 from numpy.typing import NDArray
 
-from flow.analysis.cdac import analyze_cdac_cap_mismatch
-from flow.analysis.types import AnalysisAdcCalibration, MeasCdacExt
+from flow.analysis.cache import cached_analysis
+from flow.analysis.cdac import analyze_cdac_cap_mismatch, cdac_curve_measurements, oriented_cdac_step
+from flow.analysis.comp import analyze_comp_offset_noise_curves
+from flow.analysis.resample import (
+    DEFAULT_BOOTSTRAP_REPLICATES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    map_replicates,
+    summarize_calibration_replicates,
+)
+from flow.analysis.types import AnalysisAdcCalibration, AnalysisAdcCalibrationBootstrap, MeasCdacExt
 from flow.cdac import get_cdac_weights
 
 type LogicBit = Literal[0, 1]
@@ -65,6 +75,25 @@ class CdacEndpointSeparation:
     weight: FloatArray
 
 
+@dataclass(frozen=True, slots=True)
+class _SCurveCounts:
+    """Per-input trial counts of one S-curve, oriented so that probability rises.
+
+    ``batch_point`` and ``batch_one_count`` hold one entry per resampled
+    trial batch, sorted by input point; they are empty when individual trials
+    are resampled.
+    """
+
+    side: int
+    element: int
+    direction: int
+    vin_diff_v: FloatArray
+    trial_count: NDArray[np.int64]
+    one_count: NDArray[np.int64]
+    batch_point: NDArray[np.int64]
+    batch_one_count: NDArray[np.int64]
+
+
 @dataclass(frozen=True, slots=True)
 class CdacWeightAudit:
     """Measured-weight deviations after matching the nominal total scale."""
@@ -219,6 +248,7 @@ def audit_measured_weights(
     )
 
 
+@cached_analysis
 def analyze(
     measurements: Sequence[MeasCdacExt],
     *,
@@ -240,6 +270,15 @@ def analyze(
         measurements,
         comparator_offset_v=comparator_offset_v,
     )
+    return _calibration_from_fraction(measurements, cap_analysis.effective_fraction_by_direction)
+
+
+def _calibration_from_fraction(
+    measurements: Sequence[MeasCdacExt],
+    effective_fraction_by_direction: FloatArray,
+) -> AnalysisAdcCalibration:
+    """Build the hybrid BOUT weights from ``(side, element, direction)`` fractions."""
+
     scan_params = measurements[0].param
     params = scan_params.tb
     nominal_cap_weight = np.asarray(
@@ -251,7 +290,7 @@ def analyze(
     endpoint = extract_endpoint_separation_weights(
         params.dac_astate_p,
         params.dac_astate_n,
-        cap_analysis.effective_fraction_by_direction,
+        effective_fraction_by_direction,
         allow_unresolved=True,
     )
     measured_cap_weight = endpoint.weight
@@ -294,3 +333,114 @@ def analyze(
         output_gain=1.0,
         output_offset_lsb=0.0,
     )
+
+
+def bootstrap(
+    measurements: Sequence[MeasCdacExt],
+    *,
+    comparator_offset_v: float,
+    replicates: int = DEFAULT_BOOTSTRAP_REPLICATES,
+    seed: int = 0,
+    batch_size: int | None = None,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    workers: int = 1,
+) -> AnalysisAdcCalibrationBootstrap:
+    """Bootstrap the calibration 1 weights over resampled S-curve trials.
+
+    Only the ``dac_diffcaps=1`` curves behind the effective weights are
+    resampled. Each input point redraws its trials, or its consecutive
+    ``batch_size``-trial batches, from the per-point counts reduced once here;
+    workers return the resampled p50 transitions, which then pass through the
+    same endpoint selection and hybrid weighting as :func:`analyze`. Curves
+    rejected as non-monotonic by the unresampled fit stay unresolved in every
+    replicate.
+    """
+
+    calibration = analyze(measurements, comparator_offset_v=comparator_offset_v)
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("bootstrap batch_size must be positive")
+    element_count = len(get_cdac_weights(measurements[0].param.tb.dut.cdac))
+    curve_measurements = cdac_curve_measurements(measurements, element_count)
+    effective_curves = {key: curve for key, curve in curve_measurements.items() if key[3] == 1}
+    curves = []
+    for ((element, side, direction, _), curve), fit in zip(
+        effective_curves.items(),
+        analyze_comp_offset_noise_curves(tuple(effective_curves.values())),
+        strict=True,
+    ):
+        if fit.validity == "non_monotonic" or not math.isfinite(fit.offset_v):
+            continue
+        vin_diff_v = np.round(np.concatenate([measurement.daq.vin_diff_v for measurement in curve]), decimals=12)
+        decision = np.concatenate([measurement.daq.decision for measurement in curve]).astype(np.int64)
+        if fit.decision_polarity < 0:
+            decision = 1 - decision
+        point = np.searchsorted(fit.vin_diff_v, vin_diff_v)
+        if batch_size is None:
+            batch_point = batch_one_count = np.zeros(0, dtype=np.int64)
+        else:
+            if np.any(fit.trial_count % batch_size):
+                raise ValueError("bootstrap batch_size must divide the trial count of every S-curve point")
+            order = np.argsort(point, kind="stable")
+            batch_point = point[order][::batch_size]
+            batch_one_count = decision[order].reshape(-1, batch_size).sum(axis=1)
+        curves.append(
+            _SCurveCounts(
+                side=side,
+                element=element,
+                direction=direction,
+                vin_diff_v=fit.vin_diff_v,
+                trial_count=fit.trial_count,
+                one_count=np.bincount(point, weights=decision, minlength=len(fit.vin_diff_v)).astype(np.int64),
+                batch_point=batch_point,
+                batch_one_count=batch_one_count,
+            )
+        )
+    transitions = map_replicates(
+        functools.partial(_bootstrap_transitions, curves=tuple(curves)),
+        replicates=replicates,
+        seed=seed,
+        workers=workers,
+    )
+    replicate_weights = []
+    for transition_v in transitions:
+        fraction = np.full((2, element_count, 2), np.nan, dtype=np.float64)
+        for curve, p50_v in zip(curves, transition_v, strict=True):
+            if math.isfinite(p50_v):
+                params = curve_measurements[(curve.element, curve.side, curve.direction, 1)][0].param
+                fraction[curve.side, curve.element, curve.direction] = oriented_cdac_step(
+                    params, float(p50_v), comparator_offset_v
+                )
+        try:
+            replicate_weights.append(_calibration_from_fraction(measurements, fraction).calibrated_weights)
+        except ValueError:
+            replicate_weights.append(None)
+    return summarize_calibration_replicates(
+        calibration,
+        replicate_weights,
+        batch_size=batch_size,
+        seed=seed,
+        confidence_level=confidence_level,
+    )
+
+
+def _bootstrap_transitions(seed: np.random.SeedSequence, *, curves: tuple[_SCurveCounts, ...]) -> FloatArray:
+    """Return every curve's p50 input after redrawing its trials or batches."""
+
+    rng = np.random.default_rng(seed)
+    transition_v = np.full(len(curves), np.nan, dtype=np.float64)
+    for index, curve in enumerate(curves):
+        if not len(curve.batch_point):
+            one_count = rng.binomial(curve.trial_count, curve.one_count / curve.trial_count)
+        else:
+            point_count = len(curve.vin_diff_v)
+            batch_count = np.bincount(curve.batch_point, minlength=point_count)
+            batch_start = np.concatenate(([0], np.cumsum(batch_count[:-1])))
+            drawn = batch_start[curve.batch_point] + np.floor(
+                rng.random(len(curve.batch_point)) * batch_count[curve.batch_point]
+            ).astype(np.int64)
+            one_count = np.bincount(curve.batch_point, weights=curve.batch_one_count[drawn], minlength=point_count)
+        # The same monotonic envelope and interpolation as the unresampled fit.
+        envelope = np.maximum.accumulate(one_count / curve.trial_count)
+        if envelope[0] <= 0.5 <= envelope[-1]:
+            transition_v[index] = float(np.interp(0.5, envelope, curve.vin_diff_v))
+    return transition_v
@@ -18,20 +18,45 @@ identity and therefore cannot correct INL while preserving every output code.
 
 from __future__ import annotations
 
+import functools
 import math
 from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import pairwise
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy.optimize import lsq_linear
 
 from flow.analysis.adc import ADC_RAMP_RESET_EXCLUSION_CONVERSIONS
-from flow.analysis.types import AnalysisAdcCalibration, AnalysisAdcRamp, MeasAdc, MeasAdcExt
+from flow.analysis.cache import cached_analysis
+from flow.analysis.measure import (
+    GroupedStatistics,
+    decode_packed_bout,
+    grouped_statistics,
+    pack_bout,
+    unpack_bout,
+)
+from flow.analysis.resample import (
+    DEFAULT_BOOTSTRAP_REPLICATES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    map_replicates,
+    resample_multiplicity,
+    resampling_units,
+    summarize_calibration_replicates,
+)
+from flow.analysis.types import (
+    AnalysisAdcCalibration,
+    AnalysisAdcCalibrationBootstrap,
+    AnalysisAdcRamp,
+    MeasAdc,
+    MeasAdcExt,
+)
 
 type FloatArray = NDArray[np.float64]
 type IntArray = NDArray[np.int64]
 type BoolArray = NDArray[np.bool_]
+type Uint32Array = NDArray[np.uint32]
 
 ADC_BOUT_BITS = 17
 ADC_NUMBER_CODES = 4096
@@ -59,6 +84,7 @@ FRIDA_NOMINAL_BOUT_WEIGHTS = (
 )
 
 
+@cached_analysis
 def analyze(
     measurement: MeasAdc,
     ramp: AnalysisAdcRamp,
@@ -73,6 +99,70 @@ def analyze(
     word no longer identifies where the input lies beyond the ADC range.
     """
 
+    ideal_dout, cycle_index, retained = _ramp_calibration_inputs(measurement, ramp)
+    workspace = build_empirical_calibration_workspace(measurement.daq.bout_packed, ideal_dout, cycle_index, retained)
+    return _analyze_workspace(measurement, ramp, workspace, cycle_index, retained, ridge_strength=ridge_strength)[0]
+
+
+def bootstrap(
+    measurement: MeasAdc,
+    ramp: AnalysisAdcRamp,
+    *,
+    ridge_strength: float | None = None,
+    replicates: int = DEFAULT_BOOTSTRAP_REPLICATES,
+    seed: int = 0,
+    batch_size: int | None = None,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    workers: int = 1,
+) -> AnalysisAdcCalibrationBootstrap:
+    """Bootstrap the calibration 2 weights over resampled training cycles.
+
+    The ridge strength is selected once, as in :func:`analyze`, and then held
+    fixed. Every replicate sums the per-unit Gram matrices of the drawn even
+    cycles (or ``batch_size``-conversion batches of them) with their
+    multiplicities and repeats only the bounded ``18 × 18`` solve.
+    """
+
+    ideal_dout, cycle_index, retained = _ramp_calibration_inputs(measurement, ramp)
+    workspace = build_empirical_calibration_workspace(measurement.daq.bout_packed, ideal_dout, cycle_index, retained)
+    calibration, ridge_strength = _analyze_workspace(
+        measurement,
+        ramp,
+        workspace,
+        cycle_index,
+        retained,
+        ridge_strength=ridge_strength,
+    )
+    training = retained & ((cycle_index % 2) == 0)
+    if batch_size is None:
+        units = workspace.cycles % 2 == 0
+        gram, moment, sample_count = workspace.gram[units], workspace.moment[units], workspace.cycle_sample_count[units]
+    else:
+        unit = np.zeros(len(cycle_index), dtype=np.int64)
+        unit[training] = resampling_units(cycle_index, training, batch_size=batch_size)
+        batches = build_empirical_calibration_workspace(measurement.daq.bout_packed, ideal_dout, unit, training)
+        gram, moment, sample_count = batches.gram, batches.moment, batches.cycle_sample_count
+    replicate = functools.partial(
+        _bootstrap_replicate,
+        gram=gram,
+        moment=moment,
+        sample_count=sample_count,
+        ridge_strength=ridge_strength,
+        prior=calibration.nominal_weights,
+        code_max=calibration.code_max,
+    )
+    return summarize_calibration_replicates(
+        calibration,
+        map_replicates(replicate, replicates=replicates, seed=seed, workers=workers),
+        batch_size=batch_size,
+        seed=seed,
+        confidence_level=confidence_level,
+    )
+
+
+def _ramp_calibration_inputs(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> tuple[FloatArray, IntArray, BoolArray]:
+    """Return ideal DOUT, ramp cycle index, and retained mask of every conversion."""
+
     params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
     adc_index = (
         -1
@@ -96,29 +186,37 @@ def analyze(
     for reset_index in ramp.reset_conversion_index:
         retained[max(0, reset_index - 1) : reset_index + ADC_RAMP_RESET_EXCLUSION_CONVERSIONS] = False
     retained &= (measurement.daq.dout > 0) & (measurement.daq.dout < code_max)
+    return ideal_dout, cycle_index, retained
+
 
+def _analyze_workspace(
+    measurement: MeasAdc,
+    ramp: AnalysisAdcRamp,
+    workspace: EmpiricalCalibrationWorkspace,
+    cycle_index: IntArray,
+    retained: BoolArray,
+    *,
+    ridge_strength: float | None,
+) -> tuple[AnalysisAdcCalibration, float]:
+    """Select the ridge strength if needed and fit even against odd cycles."""
+
+    params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
+    code_max = (1 << params.dut.adc_bits) - 1
     nominal_weight = np.asarray(ramp.curves[0].weights, dtype=np.float64)
     nominal_weight *= code_max / np.sum(nominal_weight)
+    # One workspace serves both the inner ridge selection and the outer fit.
     if ridge_strength is None:
-        ridge_strength = select_empirical_ridge_strength(
-            measurement.daq.bout,
-            ideal_dout,
-            cycle_index,
-            retained,
-            nominal_weights=nominal_weight,
-            code_max=code_max,
-        )
-    fit = fit_empirical_bout_calibration(
-        measurement.daq.bout,
-        ideal_dout,
-        cycle_index,
-        retained,
+        ridge_strength = workspace.select_ridge_strength(nominal_weights=nominal_weight, code_max=code_max)
+    training, validation = _cycle_disjoint_masks(cycle_index, retained)
+    fit = workspace.fit(
+        np.unique(cycle_index[training]),
+        np.unique(cycle_index[validation]),
         nominal_weights=nominal_weight,
         ridge_strength=ridge_strength,
         code_max=code_max,
     )
-    return AnalysisAdcCalibration(
-        adc_index=adc_index,
+    calibration = AnalysisAdcCalibration(
+        adc_index=ramp.adc_index,
         method="calibration2",
         label="Known-ramp fitted weights",
         code_max=code_max,
@@ -130,6 +228,32 @@ def analyze(
         output_gain=fit.output_gain,
         output_offset_lsb=fit.output_intercept_lsb,
     )
+    return calibration, ridge_strength
+
+
+def _bootstrap_replicate(
+    seed: np.random.SeedSequence,
+    *,
+    gram: FloatArray,
+    moment: FloatArray,
+    sample_count: IntArray,
+    ridge_strength: float,
+    prior: FloatArray,
+    code_max: int,
+) -> FloatArray | None:
+    """Refit one multiplicity-weighted draw of the training units."""
+
+    multiplicity = resample_multiplicity(np.random.default_rng(seed), len(gram))
+    try:
+        parameter = _solve_sufficient_statistics(
+            np.tensordot(multiplicity, gram, axes=1),
+            np.tensordot(multiplicity, moment, axes=1),
+            ridge_penalty_scale=ridge_strength * int(multiplicity @ sample_count) / ADC_BOUT_BITS,
+            prior=prior,
+        )
+    except RuntimeError:
+        return None
+    return parameter[1:] * code_max / np.sum(parameter[1:])
 
 
 @dataclass(frozen=True, slots=True)
@@ -203,16 +327,25 @@ def _aligned_calibration_inputs(
     ideal_dout: Sequence[float] | FloatArray,
     cycle_index: Sequence[int] | IntArray,
     retained: Sequence[bool] | BoolArray,
-) -> tuple[NDArray[np.uint8], FloatArray, IntArray, BoolArray]:
-    """Normalize and validate the arrays shared by the empirical fit."""
+) -> tuple[Uint32Array, FloatArray, IntArray, BoolArray]:
+    """Normalize and validate the arrays shared by the empirical fit.
+
+    BOUT may be the ``(samples, 17)`` decision matrix or packed words; it is
+    returned packed so duplicate words can be counted without row sorting.
+    """
 
     decisions = np.asarray(bout)
     target = np.asarray(ideal_dout, dtype=np.float64)
     cycles_input = np.asarray(cycle_index)
     keep_input = np.asarray(retained)
-    if decisions.ndim != 2 or decisions.shape[1] != ADC_BOUT_BITS:
-        raise ValueError(f"BOUT must have shape (samples, {ADC_BOUT_BITS})")
-    if np.any((decisions != 0) & (decisions != 1)):
+    if decisions.ndim == 1:
+        if not np.issubdtype(decisions.dtype, np.integer) or np.any(
+            (decisions < 0) | (decisions >= 1 << ADC_BOUT_BITS)
+        ):
+            raise ValueError(f"packed BOUT words must use only the low {ADC_BOUT_BITS} bits")
+    elif decisions.ndim != 2 or decisions.shape[1] != ADC_BOUT_BITS:
+        raise ValueError(f"BOUT must have shape (samples, {ADC_BOUT_BITS}) or (samples,)")
+    elif np.any((decisions != 0) & (decisions != 1)):
         raise ValueError("BOUT must contain only zero and one")
     if target.ndim != 1 or not np.all(np.isfinite(target)):
         raise ValueError("ideal DOUT must be a finite one-dimensional array")
@@ -224,7 +357,7 @@ def _aligned_calibration_inputs(
     if len(lengths) != 1:
         raise ValueError("BOUT, ideal DOUT, cycle index, and retained mask must be aligned")
     return (
-        np.asarray(decisions, dtype=np.uint8),
+        np.asarray(decisions, dtype=np.uint32) if decisions.ndim == 1 else pack_bout(decisions),
         target,
         np.asarray(cycles_input, dtype=np.int64),
         np.asarray(keep_input, dtype=np.bool_),
@@ -243,127 +376,317 @@ def _cycle_disjoint_masks(cycle_index: IntArray, retained: BoolArray) -> tuple[B
     return training, validation
 
 
-def fit_empirical_bout_calibration(
-    bout: Sequence[Sequence[int]] | NDArray[np.integer],
-    ideal_dout: Sequence[float] | FloatArray,
-    cycle_index: Sequence[int] | IntArray,
-    retained: Sequence[bool] | BoolArray,
-    *,
-    nominal_weights: Sequence[float] | FloatArray = FRIDA_NOMINAL_BOUT_WEIGHTS,
-    ridge_strength: float = DEFAULT_RIDGE_STRENGTH,
-    code_max: int = ADC_CODE_MAX,
-) -> AdcCalibrationResult:
-    """Fit nonnegative effective BOUT weights without validation-cycle leakage.
-
-    The minimized training objective is
-
-    ``sum((ideal - intercept - BOUT @ weight)**2)``
-    ``+ ridge_strength * N_train / 17 * sum((weight - nominal)**2)``.
+def _normalized_prior(nominal_weights: Sequence[float] | FloatArray, code_max: int) -> FloatArray:
+    """Validate nominal weights and scale them to sum to ``code_max``."""
 
-    Duplicate training words are compressed to weighted means before solving;
-    this is algebraically equivalent for the fitted parameters.  Validation
-    targets are used only after the solver and global affine decomposition have
-    been fixed from training data.
-    """
-
-    decisions, target, cycles, keep = _aligned_calibration_inputs(bout, ideal_dout, cycle_index, retained)
     if not isinstance(code_max, int) or code_max <= 0:
         raise ValueError("code maximum must be a positive integer")
-    if not math.isfinite(ridge_strength) or ridge_strength < 0.0:
-        raise ValueError("ridge strength must be finite and nonnegative")
     prior = np.asarray(nominal_weights, dtype=np.float64)
     if prior.shape != (ADC_BOUT_BITS,) or not np.all(np.isfinite(prior)) or np.any(prior < 0.0):
         raise ValueError(f"nominal weights must contain {ADC_BOUT_BITS} finite nonnegative values")
     if float(np.sum(prior)) <= 0.0:
         raise ValueError("nominal weights must have a positive sum")
-    prior = prior * code_max / np.sum(prior)
+    return prior * code_max / np.sum(prior)
 
-    training, validation = _cycle_disjoint_masks(cycles, keep)
-    training_bout = decisions[training]
-    training_target = target[training]
-
-    unique_bout, inverse, word_count = np.unique(
-        training_bout,
-        axis=0,
-        return_inverse=True,
-        return_counts=True,
-    )
-    word_target = np.bincount(inverse, weights=training_target) / word_count
-    sqrt_count = np.sqrt(word_count.astype(np.float64))
-    design = np.column_stack((np.ones(len(unique_bout)), unique_bout.astype(np.float64)))
-    weighted_design = design * sqrt_count[:, None]
-    weighted_target = word_target * sqrt_count
-
-    ridge_penalty_scale = ridge_strength * len(training_target) / ADC_BOUT_BITS
-    if ridge_penalty_scale:
-        prior_design = np.zeros((ADC_BOUT_BITS, ADC_BOUT_BITS + 1), dtype=np.float64)
-        prior_design[:, 1:] = np.eye(ADC_BOUT_BITS) * math.sqrt(ridge_penalty_scale)
-        weighted_design = np.vstack((weighted_design, prior_design))
-        weighted_target = np.concatenate((weighted_target, math.sqrt(ridge_penalty_scale) * prior))
 
+def _solve_sufficient_statistics(
+    gram: FloatArray,
+    moment: FloatArray,
+    *,
+    ridge_penalty_scale: float,
+    prior: FloatArray,
+) -> FloatArray:
+    """Return the bounded ``[intercept, weights]`` minimizer of the penalized normal equations.
+
+    The penalized Gram matrix is factored by its eigendecomposition into an
+    ``18 × 18`` least-squares system with the same minimizer, which is solved
+    with a free intercept and nonnegative weights. The trust-region solver
+    keeps iterates strictly inside the bounds, as the per-sample design did, so
+    a weight at its bound stays small and positive rather than exactly zero.
+    """
+
+    gram = gram.copy()
+    moment = moment.copy()
+    gram[1:, 1:] += ridge_penalty_scale * np.eye(ADC_BOUT_BITS)
+    moment[1:] += ridge_penalty_scale * prior
+    eigenvalue, eigenvector = np.linalg.eigh(gram)
+    retained = eigenvalue > eigenvalue[-1] * len(eigenvalue) * np.finfo(np.float64).eps
+    root = np.sqrt(eigenvalue[retained])
+    basis = eigenvector[:, retained].T
     lower_bound = np.concatenate(([-np.inf], np.zeros(ADC_BOUT_BITS)))
     upper_bound = np.full(ADC_BOUT_BITS + 1, np.inf)
     fit = lsq_linear(
-        weighted_design,
-        weighted_target,
+        root[:, None] * basis,
+        (basis @ moment) / root,
         bounds=(lower_bound, upper_bound),
         lsmr_tol="auto",
     )
     if not fit.success:
         raise RuntimeError(f"empirical BOUT calibration failed: {fit.message}")
-    fitted_weights = np.asarray(fit.x[1:], dtype=np.float64)
-    fitted_sum = float(np.sum(fitted_weights))
+    fitted_sum = float(np.sum(fit.x[1:]))
     if not math.isfinite(fitted_sum) or fitted_sum <= 0.0:
         raise RuntimeError("empirical BOUT calibration produced no positive weight sum")
+    return np.asarray(fit.x, dtype=np.float64)
+
+
+@dataclass(frozen=True, slots=True)
+class AdcCalibrationFit:
+    """Constrained BOUT weights and diagnostics solved from workspace statistics."""
+
+    normalized_weights: FloatArray
+    output_gain: float
+    output_intercept_lsb: float
+    diagnostics: AdcCalibrationDiagnostics
+
+
+@dataclass(frozen=True, slots=True)
+class EmpiricalCalibrationWorkspace:
+    """Sufficient statistics of retained BOUT samples for repeated empirical fits.
+
+    Samples are grouped once by ``(cycle position << 17) | packed word``; each
+    group keeps its count, target mean, squared deviation, and target extremes.
+    Every cycle also keeps the ``18 × 18`` Gram matrix and moment vector of the
+    intercept-augmented design ``[1, BOUT]``. Training on any set of complete
+    cycles therefore sums a few small matrices, and residual statistics of any
+    cycle set are evaluated per group without revisiting samples.
+    """
+
+    cycles: IntArray
+    cycle_sample_count: IntArray
+    groups: GroupedStatistics
+    gram: FloatArray
+    moment: FloatArray
+
+    def _cycle_positions(self, cycles: Sequence[int] | IntArray) -> IntArray:
+        """Return positions of the requested cycles that contain retained samples."""
+
+        requested = np.unique(np.asarray(cycles, dtype=np.int64))
+        return np.flatnonzero(np.isin(self.cycles, requested))
+
+    def _group_mask(self, positions: IntArray) -> BoolArray:
+        return np.isin(self.groups.key >> ADC_BOUT_BITS, positions)
+
+    def _residual_summary(
+        self,
+        positions: IntArray,
+        parameter: FloatArray,
+    ) -> tuple[int, float, float]:
+        """Return sample count, RMSE, and maximum absolute error of the affine prediction."""
+
+        group = self._group_mask(positions)
+        word = (self.groups.key[group] & ((1 << ADC_BOUT_BITS) - 1)).astype(np.uint32)
+        prediction = parameter[0] + decode_packed_bout(word, parameter[1:])
+        count = self.groups.count[group]
+        deviation = prediction - self.groups.mean[group]
+        squared_error = float(np.sum(count * deviation * deviation) + np.sum(self.groups.m2[group]))
+        maximum_error = np.maximum(
+            np.abs(prediction - self.groups.minimum[group]),
+            np.abs(prediction - self.groups.maximum[group]),
+        )
+        sample_count = int(np.sum(count))
+        return sample_count, math.sqrt(max(squared_error, 0.0) / sample_count), float(np.max(maximum_error))
+
+    def fit(
+        self,
+        training_cycles: Sequence[int] | IntArray,
+        validation_cycles: Sequence[int] | IntArray,
+        *,
+        nominal_weights: Sequence[float] | FloatArray = FRIDA_NOMINAL_BOUT_WEIGHTS,
+        ridge_strength: float = DEFAULT_RIDGE_STRENGTH,
+        code_max: int = ADC_CODE_MAX,
+    ) -> AdcCalibrationFit:
+        """Solve the objective of :func:`fit_empirical_bout_calibration` on two cycle sets.
+
+        The summed training Gram matrix is solved directly; validation
+        statistics are read only after the weights have been fixed.
+        """
+
+        if not math.isfinite(ridge_strength) or ridge_strength < 0.0:
+            raise ValueError("ridge strength must be finite and nonnegative")
+        prior = _normalized_prior(nominal_weights, code_max)
+        training = self._cycle_positions(training_cycles)
+        validation = self._cycle_positions(validation_cycles)
+        if not len(training):
+            raise ValueError("empirical calibration requires retained samples from a training cycle")
+        if not len(validation):
+            raise ValueError("empirical calibration requires retained samples from a validation cycle")
+        if np.intersect1d(training, validation).size:
+            raise ValueError("training and validation cycles must be disjoint")
+
+        training_sample_count = int(np.sum(self.cycle_sample_count[training]))
+        ridge_penalty_scale = ridge_strength * training_sample_count / ADC_BOUT_BITS
+        parameter = _solve_sufficient_statistics(
+            np.sum(self.gram[training], axis=0),
+            np.sum(self.moment[training], axis=0),
+            ridge_penalty_scale=ridge_penalty_scale,
+            prior=prior,
+        )
+        fitted_weights = parameter[1:]
+        fitted_sum = float(np.sum(fitted_weights))
+
+        # Duplicate training words, merged across cycles, form the compressed
+        # weighted design whose cost and conditioning are reported.
+        group = self._group_mask(training)
+        group_word = (self.groups.key[group] & ((1 << ADC_BOUT_BITS) - 1)).astype(np.uint32)
+        group_count = self.groups.count[group]
+        unique_word, inverse = np.unique(group_word, return_inverse=True)
+        word_count = np.bincount(inverse, weights=group_count).astype(np.int64)
+        word_target = np.bincount(inverse, weights=group_count * self.groups.mean[group]) / word_count
+        word_residual = parameter[0] + decode_packed_bout(unique_word, fitted_weights) - word_target
+        solver_cost = 0.5 * float(
+            np.sum(word_count * word_residual * word_residual)
+            + ridge_penalty_scale * np.sum(np.square(fitted_weights - prior))
+        )
+        unique_bout = unpack_bout(unique_word, ADC_BOUT_BITS)
+        centered_bout = unique_bout.astype(np.float64) - np.average(unique_bout, axis=0, weights=word_count)
+        weighted_centered_bout = centered_bout * np.sqrt(word_count.astype(np.float64))[:, None]
+        singular_values = np.linalg.svd(weighted_centered_bout, compute_uv=False)
+        design_rank = int(np.linalg.matrix_rank(weighted_centered_bout))
+        design_condition = (
+            float(singular_values[0] / singular_values[-1])
+            if design_rank == ADC_BOUT_BITS and singular_values[-1] > 0.0
+            else math.inf
+        )
+        _, training_rmse, training_maximum = self._residual_summary(training, parameter)
+        validation_sample_count, validation_rmse, validation_maximum = self._residual_summary(validation, parameter)
+        diagnostics = AdcCalibrationDiagnostics(
+            training_cycles=self.cycles[training],
+            validation_cycles=self.cycles[validation],
+            training_sample_count=training_sample_count,
+            validation_sample_count=validation_sample_count,
+            unique_training_word_count=len(unique_word),
+            ridge_strength=ridge_strength,
+            ridge_penalty_scale=ridge_penalty_scale,
+            design_rank=design_rank,
+            design_condition=design_condition,
+            solver_cost=solver_cost,
+            training_rmse_lsb=training_rmse,
+            validation_rmse_lsb=validation_rmse,
+            training_maximum_abs_error_lsb=training_maximum,
+            validation_maximum_abs_error_lsb=validation_maximum,
+        )
+        return AdcCalibrationFit(
+            normalized_weights=fitted_weights * code_max / fitted_sum,
+            output_gain=fitted_sum / code_max,
+            output_intercept_lsb=float(parameter[0]),
+            diagnostics=diagnostics,
+        )
+
+    def select_ridge_strength(
+        self,
+        *,
+        candidates: Sequence[float] = RIDGE_STRENGTH_CANDIDATES,
+        nominal_weights: Sequence[float] | FloatArray = FRIDA_NOMINAL_BOUT_WEIGHTS,
+        code_max: int = ADC_CODE_MAX,
+    ) -> float:
+        """Choose ridge strength on alternate outer even cycles.
+
+        The retained even cycles are taken in order and split again into inner
+        training and validation cycles. Odd cycles never enter this selection.
+        """
+
+        even_cycles = self.cycles[(self.cycles % 2) == 0]
+        if len(even_cycles) < 2:
+            raise ValueError("ridge selection requires at least two retained outer training cycles")
+        strengths = tuple(float(candidate) for candidate in candidates)
+        if not strengths:
+            raise ValueError("ridge selection requires at least one candidate")
+        validation_rmse = [
+            self.fit(
+                even_cycles[0::2],
+                even_cycles[1::2],
+                nominal_weights=nominal_weights,
+                ridge_strength=strength,
+                code_max=code_max,
+            ).diagnostics.validation_rmse_lsb
+            for strength in strengths
+        ]
+        return min(zip(validation_rmse, strengths, strict=True))[1]
+
+
+def build_empirical_calibration_workspace(
+    bout: Sequence[Sequence[int]] | NDArray[np.integer],
+    ideal_dout: Sequence[float] | FloatArray,
+    cycle_index: Sequence[int] | IntArray,
+    retained: Sequence[bool] | BoolArray,
+) -> EmpiricalCalibrationWorkspace:
+    """Compress retained samples into per-cycle sufficient statistics.
+
+    Only retained samples are read. The one key sort here replaces the
+    duplicate-word sort that every ridge candidate and split previously repeated.
+    """
 
-    normalized_weights = fitted_weights * code_max / fitted_sum
-    output_gain = fitted_sum / code_max
-    output_intercept_lsb = float(fit.x[0])
-    fractional_dout = decisions @ normalized_weights
-    rounded_dout = np.clip(np.rint(fractional_dout), 0, code_max).astype(np.int64)
-
-    ideal_prediction = output_intercept_lsb + output_gain * fractional_dout
-    residual = ideal_prediction - target
-    training_error = residual[training]
-    validation_error = residual[validation]
-    centered_bout = unique_bout.astype(np.float64) - np.average(
-        unique_bout,
-        axis=0,
-        weights=word_count,
+    decisions, target, cycles, keep = _aligned_calibration_inputs(bout, ideal_dout, cycle_index, retained)
+    if not np.any(keep):
+        raise ValueError("empirical calibration requires at least one retained sample")
+    unique_cycle, cycle_position = np.unique(cycles[keep], return_inverse=True)
+    groups = grouped_statistics(
+        (cycle_position.astype(np.int64) << ADC_BOUT_BITS) | decisions[keep].astype(np.int64),
+        target[keep],
     )
-    weighted_centered_bout = centered_bout * sqrt_count[:, None]
-    singular_values = np.linalg.svd(weighted_centered_bout, compute_uv=False)
-    design_rank = int(np.linalg.matrix_rank(weighted_centered_bout))
-    design_condition = (
-        float(singular_values[0] / singular_values[-1])
-        if design_rank == ADC_BOUT_BITS and singular_values[-1] > 0.0
-        else math.inf
+    group_cycle = groups.key >> ADC_BOUT_BITS
+    group_word = (groups.key & ((1 << ADC_BOUT_BITS) - 1)).astype(np.uint32)
+    boundary = np.searchsorted(group_cycle, np.arange(len(unique_cycle) + 1))
+    gram = np.empty((len(unique_cycle), ADC_BOUT_BITS + 1, ADC_BOUT_BITS + 1), dtype=np.float64)
+    moment = np.empty((len(unique_cycle), ADC_BOUT_BITS + 1), dtype=np.float64)
+    for position, (start, stop) in enumerate(pairwise(boundary)):
+        design = np.ones((stop - start, ADC_BOUT_BITS + 1), dtype=np.float64)
+        design[:, 1:] = unpack_bout(group_word[start:stop], ADC_BOUT_BITS)
+        count = groups.count[start:stop].astype(np.float64)
+        gram[position] = (design * count[:, None]).T @ design
+        moment[position] = design.T @ (count * groups.mean[start:stop])
+    return EmpiricalCalibrationWorkspace(
+        cycles=unique_cycle.astype(np.int64),
+        cycle_sample_count=np.bincount(cycle_position, minlength=len(unique_cycle)).astype(np.int64),
+        groups=groups,
+        gram=gram,
+        moment=moment,
     )
-    diagnostics = AdcCalibrationDiagnostics(
-        training_cycles=np.unique(cycles[training]),
-        validation_cycles=np.unique(cycles[validation]),
-        training_sample_count=len(training_error),
-        validation_sample_count=len(validation_error),
-        unique_training_word_count=len(unique_bout),
+
+
+def fit_empirical_bout_calibration(
+    bout: Sequence[Sequence[int]] | NDArray[np.integer],
+    ideal_dout: Sequence[float] | FloatArray,
+    cycle_index: Sequence[int] | IntArray,
+    retained: Sequence[bool] | BoolArray,
+    *,
+    nominal_weights: Sequence[float] | FloatArray = FRIDA_NOMINAL_BOUT_WEIGHTS,
+    ridge_strength: float = DEFAULT_RIDGE_STRENGTH,
+    code_max: int = ADC_CODE_MAX,
+) -> AdcCalibrationResult:
+    """Fit nonnegative effective BOUT weights without validation-cycle leakage.
+
+    The minimized training objective is
+
+    ``sum((ideal - intercept - BOUT @ weight)**2)``
+    ``+ ridge_strength * N_train / 17 * sum((weight - nominal)**2)``.
+
+    The fit is solved from :class:`EmpiricalCalibrationWorkspace` statistics;
+    this is algebraically equivalent for the fitted parameters. Validation
+    targets are used only after the solver and global affine decomposition have
+    been fixed from training data.
+    """
+
+    decisions, target, cycles, keep = _aligned_calibration_inputs(bout, ideal_dout, cycle_index, retained)
+    training, validation = _cycle_disjoint_masks(cycles, keep)
+    workspace = build_empirical_calibration_workspace(decisions, target, cycles, keep)
+    fit = workspace.fit(
+        np.unique(cycles[training]),
+        np.unique(cycles[validation]),
+        nominal_weights=nominal_weights,
         ridge_strength=ridge_strength,
-        ridge_penalty_scale=ridge_penalty_scale,
-        design_rank=design_rank,
-        design_condition=design_condition,
-        solver_cost=float(fit.cost),
-        training_rmse_lsb=float(np.sqrt(np.mean(np.square(training_error)))),
-        validation_rmse_lsb=float(np.sqrt(np.mean(np.square(validation_error)))),
-        training_maximum_abs_error_lsb=float(np.max(np.abs(training_error))),
-        validation_maximum_abs_error_lsb=float(np.max(np.abs(validation_error))),
+        code_max=code_max,
     )
+    fractional_dout = decode_packed_bout(decisions, fit.normalized_weights)
     return AdcCalibrationResult(
-        normalized_weights=normalized_weights,
-        output_gain=output_gain,
-        output_intercept_lsb=output_intercept_lsb,
+        normalized_weights=fit.normalized_weights,
+        output_gain=fit.output_gain,
+        output_intercept_lsb=fit.output_intercept_lsb,
         fractional_dout=np.asarray(fractional_dout, dtype=np.float64),
-        rounded_dout=rounded_dout,
+        rounded_dout=np.clip(np.rint(fractional_dout), 0, code_max).astype(np.int64),
         training_mask=training,
         validation_mask=validation,
-        diagnostics=diagnostics,
+        diagnostics=fit.diagnostics,
     )
 
 
@@ -385,32 +708,14 @@ def select_empirical_ridge_strength(
 
     decisions, target, cycles, keep = _aligned_calibration_inputs(bout, ideal_dout, cycle_index, retained)
     outer_training = keep & ((cycles % 2) == 0)
-    even_cycles = np.unique(cycles[outer_training])
-    if len(even_cycles) < 2:
+    if not np.any(outer_training):
         raise ValueError("ridge selection requires at least two retained outer training cycles")
-    inner_cycle = np.full(len(cycles), -1, dtype=np.int64)
-    for inner_index, cycle in enumerate(even_cycles):
-        inner_cycle[cycles == cycle] = inner_index
-    strengths = tuple(float(candidate) for candidate in candidates)
-    if not strengths:
-        raise ValueError("ridge selection requires at least one candidate")
-    results = [
-        fit_empirical_bout_calibration(
-            decisions,
-            target,
-            inner_cycle,
-            outer_training,
-            nominal_weights=nominal_weights,
-            ridge_strength=strength,
-            code_max=code_max,
-        )
-        for strength in strengths
-    ]
-    best = min(
-        zip(strengths, results, strict=True),
-        key=lambda item: (item[1].diagnostics.validation_rmse_lsb, item[0]),
+    workspace = build_empirical_calibration_workspace(decisions, target, cycles, outer_training)
+    return workspace.select_ridge_strength(
+        candidates=candidates,
+        nominal_weights=nominal_weights,
+        code_max=code_max,
     )
-    return best[0]
 
 
 def fit_code_density_cdf_lut(
@@ -20,7 +20,10 @@ use the same analysis without changing its data format.
 
 from __future__ import annotations
 
+import functools
 import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
 
 import hdl21 as h
 import numpy as np
@@ -28,10 +31,29 @@ from scipy.optimize import minimize
 from scipy.special import log_ndtr, ndtr
 
 from flow.analysis.adc import ADC_RAMP_RESET_EXCLUSION_CONVERSIONS
-from flow.analysis.measure import histogram_inl_dnl
-from flow.analysis.types import AnalysisAdcCalibration, AnalysisAdcRamp, MeasAdc, MeasAdcExt
+from flow.analysis.cache import cached_analysis
+from flow.analysis.measure import bout_prefix_run, decode_packed_bout, histogram_inl_dnl
+from flow.analysis.resample import (
+    DEFAULT_BOOTSTRAP_REPLICATES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    map_replicates,
+    resample_multiplicity,
+    resampling_units,
+    summarize_calibration_replicates,
+)
+from flow.analysis.types import (
+    ADC_BOUT_BITS,
+    AnalysisAdcCalibration,
+    AnalysisAdcCalibrationBootstrap,
+    AnalysisAdcRamp,
+    MeasAdc,
+    MeasAdcExt,
+)
 from flow.cdac import get_cdac_weights
 
+if TYPE_CHECKING:
+    from flow.adc.sim import AdcTbParams
+
 THRESHOLD_BIN_COUNT = 16_384
 STEP_RESOLUTION_SIGMA = 3.0
 
@@ -79,14 +101,19 @@ def _fit_probit_threshold(
     decision = np.asarray(decision, dtype=np.uint8)
     if vin_diff_v.ndim != 1 or decision.ndim != 1 or len(vin_diff_v) != len(decision):
         raise ValueError("threshold inputs and decisions must be aligned one-dimensional arrays")
-    if len(vin_diff_v) < 64:
-        raise ValueError("threshold fit requires at least 64 branch trials")
     if np.any((decision != 0) & (decision != 1)):
         raise ValueError("threshold decisions must be binary")
-    zeros = int(np.count_nonzero(decision == 0))
-    ones = len(decision) - zeros
-    if min(zeros, ones) < 8:
-        raise ValueError("threshold fit is not bracketed by at least eight decisions of each state")
+    bin_index = _threshold_bin_index(vin_diff_v, vin_diff_min_v=vin_diff_min_v, vin_diff_max_v=vin_diff_max_v)
+    return _fit_binned_probit_threshold(
+        np.bincount(bin_index, minlength=THRESHOLD_BIN_COUNT).astype(np.float64),
+        np.bincount(bin_index, weights=decision, minlength=THRESHOLD_BIN_COUNT).astype(np.float64),
+        vin_diff_min_v=vin_diff_min_v,
+        vin_diff_max_v=vin_diff_max_v,
+    )
+
+
+def _threshold_bin_index(vin_diff_v: np.ndarray, *, vin_diff_min_v: float, vin_diff_max_v: float) -> np.ndarray:
+    """Return each input's fixed-resolution threshold bin."""
 
     input_span_v = vin_diff_max_v - vin_diff_min_v
     if not math.isfinite(input_span_v) or input_span_v <= 0.0:
@@ -95,12 +122,32 @@ def _fit_probit_threshold(
     # branches.  Empty bins cost little, while coarsening a rare branch would
     # create exactly the false precision/ bias we are trying to expose for the
     # smallest capacitor steps.
+    scaled = (vin_diff_v - vin_diff_min_v) * THRESHOLD_BIN_COUNT / input_span_v
+    return np.clip(np.floor(scaled).astype(np.int64), 0, THRESHOLD_BIN_COUNT - 1)
+
+
+def _fit_binned_probit_threshold(
+    trials: np.ndarray,
+    one_count: np.ndarray,
+    *,
+    vin_diff_min_v: float,
+    vin_diff_max_v: float,
+    restart_width: bool = False,
+) -> tuple[float, float, float, int]:
+    """Fit one probit threshold from per-bin trial and one-decision counts.
+
+    ``restart_width`` additionally retries from the best width of a log-sigma
+    grid; bootstrap replicates use it, point fits keep the single start.
+    """
+
+    trial_count = int(np.sum(trials))
+    if trial_count < 64:
+        raise ValueError("threshold fit requires at least 64 branch trials")
+    ones = int(np.sum(one_count))
+    if min(trial_count - ones, ones) < 8:
+        raise ValueError("threshold fit is not bracketed by at least eight decisions of each state")
+    input_span_v = vin_diff_max_v - vin_diff_min_v
     number_bins = THRESHOLD_BIN_COUNT
-    scaled = (vin_diff_v - vin_diff_min_v) * number_bins / input_span_v
-    bin_index = np.floor(scaled).astype(np.int64)
-    bin_index = np.clip(bin_index, 0, number_bins - 1)
-    trials = np.bincount(bin_index, minlength=number_bins).astype(np.float64)
-    one_count = np.bincount(bin_index, weights=decision, minlength=number_bins).astype(np.float64)
     occupied = trials > 0.0
     trials = trials[occupied]
     one_count = one_count[occupied]
@@ -149,6 +196,30 @@ def _fit_probit_threshold(
             # but large enough to converge reproducibly in CI.
             options={"xtol": 1e-12, "ftol": 1e-12, "maxfev": 10_000},
         )
+    # From the default width, either optimizer can carry a sharp transition
+    # onto a broad, wrongly centred local solution.  For bootstrap replicates,
+    # if some width at the seed threshold already explains the data better,
+    # restart there; a properly converged fit is never beaten by this grid and
+    # is kept as is.
+    if restart_width and fit.success:
+        log_sigma_grid = np.linspace(math.log(minimum_sigma_v), math.log(maximum_sigma_v), 16)
+        grid_objective = [
+            _probit_negative_log_likelihood(np.asarray([threshold_seed_v, log_sigma]), centers_v, one_count, trials)
+            for log_sigma in log_sigma_grid
+        ]
+        if min(grid_objective) < fit.fun:
+            restart = minimize(
+                _probit_negative_log_likelihood,
+                np.asarray([threshold_seed_v, log_sigma_grid[int(np.argmin(grid_objective))]]),
+                args=(centers_v, one_count, trials),
+                method="L-BFGS-B",
+                bounds=(
+                    (vin_diff_min_v, vin_diff_max_v),
+                    (math.log(minimum_sigma_v), math.log(maximum_sigma_v)),
+                ),
+            )
+            if restart.success and restart.fun < fit.fun:
+                fit = restart
     if not fit.success or not np.all(np.isfinite(fit.x)):
         raise RuntimeError(f"ADC threshold probit fit failed: {fit.message}")
     threshold_v = float(fit.x[0])
@@ -178,71 +249,103 @@ def _fit_probit_threshold(
     )
     covariance = np.linalg.pinv(information, rcond=1e-14)
     threshold_std_v = math.sqrt(max(0.0, float(covariance[0, 0])))
-    return threshold_v, sigma_v, threshold_std_v, len(vin_diff_v)
+    return threshold_v, sigma_v, threshold_std_v, trial_count
 
 
 def _extract_prefix_thresholds(
-    decisions: np.ndarray,
+    bout_words: np.ndarray,
     inferred_vin_diff_v: np.ndarray,
     retained: np.ndarray,
     *,
     vin_diff_min_v: float,
     vin_diff_max_v: float,
+    workers: int = 1,
 ) -> dict[str, np.ndarray]:
-    """Extract every all-zero and all-one prefix threshold from BOUT."""
-
-    number_decisions = decisions.shape[1]
-    down_threshold_v = np.empty(number_decisions, dtype=np.float64)
-    up_threshold_v = np.empty(number_decisions, dtype=np.float64)
-    down_threshold_std_v = np.empty(number_decisions, dtype=np.float64)
-    up_threshold_std_v = np.empty(number_decisions, dtype=np.float64)
-    down_noise_sigma_v = np.empty(number_decisions, dtype=np.float64)
-    up_noise_sigma_v = np.empty(number_decisions, dtype=np.float64)
-    down_trial_count = np.empty(number_decisions, dtype=np.int64)
-    up_trial_count = np.empty(number_decisions, dtype=np.int64)
-
-    for decision_index in range(number_decisions):
-        if decision_index == 0:
-            # Both paths are the empty prefix at the first comparison.  Fit it
-            # once so numerical optimizer tolerance cannot create a fictitious
-            # difference between the two copies.
-            threshold = _fit_probit_threshold(
-                inferred_vin_diff_v[retained],
-                decisions[retained, decision_index],
-                vin_diff_min_v=vin_diff_min_v,
-                vin_diff_max_v=vin_diff_max_v,
-            )
-            down_threshold_v[0] = up_threshold_v[0] = threshold[0]
-            down_noise_sigma_v[0] = up_noise_sigma_v[0] = threshold[1]
-            down_threshold_std_v[0] = up_threshold_std_v[0] = threshold[2]
-            down_trial_count[0] = up_trial_count[0] = threshold[3]
-            continue
-
-        prefix = decisions[:, :decision_index]
-        down_branch = retained & np.all(prefix == 0, axis=1)
-        up_branch = retained & np.all(prefix == 1, axis=1)
-        down = _fit_probit_threshold(
-            inferred_vin_diff_v[down_branch],
-            decisions[down_branch, decision_index],
-            vin_diff_min_v=vin_diff_min_v,
-            vin_diff_max_v=vin_diff_max_v,
-        )
-        up = _fit_probit_threshold(
-            inferred_vin_diff_v[up_branch],
-            decisions[up_branch, decision_index],
-            vin_diff_min_v=vin_diff_min_v,
-            vin_diff_max_v=vin_diff_max_v,
-        )
-        down_threshold_v[decision_index], down_noise_sigma_v[decision_index] = down[:2]
-        down_threshold_std_v[decision_index], down_trial_count[decision_index] = down[2:]
-        up_threshold_v[decision_index], up_noise_sigma_v[decision_index] = up[:2]
-        up_threshold_std_v[decision_index], up_trial_count[decision_index] = up[2:]
+    """Extract every all-zero and all-one prefix threshold from packed BOUT.
+
+    Each retained conversion is binned once.  A conversion with ``r`` leading
+    zeros belongs to every all-zero branch ``k <= r`` and decides one at
+    ``k == r``, so one run-length-by-bin histogram per prefix value, summed
+    from the longest run down, yields every branch's trial and one counts.
+    The 33 independent probit fits run serially in the calling process unless
+    ``workers`` opts in to a process pool.
+    """
+
+    number_decisions = ADC_BOUT_BITS
+    bout_words = np.asarray(bout_words, dtype=np.uint32)[retained]
+    bin_index = _threshold_bin_index(
+        np.asarray(inferred_vin_diff_v, dtype=np.float64)[retained],
+        vin_diff_min_v=vin_diff_min_v,
+        vin_diff_max_v=vin_diff_max_v,
+    )
+    run_count = {
+        value: np.bincount(
+            bout_prefix_run(bout_words, number_decisions, value=value) * THRESHOLD_BIN_COUNT + bin_index,
+            minlength=(number_decisions + 1) * THRESHOLD_BIN_COUNT,
+        ).reshape(number_decisions + 1, THRESHOLD_BIN_COUNT)
+        for value in (0, 1)
+    }
+    return _fit_prefix_thresholds(
+        run_count,
+        vin_diff_min_v=vin_diff_min_v,
+        vin_diff_max_v=vin_diff_max_v,
+        workers=workers,
+    )
+
+
+def _fit_prefix_thresholds(
+    run_count: dict[int, np.ndarray],
+    *,
+    vin_diff_min_v: float,
+    vin_diff_max_v: float,
+    workers: int = 1,
+    decision_count: int = ADC_BOUT_BITS,
+    restart_width: bool = False,
+) -> dict[str, np.ndarray]:
+    """Fit the prefix thresholds of the first ``decision_count`` decisions.
+
+    ``run_count[value]`` is the ``(18, THRESHOLD_BIN_COUNT)`` histogram of
+    leading ``value``-run length by input bin; counts may be bootstrap
+    multiplicity weighted, in which case ``restart_width`` guards each fit
+    against a broad local solution.
+    """
+
+    number_decisions = decision_count
+    branch_trials = {value: np.cumsum(run_count[value][::-1].astype(np.float64), axis=0)[::-1] for value in (0, 1)}
+    # Both paths are the empty prefix at the first comparison.  Fit it once so
+    # numerical optimizer tolerance cannot create a fictitious difference
+    # between the two copies.  Afterwards an all-zero branch decides one where
+    # its zero run ends, and an all-one branch where its one run continues.
+    trials = [branch_trials[0][0]]
+    one_count = [run_count[0][0].astype(np.float64)]
+    for decision_index in range(1, number_decisions):
+        trials.extend((branch_trials[0][decision_index], branch_trials[1][decision_index]))
+        one_count.extend((run_count[0][decision_index].astype(np.float64), branch_trials[1][decision_index + 1]))
+    fit = functools.partial(
+        _fit_binned_probit_threshold,
+        vin_diff_min_v=vin_diff_min_v,
+        vin_diff_max_v=vin_diff_max_v,
+        restart_width=restart_width,
+    )
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if workers == 1:
+        fits = [fit(*counts) for counts in zip(trials, one_count, strict=True)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fits = list(executor.map(fit, trials, one_count))
+    down_fits = np.asarray([fits[0], *fits[1::2]], dtype=np.float64)
+    up_fits = np.asarray([fits[0], *fits[2::2]], dtype=np.float64)
+    down_threshold_v, down_noise_sigma_v, down_threshold_std_v = down_fits[:, :3].T
+    up_threshold_v, up_noise_sigma_v, up_threshold_std_v = up_fits[:, :3].T
+    down_trial_count = down_fits[:, 3].astype(np.int64)
+    up_trial_count = up_fits[:, 3].astype(np.int64)
 
     # Adjacent fits reuse many of the same ramp conversions.  Treating their
     # errors as independent is conservative for positively correlated p50
-    # estimates but can still miss cycle-to-cycle drift.  A future quieter scan
-    # with many independent ramp repetitions could replace this approximation
-    # with a cycle bootstrap without changing the public result type.
+    # estimates but can still miss cycle-to-cycle drift.  ``bootstrap()``
+    # resamples whole ramp cycles instead, which captures that drift in the
+    # final weights whenever the capture has enough independent repetitions.
     down_step_v = down_threshold_v[:-1] - down_threshold_v[1:]
     up_step_v = up_threshold_v[1:] - up_threshold_v[:-1]
     down_step_std_v = np.hypot(down_threshold_std_v[:-1], down_threshold_std_v[1:])
@@ -306,33 +409,23 @@ def _hybrid_weights(
 
 
 def _code_density(
-    decisions: np.ndarray,
+    bout_words: np.ndarray,
     retained: np.ndarray,
     weights: np.ndarray,
     *,
     code_max: int,
 ) -> dict[str, np.ndarray | float | int]:
-    decoded = np.rint(decisions[retained].astype(np.float64) @ weights).astype(np.int64)
+    decoded = np.rint(decode_packed_bout(bout_words[retained], weights)).astype(np.int64)
     decoded = np.clip(decoded, 0, code_max)
     counts = np.bincount(decoded, minlength=code_max + 1)
     return histogram_inl_dnl(counts, first_code=1, last_code=code_max - 1)
 
 
-def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibration:
-    """Extract Hsu prefix thresholds and validate a conservative BOUT decoder.
-
-    Complete even-numbered ramp cycles are the calibration set.  They are split
-    again: one half extracts thresholds and the other chooses how many leading
-    measured weights actually improve code-density INL.  Complete odd cycles
-    are untouched until the final reported comparison, preventing selection on
-    the result being reported.
-
-    The selected prefix is intentionally contiguous.  A noisy small step does
-    not justify trusting still-smaller later steps merely because one happened
-    to fit well.  This is especially important in the present capture, where
-    late all-zero/all-one paths have few minority decisions and the input and
-    comparator noise are comparable to the physical step size.
-    """
+def _ramp_partition(
+    measurement: MeasAdc,
+    ramp: AnalysisAdcRamp,
+) -> tuple[AdcTbParams, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return parameters, ADC index, packed BOUT, inferred input, ramp cycle, and retained mask."""
 
     params = measurement.param.tb if isinstance(measurement, MeasAdcExt) else measurement.param
     if not isinstance(params.vin_diff, h.Vpwl.Params):
@@ -344,9 +437,7 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
     )
     if ramp.adc_index != adc_index or ramp.sample_count != len(measurement.daq.bout):
         raise ValueError("calibration 3 requires the matching ADC ramp analysis")
-    decisions = np.asarray(measurement.daq.bout, dtype=np.uint8)
-    if decisions.ndim != 2 or decisions.shape[1] != 17:
-        raise ValueError("ADC threshold calibration requires stored 17-bit BOUT decisions")
+    bout_words = np.asarray(measurement.daq.bout_packed, dtype=np.uint32)
 
     sample = np.arange(ramp.sample_count, dtype=np.float64)
     reset_number = np.arange(len(ramp.reset_conversion_index), dtype=np.float64)
@@ -362,6 +453,29 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
     retained = (cycle_index >= 0) & (cycle_index < len(ramp.reset_conversion_index) - 1)
     for reset_index in ramp.reset_conversion_index:
         retained[max(0, reset_index - 1) : reset_index + ADC_RAMP_RESET_EXCLUSION_CONVERSIONS] = False
+    return params, adc_index, bout_words, inferred_vin_diff_v, cycle_index, retained
+
+
+@cached_analysis
+def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp, *, workers: int = 1) -> AnalysisAdcCalibration:
+    """Extract Hsu prefix thresholds and validate a conservative BOUT decoder.
+
+    Complete even-numbered ramp cycles are the calibration set.  They are split
+    again: one half extracts thresholds and the other chooses how many leading
+    measured weights actually improve code-density INL.  Complete odd cycles
+    are untouched until the final reported comparison, preventing selection on
+    the result being reported.  The independent probit fits of each
+    threshold extraction run serially unless ``workers`` opts in to a process
+    pool.
+
+    The selected prefix is intentionally contiguous.  A noisy small step does
+    not justify trusting still-smaller later steps merely because one happened
+    to fit well.  This is especially important in the present capture, where
+    late all-zero/all-one paths have few minority decisions and the input and
+    comparator noise are comparable to the physical step size.
+    """
+
+    params, adc_index, bout_words, inferred_vin_diff_v, cycle_index, retained = _ramp_partition(measurement, ramp)
     training = retained & (cycle_index % 2 == 0)
     validation = retained & (cycle_index % 2 != 0)
     inner_fit = training & (cycle_index % 4 == 0)
@@ -380,11 +494,12 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
     # This guards against the tempting but invalid practice of looking at the
     # odd-cycle INL and then choosing the cutoff which makes it look best.
     selection_extraction = _extract_prefix_thresholds(
-        decisions,
+        bout_words,
         inferred_vin_diff_v,
         inner_fit,
         vin_diff_min_v=ramp.vin_diff_min_v,
         vin_diff_max_v=ramp.vin_diff_max_v,
+        workers=workers,
     )
     maximum_candidate = _contiguous_resolved_count(selection_extraction["step_resolved"])
     candidate_measured_step_count = np.arange(maximum_candidate + 1, dtype=np.int64)
@@ -397,7 +512,7 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
             code_max=code_max,
         )
         candidate_density = _code_density(
-            decisions,
+            bout_words,
             inner_score,
             candidate_weight,
             code_max=code_max,
@@ -412,11 +527,12 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
     # Refit the already-selected model on every even calibration cycle.  Odd
     # cycles remain held out and are used only below for final metrics.
     extraction = _extract_prefix_thresholds(
-        decisions,
+        bout_words,
         inferred_vin_diff_v,
         training,
         vin_diff_min_v=ramp.vin_diff_min_v,
         vin_diff_max_v=ramp.vin_diff_max_v,
+        workers=workers,
     )
     selected_measured_step_count = min(
         selected_measured_step_count,
@@ -428,7 +544,7 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
         selected_measured_step_count,
         code_max=code_max,
     )
-    measured = np.zeros(decisions.shape[1], dtype=np.bool_)
+    measured = np.zeros(ADC_BOUT_BITS, dtype=np.bool_)
     measured[:selected_measured_step_count] = True
     return AnalysisAdcCalibration(
         adc_index=adc_index,
@@ -443,3 +559,98 @@ def analyze(measurement: MeasAdc, ramp: AnalysisAdcRamp) -> AnalysisAdcCalibrati
         output_gain=1.0,
         output_offset_lsb=0.0,
     )
+
+
+def bootstrap(
+    measurement: MeasAdc,
+    ramp: AnalysisAdcRamp,
+    *,
+    replicates: int = DEFAULT_BOOTSTRAP_REPLICATES,
+    seed: int = 0,
+    batch_size: int | None = None,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    workers: int = 1,
+) -> AnalysisAdcCalibrationBootstrap:
+    """Bootstrap the calibration 3 weights over resampled training cycles.
+
+    The measured prefix length selected by :func:`analyze` stays fixed, so
+    each replicate refits only the thresholds that prefix needs.  Every even
+    cycle (or ``batch_size``-conversion batch) is reduced once to sparse
+    run-length-by-bin counts; a replicate reweights those counts by its
+    multiplicities and fits serially, while ``workers`` spreads the replicates
+    over a process pool.
+    """
+
+    calibration = analyze(measurement, ramp, workers=workers)
+    measured_step_count = int(np.count_nonzero(calibration.measured_weight_mask))
+    _, _, bout_words, inferred_vin_diff_v, cycle_index, retained = _ramp_partition(measurement, ramp)
+    training = retained & (cycle_index % 2 == 0)
+    unit = resampling_units(cycle_index, training, batch_size=batch_size)
+    bin_index = _threshold_bin_index(
+        inferred_vin_diff_v[training],
+        vin_diff_min_v=ramp.vin_diff_min_v,
+        vin_diff_max_v=ramp.vin_diff_max_v,
+    )
+    # Runs longer than the refit prefix only contribute to its last branch
+    # totals, so they share one row and keep the sparse counts small.
+    row_size = (ADC_BOUT_BITS + 1) * THRESHOLD_BIN_COUNT
+    unit_counts = {}
+    for value in (0, 1):
+        run = np.minimum(bout_prefix_run(bout_words[training], ADC_BOUT_BITS, value=value), measured_step_count + 1)
+        key, count = np.unique(unit * row_size + run * THRESHOLD_BIN_COUNT + bin_index, return_counts=True)
+        unit_counts[value] = (key // row_size, key % row_size, count)
+    replicate = functools.partial(
+        _bootstrap_replicate,
+        unit_counts=unit_counts,
+        unit_count=int(unit[-1]) + 1 if len(unit) else 0,
+        nominal_weight=calibration.nominal_weights,
+        measured_step_count=measured_step_count,
+        code_max=calibration.code_max,
+        vin_diff_min_v=ramp.vin_diff_min_v,
+        vin_diff_max_v=ramp.vin_diff_max_v,
+    )
+    return summarize_calibration_replicates(
+        calibration,
+        map_replicates(replicate, replicates=replicates, seed=seed, workers=workers),
+        batch_size=batch_size,
+        seed=seed,
+        confidence_level=confidence_level,
+    )
+
+
+def _bootstrap_replicate(
+    seed: np.random.SeedSequence,
+    *,
+    unit_counts: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]],
+    unit_count: int,
+    nominal_weight: np.ndarray,
+    measured_step_count: int,
+    code_max: int,
+    vin_diff_min_v: float,
+    vin_diff_max_v: float,
+) -> np.ndarray | None:
+    """Refit the measured prefix on one multiplicity-weighted draw of training units."""
+
+    multiplicity = resample_multiplicity(np.random.default_rng(seed), unit_count)
+    if measured_step_count == 0:
+        return _hybrid_weights(nominal_weight, np.zeros(0), 0, code_max=code_max)
+    run_count = {
+        value: np.bincount(
+            cell,
+            weights=multiplicity[unit] * count,
+            minlength=(ADC_BOUT_BITS + 1) * THRESHOLD_BIN_COUNT,
+        ).reshape(ADC_BOUT_BITS + 1, THRESHOLD_BIN_COUNT)
+        for value, (unit, cell, count) in unit_counts.items()
+    }
+    try:
+        extraction = _fit_prefix_thresholds(
+            run_count,
+            vin_diff_min_v=vin_diff_min_v,
+            vin_diff_max_v=vin_diff_max_v,
+            workers=1,
+            decision_count=measured_step_count + 1,
+            restart_width=True,
+        )
+        return _hybrid_weights(nominal_weight, extraction["endpoint_weight_v"], measured_step_count, code_max=code_max)
+    except (RuntimeError, ValueError):
+        return None
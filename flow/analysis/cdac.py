@@ -7,10 +7,11 @@ from collections.abc import Mapping, Sequence
 
 import numpy as np
 
-from flow.analysis.comp import analyze_comp_offset_noise
+from flow.analysis.cache import cached_analysis
+from flow.analysis.comp import analyze_comp_offset_noise_curves
 from flow.analysis.types import AnalysisCdacCapMismatch, MeasCdacExt, Measurement
 from flow.cdac import get_cdac_weights
-from flow.scans.params import load_board_map
+from flow.scans.params import AdcScanParams, load_board_map
 
 
 def _expected_cdac_effective_fraction(measurements: Sequence[MeasCdacExt]) -> np.ndarray:
@@ -48,6 +49,47 @@ def _expected_cdac_effective_fraction(measurements: Sequence[MeasCdacExt]) -> np
     return weights / (np.sum(total_weights) + topplate_parasitic_weight)
 
 
+def cdac_curve_measurements(
+    measurements: Sequence[MeasCdacExt],
+    element_count: int,
+) -> dict[tuple[int, int, int, int], list[MeasCdacExt]]:
+    """Group S-curve points by ``(element, side, direction, diffcaps)`` indices.
+
+    Each curve keeps only its fine-stage points when it has any. Keys are
+    returned in sorted order.
+    """
+
+    grouped: dict[tuple[int, int, int, int], list[MeasCdacExt]] = {}
+    for measurement in measurements:
+        params = measurement.param
+        if params.cdac_element is None or params.cdac_side is None or params.cdac_direction is None:
+            raise ValueError("CDAC measurement is missing its side, element, or direction")
+        if not 0 <= params.cdac_element < element_count:
+            raise ValueError("CDAC measurement element is outside the configured CDAC")
+        key = (
+            params.cdac_element,
+            0 if params.cdac_side == "p" else 1,
+            0 if params.cdac_direction == "1to0" else 1,
+            params.tb.dac_diffcaps,
+        )
+        grouped.setdefault(key, []).append(measurement)
+    curves = {}
+    for key in sorted(grouped):
+        fine_measurements = [measurement for measurement in grouped[key] if measurement.param.sweep_stage == "fine"]
+        curves[key] = fine_measurements or grouped[key]
+    return curves
+
+
+def oriented_cdac_step(params: AdcScanParams, transition_v: float, comparator_offset_v: float) -> float:
+    """Return one curve's transition as a side- and direction-oriented DAC fraction."""
+
+    signed_step = (comparator_offset_v - transition_v) / float(params.tb.vdd_dac.dc)
+    side_sign = 1.0 if params.cdac_side == "p" else -1.0
+    direction_sign = 1.0 if params.cdac_direction == "0to1" else -1.0
+    return side_sign * direction_sign * signed_step
+
+
+@cached_analysis
 def analyze_cdac_cap_mismatch(
     measurements: Sequence[MeasCdacExt],
     *,
@@ -70,37 +112,14 @@ def analyze_cdac_cap_mismatch(
         raise ValueError("A-to-B CDAC analysis requires one CDAC configuration")
     element_count = next(iter(element_counts))
 
-    grouped: dict[tuple[int, int, int, int], list[MeasCdacExt]] = {}
-    for measurement in measurements:
-        params = measurement.param
-        if params.cdac_element is None or params.cdac_side is None or params.cdac_direction is None:
-            raise ValueError("CDAC measurement is missing its side, element, or direction")
-        if not 0 <= params.cdac_element < element_count:
-            raise ValueError("CDAC measurement element is outside the configured CDAC")
-        key = (
-            params.cdac_element,
-            0 if params.cdac_side == "p" else 1,
-            0 if params.cdac_direction == "1to0" else 1,
-            params.tb.dac_diffcaps,
-        )
-        grouped.setdefault(key, []).append(measurement)
-
-    curve_keys = sorted(grouped)
     per_mode_direction = np.full((2, element_count, 2, 2), np.nan, dtype=np.float64)
-    for element, side, direction, diffcaps in curve_keys:
-        curve_measurements = grouped[(element, side, direction, diffcaps)]
-        fine_measurements = [
-            measurement for measurement in curve_measurements if measurement.param.sweep_stage == "fine"
-        ]
-        fit = analyze_comp_offset_noise(fine_measurements or curve_measurements)
-        transition_v = fit.offset_v
-        valid = fit.validity != "non_monotonic" and math.isfinite(transition_v)
-        params = curve_measurements[0].param
-        signed_step = (comparator_offset_v - transition_v) / float(params.tb.vdd_dac.dc) if valid else math.nan
-        side_sign = 1.0 if params.cdac_side == "p" else -1.0
-        direction_sign = 1.0 if params.cdac_direction == "0to1" else -1.0
-        oriented_step = side_sign * direction_sign * signed_step
-        per_mode_direction[side, element, diffcaps, direction] = oriented_step
+    curves = cdac_curve_measurements(measurements, element_count)
+    fits = analyze_comp_offset_noise_curves(tuple(curves.values()))
+    for ((element, side, direction, diffcaps), curve_measurements), fit in zip(curves.items(), fits, strict=True):
+        valid = fit.validity != "non_monotonic" and math.isfinite(fit.offset_v)
+        per_mode_direction[side, element, diffcaps, direction] = (
+            oriented_cdac_step(curve_measurements[0].param, fit.offset_v, comparator_offset_v) if valid else math.nan
+        )
 
     main_fraction = np.full((2, element_count), np.nan, dtype=np.float64)
     diff_fraction = np.full((2, element_count), np.nan, dtype=np.float64)
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import itertools
 import math
 from collections.abc import Sequence
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from typing import cast
 
 import numpy as np
+from numpy.typing import NDArray
+from scipy.special import log_ndtr
 from scipy.stats import norm
 from scipy.stats import t as student_t
 
+from flow.analysis.cache import cached_analysis
 from flow.analysis.measure import measure_average_power, measure_delay, measure_settling
 from flow.analysis.types import (
     AnalysisCompCandidateSweep,
@@ -24,37 +28,148 @@ from flow.analysis.types import (
     MeasCompInt,
 )
 
+type FloatArray = NDArray[np.float64]
+type IntArray = NDArray[np.int64]
 
+
+S_CURVE_PROBABILITIES = (0.158655, 0.5, 0.841345)
+PROBIT_MAX_ITERATIONS = 100
+PROBIT_MAX_STEP_HALVINGS = 30
+PROBIT_TOLERANCE = 1e-9
+
+
+@cached_analysis
 def analyze_comp_offset_noise(
     measurements: Sequence[MeasCompExt | MeasCompInt | MeasCdacExt],
+    *,
+    probit: bool = False,
 ) -> AnalysisCompOffsetNoise:
     """Fit comparator offset and input noise from binary decision sweeps."""
 
-    if not measurements:
+    return analyze_comp_offset_noise_curves((measurements,), probit=probit)[0]
+
+
+@cached_analysis
+def analyze_comp_offset_noise_curves(
+    curves: Sequence[Sequence[MeasCompExt | MeasCompInt | MeasCdacExt]],
+    *,
+    probit: bool = False,
+) -> tuple[AnalysisCompOffsetNoise, ...]:
+    """Fit every S-curve of a campaign in one pass over its decisions.
+
+    Each result is the fit ``analyze_comp_offset_noise`` gives for that curve
+    alone. ``probit=True`` additionally refines every valid curve with a
+    maximum-likelihood probit fit seeded from its interpolated p50 and noise.
+    """
+
+    if not curves or any(not curve for curve in curves):
         raise ValueError("comparator offset/noise analysis requires measurements")
-    vin_diff_v = np.round(
+    measurements = [measurement for curve in curves for measurement in curve]
+    measurement_offset = np.concatenate(
+        ([0], np.cumsum([len(measurement.daq.decision) for measurement in measurements]))
+    ).astype(np.int64)
+    curve_offset = np.concatenate(([0], np.cumsum([len(curve) for curve in curves]))).astype(np.int64)
+    fit = _fit_scurve_segments(
         np.concatenate([measurement.daq.vin_diff_v for measurement in measurements]),
-        decimals=12,
+        np.concatenate([measurement.daq.decision for measurement in measurements]),
+        measurement_offset,
+        curve_offset,
+        batch_count=np.asarray(
+            [int(measurement.info.readbacks.get("capture_batch_count", 1)) for measurement in measurements],
+            dtype=np.int64,
+        ),
+        batch_trials=np.asarray(
+            [int(measurement.info.readbacks.get("capture_batch_trials", 0)) for measurement in measurements],
+            dtype=np.int64,
+        ),
+        probit=probit,
+    )
+    return tuple(
+        AnalysisCompOffsetNoise(
+            vin_diff_v=fit.vin_diff_v[start:stop],
+            decision_probability=fit.decision_probability[start:stop],
+            trial_count=fit.trial_count[start:stop],
+            offset_v=float(fit.offset_v[curve]),
+            noise_sigma_v=float(fit.noise_sigma_v[curve]),
+            decision_polarity=1 if fit.decision_polarity[curve] > 0 else -1,
+            validity=fit.validity[curve],
+            probit_offset_v=float(fit.probit_offset_v[curve]),
+            probit_noise_sigma_v=float(fit.probit_noise_sigma_v[curve]),
+        )
+        for curve, (start, stop) in enumerate(itertools.pairwise(fit.point_offset.tolist()))
     )
-    decisions = np.concatenate([measurement.daq.decision for measurement in measurements])
-    unique_input, inverse = np.unique(vin_diff_v, return_inverse=True)
-    if len(unique_input) < 3:
+
+
+@dataclass(frozen=True, slots=True)
+class _SCurveSegments:
+    """Per-point and per-curve S-curve results; ``point_offset`` delimits each curve's points."""
+
+    point_offset: IntArray
+    vin_diff_v: FloatArray
+    decision_probability: FloatArray
+    trial_count: IntArray
+    offset_v: FloatArray
+    noise_sigma_v: FloatArray
+    decision_polarity: IntArray
+    validity: tuple[CompFitValidity, ...]
+    probit_offset_v: FloatArray
+    probit_noise_sigma_v: FloatArray
+
+
+def _fit_scurve_segments(
+    vin_diff_v: NDArray[np.floating],
+    decision: NDArray[np.integer],
+    measurement_offset: IntArray,
+    curve_offset: IntArray,
+    *,
+    batch_count: IntArray,
+    batch_trials: IntArray,
+    probit: bool,
+) -> _SCurveSegments:
+    """Fit ragged S-curves given as sample segments per measurement and measurement segments per curve."""
+
+    curve_count = len(curve_offset) - 1
+    measurement_count = len(measurement_offset) - 1
+    sample_count = np.diff(measurement_offset)
+    measurement_curve = np.repeat(np.arange(curve_count, dtype=np.int64), np.diff(curve_offset))
+    sample_measurement = np.repeat(np.arange(measurement_count, dtype=np.int64), sample_count)
+    sample_curve = measurement_curve[sample_measurement]
+    rounded_v = np.round(np.asarray(vin_diff_v, dtype=np.float64), decimals=12)
+    decision_value = np.asarray(decision, dtype=np.float64)
+
+    # One point per distinct rounded input of each curve, ordered by curve and
+    # then input, so every curve's points form one contiguous segment.
+    order = np.lexsort((rounded_v, sample_curve))
+    sorted_curve = sample_curve[order]
+    sorted_v = rounded_v[order]
+    new_point = np.ones(len(order), dtype=np.bool_)
+    new_point[1:] = (sorted_curve[1:] != sorted_curve[:-1]) | (sorted_v[1:] != sorted_v[:-1])
+    sample_point = np.empty(len(order), dtype=np.int64)
+    sample_point[order] = np.cumsum(new_point) - 1
+    point_curve = sorted_curve[new_point]
+    point_v = sorted_v[new_point]
+    point_count = len(point_v)
+    point_offset = np.searchsorted(point_curve, np.arange(curve_count + 1)).astype(np.int64)
+    curve_point_count = np.diff(point_offset)
+    if np.any(curve_point_count < 3):
         raise ValueError("comparator offset/noise analysis requires at least three inputs")
-    count = np.bincount(inverse, minlength=len(unique_input)).astype(np.int64)
-    decision_count = np.bincount(
-        inverse,
-        weights=np.asarray(decisions, dtype=np.float64),
-        minlength=len(unique_input),
+    count = np.bincount(sample_point, minlength=point_count).astype(np.int64)
+    one_count = np.bincount(sample_point, weights=decision_value, minlength=point_count)
+    probability = one_count / count
+    input_mean = np.bincount(point_curve, weights=point_v, minlength=curve_count) / curve_point_count
+    probability_mean = np.bincount(point_curve, weights=probability, minlength=curve_count) / curve_point_count
+    trend = np.bincount(
+        point_curve,
+        weights=(point_v - input_mean[point_curve]) * (probability - probability_mean[point_curve]),
+        minlength=curve_count,
     )
-    probability = decision_count / count
-    trend = float(np.dot(unique_input - np.mean(unique_input), probability - np.mean(probability)))
-    decision_polarity = 1 if trend >= 0.0 else -1
+    decision_polarity = np.where(trend >= 0.0, 1, -1).astype(np.int64)
 
     # Adjacent-point reversals are tested across the complete curve. Use
     # Bonferroni-adjusted Wilson bounds so a long 100 µV grid does not acquire
     # an almost-certain false failure from repeated 95% pairwise tests.
-    comparison_count = max(len(unique_input) - 1, 1)
-    z_monotonic = float(norm.ppf(1.0 - 0.05 / (2.0 * comparison_count)))
+    comparison_count = np.maximum(curve_point_count - 1, 1)
+    z_monotonic = norm.ppf(1.0 - 0.05 / (2.0 * comparison_count))[point_curve]
     denominator = 1.0 + z_monotonic**2 / count
     interval_center = (probability + z_monotonic**2 / (2.0 * count)) / denominator
     interval_half_width = (
@@ -73,80 +188,241 @@ def analyze_comp_offset_noise(
     # reconstruction. A nonzero host interval additionally exposes slow drift;
     # zero-interval transport batches still expose within-capture correlation.
     # Simulations and legacy/unbatched measurements retain Wilson-only behavior.
-    batch_probabilities: list[list[float]] = [[] for _ in unique_input]
-    for measurement in measurements:
-        batch_count = int(measurement.info.readbacks.get("capture_batch_count", 1))
-        batch_trials = int(measurement.info.readbacks.get("capture_batch_trials", 0))
-        point_inputs = np.round(measurement.daq.vin_diff_v, decimals=12)
-        point_decisions = np.asarray(measurement.daq.decision)
-        if (
-            batch_count < 2
-            or batch_trials < 1
-            or batch_count * batch_trials != len(point_decisions)
-            or len(np.unique(point_inputs)) != 1
-        ):
-            continue
-        input_index = int(np.searchsorted(unique_input, point_inputs[0]))
-        batch_probabilities[input_index].extend(
-            np.mean(point_decisions.reshape(batch_count, batch_trials), axis=1).tolist()
+    batched = (batch_count >= 2) & (batch_trials >= 1) & (batch_count * batch_trials == sample_count)
+    measurement_point = np.full(measurement_count, -1, dtype=np.int64)
+    if np.any(batched):
+        # Reduce over every non-empty measurement so each segment ends at its
+        # own last sample, then keep the batched single-input measurements.
+        nonempty = np.flatnonzero(sample_count > 0)
+        first_point = np.full(measurement_count, -1, dtype=np.int64)
+        last_point = np.full(measurement_count, -1, dtype=np.int64)
+        first_point[nonempty] = np.minimum.reduceat(sample_point, measurement_offset[nonempty])
+        last_point[nonempty] = np.maximum.reduceat(sample_point, measurement_offset[nonempty])
+        single_input = batched & (first_point == last_point)
+        measurement_point[single_input] = first_point[single_input]
+        batched &= measurement_point >= 0
+    if np.any(batched):
+        sample_batched = np.repeat(batched, sample_count)
+        local_trial = np.arange(len(sample_measurement)) - measurement_offset[sample_measurement]
+        batch_offset = np.concatenate(([0], np.cumsum(np.where(batched, batch_count, 0))))
+        batch_index = (
+            batch_offset[sample_measurement] + local_trial // np.maximum(batch_trials[sample_measurement], 1)
+        )[sample_batched]
+        batch_probability = np.bincount(
+            batch_index, weights=decision_value[sample_batched], minlength=int(batch_offset[-1])
+        ) / np.repeat(batch_trials[batched], batch_count[batched])
+        batch_point = np.repeat(measurement_point[batched], batch_count[batched])
+        point_batch_count = np.bincount(batch_point, minlength=point_count)
+        clustered = point_batch_count >= 2
+        batch_mean = np.bincount(batch_point, weights=batch_probability, minlength=point_count) / np.maximum(
+            point_batch_count, 1
         )
-    for input_index, point_batches in enumerate(batch_probabilities):
-        if len(point_batches) < 2:
-            continue
-        batch_array = np.asarray(point_batches, dtype=np.float64)
-        cluster_half_width = float(
-            student_t.ppf(0.975, len(batch_array) - 1) * np.std(batch_array, ddof=1) / np.sqrt(len(batch_array))
+        batch_square_sum = np.bincount(
+            batch_point, weights=(batch_probability - batch_mean[batch_point]) ** 2, minlength=point_count
         )
-        lower_probability[input_index] = min(
-            lower_probability[input_index],
-            max(0.0, probability[input_index] - cluster_half_width),
+        degrees = point_batch_count[clustered] - 1
+        cluster_half_width = (
+            student_t.ppf(0.975, degrees)
+            * np.sqrt(batch_square_sum[clustered] / degrees)
+            / np.sqrt(point_batch_count[clustered])
         )
-        upper_probability[input_index] = max(
-            upper_probability[input_index],
-            min(1.0, probability[input_index] + cluster_half_width),
+        lower_probability[clustered] = np.minimum(
+            lower_probability[clustered], np.maximum(0.0, probability[clustered] - cluster_half_width)
         )
-    if decision_polarity > 0:
-        oriented_probability = probability
-        oriented_lower = lower_probability
-        oriented_upper = upper_probability
-    else:
-        oriented_probability = 1.0 - probability
-        oriented_lower = 1.0 - upper_probability
-        oriented_upper = 1.0 - lower_probability
-
-    significant_reversal = np.any(
-        (oriented_probability[:-1] > oriented_probability[1:]) & (oriented_lower[:-1] > oriented_upper[1:])
+        upper_probability[clustered] = np.maximum(
+            upper_probability[clustered], np.minimum(1.0, probability[clustered] + cluster_half_width)
+        )
+    rising = decision_polarity[point_curve] > 0
+    oriented_probability = np.where(rising, probability, 1.0 - probability)
+    oriented_lower = np.where(rising, lower_probability, 1.0 - upper_probability)
+    oriented_upper = np.where(rising, upper_probability, 1.0 - lower_probability)
+
+    same_curve = point_curve[1:] == point_curve[:-1]
+    reversal = (
+        same_curve & (oriented_probability[:-1] > oriented_probability[1:]) & (oriented_lower[:-1] > oriented_upper[1:])
+    )
+    significant_reversal = np.bincount(point_curve[:-1][reversal], minlength=curve_count) > 0
+
+    # Segmented running maximum without arithmetic on the probabilities: ranks
+    # offset by curve keep every curve's accumulation inside its own segment.
+    rank_order = np.argsort(oriented_probability, kind="stable")
+    rank = np.empty(point_count, dtype=np.int64)
+    rank[rank_order] = np.arange(point_count)
+    curve_key = point_curve * point_count
+    fitted_probability = oriented_probability[rank_order][np.maximum.accumulate(curve_key + rank) - curve_key]
+
+    p16, p50, p84 = (
+        _segment_input_at_probability(target, fitted_probability, point_v, point_curve, point_offset)
+        for target in S_CURVE_PROBABILITIES
     )
-    fitted_probability = np.maximum.accumulate(oriented_probability)
-
-    def input_at_probability(target: float) -> float:
-        if not fitted_probability[0] <= target <= fitted_probability[-1]:
-            return math.nan
-        return float(np.interp(target, fitted_probability, unique_input))
-
-    p16 = input_at_probability(0.158655)
-    p50 = input_at_probability(0.5)
-    p84 = input_at_probability(0.841345)
-    noise_sigma_v = abs(p84 - p16) / 2.0 if math.isfinite(p16) and math.isfinite(p84) else math.nan
-    if significant_reversal:
-        validity = "non_monotonic"
-        p50 = math.nan
-        noise_sigma_v = math.nan
-    elif all(math.isfinite(value) for value in (p16, p50, p84)):
-        validity = "valid"
-    else:
-        validity = "unbracketed"
-    return AnalysisCompOffsetNoise(
-        vin_diff_v=unique_input,
+    bracketed = np.isfinite(p16) & np.isfinite(p84)
+    noise_sigma_v = np.where(bracketed, np.abs(p84 - p16) / 2.0, math.nan)
+    p50[significant_reversal] = math.nan
+    noise_sigma_v[significant_reversal] = math.nan
+    valid = ~significant_reversal & bracketed & np.isfinite(p50)
+    validity = tuple(
+        cast(CompFitValidity, "non_monotonic" if reversed_curve else "valid" if valid_curve else "unbracketed")
+        for reversed_curve, valid_curve in zip(significant_reversal.tolist(), valid.tolist(), strict=True)
+    )
+    probit_offset_v = np.full(curve_count, math.nan, dtype=np.float64)
+    probit_noise_sigma_v = np.full(curve_count, math.nan, dtype=np.float64)
+    if probit and np.any(valid):
+        probit_offset_v, probit_noise_sigma_v = _fit_segment_probit(
+            point_v,
+            np.where(rising, one_count, count - one_count),
+            count.astype(np.float64),
+            point_curve,
+            point_offset,
+            offset_seed_v=np.where(valid, p50, 0.0),
+            sigma_seed_v=np.where(valid, noise_sigma_v, 1.0),
+            active=valid & (noise_sigma_v > 0.0),
+        )
+    return _SCurveSegments(
+        point_offset=point_offset,
+        vin_diff_v=point_v,
         decision_probability=probability,
         trial_count=count,
         offset_v=p50,
         noise_sigma_v=noise_sigma_v,
         decision_polarity=decision_polarity,
         validity=validity,
+        probit_offset_v=probit_offset_v,
+        probit_noise_sigma_v=probit_noise_sigma_v,
     )
 
 
+def _segment_input_at_probability(
+    target: float,
+    fitted_probability: FloatArray,
+    vin_diff_v: FloatArray,
+    point_curve: IntArray,
+    point_offset: IntArray,
+) -> FloatArray:
+    """Interpolate each curve's monotonic envelope at ``target`` exactly as ``np.interp`` would."""
+
+    curve_count = len(point_offset) - 1
+    first = point_offset[:-1]
+    last = point_offset[1:] - 1
+    bracketed = (fitted_probability[first] <= target) & (target <= fitted_probability[last])
+    # np.interp interpolates from the last envelope point not above the target.
+    at_or_below = np.bincount(point_curve, weights=fitted_probability <= target, minlength=curve_count)
+    lower = first + np.maximum(at_or_below.astype(np.int64), 1) - 1
+    upper = np.minimum(lower + 1, last)
+    exact = (lower == last) | (fitted_probability[lower] == target)
+    # Outside the bracket the envelope may be flat there; that result is discarded.
+    rise = fitted_probability[upper] - fitted_probability[lower]
+    slope = (vin_diff_v[upper] - vin_diff_v[lower]) / np.where(rise > 0.0, rise, 1.0)
+    interpolated = np.where(exact, vin_diff_v[lower], slope * (target - fitted_probability[lower]) + vin_diff_v[lower])
+    return np.where(bracketed, interpolated, math.nan)
+
+
+def _fit_segment_probit(
+    vin_diff_v: FloatArray,
+    one_count: FloatArray,
+    trial_count: FloatArray,
+    point_curve: IntArray,
+    point_offset: IntArray,
+    *,
+    offset_seed_v: FloatArray,
+    sigma_seed_v: FloatArray,
+    active: NDArray[np.bool_],
+) -> tuple[FloatArray, FloatArray]:
+    """Fit ``P(one) = Phi((vin - offset) / sigma)`` to every active oriented curve at once.
+
+    All curves take Newton steps in ``(offset, log(sigma))`` together, each
+    halving its own step until its likelihood does not decrease. Curves whose
+    step finds no such point, or that have not converged after
+    ``PROBIT_MAX_ITERATIONS``, report NaN.
+    """
+
+    curve_count = len(point_offset) - 1
+    span_v = vin_diff_v[point_offset[1:] - 1] - vin_diff_v[point_offset[:-1]]
+    same_curve = point_curve[1:] == point_curve[:-1]
+    minimum_spacing_v = np.full(curve_count, np.inf)
+    np.minimum.at(minimum_spacing_v, point_curve[1:][same_curve], np.diff(vin_diff_v)[same_curve])
+    minimum_log_sigma = np.log(np.maximum(minimum_spacing_v / 32.0, np.finfo(np.float64).tiny))
+    maximum_log_sigma = np.log(np.maximum(span_v, np.finfo(np.float64).tiny))
+
+    def log_likelihood(offset_v: FloatArray, log_sigma: FloatArray) -> FloatArray:
+        z = (vin_diff_v - offset_v[point_curve]) / np.exp(log_sigma)[point_curve]
+        point_log_likelihood = one_count * log_ndtr(z) + (trial_count - one_count) * log_ndtr(-z)
+        return np.bincount(point_curve, weights=point_log_likelihood, minlength=curve_count)
+
+    offset_v = offset_seed_v.astype(np.float64)
+    log_sigma = np.clip(np.log(sigma_seed_v), minimum_log_sigma, maximum_log_sigma)
+    current = log_likelihood(offset_v, log_sigma)
+    pending = active.copy()
+    converged = np.zeros(curve_count, dtype=np.bool_)
+    for _ in range(PROBIT_MAX_ITERATIONS):
+        if not np.any(pending):
+            break
+        sigma_v = np.exp(log_sigma)
+        z = (vin_diff_v - offset_v[point_curve]) / sigma_v[point_curve]
+        log_density = norm.logpdf(z)
+        log_one = log_ndtr(z)
+        log_zero = log_ndtr(-z)
+        hazard_one = np.exp(log_density - log_one)
+        hazard_zero = np.exp(log_density - log_zero)
+        zero_count = trial_count - one_count
+        # First and second derivatives of each point's log-likelihood in z;
+        # z falls with the offset at rate 1/sigma and with log(sigma) at rate z.
+        first = one_count * hazard_one - zero_count * hazard_zero
+        second = -one_count * hazard_one * (z + hazard_one) - zero_count * hazard_zero * (hazard_zero - z)
+
+        def curve_sum(weights: FloatArray) -> FloatArray:
+            return np.bincount(point_curve, weights=weights, minlength=curve_count)
+
+        score_offset = -curve_sum(first) / sigma_v
+        score_log_sigma = -curve_sum(first * z)
+        information_oo = -curve_sum(second) / sigma_v**2
+        information_os = -(curve_sum(second * z) + curve_sum(first)) / sigma_v
+        information_ss = -(curve_sum(second * z**2) + curve_sum(first * z))
+        determinant = information_oo * information_ss - information_os**2
+        # Far from the optimum the observed information can be indefinite;
+        # those curves take a Fisher-scoring step instead.
+        indefinite = (information_oo <= 0.0) | (determinant <= 0.0)
+        if np.any(indefinite):
+            fisher_weight = trial_count * np.exp(2.0 * log_density - log_one - log_zero)
+            information_oo = np.where(indefinite, curve_sum(fisher_weight) / sigma_v**2, information_oo)
+            information_os = np.where(indefinite, curve_sum(fisher_weight * z) / sigma_v, information_os)
+            information_ss = np.where(indefinite, curve_sum(fisher_weight * z**2), information_ss)
+            determinant = information_oo * information_ss - information_os**2
+        solvable = pending & (determinant > 0.0)
+        safe_determinant = np.where(solvable, determinant, 1.0)
+        step_offset = np.where(
+            solvable, (information_ss * score_offset - information_os * score_log_sigma) / safe_determinant, 0.0
+        )
+        step_log_sigma = np.where(
+            solvable, (information_oo * score_log_sigma - information_os * score_offset) / safe_determinant, 0.0
+        )
+        pending &= solvable
+        # The Newton decrement bounds the log-likelihood still to be gained;
+        # on the flat ridges of nearly deterministic curves the parameters
+        # converge only linearly, while this gain vanishes quickly.
+        settled = pending & (score_offset * step_offset + score_log_sigma * step_log_sigma <= PROBIT_TOLERANCE)
+        converged |= settled
+        pending &= ~settled
+        if not np.any(pending):
+            break
+
+        scale = np.ones(curve_count)
+        accepted = ~pending
+        for _ in range(PROBIT_MAX_STEP_HALVINGS):
+            trial_offset = offset_v + scale * step_offset
+            trial_log_sigma = np.clip(log_sigma + scale * step_log_sigma, minimum_log_sigma, maximum_log_sigma)
+            trial = log_likelihood(trial_offset, trial_log_sigma)
+            improved = ~accepted & (trial >= current)
+            offset_v = np.where(improved, trial_offset, offset_v)
+            log_sigma = np.where(improved, trial_log_sigma, log_sigma)
+            current = np.where(improved, trial, current)
+            accepted |= improved
+            if np.all(accepted):
+                break
+            scale = np.where(accepted, scale, scale / 2.0)
+        pending &= accepted
+    return np.where(converged, offset_v, math.nan), np.where(converged, np.exp(log_sigma), math.nan)
+
+
 def classify_comp_common_mode_validity(
     measurement_groups: Sequence[Sequence[MeasCompExt | MeasCompInt]],
     analyses: Sequence[AnalysisCompOffsetNoise],
@@ -201,6 +477,7 @@ def classify_comp_common_mode_validity(
     return tuple(classified)
 
 
+@cached_analysis
 def analyze_comp_timing(
     measurements: Sequence[MeasCompInt],
     *,
@@ -271,6 +548,7 @@ def _supply_voltage_v(measurement: MeasCompInt) -> float:
     return float(measurement.param.vdd_a.dc)
 
 
+@cached_analysis
 def analyze_comp_power(measurements: Sequence[MeasCompInt]) -> AnalysisCompPower:
     """Calculate average comparator power consumption."""
 
@@ -305,6 +583,7 @@ def analyze_comp_power(measurements: Sequence[MeasCompInt]) -> AnalysisCompPower
     )
 
 
+@cached_analysis
 def analyze_comp_candidate_sweep(measurements: Sequence[MeasCompInt]) -> AnalysisCompCandidateSweep:
     """Reuse the typed comparator analyses and align one row per candidate."""
 
@@ -313,7 +592,8 @@ def analyze_comp_candidate_sweep(measurements: Sequence[MeasCompInt]) -> Analysi
 
     rows = []
     seen_candidates = set()
-    for measurement in measurements:
+    noise_by_measurement = analyze_comp_offset_noise_curves([(measurement,) for measurement in measurements])
+    for measurement, noise in zip(measurements, noise_by_measurement, strict=True):
         readbacks = measurement.info.readbacks
         required = {
             "candidate_id",
@@ -334,7 +614,6 @@ def analyze_comp_candidate_sweep(measurements: Sequence[MeasCompInt]) -> Analysi
             raise ValueError(f"duplicate comparator candidate {candidate_id!r}")
         seen_candidates.add(candidate_id)
 
-        noise = analyze_comp_offset_noise([measurement])
         timing = analyze_comp_timing([measurement])
         power = analyze_comp_power([measurement])
         finite_delay = timing.clock_to_decision_s[np.isfinite(timing.clock_to_decision_s)]
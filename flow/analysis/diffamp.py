@@ -7,9 +7,11 @@ import math
 import numpy as np
 from scipy.signal import welch
 
+from flow.analysis.cache import cached_analysis
 from flow.analysis.types import AnalysisDiffampNoise
 
 
+@cached_analysis
 def analyze_diffamp_noise(
     samples_v: np.ndarray,
     *,
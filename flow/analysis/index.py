@@ -0,0 +1,253 @@
+"""Header-only SQLite index of the measurement files in one run directory.
+
+The index stores each file's flattened ``/info`` and ``/param`` scalars,
+its ``/daq`` and ``/wave`` dataset shapes, and its size and modification
+time in a sidecar beside the HDF5 files. Updating it opens only new or
+changed files, so runners can select a campaign subset by parameters without
+decoding every measurement.
+
+Update or inspect one run directory from the repository root with:
+
+    uv run python -m flow.analysis.index build/scan_adc/20260818_135848
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sqlite3
+from collections.abc import Mapping
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Self
+
+import h5py
+from hdl21.prefix import Prefixed
+
+from flow.analysis.io import decode_string, read_native
+from flow.analysis.types import InfoValue
+
+INDEX_FILENAME = "measurement_index.sqlite"
+INDEX_SCHEMA_VERSION = 1
+
+type IndexValue = InfoValue | None
+
+
+def _index_scalar(value) -> IndexValue:
+    """Return one persisted scalar in a form SQLite can compare."""
+
+    if isinstance(value, Prefixed):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _flatten_header(node: h5py.Group | h5py.Dataset, key: str, values: dict[str, IndexValue]) -> None:
+    """Flatten one native ``/info`` or ``/param`` tree into dotted scalar keys."""
+
+    kind = decode_string(node.attrs.get("_kind", ""))
+    if isinstance(node, h5py.Dataset):
+        if node.shape != ():
+            return
+        if kind == "enum":
+            # Record the member name without importing the persisted enum type.
+            values[key] = decode_string(node[()])
+            return
+        values[key] = _index_scalar(read_native(node))
+        return
+    if kind == "none":
+        values[key] = None
+        return
+    if kind == "dataclass":
+        values[key] = decode_string(node.attrs["_type"])
+    for name in node:
+        _flatten_header(node[name], f"{key}.{name}", values)
+
+
+def read_header_index(path: Path) -> tuple[dict[str, IndexValue], dict[str, tuple[int, ...]]]:
+    """Return one file's flattened header scalars and section dataset shapes."""
+
+    values: dict[str, IndexValue] = {}
+    shapes: dict[str, tuple[int, ...]] = {}
+    with h5py.File(path, "r") as input_file:
+        for section in ("info", "param"):
+            if section in input_file:
+                _flatten_header(input_file[section], section, values)
+        for section in ("daq", "wave"):
+            if section not in input_file:
+                continue
+            for name, dataset in input_file[section].items():
+                if isinstance(dataset, h5py.Dataset):
+                    shapes[f"{section}.{name}"] = tuple(int(size) for size in dataset.shape)
+    return values, shapes
+
+
+class MeasurementIndex:
+    """Incrementally maintained SQLite index of one run directory's HDF5 files."""
+
+    def __init__(self, run_dir: Path, *, index_path: Path | None = None) -> None:
+        self.run_dir = Path(run_dir)
+        if not self.run_dir.is_dir():
+            raise FileNotFoundError(2, "measurement run directory not found", self.run_dir)
+        self.index_path = self.run_dir / INDEX_FILENAME if index_path is None else Path(index_path)
+        self._connection = sqlite3.connect(self.index_path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS schema (version INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS fields (
+                path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+                key TEXT NOT NULL,
+                value,
+                PRIMARY KEY (path, key)
+            );
+            CREATE TABLE IF NOT EXISTS shapes (
+                path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+                dataset TEXT NOT NULL,
+                shape TEXT NOT NULL,
+                PRIMARY KEY (path, dataset)
+            );
+            CREATE INDEX IF NOT EXISTS fields_by_value ON fields (key, value);
+            """
+        )
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        version = self._connection.execute("SELECT version FROM schema").fetchone()
+        if version is None:
+            with self._connection:
+                self._connection.execute("INSERT INTO schema (version) VALUES (?)", (INDEX_SCHEMA_VERSION,))
+        elif version[0] != INDEX_SCHEMA_VERSION:
+            raise ValueError(f"{self.index_path} uses unsupported index schema version {version[0]}")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def update(self) -> int:
+        """Index new or changed HDF5 files, drop deleted ones, and return the re-read count."""
+
+        on_disk = {}
+        for path in sorted(self.run_dir.rglob("*.h5")):
+            if path.name.startswith("."):
+                continue
+            stat = path.stat()
+            on_disk[path.relative_to(self.run_dir).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+        indexed = {
+            relative: (size, mtime_ns)
+            for relative, size, mtime_ns in self._connection.execute("SELECT path, size, mtime_ns FROM files")
+        }
+        stale = [relative for relative, stat in on_disk.items() if indexed.get(relative) != stat]
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM files WHERE path = ?",
+                [(relative,) for relative in indexed if relative not in on_disk],
+            )
+            for relative in stale:
+                values, shapes = read_header_index(self.run_dir / relative)
+                size, mtime_ns = on_disk[relative]
+                self._connection.execute("DELETE FROM files WHERE path = ?", (relative,))
+                self._connection.execute(
+                    "INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                    (relative, size, mtime_ns),
+                )
+                self._connection.executemany(
+                    "INSERT INTO fields (path, key, value) VALUES (?, ?, ?)",
+                    [(relative, key, value) for key, value in values.items()],
+                )
+                self._connection.executemany(
+                    "INSERT INTO shapes (path, dataset, shape) VALUES (?, ?, ?)",
+                    [(relative, dataset, json.dumps(shape)) for dataset, shape in shapes.items()],
+                )
+        return len(stale)
+
+    def paths(self) -> tuple[Path, ...]:
+        """Return every indexed file in sorted order."""
+
+        rows = self._connection.execute("SELECT path FROM files ORDER BY path")
+        return tuple(self.run_dir / relative for (relative,) in rows)
+
+    def select(
+        self,
+        criteria: Mapping[str, IndexValue] | None = None,
+        *,
+        rel_tol: float = 1e-12,
+        abs_tol: float = 1e-15,
+    ) -> tuple[Path, ...]:
+        """Return sorted paths whose dotted header keys equal every criterion.
+
+        Keys follow the HDF5 layout, for example ``param.campaign``,
+        ``param.tb.vin_diff.dc`` or ``info.readbacks.fastrx_lost_count``.
+        Floating-point criteria match within ``rel_tol``/``abs_tol``; ``None``
+        matches a stored ``None`` value.
+        """
+
+        clauses = []
+        arguments: list[Any] = []
+        for key, value in (criteria or {}).items():
+            if value is None:
+                clauses.append("SELECT path FROM fields WHERE key = ? AND value IS NULL")
+                arguments.append(key)
+            elif isinstance(value, float):
+                if not math.isfinite(value):
+                    raise ValueError(f"index criterion {key!r} must be finite")
+                clauses.append(
+                    "SELECT path FROM fields WHERE key = ? AND typeof(value) IN ('integer', 'real') "
+                    "AND ABS(value - ?) <= ?"
+                )
+                arguments.extend((key, value, max(rel_tol * abs(value), abs_tol)))
+            else:
+                clauses.append("SELECT path FROM fields WHERE key = ? AND value = ?")
+                arguments.extend((key, value))
+        query = " INTERSECT ".join(clauses) if clauses else "SELECT path FROM files"
+        rows = self._connection.execute(f"SELECT path FROM ({query}) ORDER BY path", arguments)
+        return tuple(self.run_dir / relative for (relative,) in rows)
+
+    def values(self, path: Path) -> dict[str, IndexValue]:
+        """Return one indexed file's flattened header scalars."""
+
+        relative = Path(path).resolve().relative_to(self.run_dir.resolve()).as_posix()
+        rows = self._connection.execute("SELECT key, value FROM fields WHERE path = ? ORDER BY key", (relative,))
+        values = dict(rows.fetchall())
+        if not values:
+            raise KeyError(f"{path} is not indexed")
+        return values
+
+    def shapes(self, path: Path) -> dict[str, tuple[int, ...]]:
+        """Return one indexed file's ``/daq`` and ``/wave`` dataset shapes."""
+
+        relative = Path(path).resolve().relative_to(self.run_dir.resolve()).as_posix()
+        rows = self._connection.execute(
+            "SELECT dataset, shape FROM shapes WHERE path = ? ORDER BY dataset",
+            (relative,),
+        )
+        return {dataset: tuple(json.loads(shape)) for dataset, shape in rows}
+
+
+def main() -> None:
+    """Update one run directory's index and report its size."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("run_dir", type=Path, help="directory containing measurement HDF5 files")
+    args = parser.parse_args()
+    with MeasurementIndex(args.run_dir) as index:
+        updated = index.update()
+        print(f"Indexed {len(index.paths())} files in {index.index_path} ({updated} updated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import dataclasses
+import glob
 import importlib
 import math
+import os
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, Self, cast
 
 import h5py
 import numpy as np
 from hdl21.prefix import Prefix, Prefixed
+from numpy.lib.mixins import NDArrayOperatorsMixin
 
 from flow.analysis.types import (
     MEASUREMENT_TYPES,
@@ -85,29 +90,98 @@ def _resolve_type(name: str) -> type:
     return value
 
 
-def _decode_string(value):
+def decode_string(value):
+    """Return a stored HDF5 string attribute or value as ``str``."""
+
     if isinstance(value, bytes):
         return value.decode()
     return value
 
 
-def _create_dataset(parent: h5py.Group, name: str, value, *, wave: bool = False) -> h5py.Dataset:
-    """Create one scalar or array dataset with useful waveform chunking."""
+@dataclasses.dataclass(frozen=True, slots=True)
+class StorageProfile:
+    """HDF5 filters and chunk layout for non-empty measurement arrays.
+
+    ``record`` chunks each waveform record separately and lets h5py choose
+    DAQ chunks, ``column`` chunks long row runs of few columns so single bit
+    columns and time slices read independently, and ``contiguous`` stores
+    unfiltered arrays that lazy reads can memory-map.
+    """
+
+    compression: Literal["gzip", "lzf"] | None
+    compression_opts: int | None = None
+    shuffle: bool = False
+    layout: Literal["record", "column", "contiguous"] = "record"
+
+    def __post_init__(self) -> None:
+        if self.layout == "contiguous" and (self.compression is not None or self.shuffle):
+            raise ValueError("contiguous storage cannot apply HDF5 filters")
+        if self.compression_opts is not None and self.compression != "gzip":
+            raise ValueError("compression_opts is only valid for gzip")
+
+
+STORAGE_PROFILES = {
+    "default": StorageProfile("gzip"),
+    "fast": StorageProfile(None, layout="contiguous"),
+    "archive": StorageProfile("gzip", compression_opts=6, shuffle=True),
+    "analysis": StorageProfile("lzf", shuffle=True, layout="column"),
+}
+# Target about 2 MiB of float64 per chunk for column-oriented layouts.
+COLUMN_CHUNK_ELEMENTS = 1 << 18
+
+
+def _storage_options(shape: tuple[int, ...], profile: StorageProfile, *, wave: bool) -> dict[str, Any]:
+    """Return h5py dataset options for one non-empty array."""
+
+    if profile.layout == "contiguous":
+        return {}
+    options: dict[str, Any] = {}
+    if profile.compression is not None:
+        options["compression"] = profile.compression
+    if profile.compression_opts is not None:
+        options["compression_opts"] = profile.compression_opts
+    if profile.shuffle:
+        options["shuffle"] = True
+    if profile.layout == "record":
+        if wave and len(shape) >= 2:
+            options["chunks"] = (1, *shape[1:])
+    elif len(shape) == 1:
+        options["chunks"] = (min(shape[0], COLUMN_CHUNK_ELEMENTS),)
+    elif wave:
+        columns = min(shape[1], 4096)
+        rows = min(shape[0], max(1, COLUMN_CHUNK_ELEMENTS // columns))
+        options["chunks"] = (rows, columns, *shape[2:])
+    else:
+        options["chunks"] = (min(shape[0], COLUMN_CHUNK_ELEMENTS), 1, *shape[2:])
+    return options
+
+
+def _create_dataset(
+    parent: h5py.Group,
+    name: str,
+    value,
+    *,
+    wave: bool = False,
+    profile: StorageProfile = STORAGE_PROFILES["default"],
+) -> h5py.Dataset:
+    """Create one scalar or array dataset with the requested storage layout."""
 
     array = np.asarray(value)
     kwargs = {}
     if array.ndim and array.size:
-        kwargs["compression"] = "gzip"
-        if wave and array.ndim >= 2:
-            kwargs["chunks"] = (1, *array.shape[1:])
+        kwargs = _storage_options(array.shape, profile, wave=wave)
     if array.dtype.kind in {"U", "O"}:
         string_dtype = h5py.string_dtype("utf-8")
         return parent.create_dataset(name, data=np.asarray(value, dtype=object), dtype=string_dtype, **kwargs)
     return parent.create_dataset(name, data=value, **kwargs)
 
 
-def _write_native(parent: h5py.Group, name: str, value) -> None:
-    """Write one nested parameter or run-information value natively to HDF5."""
+def _write_native(parent: h5py.Group, name: str, value, *, finite: bool = True) -> None:
+    """Write one nested parameter or run-information value natively to HDF5.
+
+    Measurement parameters must be finite; analysis results pass
+    ``finite=False`` to keep NaN markers for failed or undefined fits.
+    """
 
     if value is None:
         group = parent.create_group(name)
@@ -136,13 +210,13 @@ def _write_native(parent: h5py.Group, name: str, value) -> None:
         group.attrs["_kind"] = "dataclass"
         group.attrs["_type"] = _qualified_type(type(value))
         for data_field in dataclasses.fields(value):
-            _write_native(group, data_field.name, getattr(value, data_field.name))
+            _write_native(group, data_field.name, getattr(value, data_field.name), finite=finite)
         return
     if isinstance(value, Mapping):
         group = parent.create_group(name)
         group.attrs["_kind"] = "mapping"
         for key, item in value.items():
-            _write_native(group, str(key), item)
+            _write_native(group, str(key), item, finite=finite)
         return
     if isinstance(value, (tuple, list)):
         array = np.asarray(value)
@@ -153,22 +227,22 @@ def _write_native(parent: h5py.Group, name: str, value) -> None:
         group = parent.create_group(name)
         group.attrs["_kind"] = "tuple" if isinstance(value, tuple) else "list"
         for index, item in enumerate(value):
-            _write_native(group, str(index), item)
+            _write_native(group, str(index), item, finite=finite)
         return
     if isinstance(value, np.generic):
         value = value.item()
     if isinstance(value, (bool, int, float, str, np.ndarray)):
-        if isinstance(value, float) and not math.isfinite(value):
+        if finite and isinstance(value, float) and not math.isfinite(value):
             raise ValueError(f"cannot persist non-finite scalar {value!r}")
         _create_dataset(parent, name, value)
         return
     raise TypeError(f"cannot persist {type(value).__name__} in measurement HDF5")
 
 
-def _read_native(node: h5py.Group | h5py.Dataset):
-    """Read one value written by :func:`_write_native`."""
+def read_native(node: h5py.Group | h5py.Dataset):
+    """Read one ``/info`` or ``/param`` value written by :func:`_write_native`."""
 
-    kind = _decode_string(node.attrs.get("_kind", ""))
+    kind = decode_string(node.attrs.get("_kind", ""))
     if isinstance(node, h5py.Dataset):
         value = node[()]
         if isinstance(value, np.ndarray) and value.dtype.kind in {"S", "O"}:
@@ -178,7 +252,7 @@ def _read_native(node: h5py.Group | h5py.Dataset):
         elif isinstance(value, np.generic):
             value = value.item()
         if kind == "enum":
-            enum_type = _resolve_type(_decode_string(node.attrs["_type"]))
+            enum_type = _resolve_type(decode_string(node.attrs["_type"]))
             if not issubclass(enum_type, Enum):
                 raise TypeError(f"persisted enum type {enum_type.__name__!r} is not an Enum")
             return enum_type[value]
@@ -189,7 +263,7 @@ def _read_native(node: h5py.Group | h5py.Dataset):
         if kind == "prefixed":
             return Prefixed.new(
                 Decimal(value),
-                Prefix[_decode_string(node.attrs["_prefix"])],
+                Prefix[decode_string(node.attrs["_prefix"])],
             )
         if kind == "tuple":
             return tuple(value.tolist())
@@ -200,17 +274,17 @@ def _read_native(node: h5py.Group | h5py.Dataset):
     if kind == "none":
         return None
     if kind in {"tuple", "list"}:
-        values = [_read_native(node[key]) for key in sorted(node, key=int)]
+        values = [read_native(node[key]) for key in sorted(node, key=int)]
         return tuple(values) if kind == "tuple" else values
     if kind == "mapping":
-        return {key: _read_native(node[key]) for key in node}
+        return {key: read_native(node[key]) for key in node}
     if kind == "dataclass":
-        value_type = _resolve_type(_decode_string(node.attrs["_type"]))
+        value_type = _resolve_type(decode_string(node.attrs["_type"]))
         values = {}
         missing = []
         for data_field in _dataclass_fields(value_type):
             if data_field.name in node:
-                values[data_field.name] = _read_native(node[data_field.name])
+                values[data_field.name] = read_native(node[data_field.name])
             elif data_field.default is not dataclasses.MISSING:
                 values[data_field.name] = data_field.default
             elif data_field.default_factory is not dataclasses.MISSING:
@@ -223,7 +297,12 @@ def _read_native(node: h5py.Group | h5py.Dataset):
     raise ValueError(f"unsupported HDF5 value kind {kind!r} at {node.name}")
 
 
-def _write_section(parent: h5py.File, name: str, section) -> None:
+def _write_section(
+    parent: h5py.File,
+    name: str,
+    section,
+    profile: StorageProfile = STORAGE_PROFILES["default"],
+) -> None:
     group = parent.create_group(name)
     if section is None:
         group.attrs["_kind"] = "none"
@@ -233,7 +312,7 @@ def _write_section(parent: h5py.File, name: str, section) -> None:
         value = getattr(section, data_field.name)
         if value is None:
             continue
-        _create_dataset(group, data_field.name, value, wave=name == "wave")
+        _create_dataset(group, data_field.name, value, wave=name == "wave", profile=profile)
 
 
 def _read_section(group: h5py.Group, section_type: type):
@@ -251,37 +330,415 @@ def _read_section(group: h5py.Group, section_type: type):
     return section_type(**values)
 
 
-def write_measurement(path: Path, msmt: Measurement) -> Path:
-    """Write one typed physical, behavioral, or SPICE measurement."""
+class LazyDataset(NDArrayOperatorsMixin):
+    """One stored ``/daq`` or ``/wave`` array that is read on first use.
+
+    Contiguous, uncompressed datasets are memory-mapped directly from the
+    HDF5 file; chunked or compressed datasets are read through h5py. Basic
+    slices of an unloaded dataset read only the requested rows, so analyses
+    can stream large captures without materializing them.
+    """
+
+    __slots__ = ("_array", "_offset", "dtype", "name", "path", "shape")
+
+    def __init__(self, path: Path, name: str, shape: tuple[int, ...], dtype: np.dtype, offset: int | None) -> None:
+        self.path = Path(path)
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._offset = offset
+        self._array: np.ndarray | None = None
+
+    @classmethod
+    def from_dataset(cls, path: Path, dataset: h5py.Dataset) -> LazyDataset:
+        """Describe one open dataset without reading its values."""
+
+        offset = None
+        if dataset.chunks is None and dataset.compression is None and dataset.size:
+            offset = dataset.id.get_offset()
+        return cls(path, dataset.name, dataset.shape, dataset.dtype, offset)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def loaded(self) -> bool:
+        return self._array is not None
+
+    def _source(self) -> np.ndarray | None:
+        if self._offset is None:
+            return None
+        return np.memmap(self.path, mode="r", dtype=self.dtype, shape=self.shape, offset=self._offset)
+
+    def load(self) -> np.ndarray:
+        """Return the complete array, reading it from disk at most once."""
+
+        if self._array is None:
+            array = self._source()
+            if array is None:
+                with h5py.File(self.path, "r") as input_file:
+                    array = np.asarray(input_file[self.name][()])
+            self._array = array
+        return self._array
+
+    def __getitem__(self, key):
+        if self._array is not None:
+            return self._array[key]
+        items = key if isinstance(key, tuple) else (key,)
+        if not all(isinstance(item, (int, np.integer, slice)) for item in items):
+            return self.load()[key]
+        source = self._source()
+        if source is not None:
+            return np.array(source[key])
+        with h5py.File(self.path, "r") as input_file:
+            return np.asarray(input_file[self.name][key])
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized lazy dataset")
+        return self.shape[0]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = self.load()
+        if dtype is not None and np.dtype(dtype) != array.dtype:
+            return array.astype(dtype)
+        return np.array(array, copy=True) if copy else array
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(value.load() if isinstance(value, LazyDataset) else value for value in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __getstate__(self):
+        return (self.path, self.name, self.shape, self.dtype, self._offset)
+
+    def __setstate__(self, state) -> None:
+        self.path, self.name, self.shape, self.dtype, self._offset = state
+        self._array = None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "unloaded"
+        return f"LazyDataset({str(self.path)!r}, {self.name!r}, shape={self.shape}, dtype={self.dtype}, {state})"
+
+
+def _lazy_section(group: h5py.Group, section_type: type, path: Path):
+    """Describe one section without reading arrays or running its validation."""
+
+    if group.attrs.get("_kind") == "none":
+        return None
+    values = {}
+    missing = []
+    for data_field in _dataclass_fields(section_type):
+        if data_field.name in group:
+            values[data_field.name] = LazyDataset.from_dataset(path, group[data_field.name])
+        elif data_field.default is not dataclasses.MISSING:
+            values[data_field.name] = data_field.default
+        else:
+            missing.append(data_field.name)
+    if missing:
+        raise ValueError(f"{group.name} is missing required datasets {missing}")
+    section = object.__new__(section_type)
+    for name, value in values.items():
+        object.__setattr__(section, name, value)
+    return section
+
+
+def materialize_measurement(msmt: Measurement) -> Measurement:
+    """Load every lazy array of one measurement and run the full validation."""
+
+    def materialize_section(section):
+        if section is None:
+            return None
+        values = {}
+        for data_field in dataclasses.fields(section):
+            value = getattr(section, data_field.name)
+            values[data_field.name] = value.load() if isinstance(value, LazyDataset) else value
+        return type(section)(**values)
+
+    return type(msmt)(
+        info=msmt.info,
+        param=msmt.param,
+        daq=materialize_section(msmt.daq),
+        wave=materialize_section(msmt.wave),
+    )
+
+
+def _storage_profile(name: str) -> StorageProfile:
+    try:
+        return STORAGE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown storage profile {name!r}; expected one of {sorted(STORAGE_PROFILES)}") from None
+
+
+def _write_header(output: h5py.File, msmt_info: MeasInfo, msmt_param) -> None:
+    """Write the ``/info`` and ``/param`` groups of one measurement."""
+
+    info = output.create_group("info")
+    _write_native(info, "schema_version", msmt_info.schema_version)
+    _write_native(info, "measurement_type", msmt_info.measurement_type)
+    _write_native(info, "backend", msmt_info.backend)
+    _write_native(info, "timestamp_utc", msmt_info.timestamp_utc)
+    _write_native(info, "instruments", msmt_info.instruments)
+    _write_native(info, "readbacks", msmt_info.readbacks)
+    param = output.create_group("param")
+    param.attrs["_kind"] = "dataclass"
+    param.attrs["_type"] = _qualified_type(type(msmt_param))
+    for data_field in _dataclass_fields(msmt_param):
+        _write_native(param, data_field.name, getattr(msmt_param, data_field.name))
+
+
+def write_measurement(path: Path, msmt: Measurement, *, profile: str = "default") -> Path:
+    """Write one typed physical, behavioral, or SPICE measurement.
+
+    ``profile`` names an entry of :data:`STORAGE_PROFILES` that controls the
+    filters and chunking of the ``/daq`` and ``/wave`` arrays.
+    """
+
+    storage = _storage_profile(profile)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.unlink(missing_ok=True)
+    try:
+        with h5py.File(temporary_path, "w") as output:
+            output.attrs["storage_profile"] = profile
+            _write_header(output, msmt.info, msmt.param)
+            _write_section(output, "daq", msmt.daq, storage)
+            _write_section(output, "wave", msmt.wave, storage)
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return path
+
 
+class MeasurementStream:
+    """Write one measurement whose ``/daq`` rows arrive in consecutive chunks.
+
+    Use it as a context manager or pair :meth:`open` with :meth:`close`.
+    :meth:`append` validates each chunk as a ``daq_type`` section and extends
+    resizable ``/daq`` datasets, so captures larger than host memory are
+    stored at a bounded footprint. :meth:`finish` adds ``/info``, ``/param``,
+    and ``/wave`` and renames the hidden temporary file into place like
+    :func:`write_measurement`; closing without finishing discards it.
+    Resizable datasets are always chunked, so the ``contiguous`` layout only
+    drops its filters here.
+    """
+
+    def __init__(self, path: Path, daq_type: type, *, profile: str = "default") -> None:
+        self.path = Path(path)
+        self.daq_type = daq_type
+        self.profile = profile
+        self.rows = 0
+        self._storage = _storage_profile(profile)
+        self._temporary_path = self.path.with_name(f".{self.path.name}.tmp")
+        self._output: h5py.File | None = None
+        self._fields: tuple[str, ...] | None = None
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._output is not None
+
+    def open(self) -> None:
+        """Create the hidden temporary file and its empty ``/daq`` group."""
+
+        if self._output is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._temporary_path.unlink(missing_ok=True)
+        self._output = h5py.File(self._temporary_path, "w")
+        self._output.attrs["storage_profile"] = self.profile
+        self._output.create_group("daq").attrs["_type"] = _qualified_type(self.daq_type)
+        self._fields = None
+        self.rows = 0
+
+    def close(self) -> None:
+        """Close the stream and discard its temporary file unless it was finished."""
+
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+        self._temporary_path.unlink(missing_ok=True)
+
+    def append(self, section) -> None:
+        """Append the rows of one validated ``daq_type`` section."""
+
+        if self._output is None:
+            raise RuntimeError(f"measurement stream {self.path} is not open")
+        if type(section) is not self.daq_type:
+            raise TypeError(f"expected a {self.daq_type.__name__} chunk, got {type(section).__name__}")
+        arrays = {
+            data_field.name: np.asarray(getattr(section, data_field.name))
+            for data_field in dataclasses.fields(section)
+            if getattr(section, data_field.name) is not None
+        }
+        if self._fields is None:
+            self._fields = tuple(arrays)
+        elif tuple(arrays) != self._fields:
+            raise ValueError(f"/daq chunk fields {tuple(arrays)} differ from the first chunk's {self._fields}")
+        daq = self._output["daq"]
+        rows = 0
+        for name, array in arrays.items():
+            if array.ndim == 0 or array.dtype.kind in {"U", "O"}:
+                raise ValueError(f"streamed /daq field {name} must be a numeric array")
+            if name not in daq:
+                options = _storage_options((COLUMN_CHUNK_ELEMENTS, *array.shape[1:]), self._storage, wave=False)
+                daq.create_dataset(
+                    name,
+                    shape=(0, *array.shape[1:]),
+                    maxshape=(None, *array.shape[1:]),
+                    dtype=array.dtype,
+                    **options,
+                )
+            dataset = daq[name]
+            dataset.resize(self.rows + len(array), axis=0)
+            dataset[self.rows :] = array
+            rows = len(array)
+        self.rows += rows
+
+    def finish(self, msmt_info: MeasInfo, msmt_param, wave) -> Path:
+        """Write ``/info``, ``/param``, and ``/wave`` and move the complete file into place."""
+
+        if self._output is None:
+            raise RuntimeError(f"measurement stream {self.path} is not open")
+        daq_type, wave_type = SECTION_TYPES.get(msmt_info.measurement_type, (None, None))
+        if daq_type is not self.daq_type or (wave is not None and type(wave) is not wave_type):
+            raise TypeError(f"{msmt_info.measurement_type} does not store {self.daq_type.__name__} chunks")
+        if not self.rows:
+            raise ValueError(f"measurement stream {self.path} received no /daq rows")
+        _write_header(self._output, msmt_info, msmt_param)
+        _write_section(self._output, "wave", wave, self._storage)
+        self._output.close()
+        self._output = None
+        self._temporary_path.replace(self.path)
+        return self.path
+
+
+def write_analysis(path: Path, analysis, *, attrs: Mapping[str, str | int | float] | None = None) -> Path:
+    """Write one typed analysis result, with root ``attrs``, atomically to HDF5."""
+
+    if not dataclasses.is_dataclass(analysis) and not isinstance(analysis, tuple):
+        raise TypeError(f"cannot persist {type(analysis).__name__} as an analysis result")
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary_path = path.with_name(f".{path.name}.tmp")
     temporary_path.unlink(missing_ok=True)
     try:
         with h5py.File(temporary_path, "w") as output:
-            info = output.create_group("info")
-            _write_native(info, "schema_version", msmt.info.schema_version)
-            _write_native(info, "measurement_type", msmt.info.measurement_type)
-            _write_native(info, "backend", msmt.info.backend)
-            _write_native(info, "timestamp_utc", msmt.info.timestamp_utc)
-            _write_native(info, "instruments", msmt.info.instruments)
-            _write_native(info, "readbacks", msmt.info.readbacks)
-            param = output.create_group("param")
-            param.attrs["_kind"] = "dataclass"
-            param.attrs["_type"] = _qualified_type(type(msmt.param))
-            for data_field in _dataclass_fields(msmt.param):
-                _write_native(param, data_field.name, getattr(msmt.param, data_field.name))
-            _write_section(output, "daq", msmt.daq)
-            _write_section(output, "wave", msmt.wave)
+            for key, value in (attrs or {}).items():
+                output.attrs[key] = value
+            _write_native(output, "analysis", analysis, finite=False)
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return path
+
+
+def read_analysis(path: Path):
+    """Read one analysis result written by :func:`write_analysis`."""
+
+    with h5py.File(Path(path), "r") as input_file:
+        return read_native(input_file["analysis"])
+
+
+def convert_measurement_storage(source: Path, destination: Path | None = None, *, profile: str) -> Path:
+    """Rewrite one measurement file's ``/daq`` and ``/wave`` arrays with another storage profile.
+
+    ``/info`` and ``/param`` are copied unchanged. Without ``destination`` the
+    source file is replaced atomically.
+    """
+
+    storage = _storage_profile(profile)
+    source = Path(source)
+    path = source if destination is None else Path(destination)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.unlink(missing_ok=True)
+    try:
+        with h5py.File(source, "r") as input_file, h5py.File(temporary_path, "w") as output:
+            for key, value in input_file.attrs.items():
+                output.attrs[key] = value
+            output.attrs["storage_profile"] = profile
+            for name in input_file:
+                if name not in {"daq", "wave"}:
+                    input_file.copy(input_file[name], output, name)
+                    continue
+                group = output.create_group(name)
+                for key, value in input_file[name].attrs.items():
+                    group.attrs[key] = value
+                for dataset_name, dataset in input_file[name].items():
+                    copied = _create_dataset(
+                        group,
+                        dataset_name,
+                        dataset[()],
+                        wave=name == "wave",
+                        profile=storage,
+                    )
+                    for key, value in dataset.attrs.items():
+                        copied.attrs[key] = value
         temporary_path.replace(path)
     finally:
         temporary_path.unlink(missing_ok=True)
     return path
 
 
-def read_measurement(path: Path) -> Measurement:
-    """Read one HDF5 file into its concrete typed in-memory measurement."""
+def convert_run_storage(run_dir: Path, *, profile: str, output_dir: Path | None = None) -> tuple[Path, ...]:
+    """Rewrite every measurement beneath one run directory with another storage profile."""
+
+    run_dir = Path(run_dir)
+    sources = [path for path in sorted(run_dir.rglob("*.h5")) if not path.name.startswith(".")]
+    return tuple(
+        convert_measurement_storage(
+            source,
+            None if output_dir is None else Path(output_dir) / source.relative_to(run_dir),
+            profile=profile,
+        )
+        for source in sources
+    )
+
+
+def read_measurement(path: Path, *, lazy: bool = False) -> Measurement:
+    """Read one HDF5 file into its concrete typed in-memory measurement.
+
+    With ``lazy=True`` only ``/info`` and ``/param`` are decoded. Every
+    ``/daq`` and ``/wave`` field becomes a :class:`LazyDataset` that loads on
+    first access, and section validation is deferred to
+    :func:`materialize_measurement`. Lazy reads trust the typed writer that
+    produced the file; use them to select inputs by parameters or to stream
+    large captures.
+    """
+
+    return cast(Measurement, _read_selected(path, None, lazy))
+
+
+def _read_selected(
+    path: Path,
+    select: Callable[[Measurement], bool] | None,
+    lazy: bool,
+) -> Measurement | None:
+    """Read one file if its lazily decoded measurement passes ``select``.
+
+    The header is decoded once and, for a full read, the sections are read
+    through the same open file.
+    """
 
     path = Path(path)
     with h5py.File(path, "r") as input_file:
@@ -301,27 +758,82 @@ def read_measurement(path: Path) -> Measurement:
         missing_info = sorted(required_info.difference(info_group))
         if missing_info:
             raise ValueError(f"{path} is missing required /info datasets {missing_info}")
-        measurement_type = str(_read_native(info_group["measurement_type"]))
+        measurement_type = str(read_native(info_group["measurement_type"]))
         try:
             measurement_class = MEASUREMENT_TYPES[measurement_type]
             daq_type, wave_type = SECTION_TYPES[measurement_type]
         except KeyError:
             raise ValueError(f"unsupported measurement type {measurement_type!r}") from None
         info = MeasInfo(
-            schema_version=int(_read_native(info_group["schema_version"])),
+            schema_version=int(read_native(info_group["schema_version"])),
             measurement_type=measurement_type,
-            backend=cast(Backend, str(_read_native(info_group["backend"]))),
-            timestamp_utc=_read_native(info_group["timestamp_utc"]),
-            instruments=_read_native(info_group["instruments"]),
-            readbacks=_read_native(info_group["readbacks"]),
+            backend=cast(Backend, str(read_native(info_group["backend"]))),
+            timestamp_utc=read_native(info_group["timestamp_utc"]),
+            instruments=read_native(info_group["instruments"]),
+            readbacks=read_native(info_group["readbacks"]),
             source_path=path,
         )
-        param = _read_native(input_file["param"])
+        param = read_native(input_file["param"])
+        if lazy or select is not None:
+            msmt = object.__new__(measurement_class)
+            object.__setattr__(msmt, "info", info)
+            object.__setattr__(msmt, "param", param)
+            object.__setattr__(msmt, "daq", _lazy_section(input_file["daq"], daq_type, path))
+            object.__setattr__(msmt, "wave", _lazy_section(input_file["wave"], wave_type, path))
+            if select is not None and not select(msmt):
+                return None
+            if lazy:
+                return msmt
         daq = _read_section(input_file["daq"], daq_type)
         wave = _read_section(input_file["wave"], wave_type)
     return measurement_class(info=info, param=param, daq=daq, wave=wave)
 
 
+def read_measurements(
+    paths: Sequence[Path] | str,
+    *,
+    select: Callable[[Measurement], bool] | None = None,
+    lazy: bool = False,
+    workers: int | None = None,
+) -> tuple[Measurement, ...]:
+    """Read a campaign of HDF5 measurements on a process pool.
+
+    ``paths`` is either an explicit sequence, kept in its given order, or a
+    glob pattern whose matches are sorted. ``select`` receives each lazily
+    read measurement, so it can inspect ``info`` and ``param`` before any
+    ``/daq`` or ``/wave`` array is read; rejected files are omitted from the
+    result. Process pools require ``select`` to be a picklable module-level
+    function or :func:`functools.partial`; the pool is spawn-started, so it is
+    safe to use from threaded callers. ``workers=1`` reads serially in the
+    calling process. Lazy reads only decode headers, so they default to one
+    worker; full reads default to one worker per CPU.
+    """
+
+    if isinstance(paths, str):
+        paths = sorted(glob.glob(paths, recursive=True))
+    paths = tuple(Path(path) for path in paths)
+    if workers is None:
+        workers = 1 if lazy else min(len(paths), os.cpu_count() or 1)
+    if workers < 1 and paths:
+        raise ValueError("workers must be positive")
+    if workers <= 1 or len(paths) <= 1:
+        results = [_read_selected(path, select, lazy) for path in paths]
+    else:
+        # Spawn rather than fork: the runner calls this while its render queue
+        # and target threads may hold h5py or other locks.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+            results = list(
+                executor.map(
+                    _read_selected,
+                    paths,
+                    [select] * len(paths),
+                    [lazy] * len(paths),
+                    chunksize=max(1, len(paths) // (4 * workers)),
+                )
+            )
+    return tuple(measurement for measurement in results if measurement is not None)
+
+
 def scope_records_to_adc_wave(
     records: Sequence[Mapping[int, Any]],
     conversion_index: Sequence[int],
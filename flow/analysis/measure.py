@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import math
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
@@ -168,3 +169,242 @@ def find_code_transitions(
     codes = np.arange(first, last + 1, dtype=np.int64)
     transitions = np.interp(codes + 0.5, increasing, inputs)
     return np.asarray(direction * codes, dtype=np.int64), transitions
+
+
+def pack_bout(bout: Sequence[Sequence[int]] | np.ndarray) -> np.ndarray:
+    """Pack binary ``(samples, width)`` decisions into MSB-first ``uint32`` words.
+
+    The first decision becomes the most significant used bit, matching the
+    FastRX payload, so packed words sort exactly like the decision rows.
+    """
+
+    decisions = np.asarray(bout)
+    if decisions.ndim != 2 or not 1 <= decisions.shape[1] <= 32:
+        raise ValueError("packed BOUT requires shape (samples, width) with 1 <= width <= 32")
+    if np.any((decisions != 0) & (decisions != 1)):
+        raise ValueError("packed BOUT requires binary decisions")
+    width = decisions.shape[1]
+    packed_bytes = np.packbits(decisions.astype(np.uint8, copy=False), axis=1)
+    words = np.zeros(len(decisions), dtype=np.uint32)
+    for column in range(packed_bytes.shape[1]):
+        words = (words << np.uint32(8)) | packed_bytes[:, column]
+    return words >> np.uint32(8 * packed_bytes.shape[1] - width)
+
+
+def unpack_bout(words: Sequence[int] | np.ndarray, width: int) -> np.ndarray:
+    """Expand MSB-first packed decision words into a ``(samples, width)`` uint8 matrix."""
+
+    words = np.asarray(words, dtype=np.uint32)
+    if words.ndim != 1 or not 1 <= width <= 32:
+        raise ValueError("packed BOUT words must be one-dimensional with 1 <= width <= 32")
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint32)
+    return ((words[:, None] >> shifts) & np.uint32(1)).astype(np.uint8)
+
+
+def bout_column(words: Sequence[int] | np.ndarray, cycle: int, width: int) -> np.ndarray:
+    """Return one decision cycle of packed BOUT words as uint8 values."""
+
+    if not 0 <= cycle < width <= 32:
+        raise ValueError(f"decision cycle must fit within 0..{width - 1}")
+    words = np.asarray(words, dtype=np.uint32)
+    return ((words >> np.uint32(width - 1 - cycle)) & np.uint32(1)).astype(np.uint8)
+
+
+def bout_prefix_mask(words: Sequence[int] | np.ndarray, length: int, width: int, *, value: int) -> np.ndarray:
+    """Return conversions whose first ``length`` decisions all equal ``value``.
+
+    An empty prefix selects every conversion.
+    """
+
+    if not 0 <= length <= width <= 32:
+        raise ValueError(f"decision prefix length must fit within 0..{width}")
+    if value not in (0, 1):
+        raise ValueError("decision prefix value must be zero or one")
+    words = np.asarray(words, dtype=np.uint32)
+    if length == 0:
+        return np.ones(len(words), dtype=np.bool_)
+    prefix = words >> np.uint32(width - length)
+    return prefix == (np.uint32((1 << length) - 1) if value else np.uint32(0))
+
+
+def bout_prefix_run(words: Sequence[int] | np.ndarray, width: int, *, value: int) -> np.ndarray:
+    """Return how many leading decisions of each conversion equal ``value``.
+
+    ``bout_prefix_mask(words, length, width, value=value)`` is exactly
+    ``bout_prefix_run(words, width, value=value) >= length``, so one run-length
+    pass serves every prefix length.
+    """
+
+    if not 0 < width <= 32:
+        raise ValueError("BOUT width must be within 1..32")
+    if value not in (0, 1):
+        raise ValueError("decision prefix value must be zero or one")
+    words = np.asarray(words, dtype=np.uint32)
+    if value:
+        words = ~words & np.uint32((1 << width) - 1)
+    # frexp returns the bit length of each nonnegative integer, and zero for zero.
+    return width - np.frexp(words.astype(np.float64))[1].astype(np.int64)
+
+
+def decode_packed_bout(words: Sequence[int] | np.ndarray, weights: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return ``unpack_bout(words) @ weights`` without expanding the decisions.
+
+    Each byte of the packed word indexes a 256-entry table of partial weight
+    sums. Integer weights decode exactly to ``int64``; other weights decode to
+    ``float64``.
+    """
+
+    words = np.asarray(words, dtype=np.uint32)
+    weights = np.asarray(weights)
+    if words.ndim != 1 or weights.ndim != 1 or not 1 <= len(weights) <= 32:
+        raise ValueError("packed BOUT decoding requires one-dimensional words and 1..32 weights")
+    dtype = np.int64 if np.issubdtype(weights.dtype, np.integer) else np.float64
+    # Reverse to LSB-first order so byte k covers weight positions 8k..8k+7.
+    lsb_weights = np.zeros(8 * ((len(weights) + 7) // 8), dtype=dtype)
+    lsb_weights[: len(weights)] = weights[::-1]
+    byte_bits = unpack_bout(np.arange(256, dtype=np.uint32), 8)[:, ::-1].astype(dtype)
+    decoded = np.zeros(len(words), dtype=dtype)
+    for byte in range(len(lsb_weights) // 8):
+        table = byte_bits @ lsb_weights[8 * byte : 8 * byte + 8]
+        decoded += table[(words >> np.uint32(8 * byte)) & np.uint32(0xFF)]
+    return decoded
+
+
+@dataclass(frozen=True, slots=True)
+class GroupedStatistics:
+    """Count, mean, and spread of values grouped by sorted unique keys.
+
+    ``m2`` is the sum of squared deviations from each group mean, so partial
+    statistics from separate files merge exactly with
+    :func:`merge_grouped_statistics`.
+    """
+
+    key: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Return the population variance of every group."""
+
+        return self.m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """Return the population standard deviation of every group."""
+
+        return np.sqrt(self.variance)
+
+
+def grouped_statistics(
+    keys: Sequence[float] | np.ndarray,
+    values: Sequence[float] | np.ndarray,
+) -> GroupedStatistics:
+    """Reduce values by key in linear passes after one key sort.
+
+    Sums use ``bincount`` over the inverse key index; minima and maxima use
+    segment reductions over the values sorted by group.
+    """
+
+    keys = np.asarray(keys)
+    values = np.asarray(values, dtype=np.float64)
+    if keys.ndim != 1 or values.ndim != 1 or len(keys) != len(values):
+        raise ValueError("grouped keys and values must be aligned one-dimensional arrays")
+    if not len(keys):
+        raise ValueError("grouped statistics require at least one value")
+    unique_key, inverse, count = np.unique(keys, return_inverse=True, return_counts=True)
+    mean = np.bincount(inverse, weights=values, minlength=len(unique_key)) / count
+    deviation = values - mean[inverse]
+    m2 = np.bincount(inverse, weights=deviation * deviation, minlength=len(unique_key))
+    order = np.argsort(inverse, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(count[:-1])))
+    return GroupedStatistics(
+        key=unique_key,
+        count=count.astype(np.int64),
+        mean=mean,
+        m2=m2,
+        minimum=np.minimum.reduceat(values[order], starts),
+        maximum=np.maximum.reduceat(values[order], starts),
+    )
+
+
+def merge_grouped_statistics(first: GroupedStatistics, second: GroupedStatistics) -> GroupedStatistics:
+    """Combine two partial grouped reductions with the pairwise update of Chan et al."""
+
+    key = np.union1d(first.key, second.key)
+    count = np.zeros(len(key), dtype=np.int64)
+    mean = np.zeros(len(key), dtype=np.float64)
+    m2 = np.zeros(len(key), dtype=np.float64)
+    minimum = np.full(len(key), np.inf)
+    maximum = np.full(len(key), -np.inf)
+    for part in (first, second):
+        index = np.searchsorted(key, part.key)
+        total = count[index] + part.count
+        delta = part.mean - mean[index]
+        m2[index] += part.m2 + delta * delta * count[index] * part.count / total
+        mean[index] += delta * part.count / total
+        count[index] = total
+        minimum[index] = np.minimum(minimum[index], part.minimum)
+        maximum[index] = np.maximum(maximum[index], part.maximum)
+    return GroupedStatistics(key=key, count=count, mean=mean, m2=m2, minimum=minimum, maximum=maximum)
+
+
+def fit_sine_three_parameter(
+    samples: np.ndarray,
+    time_s: np.ndarray,
+    frequency_hz: float,
+) -> np.ndarray:
+    """Return least-squares sine, cosine, and offset coefficients at a known frequency.
+
+    This is the IEEE 1057 three-parameter fit, solved through its 3x3 normal
+    equations. ``samples`` may also be a ``(records, N)`` stack with one
+    frequency per record, giving ``(records, 3)`` coefficients.
+    """
+
+    phase = 2.0 * np.pi * np.asarray(frequency_hz, dtype=np.float64)[..., None] * time_s
+    design = np.stack((np.sin(phase), np.cos(phase), np.ones_like(phase)), axis=-1)
+    transposed = np.swapaxes(design, -1, -2)
+    return np.linalg.solve(transposed @ design, transposed @ np.asarray(samples, dtype=np.float64)[..., None])[..., 0]
+
+
+def fit_sine_four_parameter(
+    samples: np.ndarray,
+    time_s: np.ndarray,
+    frequency_hz: float,
+    *,
+    tolerance_hz: float,
+    maximum_iterations: int = 16,
+) -> tuple[float, np.ndarray]:
+    """Refine a sine frequency by IEEE 1057 four-parameter Gauss-Newton steps.
+
+    Starting from ``frequency_hz``, each step linearizes the model in
+    frequency and solves the 4x4 normal equations with one pass over the
+    record. Returns the converged frequency and its three-parameter
+    coefficients, or raises ``RuntimeError`` when the steps do not settle
+    within ``tolerance_hz``.
+    """
+
+    samples = np.asarray(samples, dtype=np.float64)
+    time_s = np.asarray(time_s, dtype=np.float64)
+    coefficients = fit_sine_three_parameter(samples, time_s, frequency_hz)
+    for _ in range(maximum_iterations):
+        phase = 2.0 * np.pi * frequency_hz * time_s
+        sine = np.sin(phase)
+        cosine = np.cos(phase)
+        slope = 2.0 * np.pi * time_s * (coefficients[0] * cosine - coefficients[1] * sine)
+        slope_scale = float(np.sqrt(np.dot(slope, slope)))
+        if not slope_scale > 0.0:
+            raise RuntimeError("four-parameter sine fit has no frequency sensitivity")
+        design = np.column_stack((sine, cosine, np.ones(len(time_s)), slope / slope_scale))
+        solution = np.linalg.solve(design.T @ design, design.T @ samples)
+        step_hz = float(solution[3]) / slope_scale
+        if not math.isfinite(step_hz):
+            raise RuntimeError("four-parameter sine fit produced a non-finite frequency step")
+        frequency_hz += step_hz
+        coefficients = solution[:3]
+        if abs(step_hz) <= tolerance_hz:
+            return frequency_hz, fit_sine_three_parameter(samples, time_s, frequency_hz)
+    raise RuntimeError(f"four-parameter sine fit did not converge in {maximum_iterations} iterations")
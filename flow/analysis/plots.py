@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
+import multiprocessing
 import os
-from collections.abc import Sequence
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from itertools import pairwise
 from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal
 
 os.environ.setdefault("MPLBACKEND", "Agg")
 
@@ -24,6 +34,7 @@ from scipy.special import ndtr
 from flow.analysis.types import (
     AnalysisAdcCalibration,
     AnalysisAdcCodeDistribution,
+    AnalysisAdcDecisionPathHistogram,
     AnalysisAdcDecisionPaths,
     AnalysisAdcDynamic,
     AnalysisAdcDynamicSweep,
@@ -94,6 +105,11 @@ DENSITY_COLOR_MAP = LinearSegmentedColormap.from_list(
     "nord_purple_orange_yellow",
     SPECTRUM_COLOR_MAP(np.linspace(0.2, 1.0, 256)),
 )
+# Above this many occupied state boxes plus transition tracks, "auto" decision
+# density plots switch from vector polygons to one raster image.
+DECISION_DENSITY_VECTOR_LIMIT = 2_000
+type DecisionDensityMode = Literal["auto", "vector", "raster"]
+
 PLOT_STYLE = mpl.RcParams(
     {
         "text.usetex": False,
@@ -243,15 +259,15 @@ def style_time_units(time_s: np.ndarray) -> tuple[float, str]:
     return 1.0, "s"
 
 
-def save_figure(
-    fig: plt.Figure,
-    output_path: Path,
-) -> tuple[Path, ...]:
-    output_path = Path(output_path)
-    if output_path.suffix:
-        raise ValueError("plot output_path must be a suffixless artifact stem")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    paths = []
+# Formats of the queued plot being rendered in this context; outside a render
+# the module switches above apply.
+_RENDER_FORMATS: ContextVar[tuple[str, ...] | None] = ContextVar("_RENDER_FORMATS", default=None)
+
+
+def _enabled_formats() -> tuple[str, ...]:
+    render_formats = _RENDER_FORMATS.get()
+    if render_formats is not None:
+        return render_formats
     formats = tuple(
         output_format
         for output_format, enabled in (
@@ -263,14 +279,155 @@ def save_figure(
     )
     if not formats:
         raise RuntimeError("at least one plot output format must be enabled")
-    for output_format in formats:
-        path = output_path.with_suffix(f".{output_format}")
+    return formats
+
+
+def _artifact_paths(output_path: Path, formats: Sequence[str]) -> tuple[Path, ...]:
+    if output_path.suffix:
+        raise ValueError("plot output_path must be a suffixless artifact stem")
+    return tuple(output_path.with_suffix(f".{output_format}") for output_format in formats)
+
+
+def save_figure(
+    fig: plt.Figure,
+    output_path: Path,
+) -> tuple[Path, ...]:
+    output_path = Path(output_path)
+    paths = _artifact_paths(output_path, _enabled_formats())
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    for path in paths:
         fig.savefig(path)
-        paths.append(path)
     plt.close(fig)
-    return tuple(paths)
+    return paths
+
+
+@dataclass(frozen=True, slots=True)
+class PlotSpec:
+    """One deferred call of the ``plot_*`` function named ``plot_name``.
+
+    ``formats`` freezes the enabled output formats when the plot is
+    requested, so a worker process writes the same files.
+    """
+
+    plot_name: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    output_path: Path
+    formats: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPlot:
+    """Files written for one plot and the time spent drawing and saving them."""
+
+    output_path: Path
+    paths: tuple[Path, ...]
+    render_s: float
+
+
+def _initialize_render_worker() -> None:
+    mpl.use("Agg")
+
+
+def _render_plot_spec(spec: PlotSpec) -> RenderedPlot:
+    start_time = perf_counter()
+    token = _RENDER_FORMATS.set(spec.formats)
+    try:
+        paths = globals()[spec.plot_name].__wrapped__(*spec.args, **spec.kwargs)
+    finally:
+        _RENDER_FORMATS.reset(token)
+    return RenderedPlot(spec.output_path, tuple(paths), perf_counter() - start_time)
+
+
+class RenderQueue:
+    """Render requested plots on a pool of ``Agg`` worker processes.
+
+    With one worker each plot is rendered in this process when requested.
+    The pool starts with the first deferred plot; ``wait()`` returns the
+    rendered plots in request order and raises the first rendering error.
+    """
+
+    def __init__(self, *, workers: int | None = None) -> None:
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        if self.workers < 1:
+            raise ValueError("render workers must be positive")
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[Future[RenderedPlot] | RenderedPlot] = []
+        # pyplot is not thread-safe; targets running on threads submit, and
+        # render inline, one plot at a time.
+        self._lock = threading.Lock()
+
+    def submit(self, spec: PlotSpec) -> tuple[Path, ...]:
+        """Queue one plot and return the paths it will write."""
+
+        paths = _artifact_paths(spec.output_path, spec.formats)
+        with self._lock:
+            if self.workers == 1:
+                self._pending.append(_render_plot_spec(spec))
+                return paths
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_render_worker,
+                )
+            self._pending.append(self._executor.submit(_render_plot_spec, spec))
+        return paths
+
+    def wait(self) -> tuple[RenderedPlot, ...]:
+        """Block until every queued plot is written."""
+
+        pending, self._pending = self._pending, []
+        return tuple(plot if isinstance(plot, RenderedPlot) else plot.result() for plot in pending)
+
+    def close(self) -> None:
+        """Stop the worker pool, discarding plots that have not started."""
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._pending = []
+
+
+_ACTIVE_RENDER_QUEUE: RenderQueue | None = None
+
+
+@contextmanager
+def render_queue(*, workers: int | None = None) -> Iterator[RenderQueue]:
+    """Defer every ``plot_*`` call inside the block to one ``RenderQueue``."""
+
+    global _ACTIVE_RENDER_QUEUE
+
+    queue = RenderQueue(workers=workers)
+    previous_queue = _ACTIVE_RENDER_QUEUE
+    _ACTIVE_RENDER_QUEUE = queue
+    try:
+        yield queue
+    finally:
+        _ACTIVE_RENDER_QUEUE = previous_queue
+        queue.close()
+
+
+def queued_plot[**P](plot: Callable[P, tuple[Path, ...]]) -> Callable[P, tuple[Path, ...]]:
+    """Send calls to the active render queue, or render directly without one.
+
+    Queued calls are bound to the plot's signature first, so a bad call fails
+    where it is made and ``output_path`` is found however it was passed.
+    """
 
+    signature = inspect.signature(plot)
 
+    @functools.wraps(plot)
+    def enqueue_or_render(*args: P.args, **kwargs: P.kwargs) -> tuple[Path, ...]:
+        if _ACTIVE_RENDER_QUEUE is None:
+            return plot(*args, **kwargs)
+        output_path = Path(signature.bind(*args, **kwargs).arguments["output_path"])
+        return _ACTIVE_RENDER_QUEUE.submit(PlotSpec(plot.__name__, args, dict(kwargs), output_path, _enabled_formats()))
+
+    return enqueue_or_render
+
+
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_waveforms(
     analysis: AnalysisWaveform,
@@ -303,6 +460,7 @@ def plot_waveforms(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_diffamp_noise(
     analysis: AnalysisDiffampNoise,
@@ -358,6 +516,7 @@ def plot_diffamp_noise(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_fastrx_scope_comparison(
     msmt: MeasAdcExt,
@@ -460,6 +619,7 @@ def plot_adc_fastrx_scope_comparison(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_transfer(
     msmt_list: Sequence[MeasAdc],
@@ -490,6 +650,7 @@ def plot_adc_transfer(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_ramp_transfer(
     analysis: AnalysisAdcRamp,
@@ -522,6 +683,7 @@ def plot_adc_ramp_transfer(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_ramp_histogram(
     analysis: AnalysisAdcRamp,
@@ -562,6 +724,7 @@ def plot_adc_ramp_histogram(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_ramp_weights(
     analysis: AnalysisAdcRamp,
@@ -607,6 +770,7 @@ def plot_adc_ramp_weights(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_calibration_weights(
     analysis_list: Sequence[AnalysisAdcCalibration],
@@ -667,6 +831,7 @@ def plot_adc_calibration_weights(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_static_nonlinearity(
     msmt: MeasAdc,
@@ -691,6 +856,7 @@ def plot_adc_static_nonlinearity(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_ramp_nonlinearity(
     analysis: AnalysisAdcRamp,
@@ -719,6 +885,7 @@ def plot_adc_ramp_nonlinearity(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_code_distribution(
     msmt_list: Sequence[MeasAdc],
@@ -750,6 +917,7 @@ def plot_adc_code_distribution(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_noise_sweep(
     msmt_list: Sequence[MeasAdc],
@@ -893,6 +1061,7 @@ def plot_adc_noise_sweep(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_noise_distribution_sweep(
     msmt_list: Sequence[MeasAdc],
@@ -956,6 +1125,7 @@ def plot_adc_noise_distribution_sweep(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_dynamic(
     msmt: MeasAdc,
@@ -991,6 +1161,7 @@ def plot_adc_dynamic(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_dynamic_sweep(
     msmt_list: Sequence[MeasAdc],
@@ -1020,6 +1191,7 @@ def plot_adc_dynamic_sweep(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_power_sweep(
     msmt_list: Sequence[MeasAdc],
@@ -1087,6 +1259,7 @@ def plot_adc_power_sweep(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_power_waveform(
     analysis: AnalysisAdcPowerWaveform,
@@ -1151,6 +1324,7 @@ def plot_adc_power_waveform(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_decision_paths(
     msmt: MeasAdc,
@@ -1183,38 +1357,76 @@ def plot_adc_decision_paths(
     return save_figure(fig, output_path)
 
 
+def _decision_density_raster(
+    analysis: AnalysisAdcDecisionPathHistogram,
+    *,
+    first_code: int,
+    last_code: int,
+    pixels_per_cycle: int,
+    gutter_pixels: int,
+) -> np.ndarray:
+    """Return one row per code and ``pixels_per_cycle`` columns per decision interval.
+
+    State counts fill each interval between its gutters. A gutter column on a
+    decision boundary shows, per code, the most frequent transition whose
+    track covers that code, matching the drawing order of the vector tracks.
+    """
+
+    cycle_count, _ = analysis.code_count.shape
+    row_count = last_code - first_code + 1
+    state = analysis.code_count[:, first_code : last_code + 1].T
+    lower = np.minimum(analysis.transition_source_code, analysis.transition_destination_code)
+    upper = np.maximum(analysis.transition_source_code, analysis.transition_destination_code)
+    lower = np.maximum(lower, first_code) - first_code
+    upper = np.minimum(upper, last_code) - first_code
+    visible = lower <= upper
+    span = (upper - lower + 1)[visible]
+    track_start = np.repeat(np.cumsum(span) - span, span)
+    track_row = np.repeat(lower[visible], span) + np.arange(int(np.sum(span))) - track_start
+    track_cycle = np.repeat(analysis.transition_cycle[visible], span)
+    track = np.zeros((row_count, cycle_count + 1), dtype=np.int64)
+    np.maximum.at(track, (track_row, track_cycle), np.repeat(analysis.transition_count[visible], span))
+
+    column = np.arange(cycle_count * pixels_per_cycle)
+    column_cycle = column // pixels_per_cycle
+    column_offset = column % pixels_per_cycle
+    image = state[:, column_cycle]
+    leading_gutter = column_offset < gutter_pixels
+    trailing_gutter = column_offset >= pixels_per_cycle - gutter_pixels
+    image[:, leading_gutter] = track[:, column_cycle[leading_gutter]]
+    image[:, trailing_gutter] = track[:, column_cycle[trailing_gutter] + 1]
+    return image
+
+
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_adc_decision_path_density(
     msmt: MeasAdc,
-    analysis: AnalysisAdcDecisionPaths,
+    analysis: AnalysisAdcDecisionPathHistogram,
     *,
     output_path: Path,
+    mode: DecisionDensityMode = "auto",
+    pixels_per_cycle: int = 20,
 ) -> tuple[Path, ...]:
-    """Plot how frequently conversions follow each running SAR trajectory."""
-
+    """Plot how frequently conversions follow each running SAR trajectory.
+
+    ``vector`` draws one polygon per occupied state and transition, which
+    keeps SVG/PDF output editable for small selections; ``raster`` draws one
+    image with ``pixels_per_cycle`` columns per decision interval and one row
+    per code. ``auto`` selects ``vector`` up to
+    ``DECISION_DENSITY_VECTOR_LIMIT`` polygons.
+    """
+
+    if mode not in ("auto", "vector", "raster"):
+        raise ValueError(f"unknown decision-density mode {mode!r}")
+    if pixels_per_cycle < 4:
+        raise ValueError("decision-density rasters need at least four pixels per cycle")
     params = msmt.param.tb if isinstance(msmt, MeasAdcExt) else msmt.param
-    paths = analysis.estimate_dout
-    cycles = np.arange(analysis.estimate_dout.shape[1], dtype=np.float64)
-    substeps_per_decision = 8
-    cycle_step = 1.0 / substeps_per_decision
-    horizontal_bins = len(cycles) * substeps_per_decision
-    cycle_edges = np.arange(horizontal_bins + 1, dtype=np.float64) * cycle_step
-    fine_cycles = cycle_edges[:-1] + cycle_step / 2.0
+    state_count = analysis.code_count
+    cycles = np.arange(state_count.shape[0], dtype=np.float64)
     normalized_code_max = (1 << params.dut.adc_bits) - 1
-    code_edges = np.arange(-0.5, normalized_code_max + 1.5, 1.0)
-    count = np.zeros((len(cycle_edges) - 1, len(code_edges) - 1), dtype=np.float64)
-    for first_row in range(0, len(paths), 10_000):
-        path_chunk = paths[first_row : first_row + 10_000]
-        # A SAR estimate is a discrete state, not a continuously changing
-        # voltage. Hold each estimate through its decision interval and jump
-        # to the next value exactly at the following integer cycle.
-        held = np.repeat(path_chunk, substeps_per_decision, axis=1)
-        path_count, _, _ = np.histogram2d(
-            np.broadcast_to(fine_cycles, held.shape).ravel(),
-            held.ravel(),
-            bins=(cycle_edges, code_edges),
-        )
-        count += path_count
+    polygon_count = int(np.count_nonzero(state_count)) + len(analysis.transition_count)
+    vector = mode == "vector" or (mode == "auto" and polygon_count <= DECISION_DENSITY_VECTOR_LIMIT)
 
     # Reserve a narrow gutter between decision-state boxes. Each transition is
     # one filled vertical track spanning the gutter and the outside edges of
@@ -1223,52 +1435,45 @@ def plot_adc_decision_path_density(
     transition_half_gutter = transition_gutter_width / 2.0
     transition_tracks = []
     transition_occupancies = []
-    for cycle in range(1, len(cycles)):
-        transitions, occupancies = np.unique(
-            paths[:, (cycle - 1, cycle)],
-            axis=0,
-            return_counts=True,
-        )
-        changed = transitions[:, 0] != transitions[:, 1]
-        transitions = transitions[changed]
-        occupancies = occupancies[changed]
-        order = np.argsort(occupancies)
-        for transition, occupancy in zip(transitions[order], occupancies[order], strict=True):
-            source_code, destination_code = (float(code) for code in transition)
-            source_box_code = np.floor(source_code + 0.5)
-            destination_box_code = np.floor(destination_code + 0.5)
-            lower_edge = min(source_box_code, destination_box_code) - 0.5
-            upper_edge = max(source_box_code, destination_box_code) + 0.5
+    box_vertices = []
+    box_occupancies = []
+    if vector:
+        for index in np.lexsort((analysis.transition_count, analysis.transition_cycle)):
+            cycle = float(analysis.transition_cycle[index])
+            source_code = float(analysis.transition_source_code[index])
+            destination_code = float(analysis.transition_destination_code[index])
+            lower_edge = min(source_code, destination_code) - 0.5
+            upper_edge = max(source_code, destination_code) + 0.5
             transition_tracks.append(
                 (
-                    (float(cycle) - transition_half_gutter, lower_edge),
-                    (float(cycle) + transition_half_gutter, lower_edge),
-                    (float(cycle) + transition_half_gutter, upper_edge),
-                    (float(cycle) - transition_half_gutter, upper_edge),
+                    (cycle - transition_half_gutter, lower_edge),
+                    (cycle + transition_half_gutter, lower_edge),
+                    (cycle + transition_half_gutter, upper_edge),
+                    (cycle - transition_half_gutter, upper_edge),
                 )
             )
-            transition_occupancies.append(float(occupancy))
+            transition_occupancies.append(float(analysis.transition_count[index]))
 
-    state_count = count[::substeps_per_decision]
-    box_vertices = []
-    box_occupancies = []
-    for cycle, cycle_count in enumerate(state_count):
-        for code in np.flatnonzero(cycle_count):
-            box_vertices.append(
-                (
-                    (float(cycle) + transition_half_gutter, float(code) - 0.5),
-                    (float(cycle + 1) - transition_half_gutter, float(code) - 0.5),
-                    (float(cycle + 1) - transition_half_gutter, float(code) + 0.5),
-                    (float(cycle) + transition_half_gutter, float(code) + 0.5),
+        # A SAR estimate is a discrete state, not a continuously changing
+        # voltage: hold each estimate through its decision interval.
+        for cycle, cycle_count in enumerate(state_count):
+            for code in np.flatnonzero(cycle_count):
+                box_vertices.append(
+                    (
+                        (float(cycle) + transition_half_gutter, float(code) - 0.5),
+                        (float(cycle + 1) - transition_half_gutter, float(code) - 0.5),
+                        (float(cycle + 1) - transition_half_gutter, float(code) + 0.5),
+                        (float(cycle) + transition_half_gutter, float(code) + 0.5),
+                    )
                 )
-            )
-            box_occupancies.append(float(cycle_count[code]))
+                box_occupancies.append(float(cycle_count[code]))
 
-    density_norm = LogNorm(vmin=1, vmax=max(2, len(paths)))
+    density_norm = LogNorm(vmin=1, vmax=max(2, analysis.conversion_count))
 
-    final_mean_code = int(np.rint(np.mean(analysis.final_dout)))
-    populated_min = int(np.floor(np.min(analysis.estimate_dout) + 0.5))
-    populated_max = int(np.floor(np.max(analysis.estimate_dout) + 0.5))
+    final_mean_code = int(np.rint(analysis.final_dout_mean))
+    populated_codes = np.flatnonzero(np.any(state_count, axis=0))
+    populated_min = int(populated_codes[0])
+    populated_max = int(populated_codes[-1])
     y_limits = (
         (
             max(-0.5, populated_min - 8.5),
@@ -1295,17 +1500,39 @@ def plot_adc_decision_path_density(
             strict=True,
         )
     ):
-        boxes = PolyCollection(
-            box_vertices,
-            array=np.asarray(box_occupancies),
-            cmap=DENSITY_COLOR_MAP,
-            norm=density_norm,
-            edgecolors="none",
-            antialiaseds=False,
-            rasterized=True,
-            zorder=2,
-        )
-        ax.add_collection(boxes)
+        if not vector:
+            # Color each panel's code window once; empty pixels map to the
+            # transparent "bad" color of the log norm.
+            first_code = int(max(0.0, y_limit[0] + 0.5))
+            last_code = int(min(normalized_code_max, y_limit[1] - 0.5))
+            density_image = _decision_density_raster(
+                analysis,
+                first_code=first_code,
+                last_code=last_code,
+                pixels_per_cycle=pixels_per_cycle,
+                gutter_pixels=max(1, round(transition_half_gutter * pixels_per_cycle)),
+            )
+            ax.imshow(
+                DENSITY_COLOR_MAP(density_norm(density_image), bytes=True),
+                origin="lower",
+                aspect="auto",
+                interpolation="nearest",
+                extent=(0.0, float(len(cycles)), first_code - 0.5, last_code + 0.5),
+                zorder=2,
+            )
+        else:
+            ax.add_collection(
+                PolyCollection(
+                    box_vertices,
+                    array=np.asarray(box_occupancies),
+                    cmap=DENSITY_COLOR_MAP,
+                    norm=density_norm,
+                    edgecolors="none",
+                    antialiaseds=False,
+                    rasterized=True,
+                    zorder=2,
+                )
+            )
         if transition_tracks:
             connectors = PolyCollection(
                 transition_tracks,
@@ -1335,21 +1562,31 @@ def plot_adc_decision_path_density(
             ax.yaxis.set_minor_locator(MultipleLocator(1.0))
 
     histogram_ax = all_axes[2]
-    sample_count = len(paths)
+    sample_count = analysis.conversion_count
     final_count = state_count[-1]
     populated_final_codes = np.flatnonzero(final_count)
     populated_final_count = final_count[populated_final_codes]
-    histogram_ax.barh(
-        populated_final_codes,
-        populated_final_count / sample_count,
-        height=1.0,
-        color=DENSITY_COLOR_MAP(density_norm(populated_final_count)),
-        edgecolor="none",
-        rasterized=True,
-        zorder=2,
+    # One collection instead of one bar patch per code keeps wide noise
+    # captures cheap to draw.
+    final_fraction = populated_final_count / sample_count
+    final_bars = np.zeros((len(populated_final_codes), 4, 2), dtype=np.float64)
+    final_bars[:, 1:3, 0] = final_fraction[:, np.newaxis]
+    final_bars[:, :2, 1] = populated_final_codes[:, np.newaxis] - 0.5
+    final_bars[:, 2:, 1] = populated_final_codes[:, np.newaxis] + 0.5
+    histogram_ax.add_collection(
+        PolyCollection(
+            final_bars,
+            array=populated_final_count.astype(np.float64),
+            cmap=DENSITY_COLOR_MAP,
+            norm=density_norm,
+            edgecolors="none",
+            antialiaseds=False,
+            rasterized=True,
+            zorder=2,
+        )
     )
-    final_mean = float(np.mean(paths[:, -1]))
-    final_std = float(np.std(paths[:, -1]))
+    final_mean = analysis.final_estimate_mean_dout
+    final_std = analysis.final_estimate_std_dout
     if final_std > 0.0:
         fit_code = np.linspace(*y_limits[1], 501)
         fit_fraction_per_lsb = np.exp(-0.5 * ((fit_code - final_mean) / final_std) ** 2) / (
@@ -1384,6 +1621,7 @@ def plot_adc_decision_path_density(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_offset_noise(
     msmt_list: Sequence[MeasCompExt | MeasCompInt],
@@ -1420,6 +1658,7 @@ def plot_comp_offset_noise(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_sampling_campaign(
     msmt_list2d: Sequence[Sequence[MeasCompExt | MeasCompInt]],
@@ -1538,6 +1777,7 @@ def plot_comp_sampling_campaign(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_common_mode_campaign(
     msmt_list2d: Sequence[Sequence[MeasCompExt | MeasCompInt]],
@@ -1647,6 +1887,7 @@ def plot_comp_common_mode_campaign(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_cdac_cap_mismatch(
     msmt_list: Sequence[MeasCdacExt],
@@ -1737,6 +1978,7 @@ def plot_cdac_cap_mismatch(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_cdac_cap_mismatch_comparison(
     msmt_list2d: Sequence[Sequence[MeasCdacExt]],
@@ -1793,6 +2035,7 @@ def plot_cdac_cap_mismatch_comparison(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_timing(
     msmt_list: Sequence[MeasCompInt],
@@ -1818,6 +2061,7 @@ def plot_comp_timing(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_power(
     msmt_list: Sequence[MeasCompInt],
@@ -1838,6 +2082,7 @@ def plot_comp_power(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_candidate_sweep(
     msmt_list: Sequence[MeasCompInt],
@@ -1895,6 +2140,7 @@ def plot_comp_candidate_sweep(
     return save_figure(fig, output_path)
 
 
+@queued_plot
 @mpl.rc_context(PLOT_STYLE)
 def plot_comp_noise_power_tradeoff(
     analysis: AnalysisCompCandidateSweep,
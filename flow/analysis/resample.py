@@ -0,0 +1,105 @@
+"""Deterministic bootstrap replicates for the BOUT calibration analyses.
+
+Every replicate draws from its own child of one ``SeedSequence``, so the
+resampled units, and therefore the reported intervals, do not depend on the
+worker count or on how replicates are chunked across processes. Each
+calibration module precomputes its binned or compressed statistics per
+resampling unit once; a replicate only reweights those statistics by the
+drawn unit multiplicities and repeats the final fit.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.typing import NDArray
+
+from flow.analysis.types import AnalysisAdcCalibration, AnalysisAdcCalibrationBootstrap
+
+type FloatArray = NDArray[np.float64]
+type IntArray = NDArray[np.int64]
+
+DEFAULT_BOOTSTRAP_REPLICATES = 200
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+
+def resample_multiplicity(rng: np.random.Generator, unit_count: int) -> IntArray:
+    """Return how often each of ``unit_count`` units occurs in one bootstrap draw."""
+
+    return np.bincount(rng.integers(0, unit_count, size=unit_count), minlength=unit_count).astype(np.int64)
+
+
+def resampling_units(
+    cycle_index: NDArray[np.integer],
+    selected: NDArray[np.bool_],
+    *,
+    batch_size: int | None,
+) -> IntArray:
+    """Number the units of the selected conversions consecutively.
+
+    Units are whole ramp cycles, or consecutive ``batch_size``-conversion
+    blocks of the capture when a batch size is given.
+    """
+
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("bootstrap batch_size must be positive")
+    label = np.flatnonzero(selected) // batch_size if batch_size is not None else cycle_index[selected]
+    return np.unique(label, return_inverse=True)[1].astype(np.int64)
+
+
+def map_replicates[T](
+    replicate: Callable[[np.random.SeedSequence], T],
+    *,
+    replicates: int,
+    seed: int,
+    workers: int = 1,
+) -> list[T]:
+    """Evaluate ``replicate`` once per child seed, in replicate order.
+
+    Replicates run serially in the calling process unless ``workers`` opts in
+    to a process pool. ``replicate`` must then be picklable (a module-level
+    function or a ``functools.partial`` of one).
+    """
+
+    if replicates < 2:
+        raise ValueError("bootstrap requires at least two replicates")
+    seeds = np.random.SeedSequence(seed).spawn(replicates)
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if workers == 1:
+        return [replicate(child) for child in seeds]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(replicate, seeds, chunksize=math.ceil(replicates / workers)))
+
+
+def summarize_calibration_replicates(
+    calibration: AnalysisAdcCalibration,
+    replicate_weights: Sequence[FloatArray | None],
+    *,
+    batch_size: int | None,
+    seed: int,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+) -> AnalysisAdcCalibrationBootstrap:
+    """Reduce successful replicates to percentile intervals; ``None`` marks a failed fit."""
+
+    if not 0.0 < confidence_level < 1.0:
+        raise ValueError("bootstrap confidence_level must lie strictly between zero and one")
+    successful = [weights for weights in replicate_weights if weights is not None]
+    if len(successful) < 2:
+        raise RuntimeError("calibration bootstrap produced fewer than two successful replicates")
+    stacked = np.asarray(successful, dtype=np.float64)
+    tail = 50.0 * (1.0 - confidence_level)
+    return AnalysisAdcCalibrationBootstrap(
+        calibration=calibration,
+        batch_size=batch_size,
+        seed=seed,
+        confidence_level=confidence_level,
+        replicate_weights=stacked,
+        failed_replicate_count=len(replicate_weights) - len(successful),
+        weight_lower=np.percentile(stacked, tail, axis=0),
+        weight_upper=np.percentile(stacked, 100.0 - tail, axis=0),
+        weight_std=np.std(stacked, axis=0, ddof=1),
+    )
@@ -12,23 +12,40 @@ Run one named pipeline from the repository root with:
 Omit the target name to run every registered pipeline. Comparator targets write
 beneath ``build/analysis/comp``; the remaining targets write beneath
 ``build/analysis/adc``. Each analysis domain uses one timestamped directory per
-invocation.
+invocation. Plots render on a process pool while later targets run, and each
+plot's render time is reported at the end; ``--render-workers 1`` renders every
+plot where it is requested. Analysis results are reused from
+``build/analysis/cache`` while their inputs and the analysis code are
+unchanged; ``--no-cache`` recomputes them and ``--cache-stats`` reports the
+cache's hits and size.
+
+Targets read shared campaign loads and intermediate analyses through
+``stage_result()``, so each stage runs once per invocation however many
+targets use it. ``--target-workers N`` runs independent targets on N threads
+after starting their shared stages; the run ends with a per-stage timing
+report.
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
+from typing import Any
 
 import hdl21 as h
 import numpy as np
 
 from flow.analysis.adc import (
     analyze_adc_code_distribution,
+    analyze_adc_decision_path_histogram,
     analyze_adc_decision_paths,
     analyze_adc_dynamic,
     analyze_adc_dynamic_sweep,
@@ -39,16 +56,17 @@ from flow.analysis.adc import (
     analyze_adc_transfer,
     combine_adc_noise_comparison,
 )
+from flow.analysis.cache import analysis_cache
 from flow.analysis.calibration1 import analyze as analyze_calibration1
 from flow.analysis.calibration2 import analyze as analyze_calibration2
 from flow.analysis.calibration3 import analyze as analyze_calibration3
 from flow.analysis.cdac import analyze_cdac_cap_mismatch_campaign
 from flow.analysis.comp import (
     analyze_comp_candidate_sweep,
-    analyze_comp_offset_noise,
+    analyze_comp_offset_noise_curves,
     classify_comp_common_mode_validity,
 )
-from flow.analysis.io import read_measurement
+from flow.analysis.io import read_measurement, read_measurements
 from flow.analysis.plots import (
     plot_adc_calibration_weights,
     plot_adc_code_distribution,
@@ -71,8 +89,10 @@ from flow.analysis.plots import (
     plot_comp_noise_power_tradeoff,
     plot_comp_sampling_campaign,
     plot_waveforms,
+    render_queue,
 )
 from flow.analysis.types import (
+    AnalysisAdcNoiseSweep,
     MeasAdc,
     MeasAdcExt,
     MeasAdcInt,
@@ -83,6 +103,32 @@ from flow.analysis.waveform import analyze_measurement_waveforms
 from flow.scans.params import load_board_map
 
 BASE_PATH = Path(__file__).resolve().parents[2]
+# Configured ADC rate-sweep campaigns shared by the noise, code-distribution,
+# and power targets.
+RATE_SWEEP_ADC_INDICES = (0, 1)
+RATE_SWEEP_RATES_MBD = tuple(range(80, 1601, 40))
+RATE_SWEEP_SIMULATION_RATES_MSPS = (2, 6, 10)
+if (
+    not RATE_SWEEP_ADC_INDICES
+    or len(set(RATE_SWEEP_ADC_INDICES)) != len(RATE_SWEEP_ADC_INDICES)
+    or any(not isinstance(adc_index, int) or not 0 <= adc_index < 16 for adc_index in RATE_SWEEP_ADC_INDICES)
+):
+    raise ValueError("RATE_SWEEP_ADC_INDICES must contain unique ADC indices in 0..15")
+
+
+# The shared stages, or other targets, each stage or target reads, filled in
+# by @uses_stages. Functions without an entry depend on nothing shared.
+STAGE_DEPENDENCIES: dict[str, tuple[str, ...]] = {}
+
+
+def uses_stages[F: Callable[..., Any]](*names: str) -> Callable[[F], F]:
+    """Declare, next to its ``stage_result()`` calls, what one stage or target reads."""
+
+    def declare(function: F) -> F:
+        STAGE_DEPENDENCIES[function.__name__] = names
+        return function
+
+    return declare
 
 
 def adc_transfer_curve(output_dir: Path) -> tuple[Path, ...]:
@@ -100,8 +146,7 @@ def adc_transfer_curve(output_dir: Path) -> tuple[Path, ...]:
         )
 
     measurements_by_adc: dict[int, list[MeasAdcExt]] = {adc_index: [] for adc_index in adc_indices}
-    for input_h5 in measurement_paths:
-        measurement = read_measurement(input_h5)
+    for input_h5, measurement in zip(measurement_paths, read_measurements(measurement_paths), strict=True):
         if not isinstance(measurement, MeasAdcExt):
             raise TypeError(f"{input_h5} contains {type(measurement).__name__}, expected MeasAdcExt")
         adc_index = measurement.param.observed_adc
@@ -159,8 +204,7 @@ def adc_ramp_nonlinearity(output_dir: Path) -> tuple[Path, ...]:
     if not ramp_paths:
         raise FileNotFoundError(2, "accepted ADC ramp inputs not found", ramp_run_dir)
     ramp_by_adc = {}
-    for path in ramp_paths:
-        measurement = read_measurement(path)
+    for path, measurement in zip(ramp_paths, read_measurements(ramp_paths), strict=True):
         if not isinstance(measurement, MeasAdcExt):
             raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcExt")
         adc_index = measurement.param.observed_adc
@@ -186,7 +230,7 @@ def adc_ramp_nonlinearity(output_dir: Path) -> tuple[Path, ...]:
         adc_index: float(comparator_calibrations[adc_index]["offset_v"]) for adc_index in adc_indices
     }
     cdac_groups, _cdac_analyses = analyze_cdac_cap_mismatch_campaign(
-        tuple(tuple(read_measurement(path) for path in paths) for paths in cdac_paths_by_run),
+        tuple(read_measurements(paths) for paths in cdac_paths_by_run),
         adc_indices=adc_indices,
         board_id=board_id,
         comparator_offset_v_by_adc=comparator_offset_v_by_adc,
@@ -306,7 +350,7 @@ def adc_calibration(output_dir: Path) -> tuple[Path, ...]:
     comparator_calibrations = load_board_map()["boards"][board_id].get("comparator_calibration", {})
     comparator_offset_v = float(comparator_calibrations[adc_index]["offset_v"])
     cdac_groups, _cdac_analyses = analyze_cdac_cap_mismatch_campaign(
-        tuple(tuple(read_measurement(path) for path in paths) for paths in cdac_paths_by_run),
+        tuple(read_measurements(paths) for paths in cdac_paths_by_run),
         adc_indices=(adc_index,),
         board_id=board_id,
         comparator_offset_v_by_adc={adc_index: comparator_offset_v},
@@ -472,8 +516,7 @@ def adc00_fixed_input_noise(output_dir: Path) -> tuple[Path, ...]:
     analyzed_runs = []
     for output_prefix, paths in runs:
         measurements: list[MeasAdc] = []
-        for path in paths:
-            measurement = read_measurement(path)
+        for path, measurement in zip(paths, read_measurements(paths), strict=True):
             if not isinstance(measurement, (MeasAdcExt, MeasAdcInt)):
                 raise TypeError(f"{path} contains {type(measurement).__name__}, expected an ADC measurement")
             measurements.append(measurement)
@@ -504,7 +547,7 @@ def adc00_fixed_input_noise(output_dir: Path) -> tuple[Path, ...]:
             artifacts.extend(
                 plot_adc_decision_path_density(
                     measurement,
-                    analyze_adc_decision_paths(measurement, selection="all"),
+                    analyze_adc_decision_path_histogram(measurement, selection="all"),
                     output_path=output_dir
                     / f"{output_prefix}_50mv_{float(active_rate_hz) / 1e6:g}msps_decision_path_density",
                 )
@@ -512,33 +555,21 @@ def adc00_fixed_input_noise(output_dir: Path) -> tuple[Path, ...]:
     return tuple(artifacts)
 
 
-def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
-    """Compare configured physical ADC input-referred noise across rate and backends."""
+def adc_dc_noise_campaign() -> dict[int, dict[int, list[MeasAdcExt]]]:
+    """Load the physical 50 mV and 100 mV fixed-input rate sweeps by input and ADC."""
 
-    ADC_INDICES = (0, 1)
     PHYSICAL_NOISE_RUN_DIRS = {
         50: BASE_PATH / "build/scan_adc/20260801_194930",
         100: BASE_PATH / "build/scan_adc/20260802_021624",
     }
-    SINE_RUN_DIR = BASE_PATH / "build/scan_adc/20260730_215145_complete"
-    GENERATED_NOISE_RUN_DIR = BASE_PATH / "build/adc/hdl21gen_noise_vs_rate/20260801_0821"
-    PEX_NOISE_RUN_DIR = BASE_PATH / "build/adc/frida65a_noise_vs_rate/20260731_2353"
-    RATES_MBD = tuple(range(80, 1601, 40))
-    SIMULATION_RATES_MSPS = (2, 6, 10)
     EXPECTED_CONVERSIONS = 100_000
 
-    if (
-        not ADC_INDICES
-        or len(set(ADC_INDICES)) != len(ADC_INDICES)
-        or any(not isinstance(adc_index, int) or not 0 <= adc_index < 16 for adc_index in ADC_INDICES)
-    ):
-        raise ValueError("ADC_INDICES must contain unique ADC indices in 0..15")
     physical_measurements: dict[int, dict[int, list[MeasAdcExt]]] = {}
     for input_mv, run_dir in PHYSICAL_NOISE_RUN_DIRS.items():
         measurements_by_adc = {}
-        for adc_index in ADC_INDICES:
-            adc_measurements = []
-            for rate_mbd in RATES_MBD:
+        for adc_index in RATE_SWEEP_ADC_INDICES:
+            adc_paths = []
+            for rate_mbd in RATE_SWEEP_RATES_MBD:
                 matches = sorted(
                     run_dir.glob(
                         f"*_00_adc{adc_index:02d}_{rate_mbd}mbd_dcp{input_mv}mv_logicp2sym_"
@@ -550,9 +581,11 @@ def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
                         f"ADC{adc_index:02d} {input_mv} mV noise campaign requires one {rate_mbd} MBd file, "
                         f"found {len(matches)}"
                     )
-                measurement = read_measurement(matches[0])
+                adc_paths.append(matches[0])
+            adc_measurements = []
+            for path, measurement in zip(adc_paths, read_measurements(adc_paths), strict=True):
                 if not isinstance(measurement, MeasAdcExt):
-                    raise TypeError(f"{matches[0]} contains {type(measurement).__name__}, expected MeasAdcExt")
+                    raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcExt")
                 adc_measurements.append(measurement)
             expected_input_v = input_mv * 1.0e-3
             if any(
@@ -575,25 +608,31 @@ def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
                 )
             measurements_by_adc[adc_index] = adc_measurements
         physical_measurements[input_mv] = measurements_by_adc
+    return physical_measurements
+
+
+@uses_stages("adc_dc_noise_campaign")
+def adc_dc_noise_sweeps() -> dict[int, dict[int, AnalysisAdcNoiseSweep]]:
+    """Analyze every physical fixed-input rate sweep once, by input and ADC."""
+
+    return {
+        input_mv: {
+            adc_index: analyze_adc_noise_sweep(adc_measurements)
+            for adc_index, adc_measurements in measurements_by_adc.items()
+        }
+        for input_mv, measurements_by_adc in stage_result("adc_dc_noise_campaign").items()
+    }
+
+
+def adc_sine_campaign() -> dict[int, list[MeasAdcExt]]:
+    """Load the physical full-scale sine rate sweep by ADC."""
+
+    SINE_RUN_DIR = BASE_PATH / "build/scan_adc/20260730_215145_complete"
 
-    generated_measurements = []
-    pex_measurements = []
-    for rate_msps in SIMULATION_RATES_MSPS:
-        generated_path = GENERATED_NOISE_RUN_DIR / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
-        generated_measurement = read_measurement(generated_path)
-        if not isinstance(generated_measurement, MeasAdcInt):
-            raise TypeError(f"{generated_path} contains {type(generated_measurement).__name__}, expected MeasAdcInt")
-        generated_measurements.append(generated_measurement)
-
-        pex_path = PEX_NOISE_RUN_DIR / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
-        pex_measurement = read_measurement(pex_path)
-        if not isinstance(pex_measurement, MeasAdcInt):
-            raise TypeError(f"{pex_path} contains {type(pex_measurement).__name__}, expected MeasAdcInt")
-        pex_measurements.append(pex_measurement)
     sine_measurements: dict[int, list[MeasAdcExt]] = {}
-    for adc_index in ADC_INDICES:
-        adc_measurements = []
-        for rate_mbd in RATES_MBD:
+    for adc_index in RATE_SWEEP_ADC_INDICES:
+        adc_paths = []
+        for rate_mbd in RATE_SWEEP_RATES_MBD:
             matches = sorted(
                 SINE_RUN_DIR.glob(
                     f"*_00_adc{adc_index:02d}_{rate_mbd}mbd_sin9998.77hz_p0mv_1000mvpp_"
@@ -604,23 +643,73 @@ def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
                 raise ValueError(
                     f"ADC{adc_index:02d} sine campaign requires one {rate_mbd} MBd file, found {len(matches)}"
                 )
-            measurement = read_measurement(matches[0])
+            adc_paths.append(matches[0])
+        adc_measurements = []
+        for path, measurement in zip(adc_paths, read_measurements(adc_paths), strict=True):
             if not isinstance(measurement, MeasAdcExt):
-                raise TypeError(f"{matches[0]} contains {type(measurement).__name__}, expected MeasAdcExt")
+                raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcExt")
             if measurement.param.observed_adc != adc_index:
                 raise ValueError(f"ADC{adc_index:02d} sine campaign contains a mismatched ADC index")
             adc_measurements.append(measurement)
         sine_measurements[adc_index] = adc_measurements
+    return sine_measurements
+
+
+def spice_ideal_noise_campaign() -> list[MeasAdcInt]:
+    """Load the generated-netlist 50 mV SPICE captures at each simulated rate."""
+
+    GENERATED_NOISE_RUN_DIR = BASE_PATH / "build/adc/hdl21gen_noise_vs_rate/20260801_0821"
+
+    measurements = []
+    for rate_msps in RATE_SWEEP_SIMULATION_RATES_MSPS:
+        path = GENERATED_NOISE_RUN_DIR / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
+        measurement = read_measurement(path)
+        if not isinstance(measurement, MeasAdcInt):
+            raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcInt")
+        measurements.append(measurement)
+    return measurements
+
+
+def spice_pex_noise_campaign() -> list[MeasAdcInt]:
+    """Load the extracted-layout 50 mV SPICE captures at each simulated rate."""
+
+    PEX_NOISE_RUN_DIR = BASE_PATH / "build/adc/frida65a_noise_vs_rate/20260731_2353"
+
+    measurements = []
+    for rate_msps in RATE_SWEEP_SIMULATION_RATES_MSPS:
+        path = PEX_NOISE_RUN_DIR / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
+        measurement = read_measurement(path)
+        if not isinstance(measurement, MeasAdcInt):
+            raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcInt")
+        measurements.append(measurement)
+    return measurements
+
+
+@uses_stages(
+    "adc_dc_noise_campaign",
+    "adc_dc_noise_sweeps",
+    "adc_sine_campaign",
+    "spice_ideal_noise_campaign",
+    "spice_pex_noise_campaign",
+)
+def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
+    """Compare configured physical ADC input-referred noise across rate and backends."""
+
+    physical_measurements = stage_result("adc_dc_noise_campaign")
+    physical_noise_sweeps = stage_result("adc_dc_noise_sweeps")
+    sine_measurements = stage_result("adc_sine_campaign")
+    generated_measurements = stage_result("spice_ideal_noise_campaign")
+    pex_measurements = stage_result("spice_pex_noise_campaign")
 
     generated_noise = analyze_adc_noise_sweep(generated_measurements)
     pex_noise = analyze_adc_noise_sweep(pex_measurements)
     artifacts = []
     reference_rates = None
-    for adc_index in ADC_INDICES:
+    for adc_index in RATE_SWEEP_ADC_INDICES:
         dc_measurements = physical_measurements[50][adc_index]
         dc100_measurements = physical_measurements[100][adc_index]
-        physical_noise = analyze_adc_noise_sweep(dc_measurements)
-        physical_noise_100mv = analyze_adc_noise_sweep(dc100_measurements)
+        physical_noise = physical_noise_sweeps[50][adc_index]
+        physical_noise_100mv = physical_noise_sweeps[100][adc_index]
         sine_dynamic = analyze_adc_dynamic_sweep(sine_measurements[adc_index])
         order = np.argsort(physical_noise.active_conversion_rate_hz)
         physical_rates = physical_noise.active_conversion_rate_hz[order]
@@ -641,7 +730,7 @@ def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
             *("Measured (1 V sine)" for _ in sine_measurements[adc_index]),
         ]
         simulated_noise_sweeps = []
-        if adc_index == ADC_INDICES[0]:
+        if adc_index == RATE_SWEEP_ADC_INDICES[0]:
             simulated_noise_sweeps.extend((generated_noise, pex_noise))
             comparison_measurements.extend((*generated_measurements, *pex_measurements))
             series_labels.extend(
@@ -667,89 +756,27 @@ def adc_noise_vs_rate(output_dir: Path) -> tuple[Path, ...]:
     return tuple(artifacts)
 
 
+@uses_stages("adc_dc_noise_campaign", "adc_dc_noise_sweeps", "spice_ideal_noise_campaign")
 def adc_code_distributions(output_dir: Path) -> tuple[Path, ...]:
     """Plot configured ADC fixed-input distributions and selected decision paths."""
 
-    ADC_INDICES = (0, 1)
-    PHYSICAL_NOISE_RUN_DIRS = {
-        50: BASE_PATH / "build/scan_adc/20260801_194930",
-        100: BASE_PATH / "build/scan_adc/20260802_021624",
-    }
-    GENERATED_NOISE_RUN_DIR = BASE_PATH / "build/adc/hdl21gen_noise_vs_rate/20260801_0821"
-    RATES_MBD = tuple(range(80, 1601, 40))
-    SIMULATION_RATES_MSPS = (2, 6, 10)
     DECISION_PATH_RATES_MSPS = (2, 10)
-    EXPECTED_CONVERSIONS = 100_000
 
-    if (
-        not ADC_INDICES
-        or len(set(ADC_INDICES)) != len(ADC_INDICES)
-        or any(not isinstance(adc_index, int) or not 0 <= adc_index < 16 for adc_index in ADC_INDICES)
-    ):
-        raise ValueError("ADC_INDICES must contain unique ADC indices in 0..15")
-    physical_measurements: dict[int, dict[int, list[MeasAdcExt]]] = {}
-    for input_mv, run_dir in PHYSICAL_NOISE_RUN_DIRS.items():
-        measurements_by_adc = {}
-        for adc_index in ADC_INDICES:
-            adc_measurements = []
-            for rate_mbd in RATES_MBD:
-                matches = sorted(
-                    run_dir.glob(
-                        f"*_00_adc{adc_index:02d}_{rate_mbd}mbd_dcp{input_mv}mv_logicp2sym_"
-                        "vcm600mv_vdda1200mv_vddd1200mv_vddac1200mv_t25c.h5"
-                    )
-                )
-                if len(matches) != 1:
-                    raise ValueError(
-                        f"ADC{adc_index:02d} {input_mv} mV noise campaign requires one {rate_mbd} MBd file, "
-                        f"found {len(matches)}"
-                    )
-                measurement = read_measurement(matches[0])
-                if not isinstance(measurement, MeasAdcExt):
-                    raise TypeError(f"{matches[0]} contains {type(measurement).__name__}, expected MeasAdcExt")
-                adc_measurements.append(measurement)
-            expected_input_v = input_mv * 1.0e-3
-            if any(
-                measurement.param.observed_adc != adc_index
-                or not isinstance(measurement.param.tb.vin_diff, h.Vdc.Params)
-                or not np.isclose(float(measurement.param.tb.vin_diff.dc), expected_input_v)
-                for measurement in adc_measurements
-            ):
-                raise ValueError(
-                    f"ADC{adc_index:02d} physical noise campaign requires a fixed {input_mv} mV differential input"
-                )
-            if any(
-                len(measurement.daq.dout) != EXPECTED_CONVERSIONS
-                or int(measurement.info.readbacks.get("fastrx_lost_count", 0))
-                or int(measurement.info.readbacks.get("spi_mismatches", 0))
-                for measurement in adc_measurements
-            ):
-                raise ValueError(
-                    f"ADC{adc_index:02d} physical {input_mv} mV noise campaign contains incomplete or invalid captures"
-                )
-            measurements_by_adc[adc_index] = adc_measurements
-        physical_measurements[input_mv] = measurements_by_adc
-
-    generated_measurements = []
-    for rate_msps in SIMULATION_RATES_MSPS:
-        path = GENERATED_NOISE_RUN_DIR / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
-        measurement = read_measurement(path)
-        if not isinstance(measurement, MeasAdcInt):
-            raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcInt")
-        generated_measurements.append(measurement)
+    physical_measurements = stage_result("adc_dc_noise_campaign")
+    physical_noise_sweeps = stage_result("adc_dc_noise_sweeps")
+    generated_measurements = stage_result("spice_ideal_noise_campaign")
     artifacts = []
-    for input_mv in PHYSICAL_NOISE_RUN_DIRS:
-        for adc_index in ADC_INDICES:
-            adc_measurements = physical_measurements[input_mv][adc_index]
+    for input_mv, measurements_by_adc in physical_measurements.items():
+        for adc_index in RATE_SWEEP_ADC_INDICES:
             artifacts.extend(
                 plot_adc_noise_distribution_sweep(
-                    adc_measurements,
-                    analyze_adc_noise_sweep(adc_measurements),
+                    measurements_by_adc[adc_index],
+                    physical_noise_sweeps[input_mv][adc_index],
                     output_path=output_dir / f"adc{adc_index:02d}_{input_mv}mv_dc_output_code_distributions",
                 )
             )
 
-    for rate_msps, measurement in zip(SIMULATION_RATES_MSPS, generated_measurements, strict=True):
+    for rate_msps, measurement in zip(RATE_SWEEP_SIMULATION_RATES_MSPS, generated_measurements, strict=True):
         artifacts.extend(
             plot_adc_code_distribution(
                 [measurement],
@@ -765,9 +792,9 @@ def adc_code_distributions(output_dir: Path) -> tuple[Path, ...]:
             )
         )
 
-    for input_mv in PHYSICAL_NOISE_RUN_DIRS:
-        for adc_index in ADC_INDICES:
-            adc_measurements = physical_measurements[input_mv][adc_index]
+    for input_mv, measurements_by_adc in physical_measurements.items():
+        for adc_index in RATE_SWEEP_ADC_INDICES:
+            adc_measurements = measurements_by_adc[adc_index]
             for rate_msps in DECISION_PATH_RATES_MSPS:
                 matches = [
                     measurement
@@ -781,67 +808,29 @@ def adc_code_distributions(output_dir: Path) -> tuple[Path, ...]:
                     raise ValueError(
                         f"ADC{adc_index:02d} {input_mv} mV campaign does not contain one {rate_msps} MSPS run"
                     )
-                analysis = analyze_adc_decision_paths(matches[0], selection="all")
+                analysis = analyze_adc_decision_path_histogram(matches[0], selection="all")
                 output_path = output_dir / (f"adc{adc_index:02d}_{input_mv}mv_{rate_msps}msps_decision_path_density")
                 artifacts.extend(plot_adc_decision_path_density(matches[0], analysis, output_path=output_path))
     return tuple(artifacts)
 
 
+@uses_stages("adc_sine_campaign", "spice_ideal_noise_campaign", "spice_pex_noise_campaign")
 def adc_power_vs_rate(output_dir: Path) -> tuple[Path, ...]:
     """Plot measured and simulated power sweeps plus detailed waveforms."""
 
-    ADC_INDICES = (0, 1)
-    SINE_RUN_DIR = BASE_PATH / "build/scan_adc/20260730_215145_complete"
-    IDEAL_RUN_DIR = BASE_PATH / "build/adc/hdl21gen_noise_vs_rate/20260801_0821"
-    PEX_RUN_DIR = BASE_PATH / "build/adc/frida65a_noise_vs_rate/20260731_2353"
-    RATES_MBD = tuple(range(80, 1601, 40))
-    SIMULATION_RATES_MSPS = (2, 6, 10)
     DETAIL_RATE_MBD = 80
     SIMULATION_DETAIL_RATE_MSPS = 10
 
-    if (
-        not ADC_INDICES
-        or len(set(ADC_INDICES)) != len(ADC_INDICES)
-        or any(not isinstance(adc_index, int) or not 0 <= adc_index < 16 for adc_index in ADC_INDICES)
-    ):
-        raise ValueError("ADC_INDICES must contain unique ADC indices in 0..15")
-    sine_measurements_by_adc: dict[int, list[MeasAdcExt]] = {}
-    for adc_index in ADC_INDICES:
-        adc_measurements = []
-        for rate_mbd in RATES_MBD:
-            matches = sorted(
-                SINE_RUN_DIR.glob(
-                    f"*_00_adc{adc_index:02d}_{rate_mbd}mbd_sin9998.77hz_p0mv_1000mvpp_"
-                    "logicp2sym_vcm600mv_vdda1200mv_vddd1200mv_vddac1200mv_t25c.h5"
-                )
-            )
-            if len(matches) != 1:
-                raise ValueError(
-                    f"ADC{adc_index:02d} sine campaign requires one {rate_mbd} MBd file, found {len(matches)}"
-                )
-            measurement = read_measurement(matches[0])
-            if not isinstance(measurement, MeasAdcExt):
-                raise TypeError(f"{matches[0]} contains {type(measurement).__name__}, expected MeasAdcExt")
-            if measurement.param.observed_adc != adc_index:
-                raise ValueError(f"ADC{adc_index:02d} sine campaign contains a mismatched ADC index")
-            adc_measurements.append(measurement)
-        sine_measurements_by_adc[adc_index] = adc_measurements
-
-    simulation_measurements = {}
-    for source, run_dir in (("ideal", IDEAL_RUN_DIR), ("pex", PEX_RUN_DIR)):
-        measurements = []
-        for rate_msps in SIMULATION_RATES_MSPS:
-            path = run_dir / f"{rate_msps}msps_cm600mv_dc50mv/result.h5"
-            measurement = read_measurement(path)
-            if not isinstance(measurement, MeasAdcInt):
-                raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcInt")
-            measurements.append(measurement)
-        simulation_measurements[source] = measurements
+    sine_measurements_by_adc = stage_result("adc_sine_campaign")
+    simulation_measurements = {
+        "ideal": stage_result("spice_ideal_noise_campaign"),
+        "pex": stage_result("spice_pex_noise_campaign"),
+    }
 
     simulation_power = {
         source: analyze_adc_power_sweep(measurements) for source, measurements in simulation_measurements.items()
     }
-    expected_simulation_rates_hz = np.asarray(SIMULATION_RATES_MSPS, dtype=np.float64) * 1e6
+    expected_simulation_rates_hz = np.asarray(RATE_SWEEP_SIMULATION_RATES_MSPS, dtype=np.float64) * 1e6
     for source, analysis in simulation_power.items():
         if not np.allclose(
             np.sort(analysis.active_conversion_rate_hz),
@@ -852,7 +841,7 @@ def adc_power_vs_rate(output_dir: Path) -> tuple[Path, ...]:
             raise ValueError(f"SPICE {source} power sweep does not contain exactly 2, 6, and 10 MSPS")
 
     artifacts = []
-    for adc_index in ADC_INDICES:
+    for adc_index in RATE_SWEEP_ADC_INDICES:
         measurements = sine_measurements_by_adc[adc_index]
         artifacts.extend(
             plot_adc_power_sweep(
@@ -871,15 +860,15 @@ def adc_power_vs_rate(output_dir: Path) -> tuple[Path, ...]:
                 output_path=output_dir / f"spice_{source}_power_vs_conversion_rate",
             )
         )
-        detail_measurement = measurements[SIMULATION_RATES_MSPS.index(SIMULATION_DETAIL_RATE_MSPS)]
+        detail_measurement = measurements[RATE_SWEEP_SIMULATION_RATES_MSPS.index(SIMULATION_DETAIL_RATE_MSPS)]
         artifacts.extend(
             plot_adc_power_waveform(
                 analyze_adc_power_waveform(detail_measurement),
                 output_path=output_dir / f"spice_{source}_{SIMULATION_DETAIL_RATE_MSPS}msps_supply_power",
             )
         )
-    for adc_index in ADC_INDICES:
-        detail_measurement = sine_measurements_by_adc[adc_index][RATES_MBD.index(DETAIL_RATE_MBD)]
+    for adc_index in RATE_SWEEP_ADC_INDICES:
+        detail_measurement = sine_measurements_by_adc[adc_index][RATE_SWEEP_RATES_MBD.index(DETAIL_RATE_MBD)]
         artifacts.extend(
             plot_waveforms(
                 analyze_measurement_waveforms(detail_measurement),
@@ -896,6 +885,7 @@ def adc_power_vs_rate(output_dir: Path) -> tuple[Path, ...]:
     return tuple(artifacts)
 
 
+@uses_stages("adc_noise_vs_rate", "adc_code_distributions", "adc_power_vs_rate")
 def adc_rate_characterization(output_dir: Path) -> tuple[Path, ...]:
     """Run the configured ADC rate-sweep noise, code-distribution, and power analyses."""
 
@@ -948,8 +938,7 @@ def adc_noise_vs_comp_time(output_dir: Path) -> tuple[Path, ...]:
                 f"found {len(measurement_paths)}"
             )
         measurements = []
-        for path in measurement_paths:
-            measurement = read_measurement(path)
+        for path, measurement in zip(measurement_paths, read_measurements(measurement_paths), strict=True):
             if not isinstance(measurement, MeasAdcExt):
                 raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasAdcExt")
             measurements.append(measurement)
@@ -999,8 +988,7 @@ def comp_system_common_mode(output_dir: Path) -> tuple[Path, ...]:
         missing = RUN_DIRS[0] if RUN_DIRS else BASE_PATH / "build/scan_comp"
         raise FileNotFoundError(2, "accepted comparator common-mode inputs not found", missing)
     measurements = []
-    for path in measurement_paths:
-        measurement = read_measurement(path)
+    for path, measurement in zip(measurement_paths, read_measurements(measurement_paths), strict=True):
         if not isinstance(measurement, MeasCompExt):
             raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasCompExt")
         if measurement.param.campaign != "comp_common_mode":
@@ -1026,8 +1014,7 @@ def comp_system_common_mode(output_dir: Path) -> tuple[Path, ...]:
         if set(grouped) != EXPECTED_COMMON_MODES:
             raise ValueError(f"ADC{adc_index:02d} common-mode campaign is missing a Vin_cm curve")
         groups = [grouped[value] for value in sorted(grouped)]
-        analyses = [analyze_comp_offset_noise(group) for group in groups]
-        analyses = list(classify_comp_common_mode_validity(groups, analyses))
+        analyses = list(classify_comp_common_mode_validity(groups, analyze_comp_offset_noise_curves(groups)))
         artifacts.extend(
             plot_comp_common_mode_campaign(
                 groups,
@@ -1058,8 +1045,7 @@ def comp_system_sampling_noise(output_dir: Path) -> tuple[Path, ...]:
     measurements_by_point: dict[tuple[int, float, str, float, float], MeasCompExt] = {}
     for measurement_paths in run_measurement_paths:
         measurements_in_run: dict[tuple[int, float, str, float, float], MeasCompExt] = {}
-        for path in measurement_paths:
-            measurement = read_measurement(path)
+        for path, measurement in zip(measurement_paths, read_measurements(measurement_paths), strict=True):
             if not isinstance(measurement, MeasCompExt):
                 raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasCompExt")
             if measurement.param.campaign != "comp_sampling_noise":
@@ -1103,7 +1089,7 @@ def comp_system_sampling_noise(output_dir: Path) -> tuple[Path, ...]:
                 f"{len(COUPLING_PERCENTAGES)} matched track/hold couplings"
             )
         groups = [grouped[key] for key in sorted(grouped)]
-        analyses = [analyze_comp_offset_noise(group) for group in groups]
+        analyses = analyze_comp_offset_noise_curves(groups)
         if any(analysis.validity != "valid" for analysis in analyses):
             raise ValueError(f"ADC{adc_index:02d} sampling-noise campaign contains an invalid comparator fit")
         artifacts.extend(
@@ -1128,8 +1114,7 @@ def comp_candidate_sweep(output_dir: Path) -> tuple[Path, ...]:
         )
     measurements = []
     observed_ids = set()
-    for path in measurement_paths:
-        measurement = read_measurement(path)
+    for path, measurement in zip(measurement_paths, read_measurements(measurement_paths), strict=True):
         if not isinstance(measurement, MeasCompInt):
             raise TypeError(f"{path} contains {type(measurement).__name__}, expected MeasCompInt")
         if measurement.info.backend != "spice" or measurement.info.readbacks.get("transient_noise") is not True:
@@ -1289,7 +1274,7 @@ def cdac_system_cap_mismatch(output_dir: Path) -> tuple[Path, ...]:
         raise FileNotFoundError(2, "accepted A-to-B CDAC inputs not found", run_dirs[0])
     comparator_calibrations = load_board_map()["boards"][board_id].get("comparator_calibration", {})
     adc_groups, analyses = analyze_cdac_cap_mismatch_campaign(
-        tuple(tuple(read_measurement(path) for path in paths) for paths in paths_by_run),
+        tuple(read_measurements(paths) for paths in paths_by_run),
         adc_indices=adc_indices,
         board_id=board_id,
         comparator_offset_v_by_adc={
@@ -1335,6 +1320,113 @@ TARGETS: dict[str, Callable[[Path], tuple[Path, ...]]] = {
 }
 AGGREGATE_TARGETS = {"adc_rate_characterization"}
 
+# Shared campaign loads and intermediate analyses. Each runs at most once per
+# runner invocation, however many targets request it.
+STAGES: dict[str, Callable[[], Any]] = {
+    stage.__name__: stage
+    for stage in (
+        adc_dc_noise_campaign,
+        adc_dc_noise_sweeps,
+        adc_sine_campaign,
+        spice_ideal_noise_campaign,
+        spice_pex_noise_campaign,
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class StageTiming:
+    """Wall time of one shared stage."""
+
+    name: str
+    runtime_s: float
+
+
+class StageResults:
+    """Results of the shared stages of one runner invocation.
+
+    The first request of a stage computes it in the requesting thread; later
+    and concurrent requests wait for and share that result, or re-raise its
+    error.
+    """
+
+    def __init__(self) -> None:
+        self.timings: list[StageTiming] = []
+        self._lock = threading.Lock()
+        self._results: dict[str, Future[Any]] = {}
+
+    def get(self, name: str) -> Any:
+        """Return the result of stage ``name``, computing it on first request."""
+
+        with self._lock:
+            result = self._results.get(name)
+            owner = result is None
+            if result is None:
+                result = self._results[name] = Future()
+        if owner:
+            start_time = perf_counter()
+            try:
+                result.set_result(STAGES[name]())
+            except Exception as error:  # noqa: BLE001 - re-raised to every requester
+                result.set_exception(error)
+            finally:
+                self.timings.append(StageTiming(name, perf_counter() - start_time))
+        return result.result()
+
+
+_ACTIVE_STAGE_RESULTS: StageResults | None = None
+
+
+@contextmanager
+def stage_results() -> Iterator[StageResults]:
+    """Share every ``stage_result()`` inside the block across targets."""
+
+    global _ACTIVE_STAGE_RESULTS
+
+    results = StageResults()
+    previous_results = _ACTIVE_STAGE_RESULTS
+    _ACTIVE_STAGE_RESULTS = results
+    try:
+        yield results
+    finally:
+        _ACTIVE_STAGE_RESULTS = previous_results
+
+
+def stage_result(name: str) -> Any:
+    """Return one shared stage, computed once per ``stage_results()`` block or on every call outside one."""
+
+    if _ACTIVE_STAGE_RESULTS is None:
+        return STAGES[name]()
+    return _ACTIVE_STAGE_RESULTS.get(name)
+
+
+def stage_order(target_names: Sequence[str]) -> tuple[str, ...]:
+    """Return the shared stages of ``target_names``, each after its dependencies."""
+
+    ordered: list[str] = []
+
+    def visit(name: str) -> None:
+        for dependency in STAGE_DEPENDENCIES.get(name, ()):
+            if dependency not in ordered:
+                visit(dependency)
+                if dependency in STAGES:
+                    ordered.append(dependency)
+
+    for target_name in target_names:
+        visit(target_name)
+    return tuple(ordered)
+
+
+def run_target(target_name: str, output_dir: Path) -> tuple[tuple[Path, ...] | FileNotFoundError, float]:
+    """Run one target, returning its artifacts or missing-input error and its wall time."""
+
+    start_time = perf_counter()
+    try:
+        artifacts: tuple[Path, ...] | FileNotFoundError = TARGETS[target_name](output_dir)
+    except FileNotFoundError as error:
+        artifacts = error
+    return artifacts, perf_counter() - start_time
+
 
 def main() -> None:
     """Run one named analysis pipeline, or every target when none is named."""
@@ -1349,31 +1441,92 @@ def main() -> None:
         choices=sorted(TARGETS),
         help="analysis-pipeline function to run; omit to run all targets",
     )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=None,
+        help="plot rendering processes (default: one per CPU; 1 renders each plot when it is requested)",
+    )
+    parser.add_argument(
+        "--target-workers",
+        type=int,
+        default=1,
+        help="threads running independent targets; shared stages start first (default: 1, in registration order)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recompute every analysis instead of reusing results from build/analysis/cache",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="report analysis-cache hits, misses, evictions, and size after the run",
+    )
     args = parser.parse_args()
+    if args.target_workers < 1:
+        parser.error("--target-workers must be positive")
     run_all = args.target is None
     target_names = tuple(name for name in TARGETS if name not in AGGREGATE_TARGETS) if run_all else (args.target,)
     timestamp = datetime.now().astimezone().strftime("%Y%m%d_%H%M")
     output_dirs: dict[str, Path] = {}
+    target_output_dirs = {}
     for target_name in target_names:
         # TODO: Route cdac_* targets to analysis_cdac instead of analysis_adc.
         domain = "comp" if target_name.startswith("comp_") else "adc"
-        output_dir = output_dirs.get(domain)
-        if output_dir is None:
-            output_dir = ANALYSIS_OUTPUT_BASE / domain / timestamp
-            output_dir.mkdir(parents=True, exist_ok=False)
-            output_dirs[domain] = output_dir
-            print(f"Analysis output: {output_dir}")
-        start_time = perf_counter()
+        if domain not in output_dirs:
+            output_dirs[domain] = ANALYSIS_OUTPUT_BASE / domain / timestamp
+            output_dirs[domain].mkdir(parents=True, exist_ok=False)
+            print(f"Analysis output: {output_dirs[domain]}")
+        target_output_dirs[target_name] = output_dirs[domain]
+    run_start_time = perf_counter()
+    cache_dir = None if args.no_cache else ANALYSIS_OUTPUT_BASE / "cache"
+    with (
+        render_queue(workers=args.render_workers) as queue,
+        analysis_cache(cache_dir) as cache,
+        stage_results() as stages,
+    ):
+        executor = None if args.target_workers == 1 else ThreadPoolExecutor(max_workers=args.target_workers)
+        if executor is None:
+            # Serial runs keep registration order and load each shared
+            # stage when its first target requests it.
+            target_runs = (run_target(name, target_output_dirs[name]) for name in target_names)
+        else:
+            # Shared stages are submitted before their dependents, so no
+            # target waits on a stage that has not started.
+            for stage_name in stage_order(target_names):
+                executor.submit(stages.get, stage_name)
+            futures = [executor.submit(run_target, name, target_output_dirs[name]) for name in target_names]
+            target_runs = (future.result() for future in futures)
         try:
-            artifacts = TARGETS[target_name](output_dir)
-        except FileNotFoundError as error:
-            if not run_all:
-                raise
-            runtime_s = perf_counter() - start_time
-            print(f"Skipped {target_name}: missing {error.filename} after {runtime_s:.2f} s")
-            continue
-        runtime_s = perf_counter() - start_time
-        print(f"Completed {target_name}: {len(artifacts)} artifacts in {runtime_s:.2f} s")
+            for target_name, (artifacts, runtime_s) in zip(target_names, target_runs, strict=True):
+                if isinstance(artifacts, FileNotFoundError):
+                    if not run_all:
+                        raise artifacts
+                    print(f"Skipped {target_name}: missing {artifacts.filename} after {runtime_s:.2f} s")
+                    continue
+                print(f"Completed {target_name}: {len(artifacts)} artifacts in {runtime_s:.2f} s")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        rendered_plots = queue.wait()
+        cache_stats = None if cache is None else cache.stats()
+    for timing in stages.timings:
+        print(f"Stage {timing.name}: {timing.runtime_s:.2f} s")
+    for plot in rendered_plots:
+        print(f"Rendered {plot.output_path.name}: {len(plot.paths)} files in {plot.render_s:.2f} s")
+    if rendered_plots:
+        print(f"Rendered {len(rendered_plots)} plots; run finished {perf_counter() - run_start_time:.2f} s after start")
+    if args.cache_stats:
+        if cache_stats is None:
+            print("Analysis cache: disabled")
+        else:
+            print(
+                f"Analysis cache: {cache_stats.hits} hits saving {cache_stats.saved_s:.2f} s, "
+                f"{cache_stats.misses} misses, {cache_stats.evictions} evicted; "
+                f"{cache_stats.entry_count} entries in {cache_stats.size_bytes / 2**20:.1f} MiB"
+            )
 
 
 if __name__ == "__main__":
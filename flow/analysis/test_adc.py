@@ -15,6 +15,7 @@ from flow.adc import AdcParams
 from flow.adc.sim import AdcTbParams
 from flow.analysis.adc import (
     analyze_adc_code_distribution,
+    analyze_adc_decision_path_histogram,
     analyze_adc_decision_paths,
     analyze_adc_dynamic,
     analyze_adc_dynamic_sweep,
@@ -22,6 +23,7 @@ from flow.analysis.adc import (
     analyze_adc_nonlinearity,
     analyze_adc_power_sweep,
     analyze_adc_ramp,
+    analyze_adc_spectra,
     analyze_adc_transfer,
     analyze_scope_wave_to_bits,
     combine_adc_noise_comparison,
@@ -326,6 +328,84 @@ def test_dynamic_analysis_separates_noise_and_harmonics() -> None:
     assert result.spectral_sndr_db == pytest.approx(39.96, abs=0.2)
 
 
+def test_newton_sine_fit_matches_bounded_frequency_search() -> None:
+    rng = np.random.default_rng(11)
+    sample_rate_hz = 1.0e6
+    input_frequency_hz = 12_345.678
+    sample_count = 16_384
+    time_s = np.arange(sample_count) / sample_rate_hz
+    samples = np.rint(
+        2_048.0
+        + 1_500.0 * np.sin(2.0 * np.pi * (input_frequency_hz + 7.0) * time_s + 0.4)
+        + rng.normal(0.0, 1.0, sample_count)
+    )
+    msmt = adc_measurement(samples, sample_rate_hz=sample_rate_hz, input_frequency_hz=input_frequency_hz)
+
+    newton = analyze_adc_dynamic(msmt, sine_fit="newton")
+    search = analyze_adc_dynamic(msmt, sine_fit="bounded_search")
+    assert newton.fitted_frequency_hz == pytest.approx(input_frequency_hz + 7.0, abs=0.02)
+    assert newton.fitted_frequency_hz == pytest.approx(search.fitted_frequency_hz, abs=1e-3)
+    assert newton.residual_rms_dout <= search.residual_rms_dout * (1.0 + 1e-9)
+    assert newton.spectral_sndr_db == pytest.approx(search.spectral_sndr_db, abs=1e-6)
+    assert newton.enob_bits == pytest.approx(search.enob_bits, abs=1e-6)
+    with pytest.raises(ValueError, match="sine fit"):
+        analyze_adc_dynamic(msmt, sine_fit="fft")  # type: ignore[arg-type]
+
+
+def test_batched_spectra_match_per_record_dynamic_metrics() -> None:
+    rng = np.random.default_rng(13)
+    sample_rate_hz = 1.0e6
+    sample_count = 8_192
+    time_s = np.arange(sample_count) / sample_rate_hz
+    frequencies_hz = (12_345.678, 31_250.0, 101_234.5)
+    measurements = [
+        adc_measurement(
+            np.rint(
+                2_048.0
+                + 1_500.0 * np.sin(2.0 * np.pi * frequency_hz * time_s)
+                + 12.0 * np.sin(4.0 * np.pi * frequency_hz * time_s)
+                + rng.normal(0.0, noise_rms, sample_count)
+            ),
+            sample_rate_hz=sample_rate_hz,
+            input_frequency_hz=frequency_hz,
+        )
+        for frequency_hz, noise_rms in zip(frequencies_hz, (0.5, 1.0, 2.0), strict=True)
+    ]
+
+    spectra = analyze_adc_spectra(measurements)
+    assert spectra.spectrum_dbfs.shape == (3, sample_count // 2 + 1)
+    np.testing.assert_allclose(spectra.input_frequency_hz, frequencies_hz)
+    for index, measurement in enumerate(measurements):
+        dynamic = analyze_adc_dynamic(measurement, frequency_search_fraction=0.0)
+        assert spectra.spectral_sndr_db[index] == pytest.approx(dynamic.spectral_sndr_db, abs=1e-9)
+        assert spectra.spectral_snr_db[index] == pytest.approx(dynamic.spectral_snr_db, abs=1e-9)
+        assert spectra.spectral_thd_db[index] == pytest.approx(dynamic.spectral_thd_db, abs=1e-9)
+        assert spectra.spectral_sfdr_db[index] == pytest.approx(dynamic.spectral_sfdr_db, abs=1e-9)
+        assert spectra.spectral_enob_bits[index] == pytest.approx(dynamic.spectral_enob_bits, abs=1e-9)
+
+    # 31.25 kHz is 256 cycles of 8,192 samples: one rectangular bin holds the tone.
+    coherent = analyze_adc_spectra(measurements[1:2], mode="coherent")
+    assert coherent.spectral_thd_db[0] == pytest.approx(20.0 * math.log10(12.0 / 1_500.0), abs=0.05)
+    assert coherent.spectral_sfdr_db[0] == pytest.approx(-coherent.spectral_thd_db[0], abs=0.05)
+    with pytest.raises(ValueError, match="integer number"):
+        analyze_adc_spectra(measurements[:1], mode="coherent")
+
+    repeated = [
+        replace(measurements[2], daq=replace(measurements[2].daq, dout=dout))
+        for dout in (
+            np.rint(measurements[2].daq.dout + rng.normal(0.0, 1.0, sample_count)).astype(np.int64) for _ in range(4)
+        )
+    ]
+    averaged = analyze_adc_spectra(repeated, mode="averaged")
+    single = analyze_adc_spectra(repeated)
+    assert averaged.spectrum_dbfs.shape[0] == 1
+    assert averaged.spectral_snr_db[0] == pytest.approx(np.mean(single.spectral_snr_db), abs=0.3)
+    with pytest.raises(ValueError, match="common input frequency"):
+        analyze_adc_spectra(measurements, mode="averaged")
+    with pytest.raises(ValueError, match="equal-length"):
+        analyze_adc_spectra([measurements[0], adc_measurement(np.zeros(100))])
+
+
 def test_transfer_noise_and_code_density_use_typed_adc_data() -> None:
     msmt = adc_measurement(
         [0, 0, 1, 2, 3, 3],
@@ -438,6 +518,67 @@ def test_ramp_analysis_redecodes_with_common_calibration_weights() -> None:
         analyze_adc_ramp(measurement, calibrations=(replace(calibration, adc_index=1),))
 
 
+def test_packed_bout_matches_decision_matrix_analyses() -> None:
+    """Decode the same ramp from one packed word per conversion."""
+
+    measurement = adc_ramp_measurement()
+    packed = replace(measurement, daq=replace(measurement.daq, bout=measurement.daq.bout_packed))
+    assert packed.daq.bout.dtype == np.uint32
+    assert packed.daq.bout.shape == (len(measurement.daq.dout),)
+    np.testing.assert_array_equal(packed.daq.bout_bits, measurement.daq.bout)
+
+    expected = analyze_adc_ramp(measurement)
+    result = analyze_adc_ramp(packed)
+    np.testing.assert_array_equal(result.curves[0].count, expected.curves[0].count)
+    np.testing.assert_allclose(result.curves[0].inl, expected.curves[0].inl)
+
+    calibration = AnalysisAdcCalibration(
+        adc_index=0,
+        method="calibration1",
+        label="Synthetic calibrated BOUT",
+        code_max=4095,
+        nominal_weights=expected.curves[0].weights,
+        calibrated_weights=expected.curves[0].weights * 4095.0 / np.sum(expected.curves[0].weights),
+        measured_weight_mask=np.ones(17, dtype=np.bool_),
+        training_sample_count=100,
+        validation_sample_count=0,
+        output_gain=1.0,
+        output_offset_lsb=0.0,
+    )
+    np.testing.assert_allclose(
+        decode_bout(packed.daq.bout, calibration, rounded=False),
+        decode_bout(measurement.daq.bout, calibration, rounded=False),
+    )
+    paths = analyze_adc_decision_paths(packed, selection="same_dout")
+    reference = analyze_adc_decision_paths(measurement, selection="same_dout")
+    np.testing.assert_array_equal(paths.bout, reference.bout)
+    np.testing.assert_allclose(paths.estimate_dout, reference.estimate_dout)
+
+
+def test_chunked_adc_analyses_match_whole_array_results() -> None:
+    """Accumulate resets, histograms, and transfer sums across DAQ slices."""
+
+    measurement = adc_ramp_measurement()
+    expected = analyze_adc_ramp(measurement)
+    # An odd slice length splits reset clusters and exclusion windows.
+    chunked = analyze_adc_ramp(measurement, chunk_size=997)
+    np.testing.assert_array_equal(chunked.reset_conversion_index, expected.reset_conversion_index)
+    assert chunked.retained_sample_count == expected.retained_sample_count
+    assert chunked.ramp_frequency_hz == pytest.approx(expected.ramp_frequency_hz)
+    np.testing.assert_array_equal(chunked.curves[0].count, expected.curves[0].count)
+    np.testing.assert_allclose(chunked.curves[0].transfer_mean_dout, expected.curves[0].transfer_mean_dout)
+
+    levels = adc_measurement([0, 0, 1, 2, 3, 3, 2, 1], vin_diff_v=[-0.1, -0.1, 0.0, 0.0, 0.1, 0.1, 0.0, 0.2])
+    distribution = analyze_adc_code_distribution([levels, levels], chunk_size=3)
+    np.testing.assert_array_equal(distribution.vin_diff_v, analyze_adc_code_distribution([levels]).vin_diff_v)
+    np.testing.assert_array_equal(distribution.count, 2 * analyze_adc_code_distribution([levels]).count)
+    noise = analyze_adc_noise_sweep([levels], chunk_size=3)
+    np.testing.assert_array_equal(noise.count, analyze_adc_noise_sweep([levels]).count)
+    np.testing.assert_allclose(noise.std_dout, np.std(levels.daq.dout))
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        analyze_adc_ramp(measurement, chunk_size=0)
+
+
 def test_shared_adc_analyses_accept_internal_measurements() -> None:
     """Analyze simulated ADC data through the same public entry points."""
 
@@ -535,6 +676,68 @@ def test_decision_paths_normalize_redundant_raw_weights() -> None:
     assert paths.estimate_dout[0, -1] == pytest.approx(4095.0)
 
 
+def test_decision_path_histogram_bins_running_estimates_without_paths() -> None:
+    rng = np.random.default_rng(17)
+    bout = rng.integers(0, 2, size=(3_000, 17), dtype=np.uint8)
+    msmt = adc_measurement(rng.integers(0, 4, size=3_000))
+    object.__setattr__(msmt.daq, "bout", bout)
+    msmt = replace(msmt, daq=replace(msmt.daq, bout=msmt.daq.bout_packed))
+
+    for selection in ("all", "same_dout"):
+        paths = analyze_adc_decision_paths(msmt, selection=selection)
+        histogram = analyze_adc_decision_path_histogram(msmt, selection=selection, chunk_size=700)
+        codes = np.floor(paths.estimate_dout + 0.5).astype(np.int64)
+        assert histogram.conversion_count == len(paths.final_dout)
+        for cycle in range(18):
+            np.testing.assert_array_equal(histogram.code_count[cycle], np.bincount(codes[:, cycle], minlength=4096))
+        transitions, counts = np.unique(
+            np.stack([np.repeat(np.arange(1, 18), len(codes)), codes[:, :-1].T.ravel(), codes[:, 1:].T.ravel()]),
+            axis=1,
+            return_counts=True,
+        )
+        np.testing.assert_array_equal(
+            np.stack(
+                [histogram.transition_cycle, histogram.transition_source_code, histogram.transition_destination_code]
+            ),
+            transitions,
+        )
+        np.testing.assert_array_equal(histogram.transition_count, counts)
+        assert histogram.final_estimate_mean_dout == pytest.approx(np.mean(paths.estimate_dout[:, -1]))
+        assert histogram.final_estimate_std_dout == pytest.approx(np.std(paths.estimate_dout[:, -1]))
+        assert histogram.final_dout_mean == pytest.approx(np.mean(paths.final_dout))
+
+
+def test_decision_path_histogram_reads_bounded_spans_for_sparse_selections() -> None:
+    class RecordingBout:
+        def __init__(self, words: np.ndarray) -> None:
+            self.words = words
+            self.read_lengths: list[int] = []
+
+        def __getitem__(self, rows: slice) -> np.ndarray:
+            self.read_lengths.append(rows.stop - rows.start)
+            return self.words[rows]
+
+        def __len__(self) -> int:
+            return len(self.words)
+
+    rng = np.random.default_rng(23)
+    dout = np.zeros(5_000, dtype=np.int64)
+    dout[[3, 40, 1_200, 1_201, 4_990]] = 3
+    msmt = adc_measurement(dout)
+    object.__setattr__(msmt.daq, "bout", rng.integers(0, 2, size=(5_000, 17), dtype=np.uint8))
+    msmt = replace(msmt, daq=replace(msmt.daq, bout=msmt.daq.bout_packed))
+    expected = analyze_adc_decision_path_histogram(msmt, selection="same_dout", selected_dout=3, chunk_size=64)
+    recording = RecordingBout(np.asarray(msmt.daq.bout))
+    object.__setattr__(msmt.daq, "bout", recording)
+
+    histogram = analyze_adc_decision_path_histogram(msmt, selection="same_dout", selected_dout=3, chunk_size=64)
+
+    assert recording.read_lengths == [38, 2, 1]
+    np.testing.assert_array_equal(histogram.code_count, expected.code_count)
+    np.testing.assert_array_equal(histogram.transition_count, expected.transition_count)
+    assert histogram.final_estimate_mean_dout == expected.final_estimate_mean_dout
+
+
 def test_dynamic_sweep_retains_rate_frequency_and_logic_phase() -> None:
     measurements = []
     for index, frequency_hz in enumerate((1_000.0, 5_000.0)):
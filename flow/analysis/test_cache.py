@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+import flow.analysis.cache as analysis_cache_module
+from flow.analysis.cache import analysis_cache, cached_analysis
+from flow.analysis.io import LazyDataset
+from flow.analysis.types import AnalysisCompOffsetNoise
+
+COMPUTED_OFFSETS: list[float] = []
+
+
+@cached_analysis
+def offset_noise_analysis(offset_v: float, *, workers: int | None = None) -> tuple[AnalysisCompOffsetNoise, ...]:
+    COMPUTED_OFFSETS.append(offset_v)
+    vin_diff_v = np.linspace(-1.0e-3, 1.0e-3, 5) + offset_v
+    return (
+        AnalysisCompOffsetNoise(
+            vin_diff_v=vin_diff_v,
+            decision_probability=np.asarray([0.0, 0.1, 0.5, 0.9, 1.0]),
+            trial_count=np.full(5, 100),
+            offset_v=offset_v,
+            noise_sigma_v=2.0e-4,
+        ),
+        AnalysisCompOffsetNoise(
+            vin_diff_v=vin_diff_v,
+            decision_probability=np.ones(5),
+            trial_count=np.full(5, 100),
+            offset_v=math.nan,
+            noise_sigma_v=math.nan,
+            validity="stuck-high",
+        ),
+    )
+
+
+def test_cached_analysis_reuses_typed_results_independent_of_worker_count(tmp_path: Path) -> None:
+    """Store NaN-bearing typed results once and serve later identical calls from disk."""
+
+    COMPUTED_OFFSETS.clear()
+    direct = offset_noise_analysis(1.0e-3)
+    with analysis_cache(tmp_path) as cache:
+        assert cache is not None
+        stored = offset_noise_analysis(1.0e-3, workers=1)
+        reused = offset_noise_analysis(1.0e-3, workers=4)
+        offset_noise_analysis(2.0e-3)
+        stats = cache.stats()
+
+    assert COMPUTED_OFFSETS == [1.0e-3, 1.0e-3, 2.0e-3]
+    assert (stats.hits, stats.misses, stats.entry_count) == (1, 2, 2)
+    for expected, actual in zip(direct, reused, strict=True):
+        assert type(actual) is AnalysisCompOffsetNoise
+        np.testing.assert_array_equal(actual.vin_diff_v, expected.vin_diff_v)
+        np.testing.assert_array_equal(actual.trial_count, expected.trial_count)
+        assert actual.trial_count.dtype == np.int64
+        assert actual.validity == expected.validity
+        np.testing.assert_equal(
+            (actual.offset_v, actual.noise_sigma_v, actual.probit_offset_v),
+            (expected.offset_v, expected.noise_sigma_v, expected.probit_offset_v),
+        )
+    assert stored[0].offset_v == reused[0].offset_v
+
+
+def test_analysis_cache_evicts_least_recently_used_entries_and_tracks_code_version(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep only the newest entry under a zero size limit and miss after a code change."""
+
+    COMPUTED_OFFSETS.clear()
+    with analysis_cache(tmp_path, max_bytes=0) as cache:
+        assert cache is not None
+        for offset_v in (1.0e-3, 2.0e-3, 3.0e-3):
+            offset_noise_analysis(offset_v)
+        offset_noise_analysis(3.0e-3)
+        stats = cache.stats()
+    assert (stats.hits, stats.evictions, stats.entry_count) == (1, 2, 1)
+
+    monkeypatch.setattr(analysis_cache_module, "analysis_code_version", lambda: "edited")
+    with analysis_cache(tmp_path) as cache:
+        assert cache is not None
+        offset_noise_analysis(3.0e-3)
+        assert cache.stats().misses == 1
+    with analysis_cache(None):
+        offset_noise_analysis(3.0e-3)
+    assert COMPUTED_OFFSETS == [1.0e-3, 2.0e-3, 3.0e-3, 3.0e-3, 3.0e-3]
+
+
+def test_analysis_code_version_covers_cdac_weights_and_board_map(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Change the version when a non-analysis input of the analyses changes."""
+
+    board_map = tmp_path / "map_board.yaml"
+    board_map.write_text("boards: {}\n")
+    monkeypatch.setattr(analysis_cache_module, "ANALYSIS_DEPENDENCY_SOURCES", ("cdac/subckt.py", board_map))
+    stored = analysis_cache_module.analysis_code_version()
+    assert analysis_cache_module.analysis_code_version() == stored
+    board_map.write_text("boards: {frida: {}}\n")
+    assert analysis_cache_module.analysis_code_version() != stored
+
+
+def test_failed_cache_write_warns_and_returns_the_computed_result(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep a successful analysis when its cache entry cannot be written."""
+
+    def full_disk(*_args, **_kwargs):
+        raise OSError("No space left on device")
+
+    COMPUTED_OFFSETS.clear()
+    monkeypatch.setattr(analysis_cache_module, "write_analysis", full_disk)
+    with analysis_cache(tmp_path) as cache:
+        assert cache is not None
+        with pytest.warns(RuntimeWarning, match="No space left on device"):
+            result = offset_noise_analysis(4.0e-3)
+        stats = cache.stats()
+
+    assert result[0].offset_v == 4.0e-3
+    assert (stats.misses, stats.entry_count) == (1, 0)
+
+
+@cached_analysis
+def lazy_sample_count_analysis(samples: LazyDataset) -> tuple[AnalysisCompOffsetNoise, ...]:
+    return offset_noise_analysis(float(len(samples)))
+
+
+def test_cached_analysis_keys_lazy_datasets_without_loading_them(tmp_path: Path) -> None:
+    """Identify lazy inputs by their source file so lookups keep captures unread."""
+
+    capture = tmp_path / "capture.h5"
+
+    def lazy_samples(count: int) -> LazyDataset:
+        with h5py.File(capture, "w") as output:
+            output.create_dataset("daq/dout", data=np.arange(count), chunks=True, compression="gzip")
+        with h5py.File(capture, "r") as stored:
+            return LazyDataset.from_dataset(capture, stored["daq/dout"])
+
+    COMPUTED_OFFSETS.clear()
+    samples = lazy_samples(100)
+    with analysis_cache(tmp_path / "cache") as cache:
+        assert cache is not None
+        lazy_sample_count_analysis(samples)
+        lazy_sample_count_analysis(samples)
+        rewritten = lazy_samples(200)
+        lazy_sample_count_analysis(rewritten)
+        stats = cache.stats()
+
+    assert not samples.loaded
+    assert not rewritten.loaded
+    assert COMPUTED_OFFSETS == [100.0, 200.0]
+    assert (stats.hits, stats.misses) == (1, 2)
@@ -11,6 +11,8 @@ import pytest
 from flow.adc.sim import AdcTbParams
 from flow.analysis import calibration1
 from flow.analysis.calibration1 import (
+    _bootstrap_transitions,
+    _SCurveCounts,
     analyze,
     audit_measured_weights,
     cdac_endpoint_action,
@@ -170,3 +172,47 @@ def test_calibration1_public_analysis_returns_common_weights(monkeypatch: pytest
     assert not hybrid.measured_weight_mask[5]
     assert np.all(np.isfinite(hybrid.calibrated_weights))
     assert np.sum(hybrid.calibrated_weights) == pytest.approx(4095.0)
+
+
+def test_bootstrap_transitions_redraw_trials_or_batches_deterministically() -> None:
+    vin_diff_v = np.linspace(-1e-3, 1e-3, 5)
+    empty = np.zeros(0, dtype=np.int64)
+    sharp = _SCurveCounts(
+        side=0,
+        element=0,
+        direction=0,
+        vin_diff_v=vin_diff_v,
+        trial_count=np.full(5, 8, dtype=np.int64),
+        one_count=np.asarray([0, 0, 4, 8, 8], dtype=np.int64),
+        batch_point=empty,
+        batch_one_count=empty,
+    )
+    batched = _SCurveCounts(
+        side=1,
+        element=0,
+        direction=0,
+        vin_diff_v=vin_diff_v,
+        trial_count=np.full(5, 8, dtype=np.int64),
+        one_count=np.asarray([0, 2, 4, 6, 8], dtype=np.int64),
+        batch_point=np.repeat(np.arange(5, dtype=np.int64), 2),
+        batch_one_count=np.asarray([0, 0, 0, 2, 2, 2, 2, 4, 4, 4], dtype=np.int64),
+    )
+    seed = np.random.SeedSequence(7).spawn(1)[0]
+
+    transition_v = _bootstrap_transitions(seed, curves=(sharp, batched))
+
+    assert np.all(np.isfinite(transition_v))
+    np.testing.assert_array_equal(transition_v, _bootstrap_transitions(seed, curves=(sharp, batched)))
+    assert -5e-4 <= transition_v[0] <= 5e-4
+    assert -1e-3 <= transition_v[1] <= 1e-3
+    deterministic = _SCurveCounts(
+        side=0,
+        element=0,
+        direction=0,
+        vin_diff_v=vin_diff_v,
+        trial_count=np.full(5, 8, dtype=np.int64),
+        one_count=np.asarray([0, 0, 8, 8, 8], dtype=np.int64),
+        batch_point=empty,
+        batch_one_count=empty,
+    )
+    assert _bootstrap_transitions(seed, curves=(deterministic,))[0] == pytest.approx(-2.5e-4)
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import numpy as np
 import pytest
+from scipy.optimize import lsq_linear
 
 from flow.analysis.adc import analyze_adc_ramp
 from flow.analysis.calibration2 import (
     ADC_CODE_MAX,
     FRIDA_NOMINAL_BOUT_WEIGHTS,
     analyze,
+    bootstrap,
+    build_empirical_calibration_workspace,
     fit_code_density_cdf_lut,
     fit_empirical_bout_calibration,
     select_empirical_ridge_strength,
@@ -81,6 +86,44 @@ def test_validation_targets_cannot_change_training_fit() -> None:
     assert changed.diagnostics.validation_rmse_lsb > 900.0
 
 
+def test_workspace_matches_per_sample_fits_across_ridge_strengths_and_splits() -> None:
+    bout, ideal_dout, cycle_index, retained, _ = synthetic_calibration_data()
+    workspace = build_empirical_calibration_workspace(bout, ideal_dout, cycle_index, retained)
+    prior = np.asarray(FRIDA_NOMINAL_BOUT_WEIGHTS) * ADC_CODE_MAX / np.sum(FRIDA_NOMINAL_BOUT_WEIGHTS)
+
+    for training_cycles, validation_cycles, ridge_strength in (
+        (np.arange(0, 12, 2), np.arange(1, 12, 2), 0.02),
+        (np.arange(6), np.arange(6, 12), 0.0),
+        (np.asarray([1, 4, 7, 10]), np.asarray([0, 3]), 0.005),
+    ):
+        fit = workspace.fit(training_cycles, validation_cycles, ridge_strength=ridge_strength)
+
+        training = retained & np.isin(cycle_index, training_cycles)
+        validation = retained & np.isin(cycle_index, validation_cycles)
+        penalty = np.sqrt(ridge_strength * np.sum(training) / 17)
+        design = np.vstack(
+            (
+                np.column_stack((np.ones(np.sum(training)), bout[training])),
+                np.column_stack((np.zeros(17), penalty * np.eye(17))),
+            )
+        )
+        reference = lsq_linear(
+            design,
+            np.concatenate((ideal_dout[training], penalty * prior)),
+            bounds=(np.concatenate(([-np.inf], np.zeros(17))), np.inf),
+        ).x
+        np.testing.assert_allclose(fit.normalized_weights * fit.output_gain, reference[1:], atol=1.0e-6)
+        assert fit.output_intercept_lsb == pytest.approx(reference[0], abs=1.0e-6)
+        np.testing.assert_array_equal(fit.diagnostics.training_cycles, training_cycles)
+        assert fit.diagnostics.validation_sample_count == np.sum(validation)
+        residual = reference[0] + bout[validation] @ reference[1:] - ideal_dout[validation]
+        assert fit.diagnostics.validation_rmse_lsb == pytest.approx(np.sqrt(np.mean(residual**2)), rel=1.0e-6)
+        assert fit.diagnostics.validation_maximum_abs_error_lsb == pytest.approx(np.max(np.abs(residual)), rel=1.0e-6)
+
+    with pytest.raises(ValueError, match="disjoint"):
+        workspace.fit([0, 2], [2, 3])
+
+
 def test_code_density_cdf_lut_is_fractional_and_uses_training_only() -> None:
     count = np.arange(1, 17, dtype=np.int64)
     raw_dout = np.repeat(np.arange(16, dtype=np.int64), count)
@@ -141,6 +184,33 @@ def test_calibration2_public_analysis_returns_common_weights() -> None:
     assert np.all(result.measured_weight_mask)
     assert result.training_sample_count > 0
     assert result.validation_sample_count > 0
+    packed = replace(measurement, daq=replace(measurement.daq, bout=measurement.daq.bout_packed))
+    np.testing.assert_allclose(
+        analyze(packed, ramp, ridge_strength=0.02).calibrated_weights,
+        result.calibrated_weights,
+    )
+
+
+def test_bootstrap_is_independent_of_worker_count_and_brackets_point_fit() -> None:
+    measurement = adc_ramp_measurement(cycles=8)
+    ramp = analyze_adc_ramp(measurement)
+
+    serial = bootstrap(measurement, ramp, ridge_strength=0.02, replicates=8, seed=5, workers=1)
+    pooled = bootstrap(measurement, ramp, ridge_strength=0.02, replicates=8, seed=5, workers=2)
+
+    np.testing.assert_array_equal(serial.replicate_weights, pooled.replicate_weights)
+    assert serial.replicate_weights.shape == (8, 17)
+    assert serial.failed_replicate_count == 0
+    np.testing.assert_allclose(np.sum(serial.replicate_weights, axis=1), ADC_CODE_MAX)
+    np.testing.assert_array_equal(
+        serial.calibration.calibrated_weights,
+        analyze(measurement, ramp, ridge_strength=0.02).calibrated_weights,
+    )
+    assert np.all(serial.weight_lower <= serial.weight_upper)
+    assert np.all(serial.weight_std >= 0.0)
+    batched = bootstrap(measurement, ramp, ridge_strength=0.02, replicates=4, seed=5, batch_size=512, workers=1)
+    assert batched.batch_size == 512
+    assert batched.replicate_weights.shape == (4, 17)
 
 
 def test_clipped_endpoint_paths_must_be_removed_before_empirical_fit() -> None:
@@ -9,8 +9,15 @@ import numpy as np
 import pytest
 
 from flow.adc.sim import AdcTbParams
+from flow.analysis import calibration3
 from flow.analysis.adc import analyze_adc_ramp
-from flow.analysis.calibration3 import _extract_prefix_thresholds, _fit_probit_threshold, _hybrid_weights, analyze
+from flow.analysis.calibration3 import (
+    _extract_prefix_thresholds,
+    _fit_probit_threshold,
+    _hybrid_weights,
+    analyze,
+    bootstrap,
+)
 from flow.analysis.plots import plot_adc_calibration_weights
 from flow.analysis.test_adc import adc_measurement
 from flow.analysis.types import AdcDaq, MeasAdcExt
@@ -121,7 +128,7 @@ def threshold_analysis():
     measurement, expected_down_step_v, expected_up_step_v = _threshold_ramp_measurement()
     ramp = analyze_adc_ramp(measurement)
     extraction = _extract_prefix_thresholds(
-        measurement.daq.bout,
+        measurement.daq.bout_packed,
         measurement.daq.vin_diff_v,
         np.ones(len(measurement.daq.bout), dtype=np.bool_),
         vin_diff_min_v=-1.0,
@@ -157,6 +164,83 @@ def test_threshold_calibration_recovers_both_directional_movements(threshold_ana
     assert np.count_nonzero(result.measured_weight_mask) <= resolved_prefix_count
 
 
+def test_bootstrap_with_unit_multiplicity_reproduces_point_fit(
+    threshold_analysis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    result = threshold_analysis[0]
+    measurement, _, _ = _threshold_ramp_measurement()
+    ramp = analyze_adc_ramp(measurement)
+    monkeypatch.setattr(calibration3, "resample_multiplicity", lambda _rng, unit_count: np.ones(unit_count, np.int64))
+
+    replicated = bootstrap(measurement, ramp, replicates=2, seed=1, workers=1)
+
+    assert replicated.failed_replicate_count == 0
+    np.testing.assert_allclose(replicated.replicate_weights, np.tile(result.calibrated_weights, (2, 1)))
+    np.testing.assert_allclose(replicated.weight_std, 0.0, atol=1e-12)
+
+
+def test_only_bootstrap_replicates_restart_threshold_widths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep point fits on their single optimizer start; replicates add the width restart."""
+
+    measurement, _, _ = _threshold_ramp_measurement()
+    ramp = analyze_adc_ramp(measurement)
+    restart_width = []
+    fit = calibration3._fit_binned_probit_threshold
+
+    def recording_fit(*args, **kwargs):
+        restart_width.append(kwargs["restart_width"])
+        return fit(*args, **kwargs)
+
+    monkeypatch.setattr(calibration3, "_fit_binned_probit_threshold", recording_fit)
+    analyze(measurement, ramp)
+    point_fit_count = len(restart_width)
+    bootstrap(measurement, ramp, replicates=2, seed=3)
+
+    assert point_fit_count > 0
+    assert not any(restart_width[:point_fit_count])
+    assert len(restart_width) > 2 * point_fit_count
+    assert all(restart_width[2 * point_fit_count :])
+
+
+def test_prefix_branch_histograms_match_per_branch_fits() -> None:
+    """Run-length branch counts reproduce each separately selected prefix fit on any pool size."""
+
+    measurement, _, _ = _threshold_ramp_measurement(cycles=8)
+    retained = np.arange(len(measurement.daq.bout)) % 3 != 0
+    serial = _extract_prefix_thresholds(
+        measurement.daq.bout_packed,
+        measurement.daq.vin_diff_v,
+        retained,
+        vin_diff_min_v=-1.0,
+        vin_diff_max_v=1.0,
+        workers=1,
+    )
+    pooled = _extract_prefix_thresholds(
+        measurement.daq.bout_packed,
+        measurement.daq.vin_diff_v,
+        retained,
+        vin_diff_min_v=-1.0,
+        vin_diff_max_v=1.0,
+        workers=2,
+    )
+    for name, values in serial.items():
+        np.testing.assert_array_equal(pooled[name], values)
+    for decision_index in (1, 5):
+        for value, prefix in (("down", 0), ("up", 1)):
+            branch = retained & np.all(measurement.daq.bout[:, :decision_index] == prefix, axis=1)
+            expected = _fit_probit_threshold(
+                measurement.daq.vin_diff_v[branch],
+                measurement.daq.bout[branch, decision_index],
+                vin_diff_min_v=-1.0,
+                vin_diff_max_v=1.0,
+            )
+            assert serial[f"{value}_threshold_v"][decision_index] == expected[0]
+            assert serial[f"{value}_noise_sigma_v"][decision_index] == expected[1]
+            assert serial[f"{value}_threshold_std_v"][decision_index] == expected[2]
+            assert serial[f"{value}_trial_count"][decision_index] == expected[3]
+
+
 def test_threshold_calibration_uses_common_weight_plot(
     threshold_analysis,
     tmp_path,
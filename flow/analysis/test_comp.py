@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import replace
 from datetime import UTC, datetime
 
@@ -11,6 +12,7 @@ import pytest
 from flow.analysis.comp import (
     analyze_comp_candidate_sweep,
     analyze_comp_offset_noise,
+    analyze_comp_offset_noise_curves,
     analyze_comp_power,
     analyze_comp_timing,
     classify_comp_common_mode_validity,
@@ -154,7 +156,9 @@ def test_comp_offset_noise_reports_invalid_curves_in_analysis_only() -> None:
     assert np.isnan(result.offset_v)
 
 
-def test_comp_offset_noise_accounts_for_batched_correlation_and_wander() -> None:
+def _batched_wander_measurements() -> list[MeasCompInt]:
+    """Build four batched fine points whose middle two wander between batches."""
+
     batch_ones = (
         (0,) * 10,
         (98, 93, 90, 99, 96, 100, 94, 98, 99, 100),
@@ -194,6 +198,11 @@ def test_comp_offset_noise_accounts_for_batched_correlation_and_wander() -> None
             )
         )
 
+    return measurements
+
+
+def test_comp_offset_noise_accounts_for_batched_correlation_and_wander() -> None:
+    measurements = _batched_wander_measurements()
     unbatched = [replace(msmt, info=replace(msmt.info, readbacks={})) for msmt in measurements]
     assert analyze_comp_offset_noise(unbatched).validity == "non_monotonic"
     batched = analyze_comp_offset_noise(measurements)
@@ -210,6 +219,103 @@ def test_comp_offset_noise_accounts_for_batched_correlation_and_wander() -> None
     assert analyze_comp_offset_noise(contiguous_batches).validity == "valid"
 
 
+def test_comp_offset_noise_batching_does_not_depend_on_measurement_order() -> None:
+    """Unbatched endpoints around batched points leave the between-batch widening intact."""
+
+    measurements = _batched_wander_measurements()
+    mixed = [
+        replace(msmt, info=replace(msmt.info, readbacks={})) if index in {0, 3} else msmt
+        for index, msmt in enumerate(measurements)
+    ]
+
+    as_given = analyze_comp_offset_noise(mixed)
+    reordered = analyze_comp_offset_noise([mixed[0], mixed[3], mixed[1], mixed[2]])
+    batched_last = analyze_comp_offset_noise(mixed[::-1])
+
+    assert as_given.validity == reordered.validity == batched_last.validity == "valid"
+    for fit in (reordered, batched_last):
+        np.testing.assert_array_equal(fit.vin_diff_v, as_given.vin_diff_v)
+        np.testing.assert_array_equal(fit.decision_probability, as_given.decision_probability)
+        assert (fit.offset_v, fit.noise_sigma_v) == (as_given.offset_v, as_given.noise_sigma_v)
+
+
+def _probit_curve(
+    rng: np.random.Generator,
+    *,
+    offset_v: float,
+    sigma_v: float,
+    trials: int,
+    descending: bool = False,
+) -> list[MeasCompInt]:
+    """Build one decision sweep per input point with a known probit transition."""
+
+    measurements = []
+    for vin_diff_v in np.linspace(-3e-3, 3e-3, 31):
+        probability = 0.5 * (1.0 + math.erf((vin_diff_v - offset_v) / (sigma_v * math.sqrt(2.0))))
+        decisions = (rng.random(trials) < probability) != descending
+        measurements.append(
+            replace(
+                comparator_measurement(),
+                daq=CompDaq(
+                    trial_index=np.arange(trials),
+                    vin_diff_v=np.full(trials, vin_diff_v),
+                    vin_cm_v=np.full(trials, 0.8),
+                    decision=decisions.astype(np.uint8),
+                ),
+            )
+        )
+    return measurements
+
+
+def test_comp_offset_noise_curves_fit_each_curve_independently() -> None:
+    rng = np.random.default_rng(24)
+    curves = [
+        _probit_curve(rng, offset_v=-1e-3, sigma_v=0.5e-3, trials=400),
+        _probit_curve(rng, offset_v=0.4e-3, sigma_v=0.3e-3, trials=200, descending=True),
+        [
+            replace(measurement, daq=replace(measurement.daq, decision=np.zeros_like(measurement.daq.decision)))
+            for measurement in _probit_curve(rng, offset_v=0.0, sigma_v=1e-3, trials=50)
+        ],
+    ]
+
+    batched = analyze_comp_offset_noise_curves(curves)
+
+    assert [fit.validity for fit in batched] == ["valid", "valid", "unbracketed"]
+    assert [fit.decision_polarity for fit in batched] == [1, -1, 1]
+    for curve, fit in zip(curves, batched, strict=True):
+        single = analyze_comp_offset_noise(curve)
+        np.testing.assert_array_equal(fit.vin_diff_v, single.vin_diff_v)
+        np.testing.assert_array_equal(fit.decision_probability, single.decision_probability)
+        np.testing.assert_array_equal(fit.trial_count, single.trial_count)
+        np.testing.assert_array_equal((fit.offset_v, fit.noise_sigma_v), (single.offset_v, single.noise_sigma_v))
+    with pytest.raises(ValueError, match="requires measurements"):
+        analyze_comp_offset_noise_curves([curves[0], []])
+
+
+def test_comp_offset_noise_probit_refines_valid_curves_only() -> None:
+    rng = np.random.default_rng(25)
+    curves = [
+        _probit_curve(rng, offset_v=0.7e-3, sigma_v=0.6e-3, trials=2_000),
+        _probit_curve(rng, offset_v=-0.5e-3, sigma_v=0.4e-3, trials=2_000, descending=True),
+        [
+            replace(measurement, daq=replace(measurement.daq, decision=np.ones_like(measurement.daq.decision)))
+            for measurement in _probit_curve(rng, offset_v=0.0, sigma_v=1e-3, trials=50)
+        ],
+    ]
+
+    plain = analyze_comp_offset_noise_curves(curves)
+    refined = analyze_comp_offset_noise_curves(curves, probit=True)
+
+    assert all(math.isnan(fit.probit_offset_v) for fit in plain)
+    assert refined[0].probit_offset_v == pytest.approx(0.7e-3, abs=20e-6)
+    assert refined[0].probit_noise_sigma_v == pytest.approx(0.6e-3, rel=0.04)
+    assert refined[1].probit_offset_v == pytest.approx(-0.5e-3, abs=20e-6)
+    assert refined[1].probit_noise_sigma_v == pytest.approx(0.4e-3, rel=0.04)
+    assert math.isnan(refined[2].probit_offset_v)
+    assert math.isnan(refined[2].probit_noise_sigma_v)
+    assert [fit.offset_v for fit in refined[:2]] == [fit.offset_v for fit in plain[:2]]
+
+
 def test_comp_offset_noise_combines_numerically_equivalent_voltage_bins() -> None:
     measurements = []
     points = (
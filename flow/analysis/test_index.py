@@ -0,0 +1,56 @@
+"""Tests for the header-only run-directory measurement index."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import hdl21 as h
+
+from flow.analysis.index import INDEX_FILENAME, MeasurementIndex
+from flow.analysis.io import write_measurement
+from flow.analysis.test_types import adc_measurement
+
+
+def test_index_selects_by_flattened_parameters_and_updates_incrementally(tmp_path: Path) -> None:
+    """Query dotted header keys and reopen only new or changed HDF5 files."""
+
+    original = adc_measurement()
+    for adc_index, input_v in ((0, 0.05), (1, 0.05), (0, 0.1)):
+        write_measurement(
+            tmp_path / f"adc{adc_index:02d}_{round(input_v * 1e3)}mv.h5",
+            replace(
+                original,
+                param=replace(
+                    original.param,
+                    observed_adc=adc_index,
+                    tb=replace(original.param.tb, vin_diff=h.Vdc.Params(dc=input_v)),
+                ),
+            ),
+        )
+
+    with MeasurementIndex(tmp_path) as index:
+        assert index.update() == 3
+        assert index.index_path == tmp_path / INDEX_FILENAME
+        assert index.select({"param.observed_adc": 0, "param.tb.vin_diff.dc": 0.05}) == (tmp_path / "adc00_50mv.h5",)
+        assert index.select({"info.readbacks.locked": True}) == index.paths()
+        assert index.select({"info.instruments.scope": "MSO54", "param.observed_adc": 1}) == (
+            tmp_path / "adc01_50mv.h5",
+        )
+        values = index.values(tmp_path / "adc00_100mv.h5")
+        assert values["info.measurement_type"] == "MeasAdcExt"
+        assert values["param.board_id"] == "00"
+        assert index.shapes(tmp_path / "adc00_100mv.h5")["daq.bout"] == (2, 17)
+        assert index.update() == 0
+
+    (tmp_path / "adc01_50mv.h5").unlink()
+    write_measurement(tmp_path / "adc02_50mv.h5", replace(original, param=replace(original.param, observed_adc=2)))
+    changed = tmp_path / "adc00_50mv.h5"
+    os.utime(changed, ns=(changed.stat().st_atime_ns, changed.stat().st_mtime_ns + 1))
+
+    with MeasurementIndex(tmp_path) as index:
+        assert index.update() == 2
+        assert index.select({"param.observed_adc": 1}) == ()
+        assert index.select({"param.observed_adc": 2}) == (tmp_path / "adc02_50mv.h5",)
+        assert len(index.paths()) == 3
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import pytest
 
 from flow.analysis.measure import (
+    bout_column,
+    bout_prefix_mask,
+    bout_prefix_run,
+    decode_packed_bout,
     find_crossings,
+    fit_sine_four_parameter,
+    fit_sine_three_parameter,
+    grouped_statistics,
     measure_average_power,
     measure_delay,
     measure_settling,
+    merge_grouped_statistics,
+    pack_bout,
+    unpack_bout,
 )
 
 
@@ -41,3 +53,70 @@ def test_settling_and_power() -> None:
     )
     assert 4.0 < settling < 6.0
     assert measure_average_power(np.full(len(time_s), 1e-3), 1.2) == pytest.approx(1.2e-3)
+
+
+def test_packed_bout_accessors_match_decision_matrix() -> None:
+    rng = np.random.default_rng(5)
+    bout = rng.integers(0, 2, size=(500, 17), dtype=np.uint8)
+    bout[:4, :3] = ((0, 0, 0), (1, 1, 1), (0, 0, 1), (1, 1, 0))
+    words = pack_bout(bout)
+
+    assert words.dtype == np.uint32
+    assert int(pack_bout([[1] + [0] * 16])[0]) == 1 << 16
+    np.testing.assert_array_equal(unpack_bout(words, 17), bout)
+    np.testing.assert_array_equal(bout_column(words, 3, 17), bout[:, 3])
+    np.testing.assert_array_equal(bout_prefix_mask(words, 3, 17, value=0), np.all(bout[:, :3] == 0, axis=1))
+    np.testing.assert_array_equal(bout_prefix_mask(words, 3, 17, value=1), np.all(bout[:, :3] == 1, axis=1))
+    assert np.all(bout_prefix_mask(words, 0, 17, value=1))
+    for value in (0, 1):
+        run = bout_prefix_run(words, 17, value=value)
+        for length in range(18):
+            np.testing.assert_array_equal(run >= length, bout_prefix_mask(words, length, 17, value=value))
+    integer_weights = rng.integers(1, 2_000, size=17)
+    np.testing.assert_array_equal(decode_packed_bout(words, integer_weights), bout.astype(np.int64) @ integer_weights)
+    float_weights = rng.uniform(0.5, 1_500.0, size=17)
+    np.testing.assert_allclose(decode_packed_bout(words, float_weights), bout @ float_weights)
+    with pytest.raises(ValueError, match="binary"):
+        pack_bout(np.full((1, 17), 2))
+
+
+def test_grouped_statistics_match_per_group_reductions_and_merge_across_parts() -> None:
+    rng = np.random.default_rng(7)
+    keys = rng.integers(0, 25, size=4_000) * 1e-3
+    values = rng.normal(keys * 4e3, 2.0)
+    statistics = grouped_statistics(keys, values)
+
+    unique_keys = np.unique(keys)
+    np.testing.assert_array_equal(statistics.key, unique_keys)
+    for index, key in enumerate(unique_keys):
+        group = values[keys == key]
+        assert statistics.count[index] == len(group)
+        assert statistics.mean[index] == pytest.approx(np.mean(group))
+        assert statistics.std[index] == pytest.approx(np.std(group))
+        assert statistics.minimum[index] == np.min(group)
+        assert statistics.maximum[index] == np.max(group)
+
+    merged = functools.reduce(
+        merge_grouped_statistics,
+        (grouped_statistics(keys[part::3], values[part::3]) for part in range(3)),
+    )
+    np.testing.assert_array_equal(merged.key, statistics.key)
+    np.testing.assert_array_equal(merged.count, statistics.count)
+    np.testing.assert_allclose(merged.mean, statistics.mean)
+    np.testing.assert_allclose(merged.variance, statistics.variance)
+    np.testing.assert_array_equal(merged.minimum, statistics.minimum)
+    np.testing.assert_array_equal(merged.maximum, statistics.maximum)
+
+
+def test_sine_fits_recover_frequency_and_coefficients() -> None:
+    rng = np.random.default_rng(3)
+    time_s = np.arange(4_096) / 1.0e6
+    samples = 3.0 + 2.0 * np.sin(2.0 * np.pi * 10_010.0 * time_s) + 0.5 * np.cos(2.0 * np.pi * 10_010.0 * time_s)
+    samples += rng.normal(0.0, 1e-3, time_s.size)
+
+    np.testing.assert_allclose(fit_sine_three_parameter(samples, time_s, 10_010.0), (2.0, 0.5, 3.0), atol=1e-4)
+    frequency_hz, coefficients = fit_sine_four_parameter(samples, time_s, 10_000.0, tolerance_hz=1e-6)
+    assert frequency_hz == pytest.approx(10_010.0, abs=1e-3)
+    np.testing.assert_allclose(coefficients, (2.0, 0.5, 3.0), atol=1e-3)
+    with pytest.raises(RuntimeError, match="converge"):
+        fit_sine_four_parameter(samples, time_s, 10_000.0, tolerance_hz=1e-6, maximum_iterations=1)
@@ -15,6 +15,7 @@ from matplotlib.ticker import FixedLocator
 import flow.analysis.plots as analysis_plots
 from flow.analysis.adc import (
     analyze_adc_code_distribution,
+    analyze_adc_decision_path_histogram,
     analyze_adc_decision_paths,
     analyze_adc_dynamic,
     analyze_adc_dynamic_sweep,
@@ -171,6 +172,62 @@ def test_waveform_plot_uses_typed_signal_names_and_scaled_time(tmp_path: Path) -
     assert "LOGIC offset:" not in svg
 
 
+@pytest.mark.parametrize("workers", (1, 2))
+def test_render_queue_writes_requested_formats_in_request_order(tmp_path: Path, workers: int) -> None:
+    analysis = analyze_measurement_waveforms(adc_measurement([1, 2, 3], internal=True), signal_names=("vin_diff_v",))
+
+    with analysis_plots.render_queue(workers=workers) as queue:
+        queued_paths = [plot_waveforms(analysis, output_path=tmp_path / f"wave{index}") for index in range(3)]
+        rendered = queue.wait()
+
+    assert [plot.output_path for plot in rendered] == [tmp_path / f"wave{index}" for index in range(3)]
+    assert [plot.paths for plot in rendered] == queued_paths
+    assert all(plot.render_s > 0.0 for plot in rendered)
+    for paths in queued_paths:
+        assert_plot_formats(paths)
+    assert_plot_formats(plot_waveforms(analysis, output_path=tmp_path / "direct"))
+
+
+def test_render_queue_binds_output_path_passed_positionally(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def plot_label(label: str, output_path: Path) -> tuple[Path, ...]:
+        path = Path(output_path).with_suffix(".txt")
+        path.write_text(label)
+        return (path,)
+
+    monkeypatch.setattr(analysis_plots, "plot_label", analysis_plots.queued_plot(plot_label), raising=False)
+    analysis = analyze_measurement_waveforms(adc_measurement([1, 2, 3], internal=True), signal_names=("vin_diff_v",))
+
+    with analysis_plots.render_queue(workers=1) as queue:
+        analysis_plots.plot_label("first", tmp_path / "first")
+        with pytest.raises(TypeError):
+            plot_waveforms(analysis, tmp_path / "positional")
+        rendered = queue.wait()
+
+    assert [(plot.output_path, plot.paths) for plot in rendered] == [(tmp_path / "first", (tmp_path / "first.txt",))]
+    assert (tmp_path / "first.txt").read_text() == "first"
+
+
+def test_rendering_a_spec_does_not_change_direct_plot_formats(tmp_path: Path) -> None:
+    analysis = analyze_measurement_waveforms(adc_measurement([1, 2, 3], internal=True), signal_names=("vin_diff_v",))
+    switches = (analysis_plots.PLOT_PNGS, analysis_plots.PLOT_SVGS, analysis_plots.PLOT_PDFS)
+    spec = analysis_plots.PlotSpec(
+        "plot_waveforms",
+        (analysis,),
+        {"output_path": tmp_path / "queued"},
+        tmp_path / "queued",
+        ("svg",),
+    )
+
+    rendered = analysis_plots._render_plot_spec(spec)
+
+    assert rendered.paths == (tmp_path / "queued.svg",)
+    assert (analysis_plots.PLOT_PNGS, analysis_plots.PLOT_SVGS, analysis_plots.PLOT_PDFS) == switches
+    assert plot_waveforms(analysis, output_path=tmp_path / "direct") == analysis_plots._artifact_paths(
+        tmp_path / "direct", analysis_plots._enabled_formats()
+    )
+    assert analysis_plots._enabled_formats() != ("svg",)
+
+
 def test_comparator_campaign_and_cdac_ab_plots_are_separate_per_adc(tmp_path: Path) -> None:
     comparator_groups = []
     comparator_analyses = []
@@ -542,10 +599,9 @@ def test_dynamic_sweep_and_decision_path_plots(tmp_path: Path) -> None:
     assert "ADC decision paths" in decision_svg
     assert GRID_MAJOR_COLOR.lower() not in decision_svg.lower()
 
-    all_decisions = analyze_adc_decision_paths(measurements[0], selection="all")
     density_paths = plot_adc_decision_path_density(
         measurements[0],
-        all_decisions,
+        analyze_adc_decision_path_histogram(measurements[0]),
         output_path=tmp_path / "decision_density",
     )
     assert_plot_formats(density_paths)
@@ -574,31 +630,32 @@ def test_decision_path_density_holds_each_discrete_estimate(
 
     msmt = adc_measurement([100, 101, 102])
     analysis = analyze_adc_decision_paths(msmt, selection="all")
-    original_histogram2d = np.histogram2d
-    sampled_estimates = []
     rendered_polygons = []
-
-    def record_histogram2d(x, y, *args, **kwargs):
-        sampled_estimates.append(np.asarray(y))
-        return original_histogram2d(x, y, *args, **kwargs)
-
     original_poly_collection = analysis_plots.PolyCollection
 
     def record_poly_collection(vertices, *args, **kwargs):
         rendered_polygons.extend(np.asarray(vertices, dtype=np.float64))
         return original_poly_collection(vertices, *args, **kwargs)
 
-    monkeypatch.setattr(np, "histogram2d", record_histogram2d)
     monkeypatch.setattr(analysis_plots, "PolyCollection", record_poly_collection)
     plot_adc_decision_path_density(
         msmt,
-        analysis,
+        analyze_adc_decision_path_histogram(msmt),
         output_path=tmp_path / "held_decision_density",
     )
 
-    sampled = sampled_estimates[0].reshape(len(analysis.estimate_dout), -1)
-    expected = np.repeat(analysis.estimate_dout, 8, axis=1)
-    np.testing.assert_array_equal(sampled, expected)
+    # Every estimate is held as one box spanning its whole decision interval.
+    for cycle, estimate in enumerate(analysis.estimate_dout[0]):
+        code = np.floor(estimate + 0.5)
+        expected_box = np.asarray(
+            (
+                (cycle + 0.05, code - 0.5),
+                (cycle + 0.95, code - 0.5),
+                (cycle + 0.95, code + 0.5),
+                (cycle + 0.05, code + 0.5),
+            )
+        )
+        assert any(np.allclose(box, expected_box) for box in rendered_polygons)
 
     # The largest jump in one representative path must be connected at the
     # exact integer decision boundary and at its true endpoint values.
@@ -621,6 +678,43 @@ def test_decision_path_density_holds_each_discrete_estimate(
     assert any(np.allclose(segment, expected_segment) for segment in rendered_polygons)
 
 
+def test_decision_path_density_raster_matches_held_estimates(tmp_path: Path) -> None:
+    """Raster pixels hold the same state and transition counts as the vector boxes and tracks."""
+
+    msmt = adc_measurement([100, 101, 102])
+    histogram = analyze_adc_decision_path_histogram(msmt)
+    cycle_count, code_count = histogram.code_count.shape
+    image = analysis_plots._decision_density_raster(
+        histogram,
+        first_code=0,
+        last_code=code_count - 1,
+        pixels_per_cycle=20,
+        gutter_pixels=1,
+    )
+
+    assert image.shape == (code_count, 20 * cycle_count)
+    np.testing.assert_array_equal(image[:, 10::20], histogram.code_count.T)
+    for cycle, source, destination, count in zip(
+        histogram.transition_cycle,
+        histogram.transition_source_code,
+        histogram.transition_destination_code,
+        histogram.transition_count,
+        strict=True,
+    ):
+        track = image[min(source, destination) : max(source, destination) + 1, 20 * cycle]
+        assert np.all(track >= count)
+
+    paths = plot_adc_decision_path_density(
+        msmt,
+        histogram,
+        output_path=tmp_path / "raster_decision_density",
+        mode="raster",
+    )
+    assert all(path.exists() for path in paths)
+    with pytest.raises(ValueError, match="unknown decision-density mode"):
+        plot_adc_decision_path_density(msmt, histogram, output_path=tmp_path / "bad", mode="svg")  # type: ignore[arg-type]
+
+
 def test_noise_rate_and_power_sweep_plots(tmp_path: Path) -> None:
     measurements = []
     for adc_index, sample_rate_hz in ((0, 100_000.0), (1, 200_000.0)):
@@ -22,6 +22,13 @@ from flow.analysis.test_adc import adc_measurement, adc_ramp_measurement
 from flow.analysis.types import AdcCalibrationMethod, AnalysisAdcCalibration
 
 
+def patch_measurement_reader(monkeypatch: pytest.MonkeyPatch, read) -> None:
+    """Serve single-file and campaign reads from the same in-memory fixture."""
+
+    monkeypatch.setattr(runner, "read_measurement", read)
+    monkeypatch.setattr(runner, "read_measurements", lambda paths, **_kwargs: tuple(read(path) for path in paths))
+
+
 def test_root_api_exposes_domain_analyses_not_campaign_combiners() -> None:
     """Keep the package root focused on reusable measurement analyses."""
 
@@ -57,6 +64,40 @@ def test_runner_exposes_only_named_orchestration_entry_points() -> None:
     assert all(len(name) <= 26 for name in runner.TARGETS)
 
 
+def test_declared_stage_dependencies_match_stage_result_calls() -> None:
+    """Keep each @uses_stages declaration in step with what its function reads."""
+
+    tree = ast.parse(Path(runner.__file__).read_text())
+    functions = {**runner.TARGETS, **runner.STAGES}
+    read = {}
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef) or node.name not in functions:
+            continue
+        names = set()
+        for call in ast.walk(node):
+            if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name):
+                continue
+            if call.func.id == "stage_result":
+                argument = call.args[0]
+                assert isinstance(argument, ast.Constant), f"{node.name} reads a computed stage name"
+                names.add(argument.value)
+            elif call.func.id in runner.TARGETS:
+                names.add(call.func.id)
+        read[node.name] = names
+
+    assert read.keys() == functions.keys()
+    assert set(runner.STAGE_DEPENDENCIES) <= functions.keys()
+    for name, names in read.items():
+        assert set(runner.STAGE_DEPENDENCIES.get(name, ())) == names, name
+    assert runner.stage_order(("adc_rate_characterization",)) == (
+        "adc_dc_noise_campaign",
+        "adc_dc_noise_sweeps",
+        "adc_sine_campaign",
+        "spice_ideal_noise_campaign",
+        "spice_pex_noise_campaign",
+    )
+
+
 def test_adc_calibration_runner_combines_three_common_results(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -100,7 +141,7 @@ def test_adc_calibration_runner_combines_three_common_results(
     cdac_measurements = (SimpleNamespace(param=SimpleNamespace(board_id="00")),)
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
     monkeypatch.setattr(runner, "MeasAdcExt", SimpleNamespace)
-    monkeypatch.setattr(runner, "read_measurement", lambda path: fake_ramp if path == ramp_path else object())
+    patch_measurement_reader(monkeypatch, lambda path: fake_ramp if path == ramp_path else object())
     monkeypatch.setattr(
         runner,
         "analyze_cdac_cap_mismatch_campaign",
@@ -258,7 +299,7 @@ def test_adc_transfer_curve_accepts_complete_physical_campaign(
                     ),
                 ),
             )
-    monkeypatch.setattr(runner, "read_measurement", measurements.__getitem__)
+    patch_measurement_reader(monkeypatch, measurements.__getitem__)
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
     monkeypatch.setattr(runner, "analyze_adc_transfer", lambda measurements: measurements)
     monkeypatch.setattr(
@@ -309,7 +350,7 @@ def test_adc_ramp_runner_reuses_accepted_cdac_analysis_and_completed_ramp(
     measurements[cdac_path] = object()
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
     monkeypatch.setattr(runner, "MeasAdcExt", SimpleNamespace)
-    monkeypatch.setattr(runner, "read_measurement", measurements.__getitem__)
+    patch_measurement_reader(monkeypatch, measurements.__getitem__)
     monkeypatch.setattr(
         runner,
         "analyze_cdac_cap_mismatch_campaign",
@@ -393,7 +434,7 @@ def test_adc_ramp_runner_rejects_incomplete_capture(
     ramp_path.touch()
     measurement = adc_ramp_measurement(observed_adc=0)
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
-    monkeypatch.setattr(runner, "read_measurement", lambda _path: measurement)
+    patch_measurement_reader(monkeypatch, lambda _path: measurement)
 
     with pytest.raises(ValueError, match="complete, valid"):
         runner.adc_ramp_nonlinearity(tmp_path / "output")
@@ -440,13 +481,13 @@ def test_adc00_fixed_input_noise_adds_external_ideal_and_pex_trajectory_density(
         return (output_path.with_suffix(".png"),)
 
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
-    monkeypatch.setattr(runner, "read_measurement", measurements.__getitem__)
+    patch_measurement_reader(monkeypatch, measurements.__getitem__)
     monkeypatch.setattr(
         runner,
         "analyze_adc_noise_sweep",
         lambda _measurements: SimpleNamespace(active_conversion_rate_hz=np.asarray((2e6, 6e6, 10e6))),
     )
-    monkeypatch.setattr(runner, "analyze_adc_decision_paths", lambda _measurement, *, selection: selection)
+    monkeypatch.setattr(runner, "analyze_adc_decision_path_histogram", lambda _measurement, *, selection: selection)
     monkeypatch.setattr(runner, "plot_adc_noise_sweep", plot_noise)
     monkeypatch.setattr(runner, "plot_adc_noise_distribution_sweep", plot_distribution)
     monkeypatch.setattr(runner, "plot_adc_decision_path_density", plot_density)
@@ -516,7 +557,7 @@ def test_adc_noise_vs_comp_time_runner_uses_configured_adc_subset(
 
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
     monkeypatch.setattr(runner, "MeasAdcExt", SimpleNamespace)
-    monkeypatch.setattr(runner, "read_measurement", lambda path: measurements_by_path[path])
+    patch_measurement_reader(monkeypatch, lambda path: measurements_by_path[path])
     monkeypatch.setattr(runner, "analyze_adc_noise_sweep", lambda _measurements: SimpleNamespace())
     monkeypatch.setattr(runner, "plot_adc_noise_sweep", plot)
 
@@ -579,7 +620,7 @@ def test_adc_power_runner_combines_measured_and_separate_simulated_outputs(
         return (output_path.with_suffix(".png"),)
 
     monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
-    monkeypatch.setattr(runner, "read_measurement", measurements_by_path.__getitem__)
+    patch_measurement_reader(monkeypatch, measurements_by_path.__getitem__)
     monkeypatch.setattr(runner, "analyze_adc_power_sweep", analyze_power)
     monkeypatch.setattr(runner, "analyze_adc_power_waveform", lambda _measurement: object())
     monkeypatch.setattr(runner, "plot_adc_power_sweep", plot_power)
@@ -673,6 +714,65 @@ def test_main_without_target_runs_all_in_registration_order(
     assert "Skipped missing: missing capture.h5 after " in output
 
 
+def test_main_shares_each_stage_across_parallel_targets(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Load a campaign once for every dependent target and report each stage."""
+
+    loads = []
+
+    def campaign() -> tuple[str, ...]:
+        loads.append("campaign")
+        return ("measurement",)
+
+    def first(output_dir: Path) -> tuple[Path, ...]:
+        return tuple(output_dir / name for name in runner.stage_result("campaign"))
+
+    def second(output_dir: Path) -> tuple[Path, ...]:
+        return (*first(output_dir), output_dir / "second")
+
+    monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
+    monkeypatch.setattr(runner, "TARGETS", {"first": first, "second": second})
+    monkeypatch.setattr(runner, "STAGES", {"campaign": campaign})
+    monkeypatch.setattr(runner, "STAGE_DEPENDENCIES", {"first": ("campaign",), "second": ("campaign",)})
+    monkeypatch.setattr(sys, "argv", ["flow.analysis.runner", "--target-workers", "2", "--no-cache"])
+
+    runner.main()
+
+    assert loads == ["campaign"]
+    output = capsys.readouterr().out
+    assert output.index("Completed first: 1 artifacts in ") < output.index("Completed second: 2 artifacts in ")
+    assert "Stage campaign: " in output
+    assert runner.stage_order(("second",)) == ("campaign",)
+
+
+@pytest.mark.parametrize(
+    ("cache_flags", "expected"),
+    (
+        ((), "Analysis cache: 0 hits saving 0.00 s, 0 misses, 0 evicted; 0 entries in 0.0 MiB"),
+        (("--no-cache",), "Analysis cache: disabled"),
+    ),
+)
+def test_main_reports_analysis_cache_statistics(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    cache_flags: tuple[str, ...],
+    expected: str,
+) -> None:
+    """Report the result cache beneath the analysis root only when asked."""
+
+    monkeypatch.setattr(runner, "BASE_PATH", tmp_path)
+    monkeypatch.setattr(runner, "TARGETS", {"comp_example_target": lambda _output_dir: ()})
+    monkeypatch.setattr(sys, "argv", ["flow.analysis.runner", "comp_example_target", *cache_flags, "--cache-stats"])
+
+    runner.main()
+
+    assert expected in capsys.readouterr().out
+
+
 def test_main_rejects_unknown_target(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
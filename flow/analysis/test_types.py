@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import replace
 from datetime import UTC, datetime
 from enum import Enum
+from functools import partial
 from pathlib import Path
 
 import h5py
@@ -15,7 +16,17 @@ import pytest
 
 import flow.analysis.io as analysis_io
 from flow.adc.sim import AdcTbParams
-from flow.analysis.io import interpolate_wave_records, read_measurement, write_measurement
+from flow.analysis.io import (
+    STORAGE_PROFILES,
+    LazyDataset,
+    MeasurementStream,
+    convert_measurement_storage,
+    interpolate_wave_records,
+    materialize_measurement,
+    read_measurement,
+    read_measurements,
+    write_measurement,
+)
 from flow.analysis.types import (
     AdcDaq,
     AdcExtWave,
@@ -329,6 +340,192 @@ def test_adc_measurement_round_trip_uses_native_hdf5_groups(tmp_path: Path) -> N
         np.testing.assert_array_equal(actual, expected)
 
 
+def test_lazy_measurement_defers_daq_and_wave_reads(tmp_path: Path) -> None:
+    """Select on parameters first and read each array only when it is used."""
+
+    original = adc_measurement()
+    path = write_measurement(tmp_path / "adc.h5", original)
+
+    loaded = read_measurement(path, lazy=True)
+    assert isinstance(loaded, MeasAdcExt)
+    assert loaded.param == original.param
+    assert loaded.info.readbacks == original.info.readbacks
+    assert isinstance(loaded.daq.dout, LazyDataset)
+    assert not loaded.daq.dout.loaded
+    assert len(loaded.daq.dout) == 2
+    np.testing.assert_array_equal(loaded.daq.bout[1:], original.daq.bout[1:])
+    assert not loaded.daq.bout.loaded
+    np.testing.assert_array_equal(loaded.daq.dout - 20, original.daq.dout - 20)
+    assert loaded.daq.dout.loaded
+    assert not loaded.wave.comp_out_v.loaded
+
+    materialized = materialize_measurement(loaded)
+    assert_sections_equal(original.daq, materialized.daq)
+    assert_sections_equal(original.wave, materialized.wave)
+
+
+def test_lazy_measurement_memory_maps_contiguous_datasets(tmp_path: Path) -> None:
+    """Map uncompressed contiguous arrays instead of copying them through h5py."""
+
+    path = write_measurement(tmp_path / "adc.h5", adc_measurement())
+    with h5py.File(path, "a") as stored:
+        dout = stored["daq/dout"][()]
+        del stored["daq/dout"]
+        stored.create_dataset("daq/dout", data=dout)
+
+    loaded = read_measurement(path, lazy=True)
+    assert isinstance(loaded.daq.dout.load(), np.memmap)
+    np.testing.assert_array_equal(loaded.daq.dout, adc_measurement().daq.dout)
+
+
+def observes_adc(adc_index: int, measurement) -> bool:
+    """Select campaign files by their decoded parameters."""
+
+    return measurement.param.observed_adc == adc_index
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_campaign_reader_filters_headers_and_keeps_path_order(tmp_path: Path, workers: int) -> None:
+    """Return selected measurements in input order for serial and pooled reads."""
+
+    original = adc_measurement()
+    paths = [
+        write_measurement(
+            tmp_path / f"{index:02d}.h5",
+            replace(original, param=replace(original.param, observed_adc=index % 3)),
+        )
+        for index in range(6)
+    ]
+
+    loaded = read_measurements(paths[::-1], select=partial(observes_adc, 1), workers=workers)
+    assert [measurement.info.source_path for measurement in loaded] == [paths[4], paths[1]]
+    assert all(isinstance(measurement, MeasAdcExt) for measurement in loaded)
+    assert_sections_equal(original.daq, loaded[0].daq)
+
+    globbed = read_measurements(str(tmp_path / "*.h5"), lazy=True, workers=workers)
+    assert [measurement.info.source_path for measurement in globbed] == paths
+    assert isinstance(globbed[0].daq.dout, LazyDataset)
+
+
+def test_selected_full_reads_open_each_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Select on the lazy header and read the sections through the same handle."""
+
+    original = adc_measurement()
+    paths = [
+        write_measurement(
+            tmp_path / f"{index:02d}.h5",
+            replace(original, param=replace(original.param, observed_adc=index % 2)),
+        )
+        for index in range(4)
+    ]
+    opened = []
+    open_file = h5py.File
+
+    def counting_file(path, *args, **kwargs):
+        opened.append(Path(path))
+        return open_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(analysis_io.h5py, "File", counting_file)
+    loaded = read_measurements(paths, select=partial(observes_adc, 1), workers=1)
+
+    assert opened == paths
+    assert [measurement.info.source_path for measurement in loaded] == [paths[1], paths[3]]
+    assert_sections_equal(original.daq, loaded[0].daq)
+
+
+@pytest.mark.parametrize("profile", sorted(STORAGE_PROFILES))
+def test_storage_profiles_round_trip_with_their_filters(tmp_path: Path, profile: str) -> None:
+    """Apply each named profile's filters without changing stored values."""
+
+    original = adc_measurement()
+    path = write_measurement(tmp_path / f"{profile}.h5", original, profile=profile)
+    expected = STORAGE_PROFILES[profile]
+    with h5py.File(path, "r") as stored:
+        assert stored.attrs["storage_profile"] == profile
+        assert stored["daq/bout"].compression == expected.compression
+        assert stored["daq/bout"].shuffle == expected.shuffle
+        if expected.layout == "contiguous":
+            assert stored["daq/bout"].chunks is None
+        elif expected.layout == "column":
+            assert stored["daq/bout"].chunks == (2, 1)
+
+    loaded = read_measurement(path)
+    assert_sections_equal(original.daq, loaded.daq)
+    assert_sections_equal(original.wave, loaded.wave)
+
+
+@pytest.mark.parametrize("profile", sorted(STORAGE_PROFILES))
+def test_measurement_stream_appends_daq_chunks_to_resizable_datasets(tmp_path: Path, profile: str) -> None:
+    """Streamed DAQ rows read back like one ``write_measurement`` call."""
+
+    original = adc_measurement()
+    path = tmp_path / f"{profile}.h5"
+    with MeasurementStream(path, AdcDaq, profile=profile) as stream:
+        for row in range(len(original.daq.conversion_index)):
+            stream.append(
+                AdcDaq(
+                    conversion_index=original.daq.conversion_index[row : row + 1],
+                    bout=original.daq.bout[row : row + 1],
+                    dout_raw=original.daq.dout_raw[row : row + 1],
+                    dout=original.daq.dout[row : row + 1],
+                    vin_diff_v=original.daq.vin_diff_v[row : row + 1],
+                    fastrx_word=original.daq.fastrx_word[row : row + 1],
+                )
+            )
+        assert not path.exists()
+        assert stream.finish(original.info, original.param, original.wave) == path
+
+    with h5py.File(path, "r") as stored:
+        assert stored.attrs["storage_profile"] == profile
+        assert stored["daq/bout"].maxshape == (None, 17)
+        assert stored["daq/bout"].compression == STORAGE_PROFILES[profile].compression
+    loaded = read_measurement(path)
+    assert loaded.info.readbacks == original.info.readbacks
+    assert_sections_equal(original.daq, loaded.daq)
+    assert_sections_equal(original.wave, loaded.wave)
+
+
+def test_unfinished_measurement_stream_leaves_no_file(tmp_path: Path) -> None:
+    original = adc_measurement()
+    path = tmp_path / "measurement.h5"
+    with MeasurementStream(path, AdcDaq) as stream:
+        stream.append(original.daq)
+        with pytest.raises(ValueError, match="differ from the first chunk"):
+            stream.append(replace(original.daq, fastrx_word=None))
+        with pytest.raises(TypeError, match="does not store AdcDaq chunks"):
+            stream.finish(info("MeasCompExt"), original.param, None)
+
+    assert not path.exists()
+    assert not path.with_name(f".{path.name}.tmp").exists()
+
+
+def test_write_measurement_rejects_unknown_storage_profile(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unknown storage profile"):
+        write_measurement(tmp_path / "adc.h5", adc_measurement(), profile="zstd")
+    assert not (tmp_path / "adc.h5").exists()
+
+
+def test_storage_converter_rewrites_arrays_and_keeps_header(tmp_path: Path) -> None:
+    """Convert an archived run to memory-mappable arrays and back in place."""
+
+    original = adc_measurement()
+    source = write_measurement(tmp_path / "archive.h5", original, profile="archive")
+    fast = convert_measurement_storage(source, tmp_path / "fast/adc.h5", profile="fast")
+
+    with h5py.File(fast, "r") as stored:
+        assert stored.attrs["storage_profile"] == "fast"
+        assert stored["daq/dout"].compression is None
+        assert stored["daq"].attrs["_type"] == f"{AdcDaq.__module__}:{AdcDaq.__qualname__}"
+    loaded = read_measurement(fast, lazy=True)
+    assert isinstance(loaded.daq.dout.load(), np.memmap)
+    assert loaded.param == original.param
+
+    assert convert_measurement_storage(fast, profile="default") == fast
+    with h5py.File(fast, "r") as stored:
+        assert stored["daq/dout"].compression == "gzip"
+    assert_sections_equal(original.daq, read_measurement(fast).daq)
+
+
 def test_typed_pwl_parameter_round_trip(tmp_path: Path) -> None:
     """Persist typed PWL points as part of the shared ADC parameters."""
 
@@ -378,7 +575,7 @@ def test_native_enum_round_trip(tmp_path: Path) -> None:
     with h5py.File(path, "w") as stored:
         analysis_io._write_native(stored, "mode", PersistenceMode.NOMINAL)
     with h5py.File(path, "r") as stored:
-        assert analysis_io._read_native(stored["mode"]) is PersistenceMode.NOMINAL
+        assert analysis_io.read_native(stored["mode"]) is PersistenceMode.NOMINAL
 
 
 def test_native_enum_reader_rejects_non_enum_type(tmp_path: Path) -> None:
@@ -390,7 +587,7 @@ def test_native_enum_reader_rejects_non_enum_type(tmp_path: Path) -> None:
         dataset.attrs["_kind"] = "enum"
         dataset.attrs["_type"] = "builtins:str"
     with h5py.File(path, "r") as stored, pytest.raises(TypeError, match="is not an Enum"):
-        analysis_io._read_native(stored["mode"])
+        analysis_io.read_native(stored["mode"])
 
 
 def test_parameter_reader_applies_defaults_added_after_capture(tmp_path: Path) -> None:
@@ -539,6 +736,24 @@ def test_failed_measurement_write_preserves_existing_file(
     assert not path.with_name(f".{path.name}.tmp").exists()
 
 
+def test_packed_bout_round_trips_as_one_word_per_conversion(tmp_path: Path) -> None:
+    """Store BOUT as the packed FastRX payload and expand it on demand."""
+
+    original = adc_measurement()
+    packed = replace(original, daq=replace(original.daq, bout=original.daq.bout_packed))
+    np.testing.assert_array_equal(packed.daq.bout, (0b01010101010101010, 0b10101010101010101))
+    path = write_measurement(tmp_path / "packed.h5", packed)
+
+    with h5py.File(path, "r") as stored:
+        assert stored["daq/bout"].shape == (2,)
+        assert stored["daq/bout"].dtype == np.uint32
+    loaded = read_measurement(path)
+    np.testing.assert_array_equal(loaded.daq.bout, packed.daq.bout)
+    np.testing.assert_array_equal(loaded.daq.bout_bits, original.daq.bout)
+    lazy = read_measurement(path, lazy=True)
+    np.testing.assert_array_equal(lazy.daq.bout_packed, packed.daq.bout)
+
+
 def test_adc_sections_reject_invalid_bits_shapes_and_wave_mapping() -> None:
     """Reject malformed ADC decisions and wave records before persistence."""
 
@@ -561,6 +776,14 @@ def test_adc_sections_reject_invalid_bits_shapes_and_wave_mapping() -> None:
             dout=np.asarray([0], dtype=np.int64),
             vin_diff_v=np.asarray([0.0], dtype=np.float64),
         )
+    with pytest.raises(ValueError, match="low 17 bits"):
+        AdcDaq(
+            conversion_index=np.asarray([0], dtype=np.int64),
+            bout=np.asarray([1 << 17], dtype=np.uint32),
+            dout_raw=np.asarray([0], dtype=np.int64),
+            dout=np.asarray([0], dtype=np.int64),
+            vin_diff_v=np.asarray([0.0], dtype=np.float64),
+        )
     with pytest.raises(ValueError, match="absent from DAQ"):
         MeasAdcExt(
             info=measurement.info,
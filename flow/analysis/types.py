@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, Literal
 import numpy as np
 from numpy.typing import NDArray
 
+from flow.analysis.measure import pack_bout, unpack_bout
+
 if TYPE_CHECKING:
     from flow.adc.sim import AdcTbParams
     from flow.cdac.sim import CdacTbParams
@@ -24,6 +26,8 @@ type AdcNonlinearityMethod = Literal["endpoint", "code_density"]
 type AdcCalibrationMethod = Literal["calibration1", "calibration2", "calibration3"]
 type AdcDecoding = Literal["uncalibrated_dout", "calibration1", "calibration2", "calibration3"]
 type AdcDecisionSelection = Literal["single", "same_dout", "all"]
+type AdcSineFitMethod = Literal["newton", "bounded_search"]
+type AdcSpectrumMode = Literal["windowed", "coherent", "averaged"]
 type CompFitValidity = Literal["valid", "unbracketed", "non_monotonic", "stuck-low", "stuck-high"]
 type CompSizeProfile = Literal["half", "double", "fabricated"]
 type FloatArray = NDArray[np.float64]
@@ -32,6 +36,8 @@ type Uint8Array = NDArray[np.uint8]
 type Uint32Array = NDArray[np.uint32]
 type BoolArray = NDArray[np.bool_]
 
+ADC_BOUT_BITS = 17
+
 
 def _array_1d(values, dtype, name: str, *, finite: bool = False) -> np.ndarray:
     """Return one canonical one-dimensional array."""
@@ -136,10 +142,16 @@ class MeasInfo:
 
 @dataclass(frozen=True, slots=True)
 class AdcDaq:
-    """ADC conversion readback shared by external and internal measurements."""
+    """ADC conversion readback shared by external and internal measurements.
+
+    ``bout`` holds either an ``(N, 17)`` uint8 decision matrix or one
+    MSB-first packed uint32 word per conversion, the FastRX payload layout.
+    Both forms are stored as given; ``bout_packed`` and ``bout_bits`` return
+    either view.
+    """
 
     conversion_index: IntArray
-    bout: Uint8Array
+    bout: Uint8Array | Uint32Array
     dout_raw: IntArray
     dout: IntArray
     vin_diff_v: FloatArray
@@ -147,14 +159,19 @@ class AdcDaq:
 
     def __post_init__(self) -> None:
         conversion_index = _array_1d(self.conversion_index, np.int64, "daq.conversion_index")
-        bout = _array_2d(self.bout, np.uint8, "daq.bout")
+        if np.ndim(self.bout) == 1:
+            bout = _array_1d(self.bout, np.uint32, "daq.bout")
+            if np.any(bout >> np.uint32(ADC_BOUT_BITS)):
+                raise ValueError(f"packed daq.bout words must use only the low {ADC_BOUT_BITS} bits")
+        else:
+            bout = _array_2d(self.bout, np.uint8, "daq.bout")
+            if bout.shape[1:] != (ADC_BOUT_BITS,):
+                raise ValueError(f"daq.bout must have shape (N, {ADC_BOUT_BITS}) or (N,), got {bout.shape}")
+            if np.any((bout != 0) & (bout != 1)):
+                raise ValueError("daq.bout values must be zero or one")
         dout_raw = _array_1d(self.dout_raw, np.int64, "daq.dout_raw")
         dout = _array_1d(self.dout, np.int64, "daq.dout")
         vin_diff_v = _array_1d(self.vin_diff_v, np.float64, "daq.vin_diff_v", finite=True)
-        if bout.shape[1:] != (17,):
-            raise ValueError(f"daq.bout must have shape (N, 17), got {bout.shape}")
-        if np.any((bout != 0) & (bout != 1)):
-            raise ValueError("daq.bout values must be zero or one")
         fields = {
             "conversion_index": conversion_index,
             "bout": bout,
@@ -175,6 +192,18 @@ class AdcDaq:
         object.__setattr__(self, "vin_diff_v", vin_diff_v)
         object.__setattr__(self, "fastrx_word", fastrx_word)
 
+    @property
+    def bout_packed(self) -> Uint32Array:
+        """Return one MSB-first packed decision word per conversion."""
+
+        return self.bout if self.bout.ndim == 1 else pack_bout(self.bout)
+
+    @property
+    def bout_bits(self) -> Uint8Array:
+        """Return the ``(N, 17)`` decision matrix."""
+
+        return self.bout if self.bout.ndim == 2 else unpack_bout(self.bout, ADC_BOUT_BITS)
+
 
 @dataclass(frozen=True, slots=True)
 class AdcExtWave:
@@ -1068,6 +1097,52 @@ class AnalysisAdcCalibration:
         object.__setattr__(self, "measured_weight_mask", measured)
 
 
+@dataclass(frozen=True, slots=True)
+class AnalysisAdcCalibrationBootstrap:
+    """Resampled uncertainty of one calibration's normalized BOUT weights.
+
+    ``calibration`` is the unresampled result. Each row of
+    ``replicate_weights`` repeats the same calibration, with its model choices
+    frozen, on one bootstrap draw of the training units: whole ramp cycles or
+    S-curve trials when ``batch_size`` is ``None``, otherwise consecutive
+    batches of ``batch_size`` conversions or trials. Replicates whose fit
+    failed are counted but not stored. ``weight_lower`` and ``weight_upper``
+    are the percentile interval at ``confidence_level``.
+    """
+
+    calibration: AnalysisAdcCalibration
+    batch_size: int | None
+    seed: int
+    confidence_level: float
+    replicate_weights: FloatArray
+    failed_replicate_count: int
+    weight_lower: FloatArray
+    weight_upper: FloatArray
+    weight_std: FloatArray
+
+    def __post_init__(self) -> None:
+        if self.batch_size is not None and self.batch_size < 1:
+            raise ValueError("bootstrap batch_size must be positive")
+        if not 0.0 < self.confidence_level < 1.0:
+            raise ValueError("bootstrap confidence_level must lie strictly between zero and one")
+        if self.failed_replicate_count < 0:
+            raise ValueError("bootstrap failed_replicate_count must be nonnegative")
+        replicate = _array_2d(self.replicate_weights, np.float64, "replicate_weights", finite=True)
+        if replicate.shape[1:] != (17,) or len(replicate) < 2:
+            raise ValueError("bootstrap requires at least two replicates of 17 BOUT weights")
+        lower = _array_1d(self.weight_lower, np.float64, "weight_lower", finite=True)
+        upper = _array_1d(self.weight_upper, np.float64, "weight_upper", finite=True)
+        std = _array_1d(self.weight_std, np.float64, "weight_std", finite=True)
+        if lower.shape != (17,) or upper.shape != (17,) or std.shape != (17,):
+            raise ValueError("bootstrap intervals require exactly 17 BOUT weights")
+        if np.any(lower > upper) or np.any(std < 0.0):
+            raise ValueError("bootstrap intervals must be ordered with nonnegative spread")
+        object.__setattr__(self, "replicate_weights", replicate)
+        object.__setattr__(self, "weight_lower", lower)
+        object.__setattr__(self, "weight_upper", upper)
+        object.__setattr__(self, "weight_std", std)
+
+
 @dataclass(frozen=True, slots=True)
 class AnalysisAdcRampCurve:
     """Per-decoding results derived from one shared ramp capture.
@@ -1669,6 +1744,59 @@ class AnalysisAdcDynamicSweep:
             object.__setattr__(self, name, value)
 
 
+@dataclass(frozen=True, slots=True)
+class AnalysisAdcSpectra:
+    """Spectral ADC figures of merit for a stack of equal-length sine records."""
+
+    mode: AdcSpectrumMode
+    sample_rate_hz: float
+    input_frequency_hz: FloatArray
+    spectral_sndr_db: FloatArray
+    spectral_snr_db: FloatArray
+    spectral_thd_db: FloatArray
+    spectral_sfdr_db: FloatArray
+    spectral_enob_bits: FloatArray
+    spectrum_frequency_hz: FloatArray
+    spectrum_dbfs: FloatArray
+
+    def __post_init__(self) -> None:
+        metrics = {
+            name: _array_1d(getattr(self, name), np.float64, name, finite=True)
+            for name in (
+                "input_frequency_hz",
+                "spectral_sndr_db",
+                "spectral_snr_db",
+                "spectral_thd_db",
+                "spectral_sfdr_db",
+                "spectral_enob_bits",
+            )
+        }
+        frequency_hz = _array_1d(self.spectrum_frequency_hz, np.float64, "spectrum_frequency_hz", finite=True)
+        spectrum_dbfs = _array_2d(self.spectrum_dbfs, np.float64, "spectrum_dbfs")
+        if self.mode not in ("windowed", "coherent", "averaged"):
+            raise ValueError(f"unsupported ADC spectrum mode {self.mode!r}")
+        if _aligned_length({**metrics, "spectrum_dbfs": spectrum_dbfs}) == 0:
+            raise ValueError("ADC spectra require at least one record")
+        if self.mode == "averaged" and len(spectrum_dbfs) != 1:
+            raise ValueError("averaged ADC spectra contain exactly one row")
+        if spectrum_dbfs.shape[1] != len(frequency_hz) or len(frequency_hz) == 0:
+            raise ValueError("ADC spectrum rows must match the frequency axis")
+        if np.any(np.diff(frequency_hz) <= 0.0) or frequency_hz[0] < 0.0 or frequency_hz[-1] > self.sample_rate_hz / 2:
+            raise ValueError("ADC spectrum frequencies must increase within the Nyquist interval")
+        if np.any(np.isnan(spectrum_dbfs)) or np.any(np.isposinf(spectrum_dbfs)):
+            raise ValueError("ADC spectra contain invalid values")
+        if (
+            not math.isfinite(self.sample_rate_hz)
+            or self.sample_rate_hz <= 0.0
+            or np.any(metrics["input_frequency_hz"] <= 0.0)
+        ):
+            raise ValueError("ADC spectrum rates must be positive")
+        for name, value in metrics.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "spectrum_frequency_hz", frequency_hz)
+        object.__setattr__(self, "spectrum_dbfs", spectrum_dbfs)
+
+
 @dataclass(frozen=True, slots=True)
 class AnalysisAdcPowerSweep:
     """Static-baseline and incremental ADC supply power across conversion rates."""
@@ -1866,12 +1994,76 @@ class AnalysisAdcDecisionPaths:
         object.__setattr__(self, "estimate_dout", estimate_dout)
 
 
+@dataclass(frozen=True, slots=True)
+class AnalysisAdcDecisionPathHistogram:
+    """Running SAR estimate counts by decision cycle and nearest output code."""
+
+    selection: AdcDecisionSelection
+    conversion_count: int
+    code_count: IntArray
+    transition_cycle: IntArray
+    transition_source_code: IntArray
+    transition_destination_code: IntArray
+    transition_count: IntArray
+    final_estimate_mean_dout: float
+    final_estimate_std_dout: float
+    final_dout_mean: float
+
+    def __post_init__(self) -> None:
+        if self.selection not in ("single", "same_dout", "all"):
+            raise ValueError(f"unknown decision-path selection {self.selection!r}")
+        code_count = _array_2d(self.code_count, np.int64, "code_count")
+        transitions = {
+            name: _array_1d(getattr(self, name), np.int64, name)
+            for name in (
+                "transition_cycle",
+                "transition_source_code",
+                "transition_destination_code",
+                "transition_count",
+            )
+        }
+        if self.conversion_count <= 0 or code_count.shape[0] != ADC_BOUT_BITS + 1 or code_count.shape[1] == 0:
+            raise ValueError("ADC decision-path histogram requires conversions, one row per estimate, and codes")
+        if np.any(code_count < 0) or np.any(np.sum(code_count, axis=1) != self.conversion_count):
+            raise ValueError("every ADC decision-path histogram cycle must count each conversion once")
+        _aligned_length(transitions)
+        cycle = transitions["transition_cycle"]
+        if (
+            np.any((cycle < 1) | (cycle >= code_count.shape[0]))
+            or np.any(transitions["transition_count"] <= 0)
+            or any(
+                np.any((transitions[name] < 0) | (transitions[name] >= code_count.shape[1]))
+                for name in ("transition_source_code", "transition_destination_code")
+            )
+            or np.any(
+                np.bincount(cycle, weights=transitions["transition_count"], minlength=code_count.shape[0])[1:]
+                != self.conversion_count
+            )
+        ):
+            raise ValueError("ADC decision-path transitions must cover each conversion once per decision")
+        if (
+            not all(
+                math.isfinite(value)
+                for value in (self.final_estimate_mean_dout, self.final_estimate_std_dout, self.final_dout_mean)
+            )
+            or self.final_estimate_std_dout < 0.0
+        ):
+            raise ValueError("ADC decision-path final statistics must be finite")
+        object.__setattr__(self, "code_count", code_count)
+        for name, value in transitions.items():
+            object.__setattr__(self, name, value)
+
+
 # Comparator analyses
 
 
 @dataclass(frozen=True, slots=True)
 class AnalysisCompOffsetNoise:
-    """Comparator decision probability, offset, and input-referred noise."""
+    """Comparator decision probability, offset, and input-referred noise.
+
+    The probit fields hold the optional maximum-likelihood refinement and are
+    NaN when it was not requested or the curve is not valid.
+    """
 
     vin_diff_v: FloatArray
     decision_probability: FloatArray
@@ -1880,6 +2072,8 @@ class AnalysisCompOffsetNoise:
     noise_sigma_v: float
     decision_polarity: Literal[-1, 1] = 1
     validity: CompFitValidity = "valid"
+    probit_offset_v: float = math.nan
+    probit_noise_sigma_v: float = math.nan
 
     def __post_init__(self) -> None:
         vin_diff_v = _array_1d(self.vin_diff_v, np.float64, "vin_diff_v", finite=True)
@@ -1906,6 +2100,10 @@ class AnalysisCompOffsetNoise:
             raise ValueError("invalid comparator fits may use NaN but not infinite results")
         if math.isfinite(self.noise_sigma_v) and self.noise_sigma_v <= 0.0:
             raise ValueError("finite comparator noise must be positive")
+        if math.isinf(self.probit_offset_v) or math.isinf(self.probit_noise_sigma_v):
+            raise ValueError("comparator probit results may use NaN but not infinite values")
+        if math.isfinite(self.probit_noise_sigma_v) and self.probit_noise_sigma_v <= 0.0:
+            raise ValueError("finite comparator probit noise must be positive")
         object.__setattr__(self, "vin_diff_v", vin_diff_v)
         object.__setattr__(self, "decision_probability", probability)
         object.__setattr__(self, "trial_count", trial_count)
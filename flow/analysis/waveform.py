@@ -8,6 +8,7 @@ from typing import Any
 
 import numpy as np
 
+from flow.analysis.cache import cached_analysis
 from flow.analysis.types import AnalysisWaveform, MeasAdcExt, MeasAdcInt, Measurement
 from flow.scans.params import AdcScanParams
 
@@ -63,6 +64,7 @@ def style_measurement_text(msmt: Measurement) -> tuple[str, ...]:
     return lines
 
 
+@cached_analysis
 def analyze_measurement_waveforms(
     msmt: Measurement,
     *,
@@ -105,6 +107,7 @@ def analyze_measurement_waveforms(
     )
 
 
+@cached_analysis
 def analyze_scope_waveforms(
     waveforms: Any,
     track_names: Mapping[int, str],
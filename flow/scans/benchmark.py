@@ -0,0 +1,236 @@
+"""Manually invoked throughput benchmarks for the scan layer on the simulated bench.
+
+Run one named benchmark from the repository root with:
+
+    uv run python -m flow.scans.benchmark simulated_scan_adc
+
+Benchmarks select the offline Basil maps in ``flow.scans.simulated``, write
+only into a temporary directory, and print one plain-text table; they are not
+collected by pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from time import perf_counter
+
+import hdl21 as h
+import numpy as np
+
+from flow.scans import plldrp, scan_adc
+from flow.scans.params import BASIL_MAPS_ENVIRONMENT_VARIABLE, AdcScanParams, build_adc_variants
+from flow.scans.scope import (
+    FRIDA_SCOPE_CHANNELS,
+    ScopeXScale,
+    read_scope_csv_chunks,
+    read_scope_h5,
+    write_scope_csv,
+    write_scope_h5,
+)
+from flow.scans.simulated.bench import discard_bench, get_bench
+from flow.scans.simulated.tektronix_oscilloscope import SCOPE_CODES_PER_DIVISION, ScopeWaveform
+
+SCAN_PHASES = ("fpga", "smu", "stimulus", "scope", "model", "wait")
+
+
+@contextmanager
+def _counted_sleeps(ledger: defaultdict[str, float]) -> Iterator[None]:
+    """Book every settle and polling sleep of the scan modules to ``ledger["wait"]``."""
+
+    original = time.sleep
+
+    def sleep(seconds: float) -> None:
+        started = perf_counter()
+        original(seconds)
+        ledger["wait"] += perf_counter() - started
+
+    modules = (time, scan_adc, plldrp)
+    originals = [module.sleep for module in modules]
+    for module in modules:
+        module.sleep = sleep
+    try:
+        yield
+    finally:
+        for module, function in zip(modules, originals, strict=True):
+            module.sleep = function
+
+
+@contextmanager
+def _simulated_maps() -> Iterator[None]:
+    """Select the offline Basil maps and discard the shared bench afterwards."""
+
+    previous_maps = os.environ.get(BASIL_MAPS_ENVIRONMENT_VARIABLE)
+    os.environ[BASIL_MAPS_ENVIRONMENT_VARIABLE] = "simulated"
+    try:
+        yield
+    finally:
+        discard_bench()
+        if previous_maps is None:
+            os.environ.pop(BASIL_MAPS_ENVIRONMENT_VARIABLE, None)
+        else:
+            os.environ[BASIL_MAPS_ENVIRONMENT_VARIABLE] = previous_maps
+
+
+def _rate_sweep(conversions: int, points: int) -> list[AdcScanParams]:
+    """Return ``points`` adc_sine_conversion_rate variants spread over its 0.5--10 MSPS range."""
+
+    rates_hz = tuple(rate * 0.25e6 for rate in range(2, 41))
+    rates_hz = tuple(rates_hz[round(index * (len(rates_hz) - 1) / max(points - 1, 1))] for index in range(points))
+    return build_adc_variants(
+        board_id="00",
+        adc_indices=(0,),
+        active_conversion_rates_hz=rates_hz,
+        logic_offsets_symbols=(2.0,),
+        conversions=conversions,
+        vin_cm_v=0.700,
+        vin_diff=h.Vsin.Params(voff=0.0, vamp=0.500, freq=9_998.770151),
+    )
+
+
+def _scan_points(
+    variants: list[AdcScanParams],
+    run_dir: Path,
+    session: scan_adc.ScanSession | None = None,
+) -> None:
+    for index, params in enumerate(variants):
+        if len(variants) == 1:
+            position = "only"
+        else:
+            position = "first" if index == 0 else "last" if index == len(variants) - 1 else "middle"
+        scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+
+
+def simulated_scan_adc(conversions: tuple[int, ...] = (10_000, 1_000_000), points: int = 3) -> None:
+    """Report seconds per simulated adc_sine_conversion_rate point by bench phase.
+
+    ``fpga``, ``smu``, ``stimulus``, and ``scope`` are the configured interface
+    latencies, ``model`` is behavioral conversion, ``wait`` is the scan's own
+    settle and polling sleeps, and ``host`` is everything else.
+    """
+
+    print(f"{'conversions':>12} {'point s':>8} " + " ".join(f"{phase:>8}" for phase in (*SCAN_PHASES, "host")))
+    with _simulated_maps():
+        for count in conversions:
+            discard_bench()
+            bench = get_bench()
+            variants = _rate_sweep(count, points)
+            with tempfile.TemporaryDirectory() as directory, _counted_sleeps(bench.ledger):
+                start = perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    _scan_points(variants, Path(directory) / "run")
+                elapsed_s = perf_counter() - start
+            phases_s = [bench.ledger[phase] / len(variants) for phase in SCAN_PHASES]
+            host_s = elapsed_s / len(variants) - sum(phases_s)
+            print(
+                f"{count:>12,} {elapsed_s / len(variants):>8.2f} "
+                + " ".join(f"{seconds:>8.2f}" for seconds in (*phases_s, host_s))
+            )
+
+
+def scan_session_overhead(conversions: int = 10_000, points: int = 5) -> None:
+    """Compare seconds per simulated rate-sweep point with and without a ``ScanSession``.
+
+    Without a session every point opens and initializes all five Duts and
+    reads each setpoint back before programming it; with one the devices stay
+    open and only changed state is pushed. Columns are the phases of
+    ``simulated_scan_adc``; the SMU readings themselves are measurements and
+    cost the same in both modes.
+    """
+
+    print(f"{'session':>12} {'point s':>8} " + " ".join(f"{phase:>8}" for phase in (*SCAN_PHASES, "host")))
+    point_s = {}
+    with _simulated_maps():
+        for mode in ("per-point", "shared"):
+            discard_bench()
+            bench = get_bench()
+            variants = _rate_sweep(conversions, points)
+            with tempfile.TemporaryDirectory() as directory, _counted_sleeps(bench.ledger):
+                start = perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    if mode == "shared":
+                        with scan_adc.ScanSession() as session:
+                            _scan_points(variants, Path(directory) / "run", session)
+                    else:
+                        _scan_points(variants, Path(directory) / "run")
+                elapsed_s = perf_counter() - start
+            point_s[mode] = elapsed_s / len(variants)
+            phases_s = [bench.ledger[phase] / len(variants) for phase in SCAN_PHASES]
+            host_s = point_s[mode] - sum(phases_s)
+            print(
+                f"{mode:>12} {point_s[mode]:>8.2f} " + " ".join(f"{seconds:>8.2f}" for seconds in (*phases_s, host_s))
+            )
+    saved_s = point_s["per-point"] - point_s["shared"]
+    print(f"A session saves {saved_s:.2f} s per point ({100.0 * saved_s / point_s['per-point']:.0f}%)")
+
+
+def scope_waveform_storage(samples: tuple[int, ...] = (1_000_000, 10_000_000, 50_000_000)) -> None:
+    """Compare CSV and binary HDF5 scope files for one ``adc_vdiff`` record per length.
+
+    ``write s`` is ``write_scope_csv`` or ``write_scope_h5``; ``read s``
+    parses every CSV row or reads the HDF5 codes and decodes them to volts.
+    The record is a noisy 50 mV/div sine in 16-bit codes.
+    """
+
+    channel = FRIDA_SCOPE_CHANNELS["adc_vdiff"]
+    track_names = {channel: "adc_vdiff"}
+    rng = np.random.default_rng(0)
+    print(f"{'samples':>12} {'format':>6} {'write s':>8} {'read s':>8} {'MB':>9}")
+    for count in samples:
+        codes = 20_000.0 * np.sin(2.0 * np.pi * np.arange(count) / 4_096.0) + rng.normal(0.0, 50.0, count)
+        raw_data = np.clip(np.rint(codes), -32768, 32767).astype(np.int16)
+        waveform = ScopeWaveform(
+            name="adc_vdiff",
+            x_scale=ScopeXScale(offset=-5.0e-3, slope=1.0e-2 / count),
+            data=raw_data * (0.05 / SCOPE_CODES_PER_DIVISION),
+            raw_data=raw_data,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            for name, write in (("csv", write_scope_csv), ("h5", write_scope_h5)):
+                path = Path(directory) / f"scope.{name}"
+                start = perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    write(path, {channel: waveform}, track_names)
+                write_s = perf_counter() - start
+                start = perf_counter()
+                if name == "csv":
+                    for _time_s, _volts, _raw in read_scope_csv_chunks(path, track_names):
+                        pass
+                else:
+                    np.asarray(read_scope_h5(path)[channel].data)
+                read_s = perf_counter() - start
+                print(f"{count:>12,} {name:>6} {write_s:>8.2f} {read_s:>8.2f} {path.stat().st_size / 1e6:>9.1f}")
+
+
+BENCHMARKS: dict[str, Callable[[], None]] = {
+    benchmark.__name__: benchmark for benchmark in (simulated_scan_adc, scan_session_overhead, scope_waveform_storage)
+}
+
+
+def main() -> None:
+    """Run one named benchmark, or every benchmark when none is named."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "benchmark",
+        nargs="?",
+        choices=sorted(BENCHMARKS),
+        help="benchmark function to run; omit to run all benchmarks",
+    )
+    args = parser.parse_args()
+    for name in (args.benchmark,) if args.benchmark else tuple(BENCHMARKS):
+        print(f"== {name}")
+        start_time = perf_counter()
+        BENCHMARKS[name]()
+        print(f"Completed {name} in {perf_counter() - start_time:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
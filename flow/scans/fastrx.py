@@ -9,6 +9,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from flow.adc.sim import AdcTbParams
+from flow.analysis.measure import decode_packed_bout, unpack_bout
 from flow.cdac import get_cdac_weights
 
 
@@ -32,8 +33,18 @@ def convert_fastrx_words_to_adc(
     data_size: int,
     code_weights: list[int],
     adc_bits: int,
+    *,
+    packed: bool = False,
+    first_conversion: int = 0,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Decode and validate one complete FastRX acquisition in host memory."""
+    """Decode and validate one complete FastRX acquisition in host memory.
+
+    With ``packed=True`` the returned BOUT is the MSB-first payload word of
+    each conversion instead of the expanded ``(N, data_size)`` bit matrix.
+    ``first_conversion`` is the acquisition index of ``words[0]`` when a
+    streamed capture is decoded chunk by chunk, so frame counters are checked
+    continuously across chunk boundaries.
+    """
 
     fastrx_words = np.asarray(words, dtype=np.uint32)
     if fastrx_words.ndim != 1:
@@ -44,29 +55,33 @@ def convert_fastrx_words_to_adc(
         raise ValueError(f"received {data_size} FastRX bits for {len(code_weights)} ADC weights")
     if adc_bits <= 0:
         raise ValueError("adc_bits must be positive")
+    if first_conversion < 0:
+        raise ValueError("first_conversion must be non-negative")
 
     identifiers = (fastrx_words >> 28) & 0xF
     invalid_identifiers = np.flatnonzero(identifiers != 1)
     if invalid_identifiers.size:
         index = int(invalid_identifiers[0])
-        raise RuntimeError(f"FastRX conversion {index} has identifier {int(identifiers[index]):#x}, expected 0x1")
+        raise RuntimeError(
+            f"FastRX conversion {first_conversion + index} has identifier {int(identifiers[index]):#x}, expected 0x1"
+        )
 
     frame_counter_bits = 28 - data_size
     frame_counter_modulus = 1 << frame_counter_bits
     frames = (fastrx_words >> data_size) & (frame_counter_modulus - 1)
-    expected_frames = np.arange(len(fastrx_words), dtype=np.uint32) % frame_counter_modulus
+    expected_frames = (first_conversion + np.arange(len(fastrx_words), dtype=np.int64)) % frame_counter_modulus
     invalid_frames = np.flatnonzero(frames != expected_frames)
     if invalid_frames.size:
         index = int(invalid_frames[0])
         raise RuntimeError(
-            f"FastRX conversion {index} has frame {int(frames[index])}, expected {int(expected_frames[index])}"
+            f"FastRX conversion {first_conversion + index} has frame {int(frames[index])}, "
+            f"expected {int(expected_frames[index])}"
         )
 
-    spi_data = fastrx_words & ((1 << data_size) - 1)
-    bit_positions = np.arange(data_size - 1, -1, -1, dtype=np.uint32)
-    bout = ((spi_data[:, None] >> bit_positions) & 1).astype(np.uint8)
+    spi_data = fastrx_words & np.uint32((1 << data_size) - 1)
     weights = np.asarray(code_weights, dtype=np.int64)
-    dout_raw = bout @ weights
+    dout_raw = decode_packed_bout(spi_data, weights)
+    bout = spi_data if packed else unpack_bout(spi_data, data_size)
     normalized_code_max = (1 << adc_bits) - 1
     dout = np.rint(dout_raw * normalized_code_max / np.sum(weights)).astype(np.int64)
     return bout, dout_raw, dout
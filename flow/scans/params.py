@@ -1,6 +1,7 @@
 """Physical ADC scan parameters and configuration builders."""
 
 import math
+import os
 from collections.abc import Sequence
 from functools import cache
 from pathlib import Path
@@ -148,6 +149,34 @@ def validate_params(params: AdcScanParams) -> None:
         raise ValueError("CDAC selectors are only valid for cdac_ab")
 
 
+BASIL_MAPS_ENVIRONMENT_VARIABLE = "FRIDA_BASIL_MAPS"
+BASIL_MAP_DIRECTORIES = {
+    "physical": Path(__file__).resolve().parent,
+    "simulated": Path(__file__).resolve().parent / "simulated",
+}
+
+
+def selected_basil_bench() -> str:
+    """Return the bench named by ``FRIDA_BASIL_MAPS``, ``physical`` by default.
+
+    ``simulated`` selects the offline drivers in ``flow.scans.simulated``,
+    which keep the physical map names.
+    """
+
+    bench = os.environ.get(BASIL_MAPS_ENVIRONMENT_VARIABLE, "physical")
+    if bench not in BASIL_MAP_DIRECTORIES:
+        raise ValueError(
+            f"{BASIL_MAPS_ENVIRONMENT_VARIABLE} must be one of {sorted(BASIL_MAP_DIRECTORIES)}, got {bench!r}"
+        )
+    return bench
+
+
+def select_basil_map(filename: str) -> str:
+    """Return the path of Basil map ``filename`` for the selected bench."""
+
+    return str(BASIL_MAP_DIRECTORIES[selected_basil_bench()] / filename)
+
+
 @cache
 def load_board_map() -> dict[str, Any]:
     """Load the physical-board inventory and calibration map."""
@@ -7,12 +7,18 @@ Run one named campaign from the repository root, for example::
 Every target owns its complete parameter recipe, lifecycle loop, and output
 location. The scan modules acquire one parameter configuration per call and
 contain no command-line entry points of their own.
+
+``--simulated`` runs the same target against the offline Basil bench in
+``flow.scans.simulated``, for example on a laptop without instruments::
+
+    uv run python -m flow.scans.runner --simulated adc_sine_conversion_rate
 """
 
 from __future__ import annotations
 
 import argparse
 import dataclasses
+import os
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -20,7 +26,7 @@ from pathlib import Path
 import hdl21 as h
 
 from flow.scans import scan_adc, scan_cdac, scan_comp
-from flow.scans.params import build_adc_variants
+from flow.scans.params import BASIL_MAPS_ENVIRONMENT_VARIABLE, build_adc_variants
 
 BASE_PATH = Path(__file__).resolve().parents[2]
 
@@ -47,26 +53,27 @@ def adc_sine_conversion_rate() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -92,26 +99,27 @@ def adc00_fixed_input_noise() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -137,26 +145,27 @@ def adc_fixed_input_noise_50mv() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -182,26 +191,27 @@ def adc_fixed_input_noise_100mv() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -227,26 +237,27 @@ def adc00_fixed_input_timing() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -272,26 +283,27 @@ def adc01_fixed_input_timing() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -323,26 +335,27 @@ def adc_transfer_curve() -> Path:
     ]
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -369,26 +382,27 @@ def adc_ramp_code_density() -> Path:
     )
     active = False
     current = variants[0]
-    try:
-        for index, params in enumerate(variants):
-            position = (
-                "only"
-                if len(variants) == 1
-                else "first"
-                if index == 0
-                else "last"
-                if index == len(variants) - 1
-                else "middle"
-            )
-            current = params
-            if position in {"first", "middle"}:
-                active = True
-            scan_adc.scan(params, run_dir=run_dir, position=position)
-            if position in {"last", "only"}:
-                active = False
-    finally:
-        if active:
-            scan_adc.scan(current, run_dir=run_dir, position="abort")
+    with scan_adc.ScanSession() as session:
+        try:
+            for index, params in enumerate(variants):
+                position = (
+                    "only"
+                    if len(variants) == 1
+                    else "first"
+                    if index == 0
+                    else "last"
+                    if index == len(variants) - 1
+                    else "middle"
+                )
+                current = params
+                if position in {"first", "middle"}:
+                    active = True
+                scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+                if position in {"last", "only"}:
+                    active = False
+        finally:
+            if active:
+                scan_adc.scan(current, run_dir=run_dir, position="abort", session=session)
     return run_dir
 
 
@@ -559,7 +573,10 @@ def main() -> None:
 
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("target", choices=sorted(TARGETS), help="physical scan campaign to run")
+    parser.add_argument("--simulated", action="store_true", help="use the offline simulated Basil bench")
     args = parser.parse_args()
+    if args.simulated:
+        os.environ[BASIL_MAPS_ENVIRONMENT_VARIABLE] = "simulated"
     run_dir = TARGETS[args.target]()
     print(f"Completed {args.target} in {run_dir}")
 
@@ -1,15 +1,28 @@
-"""Run one shared ADC configuration through the behavioral model.
+"""Run shared ADC configurations through the behavioral model.
 
 Run from /local/frida:
 
     uv run python -m flow.scans.scan_behavioral
+    uv run python -m flow.scans.scan_behavioral monte_carlo --instances 256
 
-The generated HDF5 file uses the same typed measurement schema as the
-physical scan.
+The first form converts one DC point with the module-level model constants.
+The Monte Carlo campaign samples capacitor mismatch, comparator offset and
+noise, and reference noise for every ADC instance of each selected board
+channel, then converts one ramp and one sine per instance on a process pool.
+The generated HDF5 files use the same typed measurement schema as the
+physical scan, so ``analyze_adc_ramp()`` and ``analyze_adc_dynamic()`` read
+them directly.
 """
 
 from __future__ import annotations
 
+import argparse
+import functools
+import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -20,12 +33,14 @@ import numpy as np
 from flow.adc.behavioral import SAR_ADC
 from flow.adc.sim import AdcTbParams
 from flow.analysis.io import build_adc_interface_wave, write_measurement
+from flow.analysis.measure import pack_bout
 from flow.analysis.types import AdcDaq, MeasAdcExt, MeasInfo
 from flow.cdac import get_cdac_weights
-from flow.scans.params import AdcScanParams
+from flow.scans.params import AdcScanParams, build_adc_variants
 from flow.scans.scan_adc import (
     convert_dac_caps_to_adc_weights,
     convert_dout_to_normalized_dout,
+    convert_source_to_vin_diff,
 )
 
 ADC_INDEX = 0
@@ -54,11 +69,56 @@ REFERENCE_NOISE = 0.0
 SETTLING_TIME = 0.0
 SWITCHING_STRAT = "monotonic"
 
+# Monte Carlo stimuli: every instance converts one repeated full-scale ramp
+# (four periods, sixteen conversions per code) and one coherent sine.
+MONTE_CARLO_BOARD_ID = "00"
+MONTE_CARLO_CONVERSION_RATE_HZ = 10.0e6
+MONTE_CARLO_VIN_CM_V = 0.600
+MONTE_CARLO_RAMP_CONVERSIONS = 65_536
+MONTE_CARLO_RAMP_PERIODS = 4
+MONTE_CARLO_RAMP_VIN_DIFF_V = 1.0
+MONTE_CARLO_SINE_CONVERSIONS = 16_384
+MONTE_CARLO_SINE_CYCLES = 127
+MONTE_CARLO_SINE_AMPLITUDE_V = 0.500
 
-def build_frida_params() -> dict[str, dict[str, object]]:
+
+@dataclass(frozen=True, slots=True)
+class MonteCarloSpread:
+    """One-sigma spreads drawn independently for every behavioral ADC instance.
+
+    Capacitor mismatch is the model's unit-capacitor relative sigma, which it
+    divides by the square root of each capacitor's weight. The comparator
+    offset is normal; each instance's comparator and reference noise sigmas
+    are the nominal values scaled by a log-normal factor of ``noise_variation``.
+    """
+
+    capacitor_mismatch_percent: float = 0.2
+    comparator_offset_v: float = 2.0e-3
+    comparator_noise_v: float = 0.4e-3
+    reference_noise_v: float = 0.2e-3
+    noise_variation: float = 0.2
+
+    def __post_init__(self) -> None:
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if not math.isfinite(value) or value < 0.0:
+                raise ValueError(f"{name} must be finite and non-negative")
+
+
+MONTE_CARLO_SPREAD = MonteCarloSpread()
+
+
+def build_frida_params(
+    cap_weights: Sequence[int] = CAP_WEIGHTS,
+    *,
+    comparator_offset: float = COMPARATOR_OFFSET,
+    comparator_noise: float = COMPARATOR_NOISE,
+    reference_noise: float = REFERENCE_NOISE,
+    capacitor_mismatch_percent: float = 0.0,
+) -> dict[str, dict[str, object]]:
     """Build behavioral-model parameters matching FRIDA's ADC."""
 
-    cdac_capacitance = sum(CAP_WEIGHTS) * UNIT_CAPACITANCE
+    cdac_capacitance = sum(cap_weights) * UNIT_CAPACITANCE
     parasitic_capacitance = PARASITIC_RATIO * cdac_capacitance
     return {
         "ADC": {
@@ -67,23 +127,23 @@ def build_frida_params() -> dict[str, dict[str, object]]:
             "resolution": PARAMS.tb.dut.adc_bits,
         },
         "COMP": {
-            "offset_voltage": COMPARATOR_OFFSET,
+            "offset_voltage": comparator_offset,
             "common_mode_dependent_offset_gain": 0.0,
-            "threshold_voltage_noise": COMPARATOR_NOISE,
+            "threshold_voltage_noise": comparator_noise,
             "capacitor_mismatch_error": 0.0,
         },
         "CDAC": {
             "positive_reference_voltage": 1.2,
             "negative_reference_voltage": 0.0,
-            "reference_voltage_noise": REFERENCE_NOISE,
+            "reference_voltage_noise": reference_noise,
             "unit_capacitance": UNIT_CAPACITANCE,
             "use_individual_weights": True,
-            "individual_weights": CAP_WEIGHTS,
+            "individual_weights": list(cap_weights),
             "parasitic_capacitance": parasitic_capacitance,
-            "capacitor_mismatch_error": 0.0,
+            "capacitor_mismatch_error": capacitor_mismatch_percent,
             "settling_time": SETTLING_TIME,
             "switching_strat": SWITCHING_STRAT,
-            "array_size": len(CAP_WEIGHTS),
+            "array_size": len(cap_weights),
         },
     }
 
@@ -92,7 +152,7 @@ def input_attenuation(params: dict[str, dict[str, object]]) -> float:
     """Return optional sampled input gain from top-plate parasitic loading."""
 
     cdac = params["CDAC"]
-    cdac_capacitance = sum(CAP_WEIGHTS) * cast(float, cdac["unit_capacitance"])
+    cdac_capacitance = sum(cast(list[int], cdac["individual_weights"])) * cast(float, cdac["unit_capacitance"])
     parasitic_capacitance = cast(float, cdac["parasitic_capacitance"])
     return cdac_capacitance / (cdac_capacitance + parasitic_capacitance)
 
@@ -124,7 +184,185 @@ def convert_behavioral_to_bout_and_dout(
     return bout, dout_raw, dout
 
 
-def main() -> None:
+def convert_behavioral_to_measurement(
+    adc: SAR_ADC,
+    params: AdcScanParams,
+    *,
+    attenuation: float = 1.0,
+    readbacks: dict[str, str | int | float | bool] | None = None,
+) -> MeasAdcExt:
+    """Convert one configuration's whole stimulus in one batch and return its typed measurement."""
+
+    tb = params.tb
+    conversion_period_s = len(tb.seq_init_pattern) / float(tb.symbol_rate)
+    vin_diff_v = convert_source_to_vin_diff(tb.vin_diff, np.arange(tb.conversions) * conversion_period_s)
+    vin_cm_v = float(tb.vin_cm.dc)
+    bout, _codes, _energy = adc.sample_and_convert_batch(
+        vin_cm_v + attenuation * vin_diff_v / 2.0,
+        vin_cm_v - attenuation * vin_diff_v / 2.0,
+        do_normalize_result=False,
+    )
+    if bout.shape[1] != NUM_CAPTURE_BITS:
+        raise RuntimeError(f"behavioral model produced {bout.shape[1]} bits, expected {NUM_CAPTURE_BITS}")
+    code_weights = convert_dac_caps_to_adc_weights(get_cdac_weights(tb.dut.cdac))
+    dout_raw = bout.astype(np.int64) @ np.asarray(code_weights, dtype=np.int64)
+    # Vectorized convert_dout_to_normalized_dout(): both round half to even.
+    dout = np.rint(dout_raw * ((1 << tb.dut.adc_bits) - 1) / sum(code_weights)).astype(np.int64)
+    return MeasAdcExt(
+        info=MeasInfo(
+            schema_version=1,
+            measurement_type="MeasAdcExt",
+            backend="behavioral",
+            timestamp_utc=datetime.now().astimezone(),
+            instruments={"model": f"{SAR_ADC.__module__}.{SAR_ADC.__name__}"},
+            readbacks={"input_attenuation": attenuation, **(readbacks or {})},
+        ),
+        param=params,
+        daq=AdcDaq(
+            conversion_index=np.arange(tb.conversions),
+            bout=pack_bout(bout),
+            dout_raw=dout_raw,
+            dout=dout,
+            vin_diff_v=vin_diff_v,
+        ),
+        wave=build_adc_interface_wave(tb, bout[0]),
+    )
+
+
+def simulate_monte_carlo_instance(
+    stimuli: tuple[tuple[str, AdcScanParams], ...],
+    instance: int,
+    seed: np.random.SeedSequence,
+    *,
+    spread: MonteCarloSpread,
+    campaign_seed: int,
+    run_dir: Path,
+) -> tuple[Path, ...]:
+    """Sample one ADC instance from ``seed`` and write one measurement per named stimulus."""
+
+    rng = np.random.default_rng(seed)
+    comparator_offset = float(rng.normal(0.0, spread.comparator_offset_v))
+    comparator_noise = spread.comparator_noise_v * math.exp(rng.normal(0.0, spread.noise_variation))
+    reference_noise = spread.reference_noise_v * math.exp(rng.normal(0.0, spread.noise_variation))
+    first_params = stimuli[0][1]
+    model_params = build_frida_params(
+        get_cdac_weights(first_params.tb.dut.cdac),
+        comparator_offset=comparator_offset,
+        comparator_noise=comparator_noise,
+        reference_noise=reference_noise,
+        capacitor_mismatch_percent=spread.capacitor_mismatch_percent,
+    )
+    readbacks: dict[str, str | int | float | bool] = {
+        "monte_carlo_seed": campaign_seed,
+        "monte_carlo_instance": instance,
+        "capacitor_mismatch_percent": spread.capacitor_mismatch_percent,
+        "comparator_offset_v": comparator_offset,
+        "comparator_noise_v": comparator_noise,
+        "reference_noise_v": reference_noise,
+    }
+
+    # SAR_ADC draws capacitor mismatch and conversion noise from NumPy's
+    # global stream; seed it per instance and restore the caller's state.
+    global_state = np.random.get_state()
+    np.random.seed(seed.generate_state(1)[0])
+    try:
+        adc = SAR_ADC(model_params)
+        attenuation = input_attenuation(model_params) if APPLY_INPUT_ATTENUATION else 1.0
+        paths = []
+        for name, params in stimuli:
+            measurement = convert_behavioral_to_measurement(adc, params, attenuation=attenuation, readbacks=readbacks)
+            path = run_dir / f"adc_{params.observed_adc:02d}_mc{instance:05d}_{name}.h5"
+            write_measurement(path, measurement)
+            paths.append(path)
+    finally:
+        np.random.set_state(global_state)
+    return tuple(paths)
+
+
+def monte_carlo_campaign(
+    run_dir: Path,
+    *,
+    instances: int,
+    adc_indices: Sequence[int] = tuple(range(16)),
+    spread: MonteCarloSpread = MONTE_CARLO_SPREAD,
+    seed: int = 0,
+    workers: int | None = None,
+) -> tuple[Path, ...]:
+    """Write a ramp and a sine measurement for ``instances`` sampled ADCs per board channel.
+
+    Every instance draws from its own child of ``SeedSequence(seed)``, in
+    channel-major order, so the files do not depend on ``workers``; the
+    returned paths follow that order. Each channel keeps the CDAC weights of
+    its board flavor, so channels of different redundancy strategies are
+    directly comparable.
+    """
+
+    if instances < 1:
+        raise ValueError("instances must be positive")
+    adc_indices = tuple(adc_indices)
+
+    def variants(conversions: int, vin_diff, campaign: str = "adc") -> list[AdcScanParams]:
+        return build_adc_variants(
+            board_id=MONTE_CARLO_BOARD_ID,
+            adc_indices=adc_indices,
+            active_conversion_rates_hz=(MONTE_CARLO_CONVERSION_RATE_HZ,),
+            logic_offsets_symbols=(0.0,),
+            conversions=conversions,
+            vin_cm_v=MONTE_CARLO_VIN_CM_V,
+            vin_diff=vin_diff,
+            campaign=campaign,
+        )
+
+    template = variants(1, h.Vdc.Params(dc=0.0))[0].tb
+    conversion_period_s = len(template.seq_init_pattern) / float(template.symbol_rate)
+    ramp_period_s = MONTE_CARLO_RAMP_CONVERSIONS / MONTE_CARLO_RAMP_PERIODS * conversion_period_s
+    ramp = variants(
+        MONTE_CARLO_RAMP_CONVERSIONS,
+        h.Vpwl.Params(wave=f"0 {-MONTE_CARLO_RAMP_VIN_DIFF_V!r} {ramp_period_s!r} {MONTE_CARLO_RAMP_VIN_DIFF_V!r}"),
+        "adc_ramp",
+    )
+    sine = variants(
+        MONTE_CARLO_SINE_CONVERSIONS,
+        h.Vsin.Params(
+            voff=0.0,
+            vamp=MONTE_CARLO_SINE_AMPLITUDE_V,
+            freq=MONTE_CARLO_SINE_CYCLES / (MONTE_CARLO_SINE_CONVERSIONS * conversion_period_s),
+        ),
+    )
+    stimuli = [
+        (("ramp", ramp_params), ("sine", sine_params)) for ramp_params, sine_params in zip(ramp, sine, strict=True)
+    ]
+    jobs = [(channel_stimuli, instance) for channel_stimuli in stimuli for instance in range(instances)]
+    seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+    simulate = functools.partial(
+        simulate_monte_carlo_instance,
+        spread=spread,
+        campaign_seed=seed,
+        run_dir=run_dir,
+    )
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if workers == 1:
+        results = [
+            simulate(channel_stimuli, instance, child) for (channel_stimuli, instance), child in zip(jobs, seeds)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    simulate,
+                    [channel_stimuli for channel_stimuli, _instance in jobs],
+                    [instance for _channel_stimuli, instance in jobs],
+                    seeds,
+                    chunksize=max(1, len(jobs) // (4 * workers)),
+                )
+            )
+    return tuple(path for paths in results for path in paths)
+
+
+def run_dc_point() -> None:
     params = build_frida_params()
     adc = SAR_ADC(params)
     attenuation = input_attenuation(params) if APPLY_INPUT_ATTENUATION else 1.0
@@ -187,5 +425,29 @@ def main() -> None:
     print(f"ADC {ADC_INDEX:02d}: saved typed measurement to {h5_path}")
 
 
+def main() -> None:
+    """Convert the single DC point, or run the Monte Carlo campaign."""
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("campaign", nargs="?", choices=("dc", "monte_carlo"), default="dc")
+    parser.add_argument("--instances", type=int, default=256, help="sampled ADC instances per board channel")
+    parser.add_argument("--adc", type=int, nargs="+", default=list(range(16)), help="board channels to sample")
+    parser.add_argument("--seed", type=int, default=0, help="campaign SeedSequence entropy")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes; default one per CPU")
+    args = parser.parse_args()
+    if args.campaign == "dc":
+        run_dc_point()
+        return
+    run_dir = SCAN_OUTDIR / "monte_carlo" / datetime.now().astimezone().strftime("%Y%m%d_%H%M%S")
+    paths = monte_carlo_campaign(
+        run_dir,
+        instances=args.instances,
+        adc_indices=args.adc,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    print(f"Monte Carlo: wrote {len(paths)} measurements of {args.instances} instances per ADC to {run_dir}")
+
+
 if __name__ == "__main__":
     main()
@@ -30,7 +30,7 @@ from flow.scans.fastrx import (
     calculate_single_sample_fastrx_capture_alignment,
     convert_fastrx_words_to_comp,
 )
-from flow.scans.params import AdcScanParams, load_board_map, validate_params
+from flow.scans.params import AdcScanParams, load_board_map, select_basil_map, selected_basil_bench, validate_params
 from flow.scans.plldrp import calculate_pll_frequency, select_pll_configuration, set_pll_divider
 from flow.scans.scan_adc import (
     convert_params_to_spi_fmt,
@@ -773,17 +773,17 @@ def scan(
 
     acquisition_session_id = datetime.now().astimezone().isoformat(timespec="microseconds")
 
-    from gpib_ctypes import make_default_gpib
+    if selected_basil_bench() == "physical":
+        from gpib_ctypes import make_default_gpib
 
-    make_default_gpib()
+        make_default_gpib()
     from basil.dut import Dut
 
-    map_dir = Path(__file__).resolve().parent
-    daq_dut = Dut(str(map_dir / "map_fpga.yaml"))
-    awg_dut = Dut(str(map_dir / "map_awg.yaml"))
-    vin_cm_dut = Dut(str(map_dir / "map_supply.yaml"))
-    smu_dut = Dut(str(map_dir / "map_smu.yaml"))
-    scope_dut = Dut(str(map_dir / "map_scope.yaml")) if capture_scope_per_curve else None
+    daq_dut = Dut(select_basil_map("map_fpga.yaml"))
+    awg_dut = Dut(select_basil_map("map_awg.yaml"))
+    vin_cm_dut = Dut(select_basil_map("map_supply.yaml"))
+    smu_dut = Dut(select_basil_map("map_smu.yaml"))
+    scope_dut = Dut(select_basil_map("map_scope.yaml")) if capture_scope_per_curve else None
     initialized_duts = []
     daq = awg = vin_cm_supply = scope = None
     smus: list[tuple[Any, str, str]] = []
@@ -827,7 +827,7 @@ def scan(
         loaded_tolerance_v = float(supply_limits["loaded_voltage_tolerance_v"])
         supply_readbacks: dict[str, dict[str, float]] = {}
         for smu, rail, field in smus:
-            requested_v = float(getattr(first, field).dc)
+            requested_v = float(getattr(first.tb, field).dc)
             smu.off()
             smu.set_voltage(0.0)
             smu.source_volt()
@@ -852,7 +852,7 @@ def scan(
                         raise RuntimeError(f"{rail} readback failed after three attempts") from error
                     smu._intf._resource.clear()
                     sleep(0.1)
-            requested_v = float(getattr(first, field).dc)
+            requested_v = float(getattr(first.tb, field).dc)
             if measured_v > maximum_supply_v + 5e-3 or measured_v < requested_v - loaded_tolerance_v:
                 raise RuntimeError(f"{rail} loaded readback {measured_v:g} V is unsafe")
             supply_readbacks[field] = {
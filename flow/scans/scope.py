@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import csv
+import itertools
 import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import h5py
+import numpy as np
 from basil.HL.tektronix_oscilloscope import response_value
 
+from flow.analysis.io import LazyDataset
+
 DEFAULT_CAPTURE_TIMEOUT_S = 2.0
+# Rows parsed per step when converting or reading back a scope CSV.
+SCOPE_CSV_CHUNK_ROWS = 1 << 20
 
 # Fixed physical MSO54 hookup shared by every FRIDA bench test. INIT and SAMP
 # are not connected to the scope in this configuration.
@@ -21,12 +30,66 @@ FRIDA_SCOPE_CHANNELS = {
 }
 
 
-def write_scope_csv(
-    csv_path: Path,
-    waveforms: Any,
-    track_names: dict[int, str],
-) -> Path:
-    """Persist one raw, aligned oscilloscope acquisition as CSV."""
+@dataclass(frozen=True, slots=True)
+class ScopeXScale:
+    """Time axis of one record: ``offset + index * slope`` relative to the trigger."""
+
+    offset: float
+    slope: float
+    unit: str = "s"
+
+
+class ScopeVolts:
+    """Channel voltages decoded from raw scope samples only when indexed or converted."""
+
+    __slots__ = ("offset_v", "raw_data", "scale_v")
+
+    def __init__(self, raw_data: np.ndarray | LazyDataset, scale_v: float, offset_v: float) -> None:
+        self.raw_data = raw_data
+        self.scale_v = scale_v
+        self.offset_v = offset_v
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self.raw_data.shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return len(self.raw_data)
+
+    def __getitem__(self, key):
+        return np.asarray(self.raw_data[key], dtype=np.float64) * self.scale_v + self.offset_v
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        volts = np.asarray(self.raw_data, dtype=np.float64) * self.scale_v + self.offset_v
+        return volts if dtype is None else volts.astype(dtype, copy=False)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StoredScopeWaveform:
+    """One channel record read from a binary scope file.
+
+    ``raw_data`` holds the instrument codes and ``data`` decodes them to volts
+    as ``raw_data * scale_v + offset_v``, so records can be passed wherever a
+    live ``scope.get_waveforms()`` result is accepted.
+    """
+
+    name: str
+    x_scale: ScopeXScale
+    raw_data: np.ndarray | LazyDataset
+    scale_v: float
+    offset_v: float
+
+    @property
+    def data(self) -> ScopeVolts:
+        return ScopeVolts(self.raw_data, self.scale_v, self.offset_v)
+
+
+def _validate_scope_waveforms(waveforms: Any, track_names: Mapping[int, str]) -> tuple[tuple[int, ...], Any, int]:
+    """Return the channels, shared time axis, and sample count of one aligned acquisition."""
 
     channels = tuple(track_names)
     if not channels:
@@ -58,7 +121,20 @@ def write_scope_csv(
 
     if len(set(sample_counts.values())) != 1:
         raise ValueError(f"scope channels have different sample counts: {sample_counts}")
+    return channels, reference_x_scale, next(iter(sample_counts.values()))
+
+
+def write_scope_csv(
+    csv_path: Path,
+    waveforms: Any,
+    track_names: dict[int, str],
+) -> Path:
+    """Persist one raw, aligned oscilloscope acquisition as CSV.
+
+    Prefer :func:`write_scope_h5` for multi-megasample records.
+    """
 
+    channels, reference_x_scale, sample_count = _validate_scope_waveforms(waveforms, track_names)
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     with csv_path.open("w", newline="") as output:
         writer = csv.writer(output)
@@ -69,7 +145,7 @@ def write_scope_csv(
                 *(f"{track_names[channel]}_raw" for channel in channels),
             ]
         )
-        for index in range(next(iter(sample_counts.values()))):
+        for index in range(sample_count):
             writer.writerow(
                 [
                     reference_x_scale.offset + index * reference_x_scale.slope,
@@ -82,6 +158,214 @@ def write_scope_csv(
     return csv_path
 
 
+def _scope_line(low: tuple[float, float], high: tuple[float, float]) -> tuple[float, float]:
+    """Return ``(scale_v, offset_v)`` through two ``(raw, volts)`` samples."""
+
+    scale_v = (high[1] - low[1]) / (high[0] - low[0]) if high[0] != low[0] else 0.0
+    return scale_v, low[1] - low[0] * scale_v
+
+
+def _scope_extremes(raw: np.ndarray, volts: np.ndarray) -> tuple[tuple[float, float], tuple[float, float]]:
+    """Return the ``(raw, volts)`` samples at the lowest and highest raw code."""
+
+    low, high = int(np.argmin(raw)), int(np.argmax(raw))
+    return (float(raw[low]), float(volts[low])), (float(raw[high]), float(volts[high]))
+
+
+def _check_scope_line(channel: int, raw: np.ndarray, volts: np.ndarray, scale_v: float, offset_v: float) -> None:
+    """Require ``volts`` to equal ``raw * scale_v + offset_v`` to a millionth of a code."""
+
+    tolerance_v = 1.0e-6 * abs(scale_v) + 1.0e-12 * max(1.0, abs(offset_v))
+    error_v = np.abs(raw * scale_v + offset_v - volts)
+    if error_v.size and float(np.max(error_v)) > tolerance_v:
+        raise ValueError(f"scope channel {channel} voltages are not a linear function of its raw samples")
+
+
+def _scope_raw_dtype(channel: int, raw: np.ndarray) -> np.dtype:
+    """Keep 8-bit records as ``int8`` and store everything else as ``int16``."""
+
+    if raw.dtype.kind not in "iuf" or (raw.dtype.kind == "f" and not np.array_equal(raw, np.rint(raw))):
+        raise ValueError(f"scope channel {channel} raw samples must be integer instrument codes")
+    dtype = np.dtype(np.int8 if raw.dtype == np.int8 else np.int16)
+    limits = np.iinfo(dtype)
+    if raw.size and (raw.min() < limits.min or raw.max() > limits.max):
+        raise ValueError(f"scope channel {channel} raw samples exceed the {dtype} range")
+    return dtype
+
+
+def write_scope_h5(
+    h5_path: Path,
+    waveforms: Any,
+    track_names: dict[int, str],
+) -> Path:
+    """Persist one raw, aligned oscilloscope acquisition as binary HDF5.
+
+    Each channel is stored as its ``int8``/``int16`` instrument codes in a
+    contiguous ``/ch<N>`` dataset with ``name``, ``scale_v``, and
+    ``offset_v`` attributes; the time axis is the root ``x_offset``,
+    ``x_slope``, and ``x_unit``. The linear code-to-volt map is recovered from
+    each record and checked against every voltage sample. Read the file with
+    :func:`read_scope_h5`.
+    """
+
+    channels, reference_x_scale, sample_count = _validate_scope_waveforms(waveforms, track_names)
+    records = {}
+    for channel in channels:
+        raw = np.asarray(waveforms[channel].raw_data)
+        volts = np.asarray(waveforms[channel].data, dtype=np.float64)
+        dtype = _scope_raw_dtype(channel, raw)
+        if sample_count:
+            scale_v, offset_v = _scope_line(*_scope_extremes(raw, volts))
+            _check_scope_line(channel, raw, volts, scale_v, offset_v)
+        else:
+            scale_v, offset_v = 0.0, 0.0
+        records[channel] = (raw.astype(dtype, copy=False), scale_v, offset_v)
+
+    h5_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = h5_path.with_name(f".{h5_path.name}.tmp")
+    try:
+        with h5py.File(temporary_path, "w") as output:
+            output.attrs["x_offset"] = float(reference_x_scale.offset)
+            output.attrs["x_slope"] = float(reference_x_scale.slope)
+            output.attrs["x_unit"] = str(reference_x_scale.unit)
+            for channel, (raw, scale_v, offset_v) in records.items():
+                dataset = output.create_dataset(f"ch{channel}", data=raw)
+                dataset.attrs["name"] = track_names[channel]
+                dataset.attrs["scale_v"] = scale_v
+                dataset.attrs["offset_v"] = offset_v
+        temporary_path.replace(h5_path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+    print(f"Saved scope waveform HDF5: {h5_path}")
+    return h5_path
+
+
+def read_scope_h5(h5_path: Path, *, lazy: bool = False) -> dict[int, StoredScopeWaveform]:
+    """Read a :func:`write_scope_h5` file as ``{channel: record}``.
+
+    With ``lazy=True`` the raw codes stay on disk as memory-mapped
+    ``LazyDataset`` arrays until indexed. Voltages are always decoded on
+    access, so slicing a long record reads and converts only that slice.
+    """
+
+    waveforms = {}
+    with h5py.File(h5_path, "r") as stored:
+        x_scale = ScopeXScale(
+            offset=float(stored.attrs["x_offset"]),
+            slope=float(stored.attrs["x_slope"]),
+            unit=str(stored.attrs["x_unit"]),
+        )
+        for name, dataset in stored.items():
+            channel = int(name.removeprefix("ch"))
+            waveforms[channel] = StoredScopeWaveform(
+                name=str(dataset.attrs["name"]),
+                x_scale=x_scale,
+                raw_data=LazyDataset.from_dataset(h5_path, dataset) if lazy else dataset[()],
+                scale_v=float(dataset.attrs["scale_v"]),
+                offset_v=float(dataset.attrs["offset_v"]),
+            )
+    return dict(sorted(waveforms.items()))
+
+
+def read_scope_csv_chunks(
+    csv_path: Path,
+    track_names: Mapping[int, str],
+    *,
+    chunk_rows: int = SCOPE_CSV_CHUNK_ROWS,
+) -> Iterator[tuple[np.ndarray, dict[int, np.ndarray], dict[int, np.ndarray]]]:
+    """Yield ``(time_s, volts, raw)`` blocks of a :func:`write_scope_csv` file.
+
+    ``track_names`` is the mapping the CSV was written with; the CSV itself
+    stores only track names, so it supplies the channel numbers.
+    """
+
+    with csv_path.open() as source:
+        header = next(csv.reader([source.readline()]))
+        missing = [
+            column for name in track_names.values() for column in (f"{name}_v", f"{name}_raw") if column not in header
+        ]
+        if not header or header[0] != "time_s" or missing:
+            raise ValueError(f"{csv_path} is not a scope CSV for tracks {tuple(track_names.values())}")
+        while lines := list(itertools.islice(source, chunk_rows)):
+            block = np.loadtxt(lines, delimiter=",", ndmin=2)
+            yield (
+                block[:, 0],
+                {channel: block[:, header.index(f"{name}_v")] for channel, name in track_names.items()},
+                {channel: block[:, header.index(f"{name}_raw")] for channel, name in track_names.items()},
+            )
+
+
+def convert_scope_csv(
+    csv_path: Path,
+    track_names: dict[int, str],
+    h5_path: Path | None = None,
+    *,
+    chunk_rows: int = SCOPE_CSV_CHUNK_ROWS,
+) -> Path:
+    """Rewrite one :func:`write_scope_csv` file in the :func:`write_scope_h5` format.
+
+    The CSV is parsed in ``chunk_rows`` blocks, so memory stays bounded for
+    long records. Its time column and voltages must follow the stored raw
+    codes linearly; raw codes are stored as ``int16`` because the CSV does not
+    record the acquisition width.
+    """
+
+    h5_path = csv_path.with_suffix(".h5") if h5_path is None else h5_path
+    with csv_path.open("rb") as source:
+        sample_count = sum(block.count(b"\n") for block in iter(lambda: source.read(1 << 24), b"")) - 1
+        if sample_count < 1:
+            raise ValueError(f"{csv_path} holds no scope samples")
+        source.seek(0)
+        source.readline()
+        first_time_s = float(source.readline().split(b",")[0])
+        source.seek(max(0, csv_path.stat().st_size - (1 << 16)))
+        last_time_s = float(source.read().rstrip().rsplit(b"\n", 1)[-1].split(b",")[0])
+    slope_s = (last_time_s - first_time_s) / (sample_count - 1) if sample_count > 1 else 0.0
+
+    extremes: dict[int, list[tuple[float, float]]] = {channel: [] for channel in track_names}
+    row = 0
+    h5_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = h5_path.with_name(f".{h5_path.name}.tmp")
+    try:
+        with h5py.File(temporary_path, "w") as output:
+            datasets = {
+                channel: output.create_dataset(f"ch{channel}", shape=(sample_count,), dtype=np.int16)
+                for channel in track_names
+            }
+            for time_s, volts, raw in read_scope_csv_chunks(csv_path, track_names, chunk_rows=chunk_rows):
+                if row + len(time_s) > sample_count:
+                    raise ValueError(f"{csv_path} has more rows than lines")
+                expected_s = first_time_s + np.arange(row, row + len(time_s)) * slope_s
+                if not np.allclose(time_s, expected_s, rtol=1.0e-12, atol=1.0e-6 * abs(slope_s)):
+                    raise ValueError(f"{csv_path} time column is not uniformly sampled")
+                for channel in track_names:
+                    _scope_raw_dtype(channel, raw[channel])
+                    low, high = _scope_extremes(raw[channel], volts[channel])
+                    _check_scope_line(channel, raw[channel], volts[channel], *_scope_line(low, high))
+                    extremes[channel] += [low, high]
+                    datasets[channel][row : row + len(time_s)] = raw[channel]
+                row += len(time_s)
+            if row != sample_count:
+                raise ValueError(f"{csv_path} has {row} parsed rows for {sample_count} lines")
+
+            output.attrs["x_offset"] = first_time_s
+            output.attrs["x_slope"] = slope_s
+            output.attrs["x_unit"] = "s"
+            for channel, points in extremes.items():
+                scale_v, offset_v = _scope_line(min(points), max(points))
+                # Each block is linear between its own extremes, so the block
+                # extremes lying on one line makes the whole record linear.
+                _check_scope_line(channel, *np.asarray(points).T, scale_v, offset_v)
+                datasets[channel].attrs["name"] = track_names[channel]
+                datasets[channel].attrs["scale_v"] = scale_v
+                datasets[channel].attrs["offset_v"] = offset_v
+        temporary_path.replace(h5_path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return h5_path
+
+
 def wait_for_scope_capture(
     scope: Any,
     acquisition_count_before: int,
@@ -0,0 +1,6 @@
+"""Simulated Basil transfer layers and drivers for running scans without the bench.
+
+Select them with ``FRIDA_BASIL_MAPS=simulated`` (or ``runner.py --simulated``);
+the scans then load the ``map_*.yaml`` files in this directory instead of the
+physical ones.
+"""
@@ -0,0 +1,127 @@
+"""Simulated Agilent 33250A driving the board's differential input amplifier."""
+
+from __future__ import annotations
+
+from time import monotonic
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+AWG_LOADS = {"INF": "INF", "INFINITY": "INF"}
+
+
+def _number(value: float) -> str:
+    return f"{value:+.12E}"
+
+
+class SimulatedAgilent33250a(HardwareLayer):
+    """AWG whose output feeds the bench's ADC input through the board calibration."""
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        intf.device = self
+        self._replies = {
+            "*IDN?": lambda: "Agilent Technologies,33250A,0,SIMULATED",
+            "OUTP?": lambda: str(int(self._awg.enabled)),
+            "OUTP:LOAD?": lambda: "9.9E+37" if self._awg.load == "INF" else _number(float(self._awg.load)),
+            "FUNC?": lambda: {"DC": "DC", "SIN": "SIN", "RAMP": "RAMP"}[self._awg.function],
+            "FREQ?": lambda: _number(self._awg.frequency_hz),
+            "VOLT:OFFS?": lambda: _number(self._awg.offset_v),
+            "VOLT:HIGH?": lambda: _number(self._awg.offset_v + self._awg.amplitude_vpp / 2.0),
+            "VOLT:LOW?": lambda: _number(self._awg.offset_v - self._awg.amplitude_vpp / 2.0),
+            "FUNC:RAMP:SYMM?": lambda: _number(self._awg.symmetry_percent),
+        }
+
+    @property
+    def _awg(self):
+        return self._intf.bench.awg
+
+    def write(self, command: str) -> None:
+        pass
+
+    def query(self, command: str) -> str:
+        return self._replies[command]()
+
+    def get_name(self) -> str:
+        return self._intf.query("*IDN?")
+
+    def set_enable(self, value) -> None:
+        self._awg.enabled = bool(int(value))
+        self._intf.write(f"OUTP {int(value)}")
+
+    def get_enable(self) -> str:
+        return self._intf.query("OUTP?")
+
+    def set_output_load(self, value) -> None:
+        value = str(value).strip()
+        self._awg.load = AWG_LOADS.get(value.upper(), value)
+        self._intf.write(f"OUTP:LOAD {value}")
+
+    def get_output_load(self) -> str:
+        return self._intf.query("OUTP:LOAD?")
+
+    def set_voltage_range_auto(self, value) -> None:
+        self._awg.range_auto = str(value).upper() in {"1", "ON"}
+        self._intf.write(f"VOLT:RANG:AUTO {value}")
+
+    def set_DC(self, value: str) -> None:
+        """Apply ``DEF,DEF,<offset>`` as a DC output."""
+
+        *_defaults, offset_v = str(value).split(",")
+        self._apply("DC", offset_v=float(offset_v))
+        self._intf.write(f"APPL:DC {value}")
+
+    def set_sin(self, value: str) -> None:
+        """Apply ``<frequency>,<amplitude>,<offset>`` as a sine."""
+
+        frequency_hz, amplitude_vpp, offset_v = (float(field) for field in str(value).split(","))
+        self._apply("SIN", frequency_hz=frequency_hz, amplitude_vpp=amplitude_vpp, offset_v=offset_v)
+        self._intf.write(f"APPL:SIN {value}")
+
+    def set_ramp(self, value: str) -> None:
+        """Apply ``<frequency>,<amplitude>,<offset>`` as a ramp."""
+
+        frequency_hz, amplitude_vpp, offset_v = (float(field) for field in str(value).split(","))
+        self._apply("RAMP", frequency_hz=frequency_hz, amplitude_vpp=amplitude_vpp, offset_v=offset_v)
+        self._intf.write(f"APPL:RAMP {value}")
+
+    def _apply(self, function: str, *, offset_v: float, frequency_hz=None, amplitude_vpp=None) -> None:
+        awg = self._awg
+        awg.function = function
+        awg.offset_v = offset_v
+        if frequency_hz is not None:
+            if frequency_hz <= 0.0:
+                raise ValueError("AWG frequency must be positive")
+            awg.frequency_hz = frequency_hz
+        if amplitude_vpp is not None:
+            awg.amplitude_vpp = amplitude_vpp
+        # APPLy restarts the waveform.
+        awg.phase_origin_s = monotonic()
+
+    def set_function_ramp_symmetry(self, value: float) -> None:
+        value = float(value)
+        if not 0.0 <= value <= 100.0:
+            raise ValueError("ramp symmetry must be 0..100 %")
+        self._awg.symmetry_percent = value
+        self._intf.write(f"FUNC:RAMP:SYMM {value}")
+
+    def get_function_ramp_symmetry(self) -> str:
+        return self._intf.query("FUNC:RAMP:SYMM?")
+
+    def set_voltage_offset(self, value: float) -> None:
+        self._awg.offset_v = float(value)
+        self._intf.write(f"VOLT:OFFS {value}")
+
+    def get_voltage_offset(self) -> str:
+        return self._intf.query("VOLT:OFFS?")
+
+    def get_function(self) -> str:
+        return self._intf.query("FUNC?")
+
+    def get_frequency(self) -> str:
+        return self._intf.query("FREQ?")
+
+    def get_voltage_high(self) -> str:
+        return self._intf.query("VOLT:HIGH?")
+
+    def get_voltage_low(self) -> str:
+        return self._intf.query("VOLT:LOW?")
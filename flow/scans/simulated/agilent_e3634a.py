@@ -0,0 +1,80 @@
+"""Simulated Agilent E3634A supplying the input common-mode reference."""
+
+from __future__ import annotations
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+from flow.scans.simulated.bench import VIN_CM_SUPPLY_CURRENT_A
+
+E3634A_RANGES_V = {"P25V": 25.0, "P50V": 50.0}
+
+
+def _number(value: float) -> str:
+    return f"{value:+.12E}"
+
+
+class SimulatedAgilentE3634a(HardwareLayer):
+    """Vin_cm supply whose output sets the bench's input common mode."""
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        intf.device = self
+        self._replies = {
+            "*IDN?": lambda: "HEWLETT-PACKARD,E3634A,0,SIMULATED",
+            "OUTP?": lambda: str(int(self._intf.bench.vin_cm_supply_enabled)),
+            "VOLT?": lambda: _number(self._intf.bench.vin_cm_supply_v),
+            "VOLT:RANG?": lambda: self._intf.bench.vin_cm_supply_range,
+            "CURR?": lambda: _number(self._intf.bench.vin_cm_supply_current_limit_a),
+            "MEAS:VOLT?": lambda: _number(
+                self._intf.bench.vin_cm_supply_v if self._intf.bench.vin_cm_supply_enabled else 0.0
+            ),
+            "MEAS:CURR?": lambda: _number(VIN_CM_SUPPLY_CURRENT_A if self._intf.bench.vin_cm_supply_enabled else 0.0),
+        }
+
+    def write(self, command: str) -> None:
+        pass
+
+    def query(self, command: str) -> str:
+        return self._replies[command]()
+
+    def get_name(self) -> str:
+        return self._intf.query("*IDN?")
+
+    def set_enable(self, value) -> None:
+        self._intf.bench.vin_cm_supply_enabled = bool(int(value))
+        self._intf.write(f"OUTP {int(value)}")
+
+    def get_enable(self) -> str:
+        return self._intf.query("OUTP?")
+
+    def set_voltage(self, value: float) -> None:
+        value = float(value)
+        if not 0.0 <= value <= E3634A_RANGES_V[self._intf.bench.vin_cm_supply_range]:
+            raise ValueError(f"{value} V is outside the {self._intf.bench.vin_cm_supply_range} range")
+        self._intf.bench.vin_cm_supply_v = value
+        self._intf.write(f"VOLT {value}")
+
+    def get_set_voltage(self) -> str:
+        return self._intf.query("VOLT?")
+
+    def set_voltage_range(self, value: str) -> None:
+        if value not in E3634A_RANGES_V:
+            raise ValueError(f"unknown E3634A range {value!r}")
+        self._intf.bench.vin_cm_supply_range = value
+        self._intf.write(f"VOLT:RANG {value}")
+
+    def get_voltage_range(self) -> str:
+        return self._intf.query("VOLT:RANG?")
+
+    def set_current_limit(self, value: float) -> None:
+        self._intf.bench.vin_cm_supply_current_limit_a = float(value)
+        self._intf.write(f"CURR {value}")
+
+    def get_current_limit(self) -> str:
+        return self._intf.query("CURR?")
+
+    def get_voltage(self) -> str:
+        return self._intf.query("MEAS:VOLT?")
+
+    def get_current(self) -> str:
+        return self._intf.query("MEAS:CURR?")
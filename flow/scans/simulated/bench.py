@@ -0,0 +1,600 @@
+"""Shared state behind the simulated Basil transfer layers and drivers.
+
+The scans open separate ``Dut`` objects for the FPGA, AWG, Vin_cm supply,
+SMUs, and scope, and reopen them for every point. The simulated drivers in this
+package therefore keep their instrument state in one :class:`SimulatedBench`
+per process, looked up by name with :func:`get_bench`. The bench couples the
+instruments the way the board does: the AWG and Vin_cm supply set the ADC input
+through the inverse of the board's input calibration, the SPI image selects the
+observed ADC and its CDAC states, the Si570 and PLL divider set the sequencer
+clock, and the behavioral ``SAR_ADC`` model supplies every FastRX decision.
+
+Sequencer runs advance in wall-clock time, so ``is_done()`` and ``FIFO_SIZE``
+behave like the FPGA's. FastRX words are converted when the FIFO is read, which
+keeps model time out of the scans' capture timeouts. Every transfer-layer
+access waits for its configured latency through :meth:`SimulatedBench.wait`,
+which also adds the seconds to ``ledger`` by phase so a benchmark can attribute
+scan time to FPGA, instrument, scope, and model work.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import monotonic, perf_counter, sleep
+
+import numpy as np
+from bitarray import bitarray
+
+from flow.adc.behavioral import SAR_ADC
+from flow.analysis.measure import pack_bout
+from flow.scans.params import load_board_map
+from flow.scans.plldrp import PLL_DIVIDERS, calculate_pll_frequency
+from flow.scans.scan_adc import convert_vdiff_input_to_awg_supply
+from flow.scans.scan_behavioral import build_frida_params
+
+DEFAULT_BENCH_NAME = "frida"
+SEQUENCER_WORD_BYTES = 8
+SEQUENCER_SYMBOLS_PER_WORD = 8
+SEQUENCER_LANES = ("INIT", "SAMP", "COMP", "LOGIC")
+SEQUENCER_RX_SEN_BYTE = 4
+FASTRX_IDENTIFIER = 0x1
+SPI_IMAGE_BITS = 180
+SPI_MUX_LSB = 176
+SPI_ADC_CONFIG_BASE = 64
+SPI_ADC_CONFIG_BITS = 7
+SPI_ADC_FIELDS = ("en_init", "en_samp_p", "en_samp_n", "en_comp", "en_update", "dac_mode", "dac_diffcaps")
+SPI_DAC_FIELDS = {
+    "dac_astate_p": (63, 48),
+    "dac_bstate_p": (47, 32),
+    "dac_astate_n": (31, 16),
+    "dac_bstate_n": (15, 0),
+}
+CHIP_RAILS = ("VDD_A", "VDD_D", "VDD_DAC")
+# Quiescent rail currents and their increase per million conversions per
+# second while the sequencer repeats; both stay far below SMU compliance.
+RAIL_STATIC_CURRENT_A = {"VDD_A": 18.0e-6, "VDD_D": 6.0e-6, "VDD_DAC": 2.0e-6}
+RAIL_ACTIVE_CURRENT_A_PER_MSPS = {"VDD_A": 4.0e-6, "VDD_D": 9.0e-6, "VDD_DAC": 12.0e-6}
+SMU_CURRENT_NOISE_A = 5.0e-9
+SMU_VOLTAGE_NOISE_V = 20.0e-6
+VIN_CM_SUPPLY_CURRENT_A = 1.0e-6
+# The AWG-to-Vdiff inverse is tabulated once per common mode on this grid.
+INPUT_INVERSION_POINTS = 2001
+
+
+@dataclass(frozen=True, slots=True)
+class ChipConfiguration:
+    """Observed ADC, its slow-control bits, and the CDAC states of one SPI image."""
+
+    observed_adc: int
+    adc_config: Mapping[str, int]
+    dac_states: Mapping[str, tuple[int, ...]]
+
+
+def decode_spi_image(image: bytes) -> ChipConfiguration:
+    """Invert ``convert_params_to_spi_fmt()`` for the fields the bench models."""
+
+    readback = bitarray()
+    readback.frombytes(bytes(image))
+    if len(readback) < SPI_IMAGE_BITS:
+        raise ValueError(f"SPI image must hold {SPI_IMAGE_BITS} bits, got {len(readback)}")
+    bits = readback[:SPI_IMAGE_BITS][::-1]
+    observed_adc = int(bits[SPI_MUX_LSB:SPI_IMAGE_BITS][::-1].to01(), 2)
+    base = SPI_ADC_CONFIG_BASE + SPI_ADC_CONFIG_BITS * observed_adc
+    return ChipConfiguration(
+        observed_adc=observed_adc,
+        adc_config={field: int(bits[base + offset]) for offset, field in enumerate(SPI_ADC_FIELDS)},
+        dac_states={
+            field: tuple(int(bit) for bit in bits[lsb : msb + 1][::-1]) for field, (msb, lsb) in SPI_DAC_FIELDS.items()
+        },
+    )
+
+
+class AwgOutput:
+    """Programmed 33250A output, evaluated at monotonic-clock times."""
+
+    def __init__(self) -> None:
+        self.function = "DC"
+        self.frequency_hz = 1.0e3
+        self.amplitude_vpp = 0.1
+        self.offset_v = 0.0
+        self.symmetry_percent = 100.0
+        self.enabled = False
+        self.load = "INF"
+        self.range_auto = True
+        self.phase_origin_s = monotonic()
+
+    def voltage_v(self, times_s: np.ndarray) -> np.ndarray:
+        """Return the output voltage at ``times_s``; a disabled output reads zero."""
+
+        times_s = np.asarray(times_s, dtype=np.float64)
+        if not self.enabled:
+            return np.zeros_like(times_s)
+        if self.function == "DC":
+            return np.full_like(times_s, self.offset_v)
+        phase = np.mod(self.frequency_hz * (times_s - self.phase_origin_s), 1.0)
+        if self.function == "SIN":
+            return self.offset_v + self.amplitude_vpp / 2.0 * np.sin(2.0 * np.pi * phase)
+        rising_fraction = self.symmetry_percent / 100.0
+        low_v = self.offset_v - self.amplitude_vpp / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = low_v + self.amplitude_vpp * phase / rising_fraction
+            falling = low_v + self.amplitude_vpp * (1.0 - (phase - rising_fraction) / (1.0 - rising_fraction))
+        return np.where(phase < rising_fraction, rising, falling)
+
+
+class SmuChannel:
+    """Source state of one Keithley 2400 driving a chip rail."""
+
+    def __init__(self, rail: str) -> None:
+        self.rail = rail
+        self.enabled = False
+        self.voltage_v = 0.0
+        self.voltage_range_v = 21.0
+        self.current_limit_a = 105.0e-6
+        self.current_nplc = 1.0
+        self.autozero = False
+        self.four_wire = False
+        self.source_mode = "VOLT"
+
+
+class SequencerRun:
+    """One started sequencer run and the FastRX words it produces."""
+
+    def __init__(
+        self,
+        bench: SimulatedBench,
+        *,
+        started_at: float,
+        period_s: float,
+        repeats: int,
+        lanes: Mapping[str, np.ndarray],
+        rx_sen_words: np.ndarray,
+        captured: bool,
+        first_frame: int,
+    ) -> None:
+        self.bench = bench
+        self.started_at = started_at
+        self.period_s = period_s
+        self.repeats = repeats
+        self.lanes = lanes
+        self.rx_sen_words = rx_sen_words
+        self.stopped_at: float | None = None
+        self.first_frame = first_frame
+        self.read_count = 0
+        self.bits_per_word = int(np.count_nonzero(rx_sen_words))
+        self.mode: str | None = None
+        if self.bits_per_word:
+            if np.count_nonzero(np.diff(rx_sen_words.astype(np.int8), prepend=0, append=0) == 1) != 1:
+                raise ValueError("simulated FastRX supports one contiguous RX_SEN run per sequence")
+            if self.bits_per_word == bench.fastrx_data_size:
+                self.mode = "adc"
+            elif self.bits_per_word == 1:
+                self.mode = "comparator"
+            else:
+                raise ValueError(
+                    f"simulated FastRX captures 1 or {bench.fastrx_data_size} bits per sequence, "
+                    f"got {self.bits_per_word}"
+                )
+        self.captured = captured and self.mode is not None
+        # Freeze the analog state at the start; the scans never reprogram it
+        # while a capture is being read out.
+        self.awg = copy.copy(bench.awg)
+        self.vin_cm_supply_v = bench.vin_cm_supply_v if bench.vin_cm_supply_enabled else None
+        self.chip = decode_spi_image(bench.spi_image)
+        self.powered = bench.chip_powered()
+        self.vdd_dac_v = bench.rail("VDD_DAC").voltage_v
+        # The first conversion is decided at once so the scope record and the
+        # FIFO show the same decisions.
+        self.first_decisions = (
+            None if self.mode is None else bench.convert_decisions(self, self.times_s(np.zeros(1)))[0]
+        )
+
+    @property
+    def done_at(self) -> float:
+        """Return when the last repeat finishes; continuous runs never finish."""
+
+        if self.repeats == 0:
+            return math.inf
+        return self.started_at + self.repeats * self.period_s
+
+    def times_s(self, index: np.ndarray) -> np.ndarray:
+        """Return the monotonic time at which each indexed repeat is decided."""
+
+        return self.started_at + (np.asarray(index, dtype=np.float64) + 1.0) * self.period_s
+
+    def produced(self, now: float) -> int:
+        """Return how many sequence repeats finished by ``now``."""
+
+        if self.stopped_at is not None:
+            now = min(now, self.stopped_at)
+        if now >= self.done_at:
+            return self.repeats
+        return max(0, math.floor((now - self.started_at) / self.period_s))
+
+    def convert(self, start: int, stop: int) -> np.ndarray:
+        """Return the framed FastRX words of repeats ``start..stop``."""
+
+        if stop <= start:
+            return np.zeros(0, dtype=np.uint32)
+        assert self.first_decisions is not None
+        index = np.arange(start, stop, dtype=np.int64)
+        if start == 0:
+            decisions = np.vstack(
+                (self.first_decisions[None, :], self.bench.convert_decisions(self, self.times_s(index[1:])))
+            )
+        else:
+            decisions = self.bench.convert_decisions(self, self.times_s(index))
+        data_size = self.bench.fastrx_data_size
+        frames = ((self.first_frame + index) % (1 << (28 - data_size))).astype(np.uint32)
+        return (np.uint32(FASTRX_IDENTIFIER) << np.uint32(28)) | (frames << np.uint32(data_size)) | pack_bout(decisions)
+
+
+class SimulatedBench:
+    """Instrument, FPGA, and chip state shared by every simulated ``Dut``."""
+
+    def __init__(
+        self,
+        name: str = DEFAULT_BENCH_NAME,
+        *,
+        board_id: str = "00",
+        seed: int = 0,
+        latency_scale: float = 1.0,
+    ) -> None:
+        if not math.isfinite(latency_scale) or latency_scale < 0.0:
+            raise ValueError("latency_scale must be finite and non-negative")
+        board_map = load_board_map()
+        self.name = name
+        self.board_id = board_id
+        self.board = board_map["boards"][board_id]
+        self.adc_flavors = board_map["adc_flavors"]
+        self.latency_scale = latency_scale
+        self.rng = np.random.default_rng(seed)
+        self.ledger: defaultdict[str, float] = defaultdict(float)
+
+        self.awg = AwgOutput()
+        self.vin_cm_supply_v = 0.0
+        self.vin_cm_supply_enabled = False
+        self.vin_cm_supply_current_limit_a = 0.0
+        self.vin_cm_supply_range = "P25V"
+        self.rails: dict[str, SmuChannel] = {}
+
+        self.gpio_outputs: dict[str, int] = defaultdict(int)
+        self.comp_idelay_taps = 0
+        self.si570_frequency_hz = 200.0e6
+        self.pll_divider_n = 2
+        self.pll_applied_toggle = 0
+        self.pll_error = False
+        self.pll_settled_at = 0.0
+        self.spi_image = bytes(math.ceil(SPI_IMAGE_BITS / 8))
+        self.spi_readback = self.spi_image
+
+        self.sequencer_memory = bytearray()
+        self.sequencer_size = 0
+        self.sequencer_repeat = 1
+        self.sequencer_clk_divide = 1
+        self.sequencer_en_ext_start = False
+        self.sequencer_run: SequencerRun | None = None
+        self.fastrx_enabled = False
+        self.fastrx_data_size = 17
+        self.fastrx_next_frame = 0
+        self.fifo_runs: list[SequencerRun] = []
+        self.fifo_latency_s = 0.0
+
+        self.scope_armed = False
+        self.scope_record: SequencerRun | None = None
+        self.scope_acquisitions = 0
+        self.scope_settings: dict[tuple[str, int | None], str] = {}
+
+        self._models: dict[int, SAR_ADC] = {}
+        self._vin_diff_tables: dict[float, tuple[np.ndarray, np.ndarray]] = {}
+
+    def wait(self, phase: str, seconds: float) -> None:
+        """Spend one interface latency and book it to ``phase``."""
+
+        seconds *= self.latency_scale
+        if seconds > 0.0:
+            sleep(seconds)
+        self.ledger[phase] += seconds
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """Book the wall time of the enclosed work to ``phase``."""
+
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.ledger[phase] += perf_counter() - started
+
+    def rail(self, rail: str) -> SmuChannel:
+        """Return the source state of ``rail``, creating it switched off."""
+
+        if rail not in self.rails:
+            self.rails[rail] = SmuChannel(rail)
+        return self.rails[rail]
+
+    def chip_powered(self) -> bool:
+        """Return whether every chip rail is sourced above half its nominal 1.2 V."""
+
+        return all(
+            rail in self.rails and self.rails[rail].enabled and self.rails[rail].voltage_v > 0.6 for rail in CHIP_RAILS
+        )
+
+    def conversion_rate_hz(self) -> float:
+        """Return the repeat rate of a sequencer run in progress, else zero."""
+
+        run = self.sequencer_run
+        if run is None or run.stopped_at is not None or monotonic() >= run.done_at:
+            return 0.0
+        return 1.0 / run.period_s
+
+    def rail_current_a(self, rail: str) -> float:
+        """Return one noisy rail-current reading from the quiescent and active load."""
+
+        channel = self.rail(rail)
+        if not channel.enabled or not self.chip_powered():
+            return float(self.rng.normal(0.0, SMU_CURRENT_NOISE_A))
+        current_a = RAIL_STATIC_CURRENT_A[rail] + RAIL_ACTIVE_CURRENT_A_PER_MSPS[rail] * self.conversion_rate_hz() / 1e6
+        return float(current_a + self.rng.normal(0.0, SMU_CURRENT_NOISE_A))
+
+    def rail_voltage_v(self, rail: str) -> float:
+        """Return one noisy rail-voltage reading; an output that is off reads zero."""
+
+        channel = self.rail(rail)
+        if not channel.enabled:
+            return 0.0
+        return float(channel.voltage_v + self.rng.normal(0.0, SMU_VOLTAGE_NOISE_V))
+
+    def sequencer_frequency_hz(self) -> float:
+        """Return the sequencer word clock set by the Si570 and PLL divider."""
+
+        return calculate_pll_frequency(self.pll_divider_n, input_frequency_hz=self.si570_frequency_hz)[0]
+
+    def request_pll_divider(self, divider_n: int, apply_toggle: int, *, lock_s: float) -> None:
+        """Apply a GPIO2 divider command once its toggle differs from the acknowledgement."""
+
+        if apply_toggle == self.pll_applied_toggle:
+            return
+        self.pll_applied_toggle = apply_toggle
+        self.pll_error = divider_n not in PLL_DIVIDERS
+        if not self.pll_error:
+            self.pll_divider_n = divider_n
+        self.pll_settled_at = monotonic() + lock_s * self.latency_scale
+
+    def sequencer_lanes(self) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        """Return the serialized lane symbols and RX_SEN word flags of one repeat."""
+
+        memory = np.frombuffer(bytes(self.sequencer_memory), dtype=np.uint8)
+        words = memory[: self.sequencer_size * SEQUENCER_WORD_BYTES]
+        if len(words) != self.sequencer_size * SEQUENCER_WORD_BYTES:
+            raise ValueError(f"sequencer size {self.sequencer_size} exceeds the programmed memory")
+        words = words.reshape(self.sequencer_size, SEQUENCER_WORD_BYTES)
+        lanes = {
+            lane: np.unpackbits(words[:, index, None], axis=1, bitorder="little").reshape(-1)
+            for index, lane in enumerate(SEQUENCER_LANES)
+        }
+        return lanes, words[:, SEQUENCER_RX_SEN_BYTE] & 1
+
+    def start_sequencer(self) -> None:
+        """Start one sequencer run and queue its FastRX capture."""
+
+        now = monotonic()
+        self.stop_sequencer(now)
+        if self.sequencer_size <= 0:
+            raise ValueError("sequencer size must be set before start")
+        lanes, rx_sen_words = self.sequencer_lanes()
+        run = SequencerRun(
+            self,
+            started_at=now,
+            period_s=self.sequencer_size * self.sequencer_clk_divide / self.sequencer_frequency_hz(),
+            repeats=self.sequencer_repeat,
+            lanes=lanes,
+            rx_sen_words=rx_sen_words,
+            captured=self.fastrx_enabled,
+            first_frame=self.fastrx_next_frame,
+        )
+        self.sequencer_run = run
+        if run.captured:
+            self.fifo_runs.append(run)
+        if self.scope_armed and any(np.any(lane) for lane in lanes.values()):
+            self.scope_armed = False
+            self.scope_record = run
+            self.scope_acquisitions += 1
+
+    def stop_sequencer(self, now: float | None = None) -> None:
+        """Stop the current run where it is and advance the FastRX frame counter."""
+
+        run = self.sequencer_run
+        if run is None:
+            return
+        now = monotonic() if now is None else now
+        if run.stopped_at is None and now < run.done_at:
+            run.stopped_at = now
+        if run.captured:
+            self.fastrx_next_frame = run.first_frame + run.produced(now)
+        self.sequencer_run = None
+
+    def sequencer_done(self) -> bool:
+        """Return the seq_gen READY flag."""
+
+        run = self.sequencer_run
+        return run is None or run.stopped_at is not None or monotonic() >= run.done_at
+
+    def reset_fastrx(self) -> None:
+        """Restart the FastRX frame counter at zero."""
+
+        self.fastrx_next_frame = 0
+
+    def fifo_available(self, now: float | None = None) -> list[tuple[SequencerRun, int]]:
+        """Return each queued run with the number of words the host has received."""
+
+        now = monotonic() if now is None else now
+        return [(run, run.produced(now - self.fifo_latency_s)) for run in self.fifo_runs]
+
+    def fifo_size_bytes(self) -> int:
+        """Return the bytes received by the host and not yet read."""
+
+        return 4 * sum(available - run.read_count for run, available in self.fifo_available())
+
+    def read_fifo(self) -> np.ndarray:
+        """Convert and return every received FastRX word."""
+
+        chunks = []
+        for run, available in self.fifo_available():
+            chunks.append(run.convert(run.read_count, available))
+            run.read_count = available
+        self._drop_drained_runs()
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint32)
+
+    def reset_fifo(self) -> None:
+        """Discard every received word."""
+
+        for run, available in self.fifo_available():
+            run.read_count = available
+        self._drop_drained_runs()
+
+    def _drop_drained_runs(self) -> None:
+        # A run that is no longer current has a finite final count.
+        self.fifo_runs = [
+            run for run in self.fifo_runs if run is self.sequencer_run or run.read_count < run.produced(math.inf)
+        ]
+
+    def adc_model(self, adc_index: int) -> SAR_ADC:
+        """Return the behavioral model of one channel with its accepted comparator calibration."""
+
+        if adc_index not in self._models:
+            weights = self.adc_flavors[self.board["adc_channels"][adc_index]]["cdac_weights"]
+            calibration = self.comparator_calibration(adc_index)
+            self._models[adc_index] = self._seeded(
+                lambda: SAR_ADC(
+                    build_frida_params(
+                        weights,
+                        comparator_offset=calibration["offset_v"],
+                        comparator_noise=calibration["noise_sigma_v"],
+                    )
+                )
+            )
+        return self._models[adc_index]
+
+    def comparator_calibration(self, adc_index: int) -> dict[str, float]:
+        """Return the board's comparator offset and noise, or an ideal comparator."""
+
+        calibrations = self.board.get("comparator_calibration", {})
+        calibration = calibrations.get(adc_index, calibrations.get(str(adc_index), {}))
+        return {
+            "offset_v": float(calibration.get("offset_v", 0.0)),
+            "noise_sigma_v": float(calibration.get("noise_sigma_v", 0.0)),
+        }
+
+    def adc_input_v(
+        self,
+        awg: AwgOutput,
+        vin_cm_supply_v: float | None,
+        times_s: np.ndarray,
+    ) -> tuple[np.ndarray, float]:
+        """Return the ADC differential input and common mode seen at ``times_s``."""
+
+        calibration = self.board["input_calibration"]
+        if vin_cm_supply_v is None:
+            return np.zeros(len(times_s)), 0.0
+        supply_common_modes = calibration.get("vin_cm_supply_common_mode_v")
+        if supply_common_modes is None:
+            vin_cm_v = (vin_cm_supply_v - float(calibration["vin_cm_supply_offset_v"])) / float(
+                calibration["vin_cm_supply_gain"]
+            )
+        else:
+            vin_cm_v = float(np.interp(vin_cm_supply_v, calibration["vin_cm_supply_set_v"], supply_common_modes))
+        vin_cm_v = min(max(vin_cm_v, float(calibration["minimum_vin_cm_v"])), float(calibration["maximum_vin_cm_v"]))
+        if not awg.enabled:
+            return np.zeros(len(times_s)), vin_cm_v
+        key = round(vin_cm_v, 9)
+        if key not in self._vin_diff_tables:
+            maximum_abs_vdiff_v = float(calibration["maximum_abs_vdiff_v"])
+            vin_diff_grid_v = np.linspace(-maximum_abs_vdiff_v, maximum_abs_vdiff_v, INPUT_INVERSION_POINTS)
+            awg_grid_v = np.asarray(
+                [convert_vdiff_input_to_awg_supply(float(v), vin_cm_v, calibration)[0] for v in vin_diff_grid_v]
+            )
+            order = np.argsort(awg_grid_v)
+            self._vin_diff_tables[key] = (awg_grid_v[order], vin_diff_grid_v[order])
+        awg_grid_v, vin_diff_grid_v = self._vin_diff_tables[key]
+        return np.interp(awg.voltage_v(times_s), awg_grid_v, vin_diff_grid_v), vin_cm_v
+
+    def cdac_step_v(self, run: SequencerRun) -> float:
+        """Return the differential top-plate step from the A to the B CDAC state."""
+
+        adc_index = run.chip.observed_adc
+        flavor = self.adc_flavors[self.board["adc_channels"][adc_index]]
+        weights = np.asarray(flavor["cdac_weights"], dtype=np.float64)
+        total_weights = 65.0 * np.ceil(weights / 64.0)
+        switched = weights if run.chip.adc_config["dac_diffcaps"] else total_weights
+        states = {field: np.asarray(value, dtype=np.float64) for field, value in run.chip.dac_states.items()}
+        imbalance = switched @ (states["dac_bstate_p"] - states["dac_astate_p"]) - switched @ (
+            states["dac_bstate_n"] - states["dac_astate_n"]
+        )
+        denominator = total_weights.sum() + float(flavor.get("cdac_topplate_parasitic_weight", 0.0))
+        return float(run.vdd_dac_v * imbalance / denominator)
+
+    def convert_decisions(self, run: SequencerRun, times_s: np.ndarray) -> np.ndarray:
+        """Return the captured decisions of ``run`` at the given conversion times."""
+
+        with self.timed("model"):
+            if not run.powered:
+                return np.zeros((len(times_s), run.bits_per_word), dtype=np.uint8)
+            vin_diff_v, vin_cm_v = self.adc_input_v(run.awg, run.vin_cm_supply_v, times_s)
+            adc_index = run.chip.observed_adc
+            if run.mode == "comparator":
+                calibration = self.comparator_calibration(adc_index)
+                noise_v = self.rng.normal(0.0, calibration["noise_sigma_v"], len(times_s))
+                overdrive_v = vin_diff_v + self.cdac_step_v(run) - calibration["offset_v"] + noise_v
+                return (overdrive_v > 0.0).astype(np.uint8)[:, None]
+            model = self.adc_model(adc_index)
+            bout, _codes, _energy = self._seeded(
+                lambda: model.sample_and_convert_batch(
+                    vin_cm_v + vin_diff_v / 2.0,
+                    vin_cm_v - vin_diff_v / 2.0,
+                    do_normalize_result=False,
+                )
+            )
+            return np.asarray(bout, dtype=np.uint8)
+
+    def _seeded(self, build):
+        # SAR_ADC draws from NumPy's global stream; seed it from the bench
+        # generator and restore the caller's state afterwards.
+        global_state = np.random.get_state()
+        np.random.seed(int(self.rng.integers(2**32)))
+        try:
+            return build()
+        finally:
+            np.random.set_state(global_state)
+
+
+_BENCHES: dict[str, SimulatedBench] = {}
+
+
+def get_bench(name: str = DEFAULT_BENCH_NAME, **options) -> SimulatedBench:
+    """Return the process-wide bench ``name``, creating it with ``options`` on first use."""
+
+    if name not in _BENCHES:
+        _BENCHES[name] = SimulatedBench(name, **options)
+    return _BENCHES[name]
+
+
+def open_bench(init: Mapping[str, object]) -> SimulatedBench:
+    """Return the bench named in a transfer layer's ``init`` section."""
+
+    return get_bench(
+        str(init.get("bench", DEFAULT_BENCH_NAME)),
+        board_id=str(init.get("board_id", "00")),
+        seed=int(init.get("seed", 0)),
+    )
+
+
+def discard_bench(name: str = DEFAULT_BENCH_NAME) -> None:
+    """Forget bench ``name`` so the next ``get_bench()`` starts from power-on state."""
+
+    _BENCHES.pop(name, None)
@@ -0,0 +1,39 @@
+"""Simulated fast_spi_rx receiver framing COMP_OUT decisions."""
+
+from __future__ import annotations
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+
+class SimulatedFastSpiRx(HardwareLayer):
+    """FastRX control registers; the words themselves come from the bench's sequencer runs.
+
+    ``init`` takes ``data_size``, the decision bits per FastRX word (17 in the
+    FRIDA bitstream).
+    """
+
+    def init(self) -> None:
+        super().init()
+        self._intf.bench.fastrx_data_size = int(self._init.get("data_size", 17))
+
+    def reset(self) -> None:
+        self._intf.access()
+        self._intf.bench.reset_fastrx()
+
+    def set_en(self, value: bool) -> None:
+        self._intf.access()
+        self._intf.bench.fastrx_enabled = bool(value)
+
+    def get_en(self) -> bool:
+        self._intf.access()
+        return self._intf.bench.fastrx_enabled
+
+    def get_size(self) -> int:
+        self._intf.access()
+        return self._intf.bench.fastrx_data_size
+
+    def get_lost_count(self) -> int:
+        """Return zero; the simulated FIFO never overflows."""
+
+        self._intf.access()
+        return 0
@@ -0,0 +1,97 @@
+"""Simulated GPIO blocks for the board control, comparator IDELAY, and PLL DRP registers."""
+
+from __future__ import annotations
+
+from array import array
+from time import monotonic
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+COMP_IDELAY_TAPS_MASK = 0x1F
+COMP_IDELAY_LOAD_BIT = 5
+COMP_IDELAY_RDY_BIT = 6
+PLL_REQUEST_N_MASK = 0x1F
+PLL_APPLY_TOGGLE_BIT = 5
+PLL_APPLIED_TOGGLE_BIT = 7
+PLL_BUSY_BIT = 8
+PLL_LOCKED_BIT = 9
+PLL_ERROR_BIT = 10
+PLL_ACTIVE_N_LSB = 11
+# Bits the FPGA drives; everything else in the register reads back as written.
+GPIO_INPUT_MASKS = {
+    "control": 0,
+    "comp_idelay": 1 << COMP_IDELAY_RDY_BIT,
+    "pll_drp": ~((1 << (PLL_APPLY_TOGGLE_BIT + 1)) - 1),
+}
+
+
+class SimulatedGpio(HardwareLayer):
+    """GPIO register whose ``role`` ties writes and input bits to the simulated bench.
+
+    ``init`` takes ``role`` (``control``, ``comp_idelay``, or ``pll_drp``) and,
+    for ``pll_drp``, ``lock_s``, the time the PLL stays busy after a divider
+    change.
+    """
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        self._size = int(conf.get("size", 8))
+        self._width = (self._size + 7) // 8
+        self._role = "control"
+        self._lock_s = 0.0
+
+    def init(self) -> None:
+        super().init()
+        self._role = str(self._init.get("role", "control"))
+        if self._role not in GPIO_INPUT_MASKS:
+            raise ValueError(f"unknown simulated GPIO role {self._role!r}")
+        self._lock_s = float(self._init.get("lock_s", 0.0))
+
+    @property
+    def _bench(self):
+        return self._intf.bench
+
+    def reset(self) -> None:
+        self._intf.access()
+        self._bench.gpio_outputs[self.name] = 0
+
+    def set_output_en(self, value) -> None:
+        self._intf.access()
+
+    def get_output_en(self) -> array:
+        self._intf.access()
+        return array("B", [0xFF] * self._width)
+
+    def set_data(self, data) -> None:
+        self._intf.access()
+        value = int.from_bytes(bytes(data), "big") & ~GPIO_INPUT_MASKS[self._role] & ((1 << self._size) - 1)
+        self._bench.gpio_outputs[self.name] = value
+        if self._role == "comp_idelay" and value >> COMP_IDELAY_LOAD_BIT & 1:
+            self._bench.comp_idelay_taps = value & COMP_IDELAY_TAPS_MASK
+        elif self._role == "pll_drp":
+            self._bench.request_pll_divider(
+                value & PLL_REQUEST_N_MASK,
+                value >> PLL_APPLY_TOGGLE_BIT & 1,
+                lock_s=self._lock_s,
+            )
+
+    def get_data(self) -> array:
+        self._intf.access()
+        value = self._bench.gpio_outputs[self.name] | self._input_bits()
+        return array("B", (value & ((1 << self._size) - 1)).to_bytes(self._width, "big"))
+
+    def _input_bits(self) -> int:
+        if self._role == "comp_idelay":
+            return 1 << COMP_IDELAY_RDY_BIT
+        if self._role == "pll_drp":
+            bench = self._bench
+            busy = monotonic() < bench.pll_settled_at
+            locked = not busy and not bench.pll_error
+            return (
+                bench.pll_applied_toggle << PLL_APPLIED_TOGGLE_BIT
+                | int(busy) << PLL_BUSY_BIT
+                | int(locked) << PLL_LOCKED_BIT
+                | int(bench.pll_error) << PLL_ERROR_BIT
+                | bench.pll_divider_n << PLL_ACTIVE_N_LSB
+            )
+        return 0
@@ -0,0 +1,116 @@
+"""Simulated Keithley 2400 SMU sourcing one chip rail."""
+
+from __future__ import annotations
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+# Autozero measures the reference and zero alongside every reading.
+AUTOZERO_INTEGRATIONS = 2
+
+
+def _number(value: float) -> str:
+    return f"{value:+.12E}"
+
+
+class SimulatedKeithley2400(HardwareLayer):
+    """SMU state kept in the bench rail named by ``init: rail``; ``line_frequency_hz`` sets the PLC."""
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        intf.device = self
+        self._replies = {
+            "*IDN?": lambda: f"KEITHLEY INSTRUMENTS INC.,MODEL 2400,SIMULATED {self._channel.rail},C30",
+            "OUTP?": lambda: str(int(self._channel.enabled)),
+            "SOUR:FUNC?": lambda: self._channel.source_mode,
+            "SOUR:VOLT?": lambda: _number(self._channel.voltage_v),
+            "SENS:CURR:PROT?": lambda: _number(self._channel.current_limit_a),
+            "MEAS:VOLT?": lambda: _number(self._intf.bench.rail_voltage_v(self._channel.rail)),
+            "MEAS:CURR?": lambda: _number(self._intf.bench.rail_current_a(self._channel.rail)),
+        }
+
+    def init(self) -> None:
+        super().init()
+        self._line_frequency_hz = float(self._init.get("line_frequency_hz", 50.0))
+
+    @property
+    def _channel(self):
+        return self._intf.bench.rail(self._init["rail"])
+
+    def write(self, command: str) -> None:
+        pass
+
+    def query(self, command: str) -> str:
+        return self._replies[command]()
+
+    def _integration_s(self) -> float:
+        channel = self._channel
+        return channel.current_nplc / self._line_frequency_hz * (AUTOZERO_INTEGRATIONS if channel.autozero else 1)
+
+    def get_name(self) -> str:
+        return self._intf.query("*IDN?")
+
+    def on(self) -> None:
+        self._channel.enabled = True
+        self._intf.write("OUTP ON")
+
+    def off(self) -> None:
+        self._channel.enabled = False
+        self._intf.write("OUTP OFF")
+
+    def get_on(self) -> str:
+        return self._intf.query("OUTP?")
+
+    def source_volt(self) -> None:
+        self._channel.source_mode = "VOLT"
+        self._intf.write("SOUR:FUNC VOLT")
+
+    def get_source_mode(self) -> str:
+        return self._intf.query("SOUR:FUNC?")
+
+    def four_wire_off(self) -> None:
+        self._channel.four_wire = False
+        self._intf.write("SYST:RSEN OFF")
+
+    def four_wire_on(self) -> None:
+        self._channel.four_wire = True
+        self._intf.write("SYST:RSEN ON")
+
+    def set_voltage(self, value: float) -> None:
+        value = float(value)
+        if abs(value) > self._channel.voltage_range_v:
+            raise ValueError(f"{value} V exceeds the {self._channel.voltage_range_v} V source range")
+        self._channel.voltage_v = value
+        self._intf.write(f"SOUR:VOLT {value}")
+
+    def get_source_voltage(self) -> str:
+        return self._intf.query("SOUR:VOLT?")
+
+    def set_voltage_range(self, value: float) -> None:
+        self._channel.voltage_range_v = float(value)
+        self._intf.write(f"SOUR:VOLT:RANG {value}")
+
+    def set_current_limit(self, value: float) -> None:
+        self._channel.current_limit_a = float(value)
+        self._intf.write(f"SENS:CURR:PROT {value}")
+
+    def get_current_limit(self) -> str:
+        return self._intf.query("SENS:CURR:PROT?")
+
+    def current_sense_autorange_on(self) -> None:
+        self._intf.write("SENS:CURR:RANG:AUTO ON")
+
+    def set_current_nplc(self, value: float) -> None:
+        self._channel.current_nplc = float(value)
+        self._intf.write(f"SENS:CURR:NPLC {value}")
+
+    def autozero_on(self) -> None:
+        self._channel.autozero = True
+        self._intf.write("SYST:AZER ON")
+
+    def get_voltage(self) -> str:
+        """Return one voltage reading; the 2400's speed setting is shared by all functions."""
+
+        return self._intf.query("MEAS:VOLT?", busy_s=self._integration_s())
+
+    def get_current(self) -> str:
+        return self._intf.query("MEAS:CURR?", busy_s=self._integration_s())
@@ -0,0 +1,96 @@
+"""Simulated seq_gen sequencer whose runs drive FastRX, the scope trigger, and rail currents."""
+
+from __future__ import annotations
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+
+class SimulatedSeqGen(HardwareLayer):
+    """Sequencer memory and run control stored in the shared simulated bench."""
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        self._mem_size = int(conf.get("mem_size", 8192))
+
+    @property
+    def _bench(self):
+        return self._intf.bench
+
+    def init(self) -> None:
+        super().init()
+        if len(self._bench.sequencer_memory) != self._mem_size:
+            self._bench.sequencer_memory = bytearray(self._mem_size)
+
+    def reset(self) -> None:
+        self._intf.access()
+        self._bench.stop_sequencer()
+
+    def start(self) -> None:
+        self._intf.access()
+        self._bench.start_sequencer()
+
+    def set_size(self, value: int) -> None:
+        self._intf.access()
+        self._bench.sequencer_size = int(value)
+
+    def get_size(self) -> int:
+        self._intf.access()
+        return self._bench.sequencer_size
+
+    def set_clk_divide(self, value: int) -> None:
+        self._intf.access()
+        if int(value) <= 0:
+            raise ValueError("sequencer clock divider must be positive")
+        self._bench.sequencer_clk_divide = int(value)
+
+    def get_clk_divide(self) -> int:
+        self._intf.access()
+        return self._bench.sequencer_clk_divide
+
+    def set_repeat(self, value: int) -> None:
+        self._intf.access()
+        if int(value) < 0:
+            raise ValueError("sequencer repeat must be non-negative")
+        self._bench.sequencer_repeat = int(value)
+
+    def get_repeat(self) -> int:
+        self._intf.access()
+        return self._bench.sequencer_repeat
+
+    def set_en_ext_start(self, value: bool) -> None:
+        self._intf.access()
+        if value:
+            raise ValueError("the simulated sequencer has no external start")
+        self._bench.sequencer_en_ext_start = False
+
+    def get_en_ext_start(self) -> bool:
+        self._intf.access()
+        return self._bench.sequencer_en_ext_start
+
+    def is_done(self) -> bool:
+        self._intf.access()
+        return self._bench.sequencer_done()
+
+    @property
+    def is_ready(self) -> bool:
+        return self.is_done()
+
+    def get_done(self) -> bool:
+        return self.is_done()
+
+    def get_mem_size(self) -> int:
+        return self._mem_size
+
+    def set_data(self, data, addr: int = 0) -> None:
+        data = bytes(data)
+        if addr + len(data) > self._mem_size:
+            raise ValueError(f"Size of data ({len(data)} bytes) is too big for memory ({self._mem_size} bytes)")
+        self._intf.stream(len(data))
+        self._bench.sequencer_memory[addr : addr + len(data)] = data
+
+    def get_data(self, size: int | None = None, addr: int = 0) -> bytes:
+        size = self._mem_size - addr if size is None else size
+        if addr + size > self._mem_size:
+            raise ValueError("Size is too big")
+        self._intf.stream(size)
+        return bytes(self._bench.sequencer_memory[addr : addr + size])
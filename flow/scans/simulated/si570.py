@@ -0,0 +1,31 @@
+"""Simulated Si570 oscillator clocking the sequencer PLL."""
+
+from __future__ import annotations
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+from flow.scans.plldrp import SI570_MAX_FREQUENCY_HZ, SI570_MIN_FREQUENCY_HZ
+
+# Recall, register readback, freeze, six writes, and unfreeze over I2C.
+SI570_FREQUENCY_CHANGE_ACCESSES = 12
+
+
+class SimulatedSi570(HardwareLayer):
+    """Si570 programmed in MHz like Basil's driver; ``init`` takes ``frequency`` and ``factory_frequency``."""
+
+    def init(self) -> None:
+        super().init()
+        self.frequency_change(float(self._init["frequency"]))
+
+    def reset(self) -> None:
+        self._intf.access(3)
+        self._intf.bench.si570_frequency_hz = float(self._init.get("factory_frequency", 156.25)) * 1e6
+
+    def frequency_change(self, freq: float) -> None:
+        """Program the output to ``freq`` MHz."""
+
+        frequency_hz = float(freq) * 1e6
+        if not SI570_MIN_FREQUENCY_HZ <= frequency_hz <= SI570_MAX_FREQUENCY_HZ:
+            raise ValueError("The Si570 reference frequency is too low or to high")
+        self._intf.access(SI570_FREQUENCY_CHANGE_ACCESSES)
+        self._intf.bench.si570_frequency_hz = frequency_hz
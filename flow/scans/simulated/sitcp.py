@@ -0,0 +1,41 @@
+"""Simulated SiTCP transfer layer for the FPGA map."""
+
+from __future__ import annotations
+
+from basil.TL.TransferLayer import TransferLayer
+
+from flow.scans.simulated.bench import open_bench
+
+
+class SimulatedSiTcp(TransferLayer):
+    """Charge SiTCP register and stream latencies to the shared simulated bench.
+
+    ``init`` accepts ``bench``, ``board_id``, ``seed``, ``phase``,
+    ``open_latency_s`` (socket connects and Basil's module initialization),
+    ``register_latency_s`` (one UDP register round trip),
+    ``stream_bytes_per_s`` (TCP FIFO throughput), and ``stream_latency_s``
+    (FastRX word to host buffer).
+    """
+
+    def __init__(self, conf) -> None:
+        super().__init__(conf)
+        self.bench = None
+
+    def init(self) -> None:
+        super().init()
+        self.bench = open_bench(self._init)
+        self.phase = self._init.get("phase", "fpga")
+        self.register_latency_s = float(self._init.get("register_latency_s", 0.0))
+        self.stream_bytes_per_s = float(self._init.get("stream_bytes_per_s", 100.0e6))
+        self.bench.fifo_latency_s = float(self._init.get("stream_latency_s", 0.0))
+        self.bench.wait(self.phase, float(self._init.get("open_latency_s", 0.0)))
+
+    def access(self, count: int = 1) -> None:
+        """Spend ``count`` register round trips."""
+
+        self.bench.wait(self.phase, count * self.register_latency_s)
+
+    def stream(self, size_bytes: int) -> None:
+        """Spend one register round trip plus the TCP transfer of ``size_bytes``."""
+
+        self.bench.wait(self.phase, self.register_latency_s + size_bytes / self.stream_bytes_per_s)
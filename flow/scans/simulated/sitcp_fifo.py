@@ -0,0 +1,27 @@
+"""Simulated SiTCP FIFO carrying the FastRX words."""
+
+from __future__ import annotations
+
+import numpy as np
+from basil.HL.HardwareLayer import HardwareLayer
+
+
+class SimulatedSitcpFifo(HardwareLayer):
+    """Host-side FIFO of the simulated FastRX words with Basil's ``RESET``/``FIFO_SIZE`` items."""
+
+    def __getitem__(self, name: str) -> int | None:
+        if name == "RESET":
+            self._intf.access()
+            self._intf.bench.reset_fifo()
+            return None
+        if name == "FIFO_SIZE":
+            # The background TCP reader already holds these bytes; no register access.
+            return self._intf.bench.fifo_size_bytes()
+        raise KeyError(name)
+
+    def get_data(self) -> np.ndarray:
+        """Return every received FastRX word as little-endian ``uint32``."""
+
+        words = self._intf.bench.read_fifo()
+        self._intf.stream(4 * len(words))
+        return words.astype("<u4")
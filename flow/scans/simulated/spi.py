@@ -0,0 +1,67 @@
+"""Simulated SPI master shifting the FRIDA configuration chain."""
+
+from __future__ import annotations
+
+from array import array
+
+from basil.HL.HardwareLayer import HardwareLayer
+
+
+class SimulatedSpi(HardwareLayer):
+    """SPI master whose readback is the image the chain held before each transfer."""
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        self._mem_bytes = int(conf.get("mem_bytes", 32))
+        self._data = bytearray(self._mem_bytes)
+        self._size = 0
+
+    def reset(self) -> None:
+        self._intf.access()
+
+    def set_size(self, value: int) -> None:
+        self._intf.access()
+        if int(value) > 8 * self._mem_bytes:
+            raise ValueError(f"SPI size {value} exceeds {8 * self._mem_bytes} bits")
+        self._size = int(value)
+
+    def get_size(self) -> int:
+        self._intf.access()
+        return self._size
+
+    def set_data(self, data, addr: int = 0) -> None:
+        data = bytes(data)
+        if addr + len(data) > self._mem_bytes:
+            raise ValueError(f"Size of data ({len(data)} bytes) is too big for memory ({self._mem_bytes} bytes)")
+        self._intf.stream(len(data))
+        self._data[addr : addr + len(data)] = data
+
+    def start(self) -> None:
+        """Shift the programmed bits in; the bits shifted out become the readback."""
+
+        self._intf.access()
+        bench = self._intf.bench
+        bench.spi_readback = bench.spi_image
+        bench.spi_image = bytes(self._data[: (self._size + 7) // 8])
+
+    def is_done(self) -> bool:
+        self._intf.access()
+        return True
+
+    @property
+    def is_ready(self) -> bool:
+        return self.is_done()
+
+    def wait_for_ready(self) -> None:
+        self.is_done()
+
+    def get_mem_size(self) -> int:
+        return self._mem_bytes
+
+    def get_data(self, size: int | None = None, addr: int | None = None) -> array:
+        size = self._mem_bytes if size is None else size
+        if size > self._mem_bytes:
+            raise ValueError("Size is too big")
+        self._intf.stream(size)
+        readback = self._intf.bench.spi_readback[:size]
+        return array("B", readback + bytes(size - len(readback)))
@@ -0,0 +1,193 @@
+"""Simulated Tektronix MSO5 scope probing the input, two sequencer lanes, and COMP_OUT."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from basil.HL.HardwareLayer import HardwareLayer
+
+from flow.scans.scope import ScopeXScale
+from flow.scans.simulated.bench import SEQUENCER_SYMBOLS_PER_WORD
+
+# Probe wiring shared by the ADC and comparator scans.
+SCOPE_INPUT_CHANNEL = 1
+SCOPE_LANE_CHANNELS = {2: "COMP", 3: "LOGIC"}
+SCOPE_COMP_OUT_CHANNEL = 4
+SCOPE_LOGIC_SWING_V = 0.35
+SCOPE_NOISE_V = 1.0e-3
+SCOPE_DIVISIONS = 10
+# Sixteen-bit samples spanning the ten vertical divisions.
+SCOPE_CODES_PER_DIVISION = 65536 / SCOPE_DIVISIONS
+SCOPE_SETTINGS = {
+    "acquire_mode": "ACQuire:MODe",
+    "acquire_stop_after": "ACQuire:STOPAfter",
+    "horizontal_record_length": "HORizontal:RECOrdlength",
+    "horizontal_scale": "HORizontal:SCAle",
+    "coupling": "CH{channel}:COUPling",
+    "vertical_scale": "CH{channel}:SCAle",
+    "vertical_position": "CH{channel}:POSition",
+    "vertical_offset": "CH{channel}:OFFSet",
+    "bandwidth": "CH{channel}:BANdwidth",
+    "trigger_type": "TRIGger:A:TYPe",
+    "trigger_source": "TRIGger:A:EDGE:SOUrce",
+    "trigger_edge_slope": "TRIGger:A:EDGE:SLOpe",
+    "trigger_level": "TRIGger:A:LEVel:CH{channel}",
+    "trigger_mode": "TRIGger:A:MODe",
+}
+SCOPE_DEFAULTS = {
+    "HORIZONTAL:RECORDLENGTH": "10000",
+    "HORIZONTAL:SCALE": "1e-06",
+    "HORIZONTAL:POSITION": "50",
+    "TRIGGER:A:EDGE:SOURCE": "CH1",
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ScopeWaveform:
+    """One channel record in volts with its 16-bit samples."""
+
+    name: str
+    x_scale: ScopeXScale
+    data: np.ndarray
+    raw_data: np.ndarray
+
+
+class SimulatedTektronixOscilloscope(HardwareLayer):
+    """Single-sequence scope triggered by the bench's sequencer starts.
+
+    ``set_<setting>()`` and ``get_<setting>()`` cover the entries of
+    ``SCOPE_SETTINGS`` and go through the interface as SCPI, like raw
+    ``scope._intf.write()`` calls. ``init`` takes ``transfer_bytes_per_s`` for
+    ``get_waveforms()``.
+    """
+
+    def __init__(self, intf, conf) -> None:
+        super().__init__(intf, conf)
+        intf.device = self
+
+    def init(self) -> None:
+        super().init()
+        self._transfer_bytes_per_s = float(self._init.get("transfer_bytes_per_s", 5.0e6))
+
+    @property
+    def _bench(self):
+        return self._intf.bench
+
+    def __getattr__(self, name: str):
+        action, _, setting = name.partition("_")
+        if action not in {"set", "get"} or setting not in SCOPE_SETTINGS:
+            raise AttributeError(name)
+        return partial(self._set_setting if action == "set" else self._get_setting, setting)
+
+    def _set_setting(self, setting: str, value=None, channel: int | None = None) -> None:
+        if setting == "trigger_source":
+            value, channel = f"CH{channel}", None
+        self._intf.write(f"{SCOPE_SETTINGS[setting].format(channel=channel)} {value}")
+
+    def _get_setting(self, setting: str, channel: int | None = None) -> str:
+        return self._intf.query(f"{SCOPE_SETTINGS[setting].format(channel=channel)}?")
+
+    def write(self, command: str) -> None:
+        header, _, value = command.strip().partition(" ")
+        header = header.upper()
+        if header == "ACQUIRE:STATE":
+            if value.upper() in {"1", "ON", "RUN"}:
+                self._bench.scope_armed = True
+                self._bench.scope_record = None
+                self._bench.scope_acquisitions = 0
+            else:
+                self._bench.scope_armed = False
+            return
+        self._bench.scope_settings[header] = value.strip()
+
+    def query(self, command: str) -> str:
+        header = command.strip().removesuffix("?").upper()
+        bench = self._bench
+        if header == "*IDN":
+            return "TEKTRONIX,MSO54,SIMULATED,CF:91.1CT FV:2.0"
+        if header == "TRIGGER:STATE":
+            return "READY" if bench.scope_armed else "SAVE"
+        if header == "ACQUIRE:STATE":
+            return str(int(bench.scope_armed))
+        if header == "ACQUIRE:NUMACQ":
+            return str(bench.scope_acquisitions)
+        return bench.scope_settings.get(header, SCOPE_DEFAULTS.get(header, "0"))
+
+    def get_name(self) -> str:
+        return self._intf.query("*IDN?")
+
+    def set_acquire_state(self, value: str) -> None:
+        self._intf.write(f"ACQuire:STATE {value}")
+
+    def get_acquire_state(self) -> str:
+        return self._intf.query("ACQuire:STATE?")
+
+    def get_number_waveforms(self) -> str:
+        return self._intf.query("ACQuire:NUMACq?")
+
+    def _setting(self, header: str) -> float:
+        header = header.upper()
+        return float(self._bench.scope_settings.get(header, SCOPE_DEFAULTS.get(header, "0")))
+
+    def get_waveforms(self, channels) -> dict[int, ScopeWaveform]:
+        """Return the last triggered record of each requested ``{channel: name}``."""
+
+        run = self._bench.scope_record
+        if run is None:
+            raise RuntimeError("the simulated scope holds no triggered acquisition")
+        record_length = int(self._setting("HORizontal:RECOrdlength"))
+        span_s = SCOPE_DIVISIONS * self._setting("HORizontal:SCAle")
+        x_scale = ScopeXScale(
+            offset=-self._setting("HORizontal:POSition") / 100.0 * span_s,
+            slope=span_s / record_length,
+        )
+        self._intf.wait(self._intf.query_latency_s + 2 * record_length * len(channels) / self._transfer_bytes_per_s)
+
+        symbols = len(run.lanes["INIT"])
+        symbol_period_s = run.period_s / symbols
+        trigger_source = self._bench.scope_settings.get("TRIGGER:A:EDGE:SOURCE", "CH1").upper()
+        trigger_lane = SCOPE_LANE_CHANNELS.get(int(trigger_source.removeprefix("CH")))
+        trigger_symbol = 0
+        if trigger_lane is not None:
+            rising = np.flatnonzero(np.diff(run.lanes[trigger_lane].astype(np.int8), prepend=0) == 1)
+            trigger_symbol = int(rising[0]) if len(rising) else 0
+        elapsed_s = trigger_symbol * symbol_period_s + x_scale.offset + np.arange(record_length) * x_scale.slope
+        symbol = np.floor(elapsed_s / symbol_period_s).astype(np.int64)
+        running = (symbol >= 0) & ((run.repeats == 0) | (symbol < run.repeats * symbols))
+        if run.stopped_at is not None:
+            running &= elapsed_s < run.stopped_at - run.started_at
+
+        waveforms = {}
+        for channel, name in channels.items():
+            if channel == SCOPE_INPUT_CHANNEL:
+                volts = self._bench.adc_input_v(run.awg, run.vin_cm_supply_v, run.started_at + elapsed_s)[0]
+            elif channel in SCOPE_LANE_CHANNELS:
+                bits = np.where(running, run.lanes[SCOPE_LANE_CHANNELS[channel]][np.mod(symbol, symbols)], 0)
+                volts = (2.0 * bits - 1.0) * SCOPE_LOGIC_SWING_V
+            elif channel == SCOPE_COMP_OUT_CHANNEL:
+                volts = self._comp_out_v(run, symbol)
+            else:
+                raise ValueError(f"simulated scope channel {channel} is not probed")
+            waveforms[channel] = self._digitize(name, channel, x_scale, volts)
+        return waveforms
+
+    def _comp_out_v(self, run, symbol: np.ndarray) -> np.ndarray:
+        # Only the first conversion's decisions are modeled on COMP_OUT.
+        bits = np.zeros(len(symbol))
+        if run.first_decisions is not None and run.powered:
+            word = symbol // SEQUENCER_SYMBOLS_PER_WORD
+            for decision, rx_sen_word in zip(run.first_decisions, np.flatnonzero(run.rx_sen_words), strict=True):
+                bits[word == rx_sen_word] = decision
+        return (2.0 * bits - 1.0) * SCOPE_LOGIC_SWING_V
+
+    def _digitize(self, name: str, channel: int, x_scale: ScopeXScale, volts: np.ndarray) -> ScopeWaveform:
+        scale_v = self._setting(f"CH{channel}:SCAle") or 0.1
+        offset_v = self._setting(f"CH{channel}:OFFSet")
+        position_div = self._setting(f"CH{channel}:POSition")
+        volts = volts + self._bench.rng.normal(0.0, SCOPE_NOISE_V, len(volts))
+        codes = np.round(((volts - offset_v) / scale_v + position_div) * SCOPE_CODES_PER_DIVISION)
+        raw_data = np.clip(codes, -32768, 32767).astype(np.int16)
+        data = (raw_data / SCOPE_CODES_PER_DIVISION - position_div) * scale_v + offset_v
+        return ScopeWaveform(name=name, x_scale=x_scale, data=data, raw_data=raw_data)
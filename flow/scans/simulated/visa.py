@@ -0,0 +1,64 @@
+"""Simulated VISA transfer layer for the GPIB instruments and the scope socket."""
+
+from __future__ import annotations
+
+from basil.TL.TransferLayer import TransferLayer
+
+from flow.scans.simulated.bench import open_bench
+
+
+class _SimulatedResource:
+    """The part of a PyVISA resource the scans touch directly."""
+
+    def __init__(self, transfer_layer: SimulatedVisa) -> None:
+        self._transfer_layer = transfer_layer
+
+    def clear(self) -> None:
+        """Selected-device clear; costs one write."""
+
+        self._transfer_layer.wait(self._transfer_layer.write_latency_s)
+
+
+class SimulatedVisa(TransferLayer):
+    """Charge GPIB or socket latencies and pass raw SCPI to the simulated instrument.
+
+    ``init`` accepts ``bench``, ``board_id``, ``seed``, ``phase``, ``resource_name``,
+    ``open_latency_s``, ``write_latency_s``, and ``query_latency_s``. The driver on this interface
+    registers itself as ``device``; raw ``write()`` and ``query()`` calls, such
+    as the scope's ``TRIGger:STATE?``, are answered by that driver.
+    """
+
+    def __init__(self, conf) -> None:
+        super().__init__(conf)
+        self.bench = None
+        self.device = None
+        self._resource = _SimulatedResource(self)
+
+    def init(self) -> None:
+        super().init()
+        self.bench = open_bench(self._init)
+        self.phase = self._init.get("phase", "instruments")
+        self.resource_name = self._init.get("resource_name", "")
+        self.write_latency_s = float(self._init.get("write_latency_s", 0.0))
+        self.query_latency_s = float(self._init.get("query_latency_s", 0.0))
+        self.wait(float(self._init.get("open_latency_s", 0.0)))
+
+    def wait(self, seconds: float) -> None:
+        """Spend ``seconds`` on this interface."""
+
+        self.bench.wait(self.phase, seconds)
+
+    def write(self, data: str) -> None:
+        self.wait(self.write_latency_s)
+        if self.device is not None:
+            self.device.write(data)
+
+    def query(self, data: str, *, busy_s: float = 0.0) -> str:
+        """Return the device's reply after the query latency and ``busy_s`` of instrument work."""
+
+        self.wait(self.query_latency_s + busy_s)
+        return "" if self.device is None else self.device.query(data)
+
+    def read(self) -> str:
+        self.wait(self.query_latency_s)
+        return ""
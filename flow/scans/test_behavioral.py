@@ -0,0 +1,37 @@
+"""Software-only tests for the behavioral Monte Carlo campaign."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from flow.analysis.adc import analyze_adc_dynamic, analyze_adc_ramp
+from flow.analysis.io import read_measurement
+from flow.scans.scan_behavioral import MonteCarloSpread, monte_carlo_campaign
+
+
+def test_monte_carlo_campaign_writes_analyzable_instances_independent_of_workers(tmp_path) -> None:
+    spread = MonteCarloSpread(capacitor_mismatch_percent=0.5, comparator_offset_v=1.0e-3)
+    serial_paths = monte_carlo_campaign(
+        tmp_path / "serial", instances=2, adc_indices=(0, 1), spread=spread, seed=3, workers=1
+    )
+    pooled_paths = monte_carlo_campaign(
+        tmp_path / "pooled", instances=2, adc_indices=(0, 1), spread=spread, seed=3, workers=2
+    )
+
+    assert [path.name for path in serial_paths] == [
+        f"adc_{adc:02d}_mc{instance:05d}_{stimulus}.h5"
+        for adc in (0, 1)
+        for instance in (0, 1)
+        for stimulus in ("ramp", "sine")
+    ]
+    offsets = set()
+    for serial_path, pooled_path in zip(serial_paths, pooled_paths, strict=True):
+        measurement = read_measurement(serial_path)
+        np.testing.assert_array_equal(read_measurement(pooled_path).daq.bout_packed, measurement.daq.bout_packed)
+        assert measurement.info.backend == "behavioral"
+        offsets.add(measurement.info.readbacks["comparator_offset_v"])
+        if serial_path.name.endswith("ramp.h5"):
+            assert analyze_adc_ramp(measurement).retained_sample_count > 0.9 * measurement.param.tb.conversions
+        else:
+            assert analyze_adc_dynamic(measurement).spectral_enob_bits > 8.0
+    assert len(offsets) == 4
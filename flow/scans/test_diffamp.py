@@ -40,7 +40,7 @@ from flow.analysis.measure import find_crossings
 from flow.analysis.plots import plot_waveforms
 from flow.analysis.waveform import analyze_scope_waveforms
 from flow.scans.scan_adc import convert_vdiff_input_to_awg_supply
-from flow.scans.scope import FRIDA_SCOPE_CHANNELS, wait_for_scope_armed, write_scope_csv
+from flow.scans.scope import FRIDA_SCOPE_CHANNELS, wait_for_scope_armed, write_scope_h5
 
 MAP_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "build" / "test_diffamp"
@@ -442,9 +442,9 @@ def test_diffamp_calibration(linux_gpib_interface: None) -> None:
             coarse_vpp = float(coarse_high_v - coarse_low_v)
             print(f"  coarse scope: offset={coarse_offset_v:.6f} V, Vpp={coarse_vpp:.6f} V")
             if coarse_vpp == 0.0:
-                coarse_name = f"coarse_vdiff{round(1e3 * vdiff_peak_v):04d}mvpeak_vcm{round(1e3 * vin_cm_v):04d}mv.csv"
+                coarse_name = f"coarse_vdiff{round(1e3 * vdiff_peak_v):04d}mvpeak_vcm{round(1e3 * vin_cm_v):04d}mv.h5"
                 coarse_path = run_dir / coarse_name
-                write_scope_csv(coarse_path, coarse_waveforms, SCOPE_TRACKS)
+                write_scope_h5(coarse_path, coarse_waveforms, SCOPE_TRACKS)
                 raise AssertionError(f"coarse CH{SCOPE_CHANNEL} capture is flat; saved {coarse_path}")
 
             # Center a second acquisition on the measured offset and use about
@@ -484,11 +484,11 @@ def test_diffamp_calibration(linux_gpib_interface: None) -> None:
             low_v, high_v = np.percentile(samples, (0.5, 99.5))
             crossing_level_v = float((low_v + high_v) / 2.0)
 
-            csv_path = run_dir / f"{point_name}.csv"
+            waveform_path = run_dir / f"{point_name}.h5"
             # Save the raw capture before analysis so a failed assertion still
             # leaves the exact waveform available for diagnosis.
-            write_scope_csv(csv_path, waveforms, SCOPE_TRACKS)
-            print(f"  saved {samples.size} samples spanning {times[-1] - times[0]:.9g} s: {csv_path}")
+            write_scope_h5(waveform_path, waveforms, SCOPE_TRACKS)
+            print(f"  saved {samples.size} samples spanning {times[-1] - times[0]:.9g} s: {waveform_path}")
             endpoint_fraction = max(
                 float(np.mean(samples == np.min(samples))),
                 float(np.mean(samples == np.max(samples))),
@@ -496,7 +496,7 @@ def test_diffamp_calibration(linux_gpib_interface: None) -> None:
             if endpoint_fraction > 0.01:
                 raise AssertionError(
                     f"scope CH{SCOPE_CHANNEL} fine capture is clipped "
-                    f"({endpoint_fraction:.1%} of samples at one endpoint); saved {csv_path}"
+                    f"({endpoint_fraction:.1%} of samples at one endpoint); saved {waveform_path}"
                 )
 
             raw_crossings = find_crossings(
@@ -537,7 +537,7 @@ def test_diffamp_calibration(linux_gpib_interface: None) -> None:
 
             plot_paths = plot_waveforms(
                 analyze_scope_waveforms(waveforms, SCOPE_TRACKS),
-                output_path=csv_path.with_suffix(""),
+                output_path=waveform_path.with_suffix(""),
             )
             for plot_path in plot_paths:
                 print(f"  saved waveform plot: {plot_path}")
@@ -585,7 +585,7 @@ def test_diffamp_calibration(linux_gpib_interface: None) -> None:
                     ),
                     "vin_cm_within_tolerance": abs(vin_cm_measured_v / vin_cm_v - 1.0) <= RELATIVE_TOLERANCE,
                     "vdiff_offset_within_tolerance": abs(measured_vdiff_offset_v) <= VDIFF_OFFSET_ABSOLUTE_TOLERANCE_V,
-                    "scope_csv": str(csv_path),
+                    "scope_h5": str(waveform_path),
                 }
             )
             summary_path.parent.mkdir(parents=True, exist_ok=True)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from datetime import datetime
 from types import SimpleNamespace
 
 import hdl21 as h
@@ -12,12 +13,20 @@ from bitarray import bitarray
 
 from flow.adc import AdcParams
 from flow.adc.sim import AdcTbParams
+from flow.analysis.io import read_measurement
 from flow.analysis.plots import plot_waveforms
+from flow.analysis.types import AdcExtWave, MeasInfo
 from flow.analysis.waveform import analyze_scope_waveforms
-from flow.cdac import CdacParams, RedunStrat
+from flow.cdac import CdacParams, RedunStrat, get_cdac_weights
 from flow.scans import fastrx, scan_adc, seqgen
 from flow.scans.params import AdcScanParams, build_adc_variants, load_board_map
-from flow.scans.scope import FRIDA_SCOPE_CHANNELS, write_scope_csv
+from flow.scans.scope import (
+    FRIDA_SCOPE_CHANNELS,
+    convert_scope_csv,
+    read_scope_h5,
+    write_scope_csv,
+    write_scope_h5,
+)
 from flow.scans.test_diffamp import OUTPUT_DIR as DIFFAMP_OUTPUT_DIR
 from flow.scans.test_diffamp import SCOPE_TRACKS as DIFFAMP_SCOPE_TRACKS
 from flow.scans.test_diffamp import calculate_refitted_input_calibration
@@ -150,6 +159,42 @@ def test_write_scope_csv_persists_raw_aligned_acquisition(tmp_path) -> None:
     ) == (tmp_path / "scope" / "capture.pdf",)
 
 
+def test_scope_h5_stores_raw_codes_and_decodes_volts_lazily(tmp_path) -> None:
+    """Binary scope files keep the codes, the code-to-volt map, and the time axis."""
+
+    x_scale = SimpleNamespace(offset=-1.0e-3, slope=2.0e-9, unit="s")
+    raw = np.arange(-3000, 3000, dtype=np.int16)
+    waveforms = {
+        1: SimpleNamespace(x_scale=x_scale, data=raw * 2.5e-4 + 0.01, raw_data=raw),
+        3: SimpleNamespace(x_scale=x_scale, data=raw[::-1] * -1.0e-3, raw_data=raw[::-1]),
+    }
+    track_names = {1: "input", 3: "logic"}
+
+    path = write_scope_h5(tmp_path / "scope" / "capture.h5", waveforms, track_names)
+    csv_path = write_scope_csv(tmp_path / "scope" / "capture.csv", waveforms, track_names)
+    converted_path = convert_scope_csv(csv_path, track_names, chunk_rows=1_000)
+
+    assert path.stat().st_size < csv_path.stat().st_size / 4
+    for stored_path in (path, converted_path):
+        for lazy in (False, True):
+            stored = read_scope_h5(stored_path, lazy=lazy)
+            assert list(stored) == [1, 3]
+            assert stored[1].raw_data.dtype == np.int16
+            assert {channel: record.name for channel, record in stored.items()} == track_names
+            assert stored[1].x_scale.offset == pytest.approx(x_scale.offset, abs=1.0e-15)
+            assert stored[1].x_scale.slope == pytest.approx(x_scale.slope, rel=1.0e-12)
+            for channel, waveform in waveforms.items():
+                np.testing.assert_array_equal(stored[channel].raw_data[:], waveform.raw_data)
+                np.testing.assert_allclose(stored[channel].data[10:20], waveform.data[10:20], atol=1.0e-12)
+                np.testing.assert_allclose(np.asarray(stored[channel].data), waveform.data, atol=1.0e-12)
+    assert np.asarray(analyze_scope_waveforms(read_scope_h5(path), track_names).signal_values).shape == (2, 6000)
+
+    bent = {1: SimpleNamespace(x_scale=x_scale, data=(raw * 1.0e-3) ** 2, raw_data=raw)}
+    with pytest.raises(ValueError, match="not a linear function"):
+        write_scope_h5(tmp_path / "bent.h5", bent, {1: "input"})
+    assert not (tmp_path / "bent.h5").exists()
+
+
 def test_convert_params_to_seqgen_fmt_packs_serializer_lanes() -> None:
     """Verify critical 64-bit lane ordering, control placement, and zero padding."""
     memory = seqgen.convert_params_to_seqgen_fmt(serializer_params(), "0110")
@@ -396,6 +441,44 @@ def test_convert_fastrx_words_to_adc_preserves_bit_order_and_validates_headers()
         )
 
 
+def test_convert_fastrx_words_to_adc_checks_frames_across_streamed_chunks() -> None:
+    """Chunks decoded from their absolute index match the whole capture and catch dropped words."""
+
+    data_size = 24
+    code_weights = [1 << bit for bit in reversed(range(data_size))]
+    frame_counter_modulus = 1 << (28 - data_size)
+    conversions = 3 * frame_counter_modulus + 5
+    words = (
+        (1 << 28)
+        | ((np.arange(conversions, dtype=np.uint32) % frame_counter_modulus) << data_size)
+        | np.arange(conversions, dtype=np.uint32)
+    ).astype(np.uint32)
+
+    whole = fastrx.convert_fastrx_words_to_adc(words, data_size, code_weights, adc_bits=12, packed=True)
+    chunks = [
+        fastrx.convert_fastrx_words_to_adc(
+            words[start : start + 7],
+            data_size,
+            code_weights,
+            adc_bits=12,
+            packed=True,
+            first_conversion=start,
+        )
+        for start in range(0, conversions, 7)
+    ]
+    for whole_values, chunk_values in zip(whole, zip(*chunks, strict=True), strict=True):
+        np.testing.assert_array_equal(np.concatenate(chunk_values), whole_values)
+
+    with pytest.raises(RuntimeError, match="conversion 14 has frame"):
+        fastrx.convert_fastrx_words_to_adc(
+            words[15:22],
+            data_size,
+            code_weights,
+            adc_bits=12,
+            first_conversion=14,
+        )
+
+
 def test_convert_dout_to_normalized_dout_scales_to_twelve_bits() -> None:
     """Pin down ADC normalization endpoints and Python rounding behavior."""
     assert scan_adc.convert_dout_to_normalized_dout(0, [1, 1], adc_bits=12) == 0
@@ -515,3 +598,69 @@ def test_parse_pwl_wave_accepts_spice_suffixes_and_rejects_time_reversal() -> No
     assert [voltage_v for _, voltage_v in typed] == pytest.approx([-0.1, 0.1])
     with pytest.raises(ValueError, match="increase strictly"):
         scan_adc.parse_pwl_wave("1u 0 0 1")
+
+
+def adc_capture(path, *, conversions: int, identifier: int = 1) -> scan_adc.AdcCapture:
+    """Return one synthetic captured point whose FastRX frames count up from zero."""
+
+    (params,) = build_adc_variants(
+        board_id="00",
+        adc_indices=(0,),
+        active_conversion_rates_hz=(1.0e6,),
+        logic_offsets_symbols=(0.0,),
+        conversions=conversions,
+        vin_cm_v=0.8,
+        vin_diff=h.Vdc.Params(dc=0.05),
+    )
+    code_weights = scan_adc.convert_dac_caps_to_adc_weights(get_cdac_weights(params.tb.dut.cdac))
+    data_size = len(code_weights)
+    frames = np.arange(conversions, dtype=np.uint32) % np.uint32(1 << (28 - data_size))
+    return scan_adc.AdcCapture(
+        path=path,
+        info=MeasInfo(
+            schema_version=1,
+            measurement_type="MeasAdcExt",
+            backend="physical",
+            timestamp_utc=datetime.now().astimezone(),
+        ),
+        param=params,
+        fastrx_words=np.uint32(identifier << 28) | (frames << np.uint32(data_size)) | np.uint32(1 << (data_size - 1)),
+        data_size=data_size,
+        code_weights=tuple(code_weights),
+        conversion_period_s=1.0e-6,
+        wave=AdcExtWave(
+            conversion_index=np.asarray([0]),
+            time_s=np.arange(4) * 1.0e-9,
+            **{name: np.zeros((1, 4)) for name in ("vin_diff_v", "seq_comp_v", "seq_logic_v", "comp_out_v")},
+        ),
+    )
+
+
+def test_scan_session_writer_applies_back_pressure_and_drains(tmp_path) -> None:
+    session = scan_adc.ScanSession(pending_writes=1)
+    try:
+        session.write(adc_capture(tmp_path / "first.h5", conversions=64))
+        assert session.point_count(tmp_path) == 1
+        session.write(adc_capture(tmp_path / "second.h5", conversions=64))
+        assert (tmp_path / "first.h5").is_file()
+        assert session.point_count(tmp_path) == 2
+        session.drain()
+    finally:
+        session.close()
+
+    measurement = read_measurement(tmp_path / "second.h5")
+    assert len(measurement.daq.dout) == 64
+    assert np.all(measurement.daq.vin_diff_v == 0.05)
+
+
+def test_scan_session_writer_reports_failures_without_partial_files(tmp_path) -> None:
+    session = scan_adc.ScanSession(pending_writes=2)
+    try:
+        session.write(adc_capture(tmp_path / "corrupt.h5", conversions=8, identifier=2))
+        session.write(adc_capture(tmp_path / "valid.h5", conversions=8))
+        with pytest.raises(RuntimeError, match="identifier 0x2"):
+            session.drain()
+    finally:
+        session.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["valid.h5"]
@@ -35,7 +35,7 @@ import flow.analysis.plots as analysis_plots
 from flow.analysis.diffamp import analyze_diffamp_noise
 from flow.analysis.plots import plot_diffamp_noise
 from flow.scans.scan_adc import convert_vdiff_input_to_awg_supply
-from flow.scans.scope import FRIDA_SCOPE_CHANNELS, wait_for_scope_armed, write_scope_csv
+from flow.scans.scope import FRIDA_SCOPE_CHANNELS, wait_for_scope_armed, write_scope_h5
 
 MAP_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "build" / "test_noise"
@@ -308,7 +308,7 @@ def test_diffamp_noise_loopback(linux_gpib_interface: None) -> None:
             sleep(SETTLE_TIME_S)
 
         clipped = float(np.max(np.abs(samples_v - analysis.mean_v))) >= 4.5 * accepted_vertical_scale_v
-        waveform_path = write_scope_csv(run_dir / "waveform.csv", waveforms, SCOPE_TRACKS)
+        waveform_path = write_scope_h5(run_dir / "waveform.h5", waveforms, SCOPE_TRACKS)
         plot_paths = plot_diffamp_noise(
             analysis,
             output_path=run_dir / "noise_gaussian_fft",
@@ -340,7 +340,7 @@ def test_diffamp_noise_loopback(linux_gpib_interface: None) -> None:
             "measured_vdiff_mean_v": analysis.mean_v,
             "measured_noise_rms_v": analysis.noise_rms_v,
             "fft_integrated_noise_rms_v": analysis.integrated_fft_noise_rms_v,
-            "waveform_csv": str(waveform_path),
+            "waveform_h5": str(waveform_path),
             "plots": [str(path) for path in plot_paths],
         }
         summary_path = run_dir / "summary.json"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 import hdl21 as h
@@ -54,12 +55,13 @@ def test_adc_targets_reproduce_accepted_campaign_shapes(
     captured_calls = []
     captured_run_dirs = []
 
-    def scan(params, *, run_dir: Path, position: str) -> Path:
+    def scan(params, *, run_dir: Path, position: str, session=None) -> Path:
         captured_calls.append((params, position))
         captured_run_dirs.append(run_dir)
         return run_dir
 
     monkeypatch.setattr(runner.scan_adc, "scan", scan)
+    monkeypatch.setattr(runner.scan_adc, "ScanSession", nullcontext)
     result = runner.TARGETS[target_name]()
     variants = [params for params, position in captured_calls if position != "abort"]
     positions = [position for _params, position in captured_calls]
@@ -123,20 +125,31 @@ def test_adc_targets_reproduce_accepted_campaign_shapes(
 
 def test_adc_target_aborts_powered_hardware_after_interrupted_middle_point(monkeypatch) -> None:
     calls = []
+    sessions = []
 
-    def scan(params, *, run_dir: Path, position: str) -> Path:
+    class ScanSession:
+        def __enter__(self):
+            sessions.append(self)
+            return self
+
+        def __exit__(self, *_exc_info) -> None:
+            calls.append((None, "close"))
+
+    def scan(params, *, run_dir: Path, position: str, session=None) -> Path:
+        assert session is sessions[0]
         calls.append((params, position))
         if position == "middle" and sum(call_position == "middle" for _params, call_position in calls) == 1:
             raise RuntimeError("interrupted")
         return run_dir
 
     monkeypatch.setattr(runner.scan_adc, "scan", scan)
+    monkeypatch.setattr(runner.scan_adc, "ScanSession", ScanSession)
 
     with pytest.raises(RuntimeError, match="interrupted"):
         runner.adc_ramp_code_density()
 
-    assert [position for _params, position in calls] == ["first", "middle", "abort"]
-    assert calls[-1][0] is calls[-2][0]
+    assert [position for _params, position in calls] == ["first", "middle", "abort", "close"]
+    assert calls[-2][0] is calls[-3][0]
 
 
 def test_comparator_repair_target_owns_the_accepted_curve_selection(monkeypatch) -> None:
@@ -45,7 +45,7 @@ from flow.scans.scope import (
     response_value,
     wait_for_scope_armed,
     wait_for_scope_capture,
-    write_scope_csv,
+    write_scope_h5,
 )
 from flow.scans.seqgen import convert_params_to_seqgen_fmt
 
@@ -345,8 +345,8 @@ def test_serdes_rates(linux_gpib_interface: None) -> None:
                         f"serdes_{target_symbol_rate_bps / 1e6:g}mbd_"
                         f"fin{si570_frequency_hz / 1e6:g}mhz_n{divider_n:02d}"
                     )
-                    csv_path = run_dir / f"{stem}.csv"
-                    write_scope_csv(csv_path, waveforms, SCOPE_TRACKS)
+                    waveform_path = run_dir / f"{stem}.h5"
+                    write_scope_h5(waveform_path, waveforms, SCOPE_TRACKS)
 
                     measured_interval_s, measured_symbol_rate_bps = validate_capture(
                         waveforms,
@@ -355,7 +355,7 @@ def test_serdes_rates(linux_gpib_interface: None) -> None:
 
                     plot_paths = plot_waveforms(
                         analyze_scope_waveforms(waveforms, SCOPE_TRACKS),
-                        output_path=csv_path.with_suffix(""),
+                        output_path=waveform_path.with_suffix(""),
                     )
                     for plot_path in plot_paths:
                         print(f"Saved scope waveform plot: {plot_path}")
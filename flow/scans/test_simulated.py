@@ -0,0 +1,145 @@
+"""Software-only scan tests against the offline simulated Basil bench."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import hdl21 as h
+import numpy as np
+import pytest
+
+from flow.analysis.io import read_measurement
+from flow.scans import scan_adc, scan_comp
+from flow.scans.params import BASIL_MAPS_ENVIRONMENT_VARIABLE, build_adc_variants, select_basil_map
+from flow.scans.simulated.bench import discard_bench, get_bench
+
+
+@pytest.fixture
+def simulated_bench(monkeypatch):
+    """Select the simulated maps on a fresh bench without interface latencies."""
+
+    monkeypatch.setenv(BASIL_MAPS_ENVIRONMENT_VARIABLE, "simulated")
+    discard_bench()
+    yield get_bench(latency_scale=0.0)
+    discard_bench()
+
+
+def test_select_basil_map_follows_the_environment(monkeypatch) -> None:
+    monkeypatch.delenv(BASIL_MAPS_ENVIRONMENT_VARIABLE, raising=False)
+    assert Path(select_basil_map("map_fpga.yaml")) == Path(scan_adc.__file__).parent / "map_fpga.yaml"
+
+    monkeypatch.setenv(BASIL_MAPS_ENVIRONMENT_VARIABLE, "simulated")
+    assert Path(select_basil_map("map_fpga.yaml")).is_file()
+    assert Path(select_basil_map("map_fpga.yaml")).parent.name == "simulated"
+
+    monkeypatch.setenv(BASIL_MAPS_ENVIRONMENT_VARIABLE, "laptop")
+    with pytest.raises(ValueError, match="FRIDA_BASIL_MAPS"):
+        select_basil_map("map_fpga.yaml")
+
+
+def test_simulated_adc_point_captures_a_full_scale_sine(simulated_bench, tmp_path: Path) -> None:
+    (params,) = build_adc_variants(
+        board_id="00",
+        adc_indices=(0,),
+        active_conversion_rates_hz=(5.0e6,),
+        logic_offsets_symbols=(2.0,),
+        conversions=20_000,
+        vin_cm_v=0.700,
+        vin_diff=h.Vsin.Params(voff=0.0, vamp=0.500, freq=9_998.770151),
+    )
+
+    run_dir = scan_adc.scan(params, run_dir=tmp_path / "run", position="only")
+
+    (path,) = sorted(run_dir.glob("*.h5"))
+    measurement = read_measurement(path)
+    assert "SIMULATED" in measurement.info.instruments["vdd_a"]
+    assert measurement.info.readbacks["fastrx_lost_count"] == 0
+    dout = np.asarray(measurement.daq.dout, dtype=np.float64)
+    assert len(dout) == 20_000
+    sample_rate_hz = measurement.info.readbacks["actual_sample_rate_hz"]
+    phase = 2.0 * np.pi * 9_998.770151 * np.arange(len(dout)) / sample_rate_hz
+    basis = np.column_stack((np.sin(phase), np.cos(phase), np.ones_like(phase)))
+    coefficients, *_ = np.linalg.lstsq(basis, dout, rcond=None)
+    assert np.hypot(*coefficients[:2]) > 1_500.0
+    assert np.std(dout - basis @ coefficients) < 30.0
+    assert measurement.wave.comp_out_v.shape == measurement.wave.seq_logic_v.shape
+
+
+def test_long_adc_capture_streams_chunks_into_the_daq_datasets(simulated_bench, tmp_path: Path) -> None:
+    (params,) = build_adc_variants(
+        board_id="00",
+        adc_indices=(0,),
+        active_conversion_rates_hz=(5.0e6,),
+        logic_offsets_symbols=(2.0,),
+        conversions=200_000,
+        vin_cm_v=0.700,
+        vin_diff=h.Vsin.Params(voff=0.0, vamp=0.500, freq=9_998.770151),
+    )
+
+    run_dir = scan_adc.scan(params, run_dir=tmp_path / "run", position="only", fastrx_chunk_words=16_384)
+
+    (path,) = sorted(run_dir.iterdir())
+    measurement = read_measurement(path)
+    assert measurement.info.readbacks["fastrx_lost_count"] == 0
+    assert measurement.info.readbacks["fastrx_stream_chunks"] > 1
+    np.testing.assert_array_equal(measurement.daq.conversion_index, np.arange(200_000))
+    dout = np.asarray(measurement.daq.dout, dtype=np.float64)
+    sample_rate_hz = measurement.info.readbacks["actual_sample_rate_hz"]
+    phase = 2.0 * np.pi * 9_998.770151 * np.arange(len(dout)) / sample_rate_hz
+    basis = np.column_stack((np.sin(phase), np.cos(phase), np.ones_like(phase)))
+    coefficients, *_ = np.linalg.lstsq(basis, dout, rcond=None)
+    assert np.std(dout - basis @ coefficients) < 30.0
+    assert measurement.wave is not None
+
+
+def test_simulated_comparator_flips_at_the_board_offset(simulated_bench, tmp_path: Path) -> None:
+    offset_v = simulated_bench.comparator_calibration(0)["offset_v"]
+    variants = scan_comp.build_common_mode_variants(
+        adc_indices=(0,),
+        common_mode_values_v=(0.8,),
+        minimum_v=offset_v - 5.0e-3,
+        maximum_v=offset_v + 5.0e-3,
+        step_v=10.0e-3,
+        conversions=200,
+    )
+
+    run_dir = scan_comp.scan(variants, run_dir=tmp_path / "run", capture_scope_per_curve=False)
+
+    measurements = [read_measurement(path) for path in sorted(Path(run_dir).glob("*.h5"))]
+    assert [float(np.mean(measurement.daq.decision)) for measurement in measurements] == [0.0, 1.0]
+
+
+def test_scan_session_pushes_only_changed_state_between_points(simulated_bench, tmp_path: Path) -> None:
+    variants = build_adc_variants(
+        board_id="00",
+        adc_indices=(0,),
+        active_conversion_rates_hz=(2.0e6, 5.0e6, 5.0e6),
+        logic_offsets_symbols=(2.0,),
+        conversions=20_000,
+        vin_cm_v=0.700,
+        vin_diff=h.Vsin.Params(voff=0.0, vamp=0.500, freq=9_998.770151),
+    )
+    run_dir = tmp_path / "run"
+
+    with scan_adc.ScanSession() as session:
+        spi_starts = []
+        start = session.daq["spi0"].start
+        session.daq["spi0"].start = lambda: spi_starts.append(start())
+        for params, position in zip(variants, ("first", "middle", "last"), strict=True):
+            scan_adc.scan(params, run_dir=run_dir, position=position, session=session)
+            if position != "last":
+                assert session.applied["pll_configuration"][0] == simulated_bench.si570_frequency_hz
+        assert session.is_open
+        assert session.applied == {}
+        assert not simulated_bench.chip_powered()
+    assert not session.is_open
+
+    assert len(spi_starts) == 2
+    measurements = [read_measurement(path) for path in sorted(run_dir.glob("*.h5"))]
+    assert [measurement.info.readbacks["spi_mismatches"] for measurement in measurements] == [0, 0, 0]
+    assert [measurement.info.readbacks["spi_readback_skipped"] for measurement in measurements] == [False, True, True]
+    dout = np.asarray(measurements[-1].daq.dout, dtype=np.float64)
+    phase = 2.0 * np.pi * 9_998.770151 * np.arange(len(dout)) / measurements[-1].info.readbacks["actual_sample_rate_hz"]
+    basis = np.column_stack((np.sin(phase), np.cos(phase), np.ones_like(phase)))
+    coefficients, *_ = np.linalg.lstsq(basis, dout, rcond=None)
+    assert np.std(dout - basis @ coefficients) < 30.0